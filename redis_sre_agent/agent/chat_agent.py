@@ -1097,7 +1097,12 @@ class ChatAgent:
 
                     # Create summarized message for LLM if data is large
                     tool_key = env_dict.get("tool_key", tool_name)
-                    data = env_dict.get("data", {})
+                    # Size the LLM view on what the ToolMessage itself carries;
+                    # envelope-only evidence stays reachable via expand_evidence.
+                    envelope_only = tm.artifact if isinstance(tm.artifact, dict) else {}
+                    data = {
+                        k: v for k, v in env_dict.get("data", {}).items() if k not in envelope_only
+                    }
                     summarized_msg = self._create_summarized_tool_message(tm, tool_key, data)
                     messages_for_llm.append(summarized_msg)
 
@@ -256,6 +256,7 @@ def build_result_envelope(
     """Construct a ResultEnvelope dict from a tool call and corresponding ToolMessage.
 
     - Parses JSON from the ToolMessage content when possible, otherwise stores raw text (truncated)
+    - Merges envelope-only evidence carried on the ToolMessage artifact into the data
     - Derives a short operation name from tool_name
     - Preserves the tool description from the tool definition if available
     """
@@ -274,6 +275,10 @@ def build_result_envelope(
         except Exception:
             data_obj = None
 
+    artifact = getattr(tool_message, "artifact", None)
+    if isinstance(data_obj, dict) and isinstance(artifact, dict):
+        data_obj = {**data_obj, **artifact}
+
     def _extract_operation_from_tool_name(full: str) -> str:
         # e.g., "knowledge.kb.search" -> "search"
         if not full:
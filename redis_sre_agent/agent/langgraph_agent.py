@@ -2259,8 +2259,10 @@ Alternatively, if you're looking for general Redis knowledge or best practices (
                 logger.info(
                     f"Detected instance type '{detected_type}' for '{target_instance.name}'"
                 )
-                # Update the instance with detected type
-                target_instance.instance_type = detected_type
+                # Update the instance with detected type (registry instances are shared)
+                target_instance = target_instance.model_copy(
+                    update={"instance_type": detected_type}
+                )
 
                 # Save the updated instance type
                 try:
@@ -8,6 +8,8 @@ from typing import Any, Dict, List, Optional
 
 from langchain_core.messages import ToolMessage
 
+from redis_sre_agent.tools.models import ENVELOPE_ONLY_KEY
+
 
 def _serialize_tool_result(result: Any) -> str:
     if isinstance(result, str):
@@ -18,6 +20,14 @@ def _serialize_tool_result(result: Any) -> str:
         return str(result)
 
 
+def _split_envelope_only(result: Any) -> tuple[Any, Optional[Dict[str, Any]]]:
+    """Separate envelope-only evidence from the part of a result the LLM sees."""
+    if isinstance(result, dict) and isinstance(result.get(ENVELOPE_ONLY_KEY), dict):
+        visible = {k: v for k, v in result.items() if k != ENVELOPE_ONLY_KEY}
+        return visible, result[ENVELOPE_ONLY_KEY]
+    return result, None
+
+
 async def execute_tool_call_with_gate(
     *,
     tool_manager: Any,
@@ -89,11 +99,13 @@ async def execute_tool_calls_with_gate(
 
     for tool_call, result in zip(normalized_tool_calls, tool_results):
         tool_name = tool_call["name"]
+        visible, envelope_only = _split_envelope_only(result)
         tool_messages.append(
             ToolMessage(
-                content=_serialize_tool_result(result),
+                content=_serialize_tool_result(visible),
                 tool_call_id=tool_call["id"],
                 name=tool_name,
+                artifact=envelope_only,
             )
         )
 
@@ -26,9 +26,10 @@ from redis_sre_agent.core.config import settings
 from redis_sre_agent.core.migrations.instances_to_clusters import (
     run_instances_to_clusters_migration,
 )
-from redis_sre_agent.core.redis import initialize_redis
+from redis_sre_agent.core.redis import close_redis_connections, initialize_redis
 from redis_sre_agent.core.targets import sync_target_catalog_from_authoritative_records
 from redis_sre_agent.observability.tracing import setup_tracing as setup_base_tracing
+from redis_sre_agent.tools.http import close_http_clients
 from redis_sre_agent.tools.mcp.pool import MCPConnectionPool
 
 # Configure logging with consistent format
@@ -138,6 +139,17 @@ async def lifespan(app: FastAPI):
         logger.info(f"Embedding model: {settings.embedding_model}")
         logger.info(f"Debug mode: {settings.debug}")
 
+        if settings.embedding_prewarm:
+            try:
+                from redis_sre_agent.core.vectorizer_helpers import prewarm_vectorizer
+
+                await prewarm_vectorizer()
+                _app_startup_state["embedding_prewarm"] = "ok"
+                logger.info("✅ Vectorizer prewarmed")
+            except Exception as e:
+                logger.warning(f"Vectorizer prewarm failed (continuing): {e}")
+                _app_startup_state["embedding_prewarm"] = {"error": str(e)}
+
         # Start MCP connection pool (keeps connections warm across queries)
         try:
             mcp_pool = MCPConnectionPool.get_instance()
@@ -167,6 +179,18 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Error shutting down MCP pool: {e}")
 
+    # Release pooled Redis connections held by this event loop
+    try:
+        await close_redis_connections()
+    except Exception as e:
+        logger.warning(f"Error closing Redis connections: {e}")
+
+    # Release pooled tool HTTP connections held by this event loop
+    try:
+        await close_http_clients()
+    except Exception as e:
+        logger.warning(f"Error closing HTTP clients: {e}")
+
 
 # Create FastAPI application
 app = FastAPI(
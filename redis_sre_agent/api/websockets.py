@@ -3,8 +3,9 @@
 import asyncio
 import json
 import logging
+from collections import deque
 from datetime import datetime, timezone
-from typing import Dict, Set
+from typing import Callable, Deque, Dict, Optional, Tuple
 
 from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
 from redis.asyncio import Redis
@@ -18,16 +19,137 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Active WebSocket connections per task
-_active_connections: Dict[str, Set[WebSocket]] = {}
+# Task streams are kept for 24 hours after the last published update
+TASK_STREAM_TTL_SECONDS = 86400
+
+
+def encode_task_stream_event(thread_id: str, update_type: str, data: Dict) -> Dict[str, str]:
+    """Build the string-valued stream fields for a task update event.
+
+    Shared by ``TaskStreamManager.publish_task_update`` and pipelined writers
+    (e.g. ``TaskUpdateWriter``) that XADD task updates themselves.
+    """
+    # Build typed event with extra fields preserved at top-level
+    # Avoid duplicate keyword errors if callers pass 'update_type' or 'thread_id' in data
+    safe_data = {k: v for k, v in (data or {}).items() if k not in {"update_type", "thread_id"}}
+    event = TaskStreamEvent(thread_id=thread_id, update_type=update_type, **safe_data)
+    stream_data = event.model_dump()
+
+    # Convert all values to strings for Redis Stream
+    return {k: json.dumps(v) if not isinstance(v, str) else v for k, v in stream_data.items()}
+
+
+# Progress updates may be dropped for a slow client when its queue is full;
+# every other update type marks a state change the UI must not miss.
+DROPPABLE_UPDATE_TYPES = frozenset({"progress"})
+
+# WebSocket close code asking a client that fell too far behind to reconnect
+_SLOW_CLIENT_CLOSE_CODE = 1013
+
+
+class TaskStreamSubscriber:
+    """Bounded outbound queue and sender task for one WebSocket client.
+
+    Stream updates are queued here so a slow socket never blocks the shared
+    stream reader. When the queue is full the oldest queued progress update is
+    dropped in favour of the new one; if nothing can be dropped the client is
+    closed so it reconnects and resyncs from the initial state.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        max_queue_size: int,
+        on_closed: Optional[Callable[["TaskStreamSubscriber"], None]] = None,
+    ):
+        self.websocket = websocket
+        self.max_queue_size = max_queue_size
+        self._on_closed = on_closed
+        self.dropped = 0
+        self._messages: Deque[Tuple[str, str]] = deque()
+        self._ready = asyncio.Event()
+        self._overflowed = False
+        self._sender: Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._messages)
+
+    def put(self, update_type: str, message: str) -> bool:
+        """Queue a serialized update. Returns False if the client overflowed."""
+        if self._overflowed:
+            return False
+        if len(self._messages) >= self.max_queue_size:
+            for i, (queued_type, _) in enumerate(self._messages):
+                if queued_type in DROPPABLE_UPDATE_TYPES:
+                    del self._messages[i]
+                    self.dropped += 1
+                    break
+            else:
+                self._overflowed = True
+                self._ready.set()
+                return False
+        self._messages.append((update_type, message))
+        self._ready.set()
+        return True
+
+    def start(self) -> None:
+        """Start delivering queued updates to the socket."""
+        if self._sender is None:
+            self._sender = asyncio.create_task(self._send_loop())
+
+    async def stop(self) -> None:
+        """Stop the sender task without closing the socket."""
+        sender, self._sender = self._sender, None
+        if sender is None or sender is asyncio.current_task():
+            return
+        sender.cancel()
+        try:
+            await sender
+        except asyncio.CancelledError:
+            pass
+
+    async def _send_loop(self) -> None:
+        try:
+            while True:
+                await self._ready.wait()
+                self._ready.clear()
+                if self._overflowed:
+                    logger.warning("Closing WebSocket client that fell behind its update queue")
+                    await self.websocket.close(code=_SLOW_CLIENT_CLOSE_CODE)
+                    break
+                while self._messages and not self._overflowed:
+                    _, message = self._messages.popleft()
+                    await self.websocket.send_text(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Failed to send message to WebSocket client: {e}")
+        if self._on_closed is not None:
+            self._on_closed(self)
 
 
 class TaskStreamManager:
-    """Manages Redis Streams for task status updates."""
+    """Manages Redis Streams for task status updates.
 
-    def __init__(self):
+    A single reader task issues one ``XREAD`` across the stream keys of every
+    watched thread and fans each update out to that thread's subscribers.
+    """
+
+    def __init__(
+        self,
+        max_client_queue_size: int = 100,
+        read_block_ms: int = 1000,
+        read_count: int = 100,
+    ):
         self.redis_client: Redis = None
-        self._consumer_tasks: Dict[str, asyncio.Task] = {}
+        self.max_client_queue_size = max_client_queue_size
+        self.read_block_ms = read_block_ms
+        self.read_count = read_count
+        # Last delivered stream entry ID per watched thread
+        self._last_ids: Dict[str, str] = {}
+        self._subscribers: Dict[str, Dict[WebSocket, TaskStreamSubscriber]] = {}
+        self._reader_task: Optional[asyncio.Task] = None
 
     async def _get_client(self) -> Redis:
         """Get Redis client (lazy initialization)."""
@@ -44,25 +166,13 @@ class TaskStreamManager:
         try:
             client = await self._get_client()
             stream_key = self._get_stream_key(thread_id)
-
-            # Build typed event with extra fields preserved at top-level
-            # Avoid duplicate keyword errors if callers pass 'update_type' or 'thread_id' in data
-            safe_data = {
-                k: v for k, v in (data or {}).items() if k not in {"update_type", "thread_id"}
-            }
-            event = TaskStreamEvent(thread_id=thread_id, update_type=update_type, **safe_data)
-            stream_data = event.model_dump()
-
-            # Convert all values to strings for Redis Stream
-            stream_data_str = {
-                k: json.dumps(v) if not isinstance(v, str) else v for k, v in stream_data.items()
-            }
+            stream_data_str = encode_task_stream_event(thread_id, update_type, data)
 
             # Add to stream with automatic ID generation
             await client.xadd(stream_key, stream_data_str)
 
             # Set TTL on the stream (24 hours)
-            await client.expire(stream_key, 86400)
+            await client.expire(stream_key, TASK_STREAM_TTL_SECONDS)
 
             logger.debug(f"Published update to stream {stream_key}: {update_type}")
             return True
@@ -71,65 +181,128 @@ class TaskStreamManager:
             logger.error(f"Failed to publish task update for {thread_id}: {e}")
             return False
 
+    def is_consuming(self, thread_id: str) -> bool:
+        """Return True if updates for the thread are being read."""
+        return thread_id in self._last_ids
+
+    def connection_count(self, thread_id: str) -> int:
+        """Return the number of WebSocket clients subscribed to a thread."""
+        return len(self._subscribers.get(thread_id, {}))
+
+    async def subscribe(self, thread_id: str, websocket: WebSocket) -> TaskStreamSubscriber:
+        """Register a WebSocket client for a thread's updates.
+
+        Updates are queued from now on; call ``start()`` on the returned
+        subscriber once anything that must be sent first has been sent.
+        """
+        clients = self._subscribers.setdefault(thread_id, {})
+        subscriber = clients.get(websocket)
+        if subscriber is None:
+            subscriber = TaskStreamSubscriber(
+                websocket,
+                self.max_client_queue_size,
+                on_closed=lambda closed: self._discard_subscriber(thread_id, closed),
+            )
+            clients[websocket] = subscriber
+        await self.start_consumer(thread_id)
+        return subscriber
+
+    async def unsubscribe(self, thread_id: str, websocket: WebSocket) -> None:
+        """Remove a WebSocket client; stop reading the thread if it was the last."""
+        clients = self._subscribers.get(thread_id, {})
+        subscriber = clients.pop(websocket, None)
+        if subscriber is not None:
+            await subscriber.stop()
+        if not clients:
+            self._subscribers.pop(thread_id, None)
+            await self.stop_consumer(thread_id)
+
+    def _discard_subscriber(self, thread_id: str, subscriber: TaskStreamSubscriber) -> None:
+        """Drop a subscriber whose socket failed; the endpoint cleans up the rest."""
+        clients = self._subscribers.get(thread_id, {})
+        if clients.get(subscriber.websocket) is subscriber:
+            del clients[subscriber.websocket]
+
     async def start_consumer(self, thread_id: str) -> None:
-        """Start consuming updates for a specific thread."""
-        if thread_id in self._consumer_tasks:
+        """Start reading updates for a specific thread."""
+        if thread_id in self._last_ids:
             return  # Already consuming
 
-        task = asyncio.create_task(self._consume_stream(thread_id))
-        self._consumer_tasks[thread_id] = task
+        # Pin the current end of the stream rather than using "$", so entries
+        # added before the reader's next XREAD picks up this key are not lost.
+        last_id = "0-0"
+        try:
+            client = await self._get_client()
+            latest = await client.xrevrange(self._get_stream_key(thread_id), count=1)
+            if latest:
+                message_id = latest[0][0]
+                last_id = message_id.decode() if isinstance(message_id, bytes) else message_id
+        except Exception as e:
+            logger.warning(f"Could not read stream position for {thread_id}: {e}")
+            last_id = "$"
+
+        self._last_ids[thread_id] = last_id
+        if self._reader_task is None or self._reader_task.done():
+            self._reader_task = asyncio.create_task(self._consume_streams())
         logger.info(f"Started stream consumer for thread {thread_id}")
 
     async def stop_consumer(self, thread_id: str) -> None:
-        """Stop consuming updates for a specific thread."""
-        if thread_id in self._consumer_tasks:
-            task = self._consumer_tasks.pop(thread_id)
+        """Stop reading updates for a specific thread."""
+        if self._last_ids.pop(thread_id, None) is None:
+            return
+        logger.info(f"Stopped stream consumer for thread {thread_id}")
+        if not self._last_ids and self._reader_task is not None:
+            task, self._reader_task = self._reader_task, None
             task.cancel()
             try:
                 await task
             except asyncio.CancelledError:
                 pass
-            logger.info(f"Stopped stream consumer for thread {thread_id}")
 
-    async def _consume_stream(self, thread_id: str) -> None:
-        """Consume updates from Redis Stream and broadcast to WebSocket clients."""
+    async def _consume_streams(self) -> None:
+        """Read all watched streams with one XREAD and dispatch to subscribers."""
         try:
             client = await self._get_client()
-            stream_key = self._get_stream_key(thread_id)
-
-            # Start reading from the latest messages
-            last_id = "$"
-
-            while thread_id in _active_connections and _active_connections[thread_id]:
+            while self._last_ids:
+                stream_threads = {
+                    self._get_stream_key(thread_id): thread_id for thread_id in self._last_ids
+                }
+                streams = {
+                    stream_key: self._last_ids[thread_id]
+                    for stream_key, thread_id in stream_threads.items()
+                }
                 try:
-                    # Read new messages from the stream
-                    messages = await client.xread({stream_key: last_id}, count=10, block=1000)
-
-                    if not messages:
-                        continue
-
-                    # Process messages
-                    for stream, stream_messages in messages:
-                        for message_id, fields in stream_messages:
-                            await self._broadcast_update(thread_id, fields)
-                            last_id = (
-                                message_id.decode() if isinstance(message_id, bytes) else message_id
-                            )
-
+                    messages = await client.xread(
+                        streams, count=self.read_count, block=self.read_block_ms
+                    )
                 except asyncio.CancelledError:
-                    break
+                    raise
                 except Exception as e:
-                    logger.error(f"Error consuming stream for {thread_id}: {e}")
+                    logger.error(f"Error consuming task streams: {e}")
                     await asyncio.sleep(1)  # Brief pause before retrying
-
+                    continue
+
+                for stream, stream_messages in messages or []:
+                    stream_key = stream.decode() if isinstance(stream, bytes) else stream
+                    thread_id = stream_threads.get(stream_key)
+                    if thread_id is None or thread_id not in self._last_ids:
+                        continue  # Unsubscribed while the read was in flight
+                    for message_id, fields in stream_messages:
+                        self._last_ids[thread_id] = (
+                            message_id.decode() if isinstance(message_id, bytes) else message_id
+                        )
+                        self._broadcast_update(thread_id, fields)
+        except asyncio.CancelledError:
+            pass
         except Exception as e:
-            logger.error(f"Stream consumer failed for {thread_id}: {e}")
+            logger.error(f"Stream consumer failed: {e}")
         finally:
-            logger.info(f"Stream consumer stopped for {thread_id}")
+            logger.info("Stream consumer stopped")
 
-    async def _broadcast_update(self, thread_id: str, fields: Dict) -> None:
-        """Broadcast update to all WebSocket clients for this thread."""
-        if thread_id not in _active_connections:
+    def _broadcast_update(self, thread_id: str, fields: Dict) -> None:
+        """Queue an update for every WebSocket client watching this thread."""
+        clients = self._subscribers.get(thread_id)
+        if not clients:
             return
 
         # Parse the stream fields back to proper types
@@ -152,23 +325,9 @@ class TaskStreamManager:
             except Exception:
                 message = json.dumps(update_data)
 
-            # Broadcast to all connected clients for this thread
-            disconnected_clients = set()
-            for websocket in _active_connections[thread_id].copy():
-                try:
-                    await websocket.send_text(message)
-                except Exception as e:
-                    logger.warning(f"Failed to send message to WebSocket client: {e}")
-                    disconnected_clients.add(websocket)
-
-            # Remove disconnected clients
-            for websocket in disconnected_clients:
-                _active_connections[thread_id].discard(websocket)
-
-            # Stop consumer if no more clients
-            if not _active_connections[thread_id]:
-                await self.stop_consumer(thread_id)
-                del _active_connections[thread_id]
+            update_type = str(update_data.get("update_type", ""))
+            for subscriber in list(clients.values()):
+                subscriber.put(update_type, message)
 
         except Exception as e:
             logger.error(f"Failed to broadcast update for {thread_id}: {e}")
@@ -206,14 +365,8 @@ async def websocket_task_status(websocket: WebSocket, thread_id: str):
             await websocket.close(code=4004)
             return
 
-        # Add client to active connections
-        if thread_id not in _active_connections:
-            _active_connections[thread_id] = set()
-        _active_connections[thread_id].add(websocket)
-
-        # Start stream consumer if this is the first client
-        if len(_active_connections[thread_id]) == 1:
-            await _stream_manager.start_consumer(thread_id)
+        # Subscribe before reading state so no update between the two is lost
+        subscriber = await _stream_manager.subscribe(thread_id, websocket)
 
         # Get the latest task for this thread to send updates/result/error
         from redis_sre_agent.core.tasks import TaskManager
@@ -253,6 +406,7 @@ async def websocket_task_status(websocket: WebSocket, thread_id: str):
             timestamp=datetime.now(timezone.utc).isoformat(),
         )
         await websocket.send_text(initial_event.model_dump_json())
+        subscriber.start()
 
         # Keep connection alive and handle client messages
         while True:
@@ -279,14 +433,8 @@ async def websocket_task_status(websocket: WebSocket, thread_id: str):
         logger.error(f"WebSocket connection error for thread {thread_id}: {e}")
 
     finally:
-        # Clean up connection
-        if thread_id in _active_connections:
-            _active_connections[thread_id].discard(websocket)
-
-            # Stop consumer if no more clients
-            if not _active_connections[thread_id]:
-                await _stream_manager.stop_consumer(thread_id)
-                del _active_connections[thread_id]
+        # Clean up connection; stops the stream consumer after the last client
+        await _stream_manager.unsubscribe(thread_id, websocket)
 
         logger.info(f"WebSocket client disconnected for thread {thread_id}")
 
@@ -308,14 +456,14 @@ async def get_task_stream_info(thread_id: str):
             stream_length = 0
 
         # Get active connections count
-        active_connections = len(_active_connections.get(thread_id, set()))
+        active_connections = _stream_manager.connection_count(thread_id)
 
         return {
             "thread_id": thread_id,
             "stream_key": stream_key,
             "stream_length": stream_length,
             "active_connections": active_connections,
-            "consumer_active": thread_id in _stream_manager._consumer_tasks,
+            "consumer_active": _stream_manager.is_consuming(thread_id),
         }
 
     except Exception as e:
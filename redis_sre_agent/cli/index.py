@@ -299,7 +299,41 @@ def index_sync_schemas(index_name: str, yes: bool, as_json: bool):
                 f"  - {name}: {info.get('action', 'unknown')} "
                 f"(previously {info.get('previous_status', 'unknown')})"
             )
+            if info.get("reencoded_vectors"):
+                console.print(f"    re-encoded vectors: {info['reencoded_vectors']}")
             if info.get("error"):
                 console.print(f"    error: {info['error']}")
 
     asyncio.run(_run())
+
+
+@index.command("backfill-chunk-registry")
+@click.option("--force", is_flag=True, help="Rebuild even for indices already backfilled")
+@click.option("--json", "as_json", is_flag=True, help="Output JSON")
+def index_backfill_chunk_registry(force: bool, as_json: bool):
+    """Build per-document chunk key sets so ingestion stops scanning the keyspace."""
+
+    async def _run():
+        from redis_sre_agent.core.migrations.chunk_registry import run_chunk_registry_backfill
+
+        console = Console()
+        summary = await run_chunk_registry_backfill(force=force, source="cli")
+
+        if as_json:
+            print(_json.dumps(summary.to_dict(), indent=2))
+            return
+
+        if summary.skipped_due_lock:
+            console.print("[yellow]Another backfill is running; skipped.[/yellow]")
+            return
+
+        for prefix, counts in summary.indices.items():
+            console.print(
+                f"  - {prefix}: {counts['chunks']} chunks across {counts['documents']} documents"
+            )
+        for prefix in summary.skipped_ready:
+            console.print(f"  - {prefix}: already backfilled")
+        for error in summary.errors:
+            console.print(f"[red]  error: {error}[/red]")
+
+    asyncio.run(_run())
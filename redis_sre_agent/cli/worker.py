@@ -167,6 +167,17 @@ def start(concurrency: int):
             # Continue anyway - some functionality may still work
         else:
             if indices_created:
+                try:
+                    from redis_sre_agent.core.migrations.chunk_registry import (
+                        run_chunk_registry_backfill,
+                    )
+
+                    backfill_summary = await run_chunk_registry_backfill(source="worker_startup")
+                    logger.info("Chunk registry backfill summary: %s", backfill_summary.to_dict())
+                except Exception as e:
+                    log_cli_exception(__name__, "worker CLI command failed", e)
+                    logger.warning("Chunk registry backfill failed (continuing): %s", e)
+
                 try:
                     auto_load_result = await auto_load_configured_knowledge_pack(settings)
                     logger.info("Knowledge-pack auto-load status: %s", auto_load_result)
@@ -175,6 +186,15 @@ def start(concurrency: int):
                     logger.error("Knowledge-pack auto-load failed: %s", e)
                     # Continue anyway - worker startup does not depend on the pack
 
+        if settings.embedding_prewarm:
+            try:
+                from redis_sre_agent.core.vectorizer_helpers import prewarm_vectorizer
+
+                await prewarm_vectorizer()
+                logger.info("✅ Vectorizer prewarmed")
+            except Exception as e:
+                logger.warning("Vectorizer prewarm failed (continuing): %s", e)
+
         # Run startup migration for legacy instance->cluster links (idempotent).
         try:
             from redis_sre_agent.core.migrations.instances_to_clusters import (
@@ -187,6 +207,17 @@ def start(concurrency: int):
             log_cli_exception(__name__, "worker CLI command failed", e)
             logger.warning("Instance-cluster startup migration failed (continuing): %s", e)
 
+        # Start MCP connection pool so agent turns in this worker reuse warm
+        # sessions instead of spawning MCP servers per ToolManager.
+        try:
+            from redis_sre_agent.tools.mcp.pool import MCPConnectionPool
+
+            mcp_status = await MCPConnectionPool.get_instance().start()
+            logger.info("MCP connection pool started: %s", mcp_status)
+        except Exception as e:
+            log_cli_exception(__name__, "worker CLI command failed", e)
+            logger.warning("MCP connection pool failed to start (continuing): %s", e)
+
         try:
             # Register tasks first (support both sync and async implementations)
             reg = register_sre_tasks()
@@ -207,6 +238,23 @@ def start(concurrency: int):
             log_cli_exception(__name__, "worker CLI command failed", e)
             logger.error(f"\u274c Worker error: {e}")
             raise
+        finally:
+            from redis_sre_agent.core.redis import close_redis_connections
+            from redis_sre_agent.tools.http import close_http_clients
+            from redis_sre_agent.tools.mcp.pool import MCPConnectionPool
+
+            try:
+                await MCPConnectionPool.get_instance().shutdown()
+            except Exception as e:
+                logger.warning(f"Error shutting down MCP pool: {e}")
+            try:
+                await close_redis_connections()
+            except Exception as e:
+                logger.warning(f"Error closing Redis connections: {e}")
+            try:
+                await close_http_clients()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP clients: {e}")
 
     try:
         asyncio.run(_worker())
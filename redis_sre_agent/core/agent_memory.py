@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import re
+import time
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, AsyncIterator, Dict, List, Optional
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional, Tuple
 
 from redis_sre_agent.core.config import settings
 from redis_sre_agent.core.progress import ProgressEmitter
@@ -18,6 +22,8 @@ logger = logging.getLogger(__name__)
 
 SKIP_MEMORY_USER_IDS = {"", "unknown", "system", "mcp-user", "scheduler"}
 
+ASSET_SEARCH_CACHE_MAX_ENTRIES = 256
+
 try:
     from agent_memory_client import MemoryAPIClient, MemoryClientConfig
     from agent_memory_client.exceptions import MemoryNotFoundError
@@ -79,6 +85,53 @@ Current datetime: {current_datetime}
 Conversation: {message}"""
 
 
+_QUERY_WORD = re.compile(r"[a-z][a-z_-]*")
+
+# Asset-scoped long-term search results keyed by (asset session id, query
+# bucket, limit). Scheduled runs against one asset fire bursts of near-identical
+# queries; asset memories are extracted asynchronously by AMS, so a short TTL
+# loses little freshness.
+_asset_search_cache: "OrderedDict[Tuple[str, str, int], Tuple[float, LongTermSearchResult]]" = (
+    OrderedDict()
+)
+
+
+def _query_bucket(query: str) -> str:
+    """Bucket queries that differ only in order, case, punctuation or numbers.
+
+    AMS embeds queries server-side, so the bucket is lexical: the sorted set of
+    alphabetic words. Timestamps and ids in templated scheduled prompts fall away.
+    """
+    words = sorted(set(_QUERY_WORD.findall(query.lower())))
+    return hashlib.sha1(" ".join(words).encode()).hexdigest()
+
+
+def _get_cached_asset_search(key: Tuple[str, str, int]) -> Optional["LongTermSearchResult"]:
+    entry = _asset_search_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, result = entry
+    if expires_at <= time.monotonic():
+        _asset_search_cache.pop(key, None)
+        return None
+    return result
+
+
+def _store_asset_search(key: Tuple[str, str, int], result: "LongTermSearchResult") -> None:
+    ttl = settings.agent_memory_asset_search_cache_ttl_seconds
+    if ttl <= 0:
+        return
+    _asset_search_cache[key] = (time.monotonic() + ttl, result)
+    _asset_search_cache.move_to_end(key)
+    while len(_asset_search_cache) > ASSET_SEARCH_CACHE_MAX_ENTRIES:
+        _asset_search_cache.popitem(last=False)
+
+
+def clear_asset_search_cache() -> None:
+    """Drop all cached asset-scoped long-term search results."""
+    _asset_search_cache.clear()
+
+
 @dataclass
 class TurnMemoryContext:
     """Prepared memory context for a single agent turn."""
@@ -453,52 +506,137 @@ class AgentMemoryService:
 
         try:
             async with self.open_session() as session:
-                prompt_sections: List[tuple[str, Any, List[Any], bool]] = []
-                total_memories = 0
-                user_working_memory = None
-                asset_working_memory = None
-                created_any = False
                 limit = settings.agent_memory_retrieval_limit
+                deadline = settings.agent_memory_turn_deadline_seconds
+                timings: Dict[str, float] = {}
+
+                async def _timed(stage: str, awaitable: Awaitable[Any]) -> Any:
+                    started = time.monotonic()
+                    try:
+                        return await awaitable
+                    finally:
+                        timings[stage] = round((time.monotonic() - started) * 1000, 1)
+
+                cache_key: Optional[Tuple[str, str, int]] = None
+                cached_asset_search: Optional[LongTermSearchResult] = None
+                if asset_scope:
+                    cache_key = (
+                        self._asset_session_id(instance_id=instance_id, cluster_id=cluster_id)
+                        or "",
+                        _query_bucket(query),
+                        limit,
+                    )
+                    cached_asset_search = _get_cached_asset_search(cache_key)
 
+                # The four AMS reads are independent; issue them together and
+                # bound the wait so a slow AMS cannot hold up the first LLM call.
+                calls: Dict[str, Awaitable[Any]] = {}
                 if user_scope:
-                    user_wm = await session.get_user_working_memory(
+                    calls["user_working_memory"] = session.get_user_working_memory(
                         session_id=session_id,
                         user_id=user_id,
                         create_if_missing=True,
                     )
-                    user_working_memory = user_wm.memory
-                    created_any = created_any or user_wm.created
-                    user_search = await session.search_user_long_term(
+                    calls["user_long_term"] = session.search_user_long_term(
                         query=query,
                         user_id=user_id,
                         limit=limit,
                     )
-                    prompt_sections.append(
-                        ("User-scoped memory", user_working_memory, user_search.memories, True)
-                    )
-                    total_memories += len(user_search.memories)
-
                 if asset_scope:
-                    asset_wm = await session.get_asset_working_memory(
+                    calls["asset_working_memory"] = session.get_asset_working_memory(
                         instance_id=instance_id,
                         cluster_id=cluster_id,
                         fallback_session_id=session_id,
                         create_if_missing=True,
                     )
-                    asset_working_memory = asset_wm.memory
-                    created_any = created_any or asset_wm.created
-                    asset_search = await session.search_asset_long_term(
-                        query=query,
-                        instance_id=instance_id,
-                        cluster_id=cluster_id,
-                        limit=limit,
-                        filter_preferences=True,
+                    if cached_asset_search is None:
+                        calls["asset_long_term"] = session.search_asset_long_term(
+                            query=query,
+                            instance_id=instance_id,
+                            cluster_id=cluster_id,
+                            limit=limit,
+                            filter_preferences=True,
+                        )
+
+                started = time.monotonic()
+                tasks = {
+                    stage: asyncio.create_task(_timed(stage, call)) for stage, call in calls.items()
+                }
+                try:
+                    _, pending = await asyncio.wait(tasks.values(), timeout=deadline)
+                finally:
+                    for task in tasks.values():
+                        task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                timings["total"] = round((time.monotonic() - started) * 1000, 1)
+
+                results: Dict[str, Any] = {}
+                timed_out: List[str] = []
+                failed: Dict[str, BaseException] = {}
+                for stage, task in tasks.items():
+                    if task in pending:
+                        timed_out.append(stage)
+                    elif task.exception() is not None:
+                        failed[stage] = task.exception()  # type: ignore[assignment]
+                    else:
+                        results[stage] = task.result()
+
+                if not results and cached_asset_search is None:
+                    if failed:
+                        raise next(iter(failed.values()))
+                    raise asyncio.TimeoutError(
+                        f"AMS retrieval did not finish within {deadline}s deadline"
+                    )
+                for stage, error in failed.items():
+                    logger.warning(
+                        "AMS %s retrieval failed for session %s: %s", stage, session_id, error
+                    )
+                if timed_out:
+                    logger.warning(
+                        "AMS retrieval for session %s exceeded %ss deadline: %s",
+                        session_id,
+                        deadline,
+                        ", ".join(timed_out),
+                    )
+
+                asset_search = cached_asset_search or results.get("asset_long_term")
+                if cache_key is not None and "asset_long_term" in results:
+                    _store_asset_search(cache_key, results["asset_long_term"])
+
+                prompt_sections: List[tuple[str, Any, List[Any], bool]] = []
+                total_memories = 0
+                created_any = False
+                user_working_memory = None
+                asset_working_memory = None
+
+                if user_scope:
+                    user_wm = results.get("user_working_memory")
+                    if user_wm is not None:
+                        user_working_memory = user_wm.memory
+                        created_any = created_any or user_wm.created
+                    user_search = results.get("user_long_term")
+                    user_memories = user_search.memories if user_search is not None else []
+                    prompt_sections.append(
+                        ("User-scoped memory", user_working_memory, user_memories, True)
                     )
+                    total_memories += len(user_memories)
+
+                if asset_scope:
+                    asset_wm = results.get("asset_working_memory")
+                    if asset_wm is not None:
+                        asset_working_memory = asset_wm.memory
+                        created_any = created_any or asset_wm.created
+                    asset_memories = asset_search.memories if asset_search is not None else []
                     prompt_sections.append(
-                        ("Asset-scoped memory", asset_working_memory, asset_search.memories, False)
+                        ("Asset-scoped memory", asset_working_memory, asset_memories, False)
                     )
-                    total_memories += len(asset_search.memories)
+                    total_memories += len(asset_memories)
 
+                partial = bool(timed_out or failed)
+                if partial:
+                    status = "partial"
+                else:
+                    status = "created" if created_any else "loaded"
                 await self._emit(
                     emitter,
                     (
@@ -508,11 +646,15 @@ class AgentMemoryService:
                     ),
                     "memory_context",
                     {
-                        "status": "created" if created_any else "loaded",
+                        "status": status,
                         "long_term_count": total_memories,
                         "user_scope": user_scope,
                         "asset_scope": asset_scope,
                         "session_id": session_id,
+                        "timings_ms": timings,
+                        "timed_out": timed_out,
+                        "failed": sorted(failed),
+                        "asset_long_term_cached": cached_asset_search is not None,
                     },
                 )
                 return TurnMemoryContext(
@@ -520,7 +662,12 @@ class AgentMemoryService:
                     user_working_memory=user_working_memory,
                     asset_working_memory=asset_working_memory,
                     long_term_count=total_memories,
-                    status="loaded",
+                    status="partial" if partial else "loaded",
+                    error=(
+                        "incomplete AMS retrieval: " + ", ".join(timed_out + sorted(failed))
+                        if partial
+                        else None
+                    ),
                 )
         except Exception as exc:
             logger.warning("AMS retrieval failed for session %s: %s", session_id, exc)
@@ -42,6 +42,7 @@ CLI_TO_MCP_TOOL_NAMES = {
     "cluster get": "redis_sre_get_cluster",
     "cluster list": "redis_sre_list_clusters",
     "cluster update": "redis_sre_update_cluster",
+    "index backfill-chunk-registry": "redis_sre_backfill_chunk_registry",
     "index list": "redis_sre_list_indices",
     "index recreate": "redis_sre_recreate_indices",
     "index schema-status": "redis_sre_get_index_schema_status",
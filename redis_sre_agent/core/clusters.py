@@ -18,6 +18,7 @@ from redisvl.query import CountQuery, FilterQuery
 from redisvl.query.filter import Tag
 
 from .encryption import encrypt_secret, get_secret_value
+from .keys import RedisKeys
 from .redis import SRE_CLUSTERS_INDEX, get_clusters_index, get_redis_client
 from .redisearch import tag_contains_expression
 
@@ -339,6 +340,8 @@ async def delete_cluster_index_doc(cluster_id: str) -> None:
     try:
         client = get_redis_client()
         await client.delete(f"{SRE_CLUSTERS_INDEX}:{cluster_id}")
+        # Invalidate in-process target indexes in every worker.
+        await client.incr(RedisKeys.target_catalog_generation())
     except Exception:
         return
 
@@ -319,6 +319,18 @@ class Settings(BaseSettings):
         default=12,
         description="Maximum recent working-memory messages to retain per session update.",
     )
+    agent_memory_turn_deadline_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        description="Deadline for loading AMS memory context before a turn. Retrieval calls "
+        "that have not finished by then are cancelled and the turn proceeds with partial context.",
+    )
+    agent_memory_asset_search_cache_ttl_seconds: float = Field(
+        default=60.0,
+        ge=0,
+        description="How long asset-scoped long-term search results are reused for similar "
+        "queries against the same instance or cluster. 0 disables the cache.",
+    )
     agent_memory_working_ttl_seconds: Optional[int] = Field(
         default=None,
         description="Optional TTL for AMS working memory sessions. None keeps sessions persistent.",
@@ -365,10 +377,70 @@ class Settings(BaseSettings):
             "OpenAI text-embedding-3-small=1536, all-MiniLM-L6-v2=384, all-mpnet-base-v2=768"
         ),
     )
+    vector_index_algorithm: Literal["flat", "hnsw", "svs-vamana"] = Field(
+        default="flat",
+        description=(
+            "Vector index algorithm for the knowledge, skills and support-ticket indices: "
+            "'flat' (exact brute-force), 'hnsw' or 'svs-vamana' (approximate, requires "
+            "Redis 8.2+). Run `redis-sre-agent index sync-schemas` after changing it."
+        ),
+    )
+    vector_hnsw_m: int = Field(
+        default=16,
+        ge=2,
+        description="HNSW M: maximum outgoing edges per node in each graph layer.",
+    )
+    vector_hnsw_ef_construction: int = Field(
+        default=200,
+        ge=1,
+        description="HNSW EF_CONSTRUCTION: candidate list size while building the graph.",
+    )
+    vector_hnsw_ef_runtime: int = Field(
+        default=10,
+        ge=1,
+        description="HNSW EF_RUNTIME: default candidate list size for KNN queries.",
+    )
+    vector_datatype: Literal["float32", "float16"] = Field(
+        default="float32",
+        description=(
+            "Datatype used to store and query document vectors. 'float16' halves vector "
+            "memory; schema sync re-encodes stored vectors when it changes. Custom "
+            "VECTORIZER_FACTORY implementations should embed with this dtype."
+        ),
+    )
     embeddings_cache_ttl: Optional[int] = Field(
         default=86400 * 7,  # 7 days
         description="TTL in seconds for cached embeddings. None means no expiration.",
     )
+    embedding_prewarm: bool = Field(
+        default=False,
+        description=(
+            "Load the configured vectorizer and run one embedding during API and "
+            "worker startup so the first knowledge search does not pay model load time."
+        ),
+    )
+    ingestion_concurrency: int = Field(
+        default=10,
+        ge=1,
+        description="Documents indexed concurrently per category during batch ingestion.",
+    )
+    embedding_batch_size: int = Field(
+        default=256,
+        ge=1,
+        description="Maximum texts per embedding call when ingestion batches chunks "
+        "across documents.",
+    )
+    embedding_batch_max_tokens: int = Field(
+        default=100_000,
+        ge=1,
+        description="Maximum estimated tokens (about 4 characters each) per ingestion "
+        "embedding call.",
+    )
+    embedding_batch_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum ingestion embedding calls in flight at once.",
+    )
     knowledge_pack_path: Optional[Path] = Field(
         default=None,
         description="Optional path to a release knowledge-pack zip file.",
@@ -412,6 +484,23 @@ class Settings(BaseSettings):
     task_timeout: int = Field(
         default=TWENTY_MINUTES_IN_SECONDS, description="Task timeout in seconds"
     )
+    task_update_flush_interval_ms: int = Field(
+        default=5,
+        ge=0,
+        description="Milliseconds to buffer task progress updates so concurrent updates share "
+        "one pipelined Redis write. 0 flushes each update immediately.",
+    )
+    scheduler_claim_batch_size: int = Field(
+        default=500,
+        ge=1,
+        description="Due schedules claimed and rescheduled per Redis script call.",
+    )
+    scheduler_submit_concurrency: int = Field(
+        default=16,
+        ge=1,
+        description="Claimed schedule runs whose threads and Docket tasks are created "
+        "concurrently.",
+    )
 
     # Agent
     max_iterations: int = Field(
@@ -439,6 +528,18 @@ class Settings(BaseSettings):
         default=100, description="LangGraph recursion limit for complex workflows"
     )
     tool_timeout: int = Field(default=60, description="Tool execution timeout")
+    tool_call_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum read-only tool calls executed concurrently across all agent turns "
+        "in the process. Set to 1 to run tool calls one at a time.",
+    )
+    tool_call_provider_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum concurrent read-only tool calls routed to the same provider "
+        "across all agent turns in the process.",
+    )
     agent_permission_mode: Literal["read_only", "read_write"] = Field(
         default="read_only",
         description="Global tool execution mode for HITL enforcement. "
@@ -458,6 +559,13 @@ class Settings(BaseSettings):
         default=60,
         description="Default TTL in seconds for cached tool outputs",
     )
+    tool_cache_lock_ttl: int = Field(
+        default=0,
+        ge=0,
+        description="Seconds to hold a Redis lock so only one process invokes a tool on a "
+        "shared cache miss while others wait for its result. 0 limits coalescing to "
+        "concurrent calls within one process.",
+    )
     tool_cache_ttl_overrides: Dict[str, int] = Field(
         default_factory=dict,
         description="Per-tool TTL overrides in seconds. Keys are matched against tool names. "
@@ -528,6 +636,43 @@ class Settings(BaseSettings):
         gt=0,
         description="Maximum characters to send through one PII remediation pass.",
     )
+    pii_remediation_batch_size: int = Field(
+        default=16,
+        gt=0,
+        description="Text chunks classified per PII model forward pass.",
+    )
+    pii_remediation_max_sequence_chars: int = Field(
+        default=2000,
+        gt=0,
+        description=(
+            "Longer text blocks are split into overlapping chunks of at most this many "
+            "characters before PII classification."
+        ),
+    )
+    pii_remediation_cache_enabled: bool = Field(
+        default=True,
+        description=(
+            "Cache PII span detections by content hash so unchanged text blocks are not "
+            "re-classified on every outbound LLM request."
+        ),
+    )
+    pii_remediation_cache_max_entries: int = Field(
+        default=4096,
+        gt=0,
+        description="Maximum text blocks kept in the in-process PII detection cache.",
+    )
+    pii_remediation_cache_ttl_seconds: int = Field(
+        default=3600,
+        gt=0,
+        description="Seconds a cached PII detection stays valid.",
+    )
+    pii_remediation_cache_redis_enabled: bool = Field(
+        default=False,
+        description=(
+            "Also share cached PII detections across processes through Redis. Entries are "
+            "encrypted with REDIS_SRE_MASTER_KEY and skipped if it is not configured."
+        ),
+    )
     pii_remediation_categories: List[str] = Field(
         default_factory=lambda: [
             "private_person",
@@ -606,6 +751,24 @@ class Settings(BaseSettings):
         "Example: {'memory': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-memory'], "
         "'tools': {'search_memories': {'capability': 'logs'}}}}",
     )
+    mcp_pool_sessions_per_server: int = Field(
+        default=2,
+        ge=1,
+        description="Sessions the MCP connection pool keeps open per server. "
+        "Tool calls are dispatched to the least-busy healthy session.",
+    )
+    mcp_pool_max_in_flight_per_session: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum concurrent tool calls on one pooled MCP session; "
+        "further calls wait for a free slot.",
+    )
+    mcp_pool_health_check_interval: float = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds between MCP pool health checks (ping and reconnect of "
+        "unhealthy sessions). 0 disables the background health check.",
+    )
 
     # Skill backend configuration
     skill_roots: List[str] = Field(
@@ -8,9 +8,15 @@ import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from redis_sre_agent.core.config import settings
+from redis_sre_agent.core.pii_detection_cache import (
+    CachedSpan,
+    PIIDetectionCache,
+    detector_fingerprint,
+    text_digest,
+)
 from redis_sre_agent.core.pii_remediation import (
     PIIFinding,
     PIIRemediationDecision,
@@ -19,9 +25,16 @@ from redis_sre_agent.core.pii_remediation import (
     PIIRemediationResult,
     PIITextBlock,
 )
+from redis_sre_agent.observability.pii_remediation_metrics import (
+    record_pii_detection_cache_lookups,
+)
 
 logger = logging.getLogger(__name__)
 
+# Characters shared by neighbouring chunks of a long block so entities that
+# straddle a chunk boundary are still seen whole by one chunk.
+_CHUNK_OVERLAP_CHARS = 128
+
 
 @dataclass(frozen=True)
 class _SpanDetection:
@@ -44,6 +57,33 @@ def _normalize_category(raw: Optional[str]) -> str:
     return value.lower()
 
 
+def _chunk_text(text: str, max_chars: int) -> List[Tuple[int, str]]:
+    """Split text into ``(offset, chunk)`` pieces of at most ``max_chars``.
+
+    Consecutive chunks overlap by up to ``_CHUNK_OVERLAP_CHARS`` and break on
+    whitespace where possible so words are not split.
+    """
+    if len(text) <= max_chars:
+        return [(0, text)]
+
+    overlap = min(_CHUNK_OVERLAP_CHARS, max_chars // 4)
+    chunks: List[Tuple[int, str]] = []
+    start = 0
+    while start < len(text):
+        end = min(start + max_chars, len(text))
+        if end < len(text):
+            split = text.rfind(" ", start + max_chars // 2, end)
+            if split > start:
+                end = split
+        chunks.append((start, text[start:end]))
+        if end >= len(text):
+            break
+        next_start = max(end - overlap, start + 1)
+        space = text.find(" ", next_start, end)
+        start = space + 1 if space != -1 else next_start
+    return chunks
+
+
 class DefaultPrivacyFilterPIIRemediator:
     """Default implementation using a local token-classification pipeline."""
 
@@ -54,12 +94,26 @@ class DefaultPrivacyFilterPIIRemediator:
         *,
         model_name: Optional[str] = None,
         categories: Optional[Sequence[str]] = None,
+        batch_size: Optional[int] = None,
+        max_sequence_chars: Optional[int] = None,
     ) -> None:
         self.model_name = model_name or settings.pii_remediation_model
+        self.batch_size = batch_size or settings.pii_remediation_batch_size
+        self.max_sequence_chars = max_sequence_chars or settings.pii_remediation_max_sequence_chars
         category_source = settings.pii_remediation_categories if categories is None else categories
         self.categories = {
             normalized for item in category_source if (normalized := _normalize_category(item))
         }
+        self._detection_cache: Optional[PIIDetectionCache] = None
+        if settings.pii_remediation_cache_enabled:
+            self._detection_cache = PIIDetectionCache(
+                fingerprint=detector_fingerprint(
+                    self.model_name, self.categories, self.max_sequence_chars
+                ),
+                max_entries=settings.pii_remediation_cache_max_entries,
+                ttl_seconds=settings.pii_remediation_cache_ttl_seconds,
+                redis_enabled=settings.pii_remediation_cache_redis_enabled,
+            )
         self._pipeline: Any = None
         self._pipeline_lock = threading.RLock()
         self._executor: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(
@@ -88,14 +142,40 @@ class DefaultPrivacyFilterPIIRemediator:
             return self._pipeline
 
     def _detect_spans(self, text: str) -> List[_SpanDetection]:
-        if not text:
-            return []
+        return self._detect_spans_batch([text])[0]
+
+    def _detect_spans_batch(self, texts: Sequence[str]) -> List[List[_SpanDetection]]:
+        """Classify all texts in as few pipeline calls as possible.
+
+        Long texts are chunked to ``max_sequence_chars``; chunks from every
+        text are classified together ``batch_size`` at a time and the spans
+        are mapped back to offsets in their source text.
+        """
+        chunks: List[Tuple[int, int, str]] = []
+        for index, text in enumerate(texts):
+            if text:
+                chunks.extend(
+                    (index, offset, chunk)
+                    for offset, chunk in _chunk_text(text, self.max_sequence_chars)
+                )
 
-        with self._pipeline_lock:
-            classifier = self._get_pipeline()
-            raw_results = classifier(text)
-        detections: List[_SpanDetection] = []
+        detections: List[List[_SpanDetection]] = [[] for _ in texts]
+        for batch_start in range(0, len(chunks), self.batch_size):
+            batch = chunks[batch_start : batch_start + self.batch_size]
+            with self._pipeline_lock:
+                classifier = self._get_pipeline()
+                raw_batch = classifier([chunk for _, _, chunk in batch], batch_size=len(batch))
+            for (index, offset, _), raw_results in zip(batch, raw_batch or []):
+                detections[index].extend(self._to_spans(texts[index], offset, raw_results))
+
+        # Prefer the widest same-start span so overlap filtering does not keep
+        # a shorter prefix and leave the longer sensitive suffix exposed.
+        for spans in detections:
+            spans.sort(key=lambda span: (span.start, -span.end))
+        return [self._dedupe_overlaps(spans) for spans in detections]
 
+    def _to_spans(self, text: str, offset: int, raw_results: Any) -> List[_SpanDetection]:
+        spans: List[_SpanDetection] = []
         for item in raw_results or []:
             category = _normalize_category(
                 item.get("entity_group") or item.get("entity") or item.get("label")
@@ -106,11 +186,11 @@ class DefaultPrivacyFilterPIIRemediator:
             end = item.get("end")
             if start is None or end is None:
                 continue
-            start_i = int(start)
-            end_i = int(end)
-            if start_i < 0 or end_i <= start_i or end_i > len(text):
+            start_i = int(start) + offset
+            end_i = int(end) + offset
+            if start_i < offset or end_i <= start_i or end_i > len(text):
                 continue
-            detections.append(
+            spans.append(
                 _SpanDetection(
                     category=category,
                     start=start_i,
@@ -120,11 +200,56 @@ class DefaultPrivacyFilterPIIRemediator:
                     raw_entity=item.get("entity_group") or item.get("entity") or item.get("label"),
                 )
             )
+        return spans
 
-        # Prefer the widest same-start span so overlap filtering does not keep
-        # a shorter prefix and leave the longer sensitive suffix exposed.
-        detections.sort(key=lambda span: (span.start, -span.end))
-        return self._dedupe_overlaps(detections)
+    async def _detect_spans_cached(
+        self, texts: Sequence[str], executor: ThreadPoolExecutor
+    ) -> List[List[_SpanDetection]]:
+        """Detect spans, classifying only blocks missing from the detection cache."""
+        loop = asyncio.get_running_loop()
+        cache = self._detection_cache
+        if cache is None:
+            return await loop.run_in_executor(executor, self._detect_spans_batch, list(texts))
+
+        digests = [text_digest(text) if text else "" for text in texts]
+        text_by_digest = {digest: text for digest, text in zip(digests, texts) if digest}
+        cached = await cache.get_many(list(text_by_digest))
+        misses = [digest for digest in text_by_digest if digest not in cached]
+        record_pii_detection_cache_lookups(hits=len(cached), misses=len(misses))
+
+        if misses:
+            detected = await loop.run_in_executor(
+                executor,
+                self._detect_spans_batch,
+                [text_by_digest[digest] for digest in misses],
+            )
+            fresh: Dict[str, List[CachedSpan]] = {
+                digest: [
+                    (span.category, span.start, span.end, span.confidence, span.raw_entity)
+                    for span in spans
+                ]
+                for digest, spans in zip(misses, detected)
+            }
+            await cache.set_many(fresh)
+            cached.update(fresh)
+
+        return [
+            [
+                _SpanDetection(
+                    category=category,
+                    start=start,
+                    end=end,
+                    text=text[start:end],
+                    confidence=confidence,
+                    raw_entity=raw_entity,
+                )
+                for category, start, end, confidence, raw_entity in cached[digest]
+                if 0 <= start < end <= len(text)
+            ]
+            if digest
+            else []
+            for text, digest in zip(texts, digests)
+        ]
 
     @staticmethod
     def _dedupe_overlaps(detections: Iterable[_SpanDetection]) -> List[_SpanDetection]:
@@ -187,17 +312,14 @@ class DefaultPrivacyFilterPIIRemediator:
         start = time.perf_counter()
         spans_by_block: Dict[str, List[_SpanDetection]] = {}
         findings: List[PIIFinding] = []
-        loop = asyncio.get_running_loop()
         executor = self._executor
         if executor is None:
             raise RuntimeError("PII remediator has been shut down")
 
-        for block in request.blocks:
-            spans = await loop.run_in_executor(
-                executor,
-                self._detect_spans,
-                block.text or "",
-            )
+        block_spans = await self._detect_spans_cached(
+            [block.text or "" for block in request.blocks], executor
+        )
+        for block, spans in zip(request.blocks, block_spans):
             spans_by_block[block.block_id] = spans
             for span in spans:
                 findings.append(
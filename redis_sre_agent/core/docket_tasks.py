@@ -1343,6 +1343,8 @@ async def embed_qa_record(
     Returns:
         Dictionary with status and qa_id
     """
+    from redisvl.redis.utils import array_to_buffer
+
     from redis_sre_agent.core.qa import QAManager
     from redis_sre_agent.core.redis import get_vectorizer
 
@@ -1355,10 +1357,11 @@ async def embed_qa_record(
             logger.warning(f"Q&A record {qa_id} not found for embedding")
             return {"status": "error", "error": f"Q&A record {qa_id} not found", "qa_id": qa_id}
 
-        # Generate embeddings
+        # Generate embeddings. The Q&A index always stores float32 vectors,
+        # independent of the document indices' VECTOR_DATATYPE.
         vectorizer = get_vectorizer()
-        question_vector = await vectorizer.aembed(qa.question, as_buffer=True)
-        answer_vector = await vectorizer.aembed(qa.answer, as_buffer=True)
+        question_vector = array_to_buffer(await vectorizer.aembed(qa.question), "float32")
+        answer_vector = array_to_buffer(await vectorizer.aembed(qa.answer), "float32")
 
         # Update the record with vectors
         await qa_manager.update_vectors(
@@ -1783,9 +1786,60 @@ async def process_pipeline_operation(
         raise
 
 
+# How often the perpetual scheduler runs, and how far past the next run it
+# claims work. Claimed runs are handed to Docket for their exact due time, so
+# dispatch precision does not depend on this interval.
+SCHEDULER_INTERVAL = timedelta(seconds=30)
+SCHEDULER_CLAIM_SLACK = timedelta(seconds=5)
+
+
+async def _submit_scheduled_run(
+    docket: Docket,
+    thread_manager: ThreadManager,
+    run: Dict[str, Any],
+) -> Optional[str]:
+    """Create the thread for one claimed schedule run and submit it to Docket."""
+    schedule_id = run["id"]
+    scheduled_time: datetime = run["scheduled_at"]
+
+    # Prepare context for the scheduled run
+    run_context = {
+        "schedule_id": schedule_id,
+        "schedule_name": run["name"],
+        "automated": True,
+        "original_query": run["instructions"],
+        "scheduled_at": scheduled_time.isoformat(),
+    }
+    if run.get("redis_instance_id"):
+        run_context["instance_id"] = run["redis_instance_id"]
+
+    thread_id = await thread_manager.create_thread(
+        user_id="scheduler",
+        session_id=f"schedule_{schedule_id}_{scheduled_time.strftime('%Y%m%d_%H%M')}",
+        initial_context=run_context,
+        tags=["automated", "scheduled"],
+    )
+    # Set subject for scheduled tasks to the schedule name for clarity
+    await thread_manager.set_thread_subject(thread_id, run["name"])
+
+    # The claim already guarantees a single owner per run; the Docket key
+    # additionally makes a resubmission of the same slot a no-op.
+    task_key = f"schedule_{schedule_id}_{scheduled_time.strftime('%Y%m%d_%H%M%S')}"
+    task_func = docket.add(process_agent_turn, when=scheduled_time, key=task_key)
+    agent_task_id = await task_func(
+        thread_id=thread_id,
+        message=run["instructions"],
+        context=run_context,
+    )
+    logger.info(
+        f"Submitted agent task {agent_task_id} for schedule {schedule_id} at {scheduled_time} with key {task_key}"
+    )
+    return agent_task_id
+
+
 @sre_task
 async def scheduler_task(
-    perpetual: Perpetual = Perpetual(every=timedelta(seconds=30), automatic=True),
+    perpetual: Perpetual = Perpetual(every=SCHEDULER_INTERVAL, automatic=True),
     concurrency: ConcurrencyLimit = ConcurrencyLimit(max_concurrent=1),
     retry: Retry = Retry(attempts=3, delay=timedelta(seconds=5)),
 ) -> Dict[str, Any]:
@@ -1799,139 +1853,75 @@ async def scheduler_task(
     preventing multiple workers or rapid rescheduling from creating duplicates.
 
     This task:
-    1. Queries Redis for schedules that need to run based on current time
-    2. Submits tasks to Docket with deduplication keys
-    3. Updates schedule next_run_at times
+    1. Atomically claims schedules due before the next scheduler run from the
+       due set and advances each to its next slot
+    2. Submits the claimed runs to Docket for their exact due time, with
+       deduplication keys
     """
     try:
         logger.info("Running scheduler task")
         current_time = datetime.now(timezone.utc)
 
-        # Import schedule storage functions
         from ..core.schedules import (
-            find_schedules_needing_runs,
-            update_schedule_last_run,
-            update_schedule_next_run,
+            claim_due_schedules,
+            ensure_schedule_due_index,
+            release_schedule_claims,
         )
 
-        # Find schedules that need runs
-        schedules_needing_runs = await find_schedules_needing_runs(current_time)
-        logger.info(f"Found {len(schedules_needing_runs)} schedules needing runs")
-
-        if not schedules_needing_runs:
-            logger.debug("No schedules need runs at this time")
-            return {
-                "task_id": str(ULID()),
-                "submitted_tasks": 0,
-                "timestamp": current_time.isoformat(),
-                "status": "completed",
-            }
-
-        submitted_tasks = 0
+        await ensure_schedule_due_index()
 
-        # Get Docket instance
+        # Connect to Docket before claiming so a connection failure cannot
+        # leave runs claimed but never submitted.
         async with Docket(url=await get_redis_url(), name="sre_docket") as docket:
-            for schedule in schedules_needing_runs:
-                try:
-                    schedule_id = schedule["id"]
-
-                    # Calculate when this task should actually run
-                    # Use the next_run_at time from the schedule
-                    if schedule.get("next_run_at"):
-                        scheduled_time = datetime.fromisoformat(
-                            schedule["next_run_at"].replace("Z", "+00:00")
-                        )
-                    else:
-                        # Fallback to current time if no next_run_at
-                        scheduled_time = current_time
-
-                    # Create a thread for this scheduled task
-                    redis_client = get_redis_client()
-                    thread_manager = ThreadManager(redis_client=redis_client)
-
-                    # Prepare context for the scheduled run
-                    run_context = {
-                        "schedule_id": schedule_id,
-                        "schedule_name": schedule["name"],
-                        "automated": True,
-                        "original_query": schedule["instructions"],
-                        "scheduled_at": scheduled_time.isoformat(),
-                    }
-
-                    if schedule.get("redis_instance_id"):
-                        run_context["instance_id"] = schedule["redis_instance_id"]
-
-                    # Create thread for the scheduled run
-                    thread_id = await thread_manager.create_thread(
-                        user_id="scheduler",
-                        session_id=f"schedule_{schedule_id}_{scheduled_time.strftime('%Y%m%d_%H%M')}",
-                        initial_context=run_context,
-                        tags=["automated", "scheduled"],
-                    )
-
-                    # Set subject for scheduled tasks to the schedule name for clarity
-                    await thread_manager.set_thread_subject(thread_id, schedule["name"])
-
-                    # Create a unique deduplication key for this schedule + time slot
-                    # This ensures we don't create duplicate tasks for the same schedule at the same time
-                    time_slot = scheduled_time.strftime("%Y%m%d_%H%M")  # Round to minute precision
-                    task_key = f"schedule_{schedule_id}_{time_slot}"
-
-                    # Use Redis-based deduplication to prevent race conditions
-                    redis_client = await get_redis_client()
-                    dedup_key = f"sre_task_dedup:{task_key}"
+            claimed_runs = await claim_due_schedules(
+                current_time + SCHEDULER_INTERVAL + SCHEDULER_CLAIM_SLACK,
+                current_time=current_time,
+                batch_size=settings.scheduler_claim_batch_size,
+            )
+            logger.info(f"Claimed {len(claimed_runs)} scheduled runs")
+
+            if not claimed_runs:
+                logger.debug("No schedules need runs at this time")
+                return {
+                    "task_id": str(ULID()),
+                    "submitted_tasks": 0,
+                    "timestamp": current_time.isoformat(),
+                    "status": "completed",
+                }
 
-                    # Try to set the deduplication key with expiration (5 minutes)
-                    # This will only succeed if the key doesn't already exist
-                    task_submitted = await redis_client.set(dedup_key, "submitted", ex=300, nx=True)
+            thread_manager = ThreadManager(redis_client=get_redis_client())
+            semaphore = asyncio.Semaphore(settings.scheduler_submit_concurrency)
 
-                    if task_submitted:
-                        # We successfully claimed this task slot, submit to Docket
-                        task_func = docket.add(
-                            process_agent_turn, when=scheduled_time, key=task_key
-                        )
-                        agent_task_id = await task_func(
-                            thread_id=thread_id,
-                            message=schedule["instructions"],
-                            context=run_context,
-                        )
-                        logger.info(
-                            f"Submitted agent task {agent_task_id} for schedule {schedule_id} at {scheduled_time} with key {task_key}"
-                        )
-                        submitted_tasks += 1
-                    else:
-                        # Another scheduler task already submitted this task
-                        logger.debug(
-                            f"Agent task for schedule {schedule_id} at {scheduled_time} already submitted by another scheduler (key: {task_key})"
+            async def _submit(run: Dict[str, Any]) -> bool:
+                async with semaphore:
+                    try:
+                        await _submit_scheduled_run(docket, thread_manager, run)
+                        return True
+                    except Exception as e:
+                        logger.error(
+                            f"Failed to submit run of schedule {run['id']} at {run['scheduled_at']}: {e}"
                         )
+                        return False
 
-                    # Update last run time for both successful and skipped tasks
-                    await update_schedule_last_run(schedule_id, scheduled_time)
+            outcomes = await asyncio.gather(*(_submit(run) for run in claimed_runs))
 
-                except Exception as e:
-                    logger.error(f"Failed to process schedule {schedule_id}: {e}")
-
-                # Calculate and update next run time regardless of success/failure
-                try:
-                    from ..core.schedules import Schedule
-
-                    schedule_obj = Schedule(**schedule)
-                    next_run = schedule_obj.calculate_next_run()
-                    await update_schedule_next_run(schedule_id, next_run)
-                    logger.debug(f"Updated next run time for schedule {schedule_id} to {next_run}")
-                except Exception as e:
-                    logger.error(f"Failed to update next run time for schedule {schedule_id}: {e}")
+        # Hand failed runs back to the due set so the next pass retries them
+        failed_runs = [run for run, ok in zip(claimed_runs, outcomes) if not ok]
+        if failed_runs:
+            await release_schedule_claims(failed_runs)
+            logger.warning(f"Released {len(failed_runs)} unsubmitted runs back to the due set")
 
+        submitted_tasks = sum(1 for ok in outcomes if ok)
         result = {
             "task_id": str(ULID()),
-            "processed_schedules": len(schedules_needing_runs),
+            "processed_schedules": len(claimed_runs),
             "submitted_tasks": submitted_tasks,
             "timestamp": current_time.isoformat(),
             "status": "completed",
         }
 
         logger.info(
-            f"Scheduler task completed: processed {len(schedules_needing_runs)} schedules, submitted {submitted_tasks} tasks"
+            f"Scheduler task completed: processed {len(claimed_runs)} schedules, submitted {submitted_tasks} tasks"
         )
 
         # Note: With automatic=True, Docket will automatically reschedule this task
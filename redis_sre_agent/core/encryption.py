@@ -13,9 +13,12 @@ import base64
 import json
 import logging
 import os
+from functools import lru_cache
+from typing import Any, Optional
 
 from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from pydantic import SecretStr
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +49,12 @@ def _get_master_key() -> bytes:
             "Generate one with: python -c 'import os, base64; print(base64.b64encode(os.urandom(32)).decode())'"
         )
 
+    return _decode_master_key(master_key_b64)
+
+
+@lru_cache(maxsize=4)
+def _decode_master_key(master_key_b64: str) -> bytes:
+    """Decode and validate a master key; cached per value so rotation still applies."""
     try:
         master_key = base64.b64decode(master_key_b64)
         if len(master_key) != 32:
@@ -244,3 +253,45 @@ def get_secret_value(data: str) -> str:
             f"Secret is stored in plaintext (length: {len(data)}), consider migrating to encrypted"
         )
         return data
+
+
+class EncryptedSecretStr(SecretStr):
+    """SecretStr over stored secret data, decrypted on first use and then cached.
+
+    Loading an instance no longer pays for envelope decryption of secrets that
+    are never used; the plaintext is computed once per object by
+    ``get_secret_value`` and shared by every later caller (and model copies).
+    """
+
+    def __init__(self, stored_value: str) -> None:
+        self._stored_value = stored_value
+        self._plaintext: Optional[str] = None
+
+    @property
+    def stored_value(self) -> str:
+        """The secret exactly as persisted (normally an encrypted envelope)."""
+        return self._stored_value
+
+    @property
+    def is_decrypted(self) -> bool:
+        return self._plaintext is not None
+
+    def get_secret_value(self) -> str:
+        if self._plaintext is None:
+            self._plaintext = get_secret_value(self._stored_value)
+        return self._plaintext
+
+    def __bool__(self) -> bool:
+        return bool(self._stored_value)
+
+    def __len__(self) -> int:
+        return len(self.get_secret_value())
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, SecretStr) and self.get_secret_value() == other.get_secret_value()
+
+    def __hash__(self) -> int:
+        return hash(self.get_secret_value())
+
+    def _display(self) -> str:
+        return "**********" if self._stored_value else ""
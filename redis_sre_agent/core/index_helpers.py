@@ -130,3 +130,11 @@ async def sync_index_schemas_helper(
             "index_name": normalized_index_name or "all",
         }
     return await sync_index_schemas(index_name=normalized_index_name, config=config)
+
+
+async def backfill_chunk_registry_helper(*, force: bool = False) -> Dict[str, Any]:
+    """Build per-document chunk registry sets for the document indices."""
+    from redis_sre_agent.core.migrations.chunk_registry import run_chunk_registry_backfill
+
+    summary = await run_chunk_registry_backfill(force=force, source="mcp")
+    return {"success": not summary.errors, **summary.to_dict()}
@@ -9,7 +9,8 @@ from __future__ import annotations
 
 import json
 import logging
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Annotated, Any, Dict, List, Optional
@@ -19,12 +20,18 @@ from redisvl.query import CountQuery, FilterQuery
 from redisvl.query.filter import Tag
 from ulid import ULID
 
-from .encryption import encrypt_secret, get_secret_value
+from .encryption import (
+    EncryptedSecretStr,
+    encrypt_secret,
+    get_secret_value,  # noqa: F401  # Expose for tests that patch via this module path
+    is_encrypted,
+)
 from .keys import RedisKeys
 from .redis import (
     SRE_INSTANCES_INDEX,
     get_instances_index,
     get_redis_client,  # noqa: F401  # Expose for tests that patch via this module path
+    parse_generation,
 )
 from .redisearch import tag_contains_expression
 
@@ -191,6 +198,9 @@ class RedisInstance(BaseModel):
     @classmethod
     def validate_not_app_redis(cls, v: SecretStr) -> SecretStr:
         """Ensure this is not the application's own Redis database."""
+        if isinstance(v, EncryptedSecretStr) and not v.is_decrypted:
+            # Stored secrets were checked when written; don't decrypt just to load.
+            return v
         try:
             from redis_sre_agent.core.config import settings
 
@@ -224,14 +234,12 @@ class RedisInstance(BaseModel):
         if isinstance(self.admin_username, str):
             admin_username = self.admin_username.strip()
             self.admin_username = admin_username or None
-        admin_password_value = (
-            self.admin_password.get_secret_value()
-            if isinstance(self.admin_password, SecretStr)
-            else None
-        )
         has_admin_url = bool(self.admin_url)
         has_admin_username = bool(self.admin_username)
-        has_admin_password = bool(admin_password_value)
+        # Truthiness of an EncryptedSecretStr checks the stored value without decrypting it.
+        has_admin_password = isinstance(self.admin_password, SecretStr) and bool(
+            self.admin_password
+        )
         has_any_admin_field = has_admin_url or has_admin_username or has_admin_password
         has_all_admin_fields = has_admin_url and has_admin_username and has_admin_password
         if has_any_admin_field and not has_all_admin_fields:
@@ -357,6 +365,84 @@ class RedisInstance(BaseModel):
             return None
 
 
+_INSTANCE_SECRET_FIELDS = ("connection_url", "admin_password")
+# Backstop for writers that predate the generation counter.
+_INSTANCE_REGISTRY_TTL_SECONDS = 30.0
+
+
+def _instance_from_stored_data(inst_data: Dict[str, Any]) -> RedisInstance:
+    """Build an instance from its stored JSON, deferring secret decryption to first use."""
+    for secret_field in _INSTANCE_SECRET_FIELDS:
+        if inst_data.get(secret_field):
+            inst_data[secret_field] = EncryptedSecretStr(inst_data[secret_field])
+    return RedisInstance(**inst_data)
+
+
+@dataclass
+class _InstanceRegistry:
+    """Process-local copy of configured instances for one registry generation.
+
+    Instances are shared between callers: treat them as read-only and use
+    ``model_copy(update=...)`` to derive modified instances before saving.
+    """
+
+    generation: Optional[int] = None
+    loaded_at: float = 0.0
+    instances: List[RedisInstance] = field(default_factory=list)
+    by_id: Dict[str, RedisInstance] = field(default_factory=dict)
+
+    def is_current(self, generation: Optional[int]) -> bool:
+        return (
+            generation is not None
+            and self.generation == generation
+            and time.monotonic() - self.loaded_at < _INSTANCE_REGISTRY_TTL_SECONDS
+        )
+
+    def store(self, instances: List[RedisInstance], generation: Optional[int]) -> None:
+        self.instances = list(instances)
+        self.by_id = {instance.id: instance for instance in instances}
+        self.generation = generation
+        self.loaded_at = time.monotonic()
+
+    def clear(self) -> None:
+        self.store([], None)
+
+
+_instance_registry = _InstanceRegistry()
+
+
+def clear_instance_registry() -> None:
+    """Drop the process-local instance registry; the next read reloads from Redis."""
+    _instance_registry.clear()
+
+
+async def _read_instances_generation() -> Optional[int]:
+    """Return the shared instances generation, or None when it cannot be read."""
+    try:
+        raw = await get_redis_client().get(RedisKeys.instances_generation())
+    except Exception:
+        return None
+    if raw is None:
+        return 0
+    return parse_generation(raw)
+
+
+async def _bump_instances_generation(client: Any) -> None:
+    """Invalidate instance registries in every process after a write."""
+    _instance_registry.clear()
+    try:
+        await client.incr(RedisKeys.instances_generation())
+    except Exception:
+        logger.debug("Failed to bump instances generation", exc_info=True)
+
+
+async def _get_registered_instances() -> List[RedisInstance]:
+    generation = await _read_instances_generation()
+    if not _instance_registry.is_current(generation):
+        _instance_registry.store(await _load_instances_from_index(), generation)
+    return list(_instance_registry.instances)
+
+
 async def _load_instances_from_index() -> List[RedisInstance]:
     """Load configured instances directly from the instances search index."""
     await _ensure_instances_index_exists()
@@ -387,11 +473,7 @@ async def _load_instances_from_index() -> List[RedisInstance]:
             if isinstance(raw, bytes):
                 raw = raw.decode("utf-8")
             inst_data = json.loads(raw)
-            if inst_data.get("connection_url"):
-                inst_data["connection_url"] = get_secret_value(inst_data["connection_url"])
-            if inst_data.get("admin_password"):
-                inst_data["admin_password"] = get_secret_value(inst_data["admin_password"])
-            out.append(RedisInstance(**inst_data))
+            out.append(_instance_from_stored_data(inst_data))
         except Exception as e:
             logger.exception("Failed to load instance from search result: %s. Skipping.", e)
     return out
@@ -399,13 +481,17 @@ async def _load_instances_from_index() -> List[RedisInstance]:
 
 async def get_instances_strict() -> List[RedisInstance]:
     """Load configured instances and surface transport/index failures to callers."""
-    return await _load_instances_from_index()
+    return await _get_registered_instances()
 
 
 async def get_instances() -> List[RedisInstance]:
-    """Load configured instances using a single FT.SEARCH over the instances index."""
+    """Load configured instances using a single FT.SEARCH over the instances index.
+
+    Results are served from the process-local registry until the shared
+    instances generation changes (see ``save_instances``).
+    """
     try:
-        return await _load_instances_from_index()
+        return await _get_registered_instances()
     except Exception as e:
         logger.exception("Failed to get instances from Redis: %s", e)
         return []
@@ -516,11 +602,7 @@ async def query_instances(
                 if isinstance(raw, bytes):
                     raw = raw.decode("utf-8")
                 inst_data = json.loads(raw)
-                if inst_data.get("connection_url"):
-                    inst_data["connection_url"] = get_secret_value(inst_data["connection_url"])
-                if inst_data.get("admin_password"):
-                    inst_data["admin_password"] = get_secret_value(inst_data["admin_password"])
-                instances.append(RedisInstance(**inst_data))
+                instances.append(_instance_from_stored_data(inst_data))
             except Exception as e:
                 logger.exception("Failed to load instance from query result: %s. Skipping.", e)
 
@@ -568,12 +650,20 @@ async def _upsert_instance_index_doc(instance: "RedisInstance") -> bool:
         client = get_redis_client()
         key = f"{SRE_INSTANCES_INDEX}:{instance.id}"
 
-        # Serialize full instance data (with encrypted secrets) into 'data'
-        inst_dict = instance.model_dump(mode="json")
-        if inst_dict.get("connection_url"):
-            inst_dict["connection_url"] = encrypt_secret(inst_dict["connection_url"])
-        if inst_dict.get("admin_password"):
-            inst_dict["admin_password"] = encrypt_secret(inst_dict["admin_password"])
+        # Serialize full instance data (with encrypted secrets) into 'data'.
+        # Secrets loaded from storage keep their envelope instead of a decrypt/re-encrypt.
+        stored_secrets = {
+            secret_field: secret.stored_value
+            for secret_field in _INSTANCE_SECRET_FIELDS
+            if isinstance(secret := getattr(instance, secret_field), EncryptedSecretStr)
+            and is_encrypted(secret.stored_value)
+        }
+        inst_dict = instance.model_dump(mode="json", exclude=set(stored_secrets))
+        for secret_field in _INSTANCE_SECRET_FIELDS:
+            if secret_field in stored_secrets:
+                inst_dict[secret_field] = stored_secrets[secret_field]
+            elif inst_dict.get(secret_field):
+                inst_dict[secret_field] = encrypt_secret(inst_dict[secret_field])
 
         # Index timestamps (numeric) but keep ISO strings inside 'data'
         created_ts = _to_epoch(inst_dict.get("created_at"))
@@ -619,6 +709,9 @@ async def delete_instance_index_doc(instance_id: str) -> None:
     try:
         client = get_redis_client()
         await client.delete(f"{SRE_INSTANCES_INDEX}:{instance_id}")
+        await _bump_instances_generation(client)
+        # Invalidate in-process target indexes in every worker.
+        await client.incr(RedisKeys.target_catalog_generation())
     except Exception:
         return
 
@@ -693,6 +786,7 @@ async def save_instances(instances: List[RedisInstance]) -> bool:
                 await client.delete(f"{SRE_INSTANCES_INDEX}:{sid}")
             except Exception:
                 pass
+        await _bump_instances_generation(client)
 
         # Keep the unified discovery catalog in sync without changing the
         # authoritative instance index behavior.
@@ -721,11 +815,7 @@ async def get_session_instances(thread_id: str) -> List[RedisInstance]:
         data = json.loads(raw)
         out: List[RedisInstance] = []
         for inst_data in data:
-            if inst_data.get("connection_url"):
-                inst_data["connection_url"] = get_secret_value(inst_data["connection_url"])
-            if inst_data.get("admin_password"):
-                inst_data["admin_password"] = get_secret_value(inst_data["admin_password"])
-            out.append(RedisInstance(**inst_data))
+            out.append(_instance_from_stored_data(inst_data))
         return out
     except Exception as e:
         logger.exception("Failed to get session instances for %s: %s", thread_id, e)
@@ -769,8 +859,10 @@ async def get_all_instances(
     session_instances: List[RedisInstance] = []
     if thread_id:
         session_instances = await get_session_instances(thread_id)
-    urls = {i.connection_url.get_secret_value() for i in configured}
     out = list(configured)
+    if not session_instances:
+        return out
+    urls = {i.connection_url.get_secret_value() for i in configured}
     for s in session_instances:
         if s.connection_url.get_secret_value() not in urls:
             out.append(s)
@@ -826,6 +918,11 @@ async def get_instance_by_id(instance_id: str) -> Optional[RedisInstance]:
     as it does a direct HGETALL on the instance key instead of searching.
     """
     try:
+        if _instance_registry.generation is not None:
+            generation = await _read_instances_generation()
+            if _instance_registry.is_current(generation):
+                return _instance_registry.by_id.get(instance_id)
+
         client = get_redis_client()
         key = f"{SRE_INSTANCES_INDEX}:{instance_id}"
         data = await client.hget(key, "data")
@@ -836,13 +933,7 @@ async def get_instance_by_id(instance_id: str) -> Optional[RedisInstance]:
         if isinstance(data, bytes):
             data = data.decode("utf-8")
 
-        inst_data = json.loads(data)
-        if inst_data.get("connection_url"):
-            inst_data["connection_url"] = get_secret_value(inst_data["connection_url"])
-        if inst_data.get("admin_password"):
-            inst_data["admin_password"] = get_secret_value(inst_data["admin_password"])
-
-        return RedisInstance(**inst_data)
+        return _instance_from_stored_data(json.loads(data))
     except Exception as e:
         logger.exception("Failed to get instance by ID %s: %s", instance_id, e)
         return None
@@ -877,13 +968,7 @@ async def get_instance_by_name(instance_name: str) -> Optional[RedisInstance]:
         if isinstance(raw, bytes):
             raw = raw.decode("utf-8")
 
-        inst_data = json.loads(raw)
-        if inst_data.get("connection_url"):
-            inst_data["connection_url"] = get_secret_value(inst_data["connection_url"])
-        if inst_data.get("admin_password"):
-            inst_data["admin_password"] = get_secret_value(inst_data["admin_password"])
-
-        return RedisInstance(**inst_data)
+        return _instance_from_stored_data(json.loads(raw))
     except Exception as e:
         logger.exception("Failed to get instance by name %s: %s", instance_name, e)
         return None
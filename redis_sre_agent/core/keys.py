@@ -60,6 +60,16 @@ class RedisKeys:
         """Key for user's configured instances (set of instance IDs)."""
         return f"sre:user:{user_id}:instances"
 
+    @staticmethod
+    def instances_generation() -> str:
+        """Counter bumped whenever configured instances are saved or deleted."""
+        return "sre:instances:generation"
+
+    @staticmethod
+    def target_catalog_generation() -> str:
+        """Counter bumped whenever instances, clusters, or the target catalog change."""
+        return "sre:targets:generation"
+
     # ============================================================================
     # Knowledge base keys
     # ============================================================================
@@ -79,6 +89,11 @@ class RedisKeys:
         """Pattern for matching all chunks of a document."""
         return f"sre_knowledge:{document_hash}:chunk:*"
 
+    @staticmethod
+    def knowledge_chunk_registry(document_hash: str) -> str:
+        """Key for the set of chunk keys stored for a document."""
+        return f"sre_knowledge_chunks:{document_hash}"
+
     @staticmethod
     def knowledge_documents() -> str:
         """Key for knowledge documents hash."""
@@ -188,6 +203,25 @@ class RedisKeys:
         # Schedules use underscore prefix for historical compatibility
         return f"sre_schedules:{schedule_id}"
 
+    @staticmethod
+    def schedules_due() -> str:
+        """Sorted set of enabled schedule_ids (score=next_run_at timestamp)."""
+        return "sre:schedules:due"
+
+    @staticmethod
+    def schedules_due_ready() -> str:
+        """Marker set once existing schedules have been added to the due set."""
+        return "sre:schedules:due:ready"
+
+    # ============================================================================
+    # PII remediation keys
+    # ============================================================================
+
+    @staticmethod
+    def pii_detection(detector_fingerprint: str, text_hash: str) -> str:
+        """Key for cached (encrypted) PII span detections of one text block."""
+        return f"sre:pii_detection:{detector_fingerprint}:{text_hash}"
+
     # ============================================================================
     # Stream keys (for WebSocket updates)
     # ============================================================================
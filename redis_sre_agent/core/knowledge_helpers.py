@@ -6,6 +6,7 @@ They are called by:
 - Tools (in agent.knowledge_agent) for LLM access with custom docstrings
 """
 
+import asyncio
 import hashlib
 import logging
 import re
@@ -18,7 +19,7 @@ from redisvl.query import BaseQuery, FilterQuery, HybridQuery, VectorQuery, Vect
 from redisvl.query.filter import FilterExpression, Tag
 from ulid import ULID
 
-from redis_sre_agent.core.config import Settings
+from redis_sre_agent.core.config import Settings, settings
 from redis_sre_agent.core.redis import (
     get_knowledge_index,
     get_skills_index,
@@ -557,22 +558,25 @@ async def _run_hybrid_rrf_fallback(
     num_results: int,
 ) -> List[Dict[str, Any]]:
     """Approximate HybridQuery semantics with separate RedisVL text/vector queries."""
-    text_results = await index.query(
-        _RawTextQuery(
-            _hybrid_text_query(query),
-            filter_expression=query_filter,
-            return_fields=return_fields,
-            num_results=num_results,
-        )
-    )
-    vector_results = await index.query(
-        VectorQuery(
-            vector=query_vector,
-            vector_field_name="vector",
-            return_fields=return_fields,
-            num_results=num_results,
-            filter_expression=query_filter,
-        )
+    text_results, vector_results = await asyncio.gather(
+        index.query(
+            _RawTextQuery(
+                _hybrid_text_query(query),
+                filter_expression=query_filter,
+                return_fields=return_fields,
+                num_results=num_results,
+            )
+        ),
+        index.query(
+            VectorQuery(
+                vector=query_vector,
+                dtype=settings.vector_datatype,
+                vector_field_name="vector",
+                return_fields=return_fields,
+                num_results=num_results,
+                filter_expression=query_filter,
+            )
+        ),
     )
     return _reciprocal_rank_fuse([text_results, vector_results], limit=num_results)
 
@@ -1174,57 +1178,7 @@ async def search_knowledge_base_helper(
 
     exact_match_search = _looks_like_precise_search_query(query, normalized_index_type)
     precise_search = hybrid_search or exact_match_search
-    exact_matches = (
-        await _find_exact_document_matches(
-            query=query,
-            index_type=normalized_index_type,
-            version=version,
-            category=category,
-            doc_type=normalized_doc_type,
-            config=config,
-            include_special_document_types=include_special_document_types,
-        )
-        if exact_match_search
-        else []
-    )
-    precise_text_matches = (
-        await _find_precise_text_matches(
-            query=query,
-            index_type=normalized_index_type,
-            version=version,
-            category=category,
-            doc_type=normalized_doc_type,
-            config=config,
-            include_special_document_types=include_special_document_types,
-            force_literal_phrase=exact_match_search,
-        )
-        if exact_match_search
-        else []
-    )
     effective_hybrid_search = hybrid_search or precise_search
-    query_vector: List[float] = []
-    semantic_search_available = True
-
-    # Measure embedding latency and trace it. Exact-looking queries can still
-    # return identifier/text hits when the embedding provider is unavailable.
-    _t0 = time.monotonic()
-    try:
-        vectorizer = get_vectorizer(config=config)
-        with tracer.start_as_current_span("knowledge.embed") as _span:
-            _span.set_attribute("query.length", len(query))
-            vectors = await vectorizer.aembed_many([query])
-        _t1 = time.monotonic()
-        query_vector = vectors[0] if vectors else []
-    except Exception as exc:
-        _t1 = time.monotonic()
-        if exact_match_search and (exact_matches or precise_text_matches):
-            semantic_search_available = False
-            logger.warning(
-                "Embedding search unavailable for exact knowledge query; returning exact matches: %s",
-                exc,
-            )
-        else:
-            raise
 
     # We need to fetch more results if there's an offset, then slice.
     # This path merges exact/quoted prequery results with semantic results and
@@ -1235,7 +1189,7 @@ async def search_knowledge_base_helper(
         # Oversample when version filtering to improve recall after post-filtering.
         fetch_limit = min(fetch_limit * 4, 200)
 
-    async def _run_query(query_filter, num_results: int):
+    async def _run_query(query_filter, query_vector: List[float], num_results: int):
         if effective_hybrid_search:
             if normalized_index_type in _HYBRID_UNSUPPORTED_INDEX_TYPES:
                 logger.info(
@@ -1255,6 +1209,7 @@ async def search_knowledge_base_helper(
             logger.info(f"Using hybrid search (vector + full-text) for query: {query}")
             hybrid_query = HybridQuery(
                 vector=query_vector,
+                dtype=settings.vector_datatype,
                 vector_field_name="vector",
                 text_field_name="content",
                 text=query,
@@ -1288,6 +1243,7 @@ async def search_knowledge_base_helper(
         if effective_threshold is not None:
             q = VectorRangeQuery(
                 vector=query_vector,
+                dtype=settings.vector_datatype,
                 vector_field_name="vector",
                 return_fields=return_fields,
                 num_results=num_results,
@@ -1296,6 +1252,7 @@ async def search_knowledge_base_helper(
         else:
             q = VectorQuery(
                 vector=query_vector,
+                dtype=settings.vector_datatype,
                 vector_field_name="vector",
                 return_fields=return_fields,
                 num_results=num_results,
@@ -1304,9 +1261,52 @@ async def search_knowledge_base_helper(
             q.set_filter(query_filter)
         return await index.query(q)
 
-    # Perform vector search
-    _t2 = time.monotonic()
-    if semantic_search_available:
+    # Per-stage wall-clock timings in ms. Stages run concurrently, so they
+    # overlap and do not add up to the total.
+    timings: Dict[str, float] = {}
+
+    async def _timed(stage: str, awaitable):
+        started = time.monotonic()
+        try:
+            return await awaitable
+        finally:
+            timings[stage] = round((time.monotonic() - started) * 1000, 1)
+
+    async def _exact_prequery(query_category: Optional[str]) -> List[Dict[str, Any]]:
+        if not exact_match_search:
+            return []
+        return await _find_exact_document_matches(
+            query=query,
+            index_type=normalized_index_type,
+            version=version,
+            category=query_category,
+            doc_type=normalized_doc_type,
+            config=config,
+            include_special_document_types=include_special_document_types,
+        )
+
+    async def _phrase_prequery(query_category: Optional[str]) -> List[Dict[str, Any]]:
+        if not exact_match_search:
+            return []
+        return await _find_precise_text_matches(
+            query=query,
+            index_type=normalized_index_type,
+            version=version,
+            category=query_category,
+            doc_type=normalized_doc_type,
+            config=config,
+            include_special_document_types=include_special_document_types,
+            force_literal_phrase=exact_match_search,
+        )
+
+    async def _embed_query() -> List[float]:
+        vectorizer = get_vectorizer(config=config)
+        with tracer.start_as_current_span("knowledge.embed") as _span:
+            _span.set_attribute("query.length", len(query))
+            vectors = await vectorizer.aembed_many([query])
+        return vectors[0] if vectors else []
+
+    async def _semantic_query(query_filter, query_vector: List[float]) -> List[Dict[str, Any]]:
         with tracer.start_as_current_span("knowledge.index.query") as _span:
             _span.set_attribute("limit", int(limit))
             _span.set_attribute("offset", int(offset))
@@ -1316,11 +1316,43 @@ async def search_knowledge_base_helper(
                 "distance_threshold",
                 float(distance_threshold) if distance_threshold is not None else -1.0,
             )
-            _span.set_attribute("query.filtered", bool(filter_expr is not None))
-            all_results = await _run_query(filter_expr, fetch_limit)
+            _span.set_attribute("query.filtered", bool(query_filter is not None))
+            return await _run_query(query_filter, query_vector, fetch_limit)
+
+    async def _embed_and_search():
+        # Embedding failures are returned rather than raised: exact-looking
+        # queries can still answer from the prequeries without semantic search.
+        try:
+            query_vector = await _timed("embed", _embed_query())
+        except Exception as exc:
+            return exc
+        return query_vector, await _timed("index", _semantic_query(filter_expr, query_vector))
+
+    # Exact tag matches, literal phrase matches and embed+vector search are
+    # independent, so issue them concurrently.
+    _t0 = time.monotonic()
+    exact_matches, precise_text_matches, semantic = await asyncio.gather(
+        _timed("exact", _exact_prequery(category)),
+        _timed("phrase", _phrase_prequery(category)),
+        _embed_and_search(),
+    )
+    query_vector: List[float] = []
+    semantic_search_available = True
+    all_results: List[Dict[str, Any]] = []
+    if isinstance(semantic, Exception):
+        if exact_match_search and (exact_matches or precise_text_matches):
+            semantic_search_available = False
+            logger.warning(
+                "Embedding search unavailable for exact knowledge query; returning exact matches: %s",
+                semantic,
+            )
+        else:
+            raise semantic
     else:
-        all_results = []
-    _t3 = time.monotonic()
+        query_vector, all_results = semantic
+    if not exact_match_search:
+        timings.pop("exact", None)
+        timings.pop("phrase", None)
 
     merged_results = _dedupe_docs([*exact_matches, *precise_text_matches, *all_results])
     filtered_results = [
@@ -1340,47 +1372,23 @@ async def search_knowledge_base_helper(
     # while preserving other filters such as version/doc_type.
     if category is not None and len(filtered_results) == 0:
         category_fallback_expr = Tag("version") == version if version is not None else None
-        if semantic_search_available:
-            with tracer.start_as_current_span("knowledge.index.query") as _span:
-                _span.set_attribute("limit", int(limit))
-                _span.set_attribute("offset", int(offset))
-                _span.set_attribute("hybrid_search", bool(effective_hybrid_search))
-                _span.set_attribute("version", version or "all")
-                _span.set_attribute(
-                    "distance_threshold",
-                    float(distance_threshold) if distance_threshold is not None else -1.0,
-                )
-                _span.set_attribute("query.filtered", bool(category_fallback_expr is not None))
-                category_fallback_results = await _run_query(category_fallback_expr, fetch_limit)
-        else:
-            category_fallback_results = []
-
-        fallback_exact_matches = (
-            await _find_exact_document_matches(
-                query=query,
-                index_type=normalized_index_type,
-                version=version,
-                category=None,
-                doc_type=normalized_doc_type,
-                config=config,
-                include_special_document_types=include_special_document_types,
-            )
-            if exact_match_search
-            else []
-        )
-        fallback_precise_text_matches = (
-            await _find_precise_text_matches(
-                query=query,
-                index_type=normalized_index_type,
-                version=version,
-                category=None,
-                doc_type=normalized_doc_type,
-                config=config,
-                include_special_document_types=include_special_document_types,
-                force_literal_phrase=exact_match_search,
-            )
-            if exact_match_search
-            else []
+
+        async def _category_fallback_semantic() -> List[Dict[str, Any]]:
+            if not semantic_search_available:
+                return []
+            return await _semantic_query(category_fallback_expr, query_vector)
+
+        (
+            category_fallback_results,
+            fallback_exact_matches,
+            fallback_precise_text_matches,
+        ) = await _timed(
+            "category_fallback",
+            asyncio.gather(
+                _category_fallback_semantic(),
+                _exact_prequery(None),
+                _phrase_prequery(None),
+            ),
         )
         merged_fallback_results = _dedupe_docs(
             [*fallback_exact_matches, *fallback_precise_text_matches, *category_fallback_results]
@@ -1396,6 +1404,7 @@ async def search_knowledge_base_helper(
                 or _doc_is_general_knowledge(doc)
             )
         ]
+    timings["total"] = round((time.monotonic() - _t0) * 1000, 1)
 
     # Apply offset by slicing results
     if offset > 0:
@@ -1435,7 +1444,7 @@ async def search_knowledge_base_helper(
                 # RedisVL returns distance when return_score=True (default). Some versions
                 # expose it as 'score' and others as 'vector_distance' or 'distance'.
                 # Normalize to float.
-                "score": (lambda _v: (float(_v) if _v is not None else 0.0))(
+                "score": (lambda _v: float(_v) if _v is not None else 0.0)(
                     doc.get("score")
                     if doc.get("score") is not None
                     else (
@@ -1447,14 +1456,12 @@ async def search_knowledge_base_helper(
             }
             for doc in results
         ],
+        "timings_ms": timings,
     }
 
-    # Log timing metrics for observability
-    _embed_ms = int((_t1 - _t0) * 1000)
-    _index_ms = int((_t3 - _t2) * 1000)
-    _total_ms = int((_t3 - _t0) * 1000)
     logger.debug(
-        f"Knowledge search timings: embed_ms={_embed_ms} index_ms={_index_ms} total_ms={_total_ms}"
+        "Knowledge search timings: %s",
+        " ".join(f"{stage}_ms={elapsed}" for stage, elapsed in timings.items()),
     )
 
     logger.info(f"Knowledge search completed: ({len(results)} results)")
@@ -1536,8 +1543,12 @@ async def ingest_sre_document_helper(
         "chunk_index": 0,
     }
 
-    # Store in vector index
-    await index.load(data=[document], id_field="id", keys=[doc_key])
+    # Store in vector index and register the chunk so delete/reuse can find it
+    from redis_sre_agent.pipelines.ingestion.deduplication import DocumentDeduplicator
+
+    await DocumentDeduplicator(index, key_prefix=key_prefix).load_chunks(
+        document_hash, [document], [doc_key]
+    )
 
     result = {
         "task_id": str(ULID()),
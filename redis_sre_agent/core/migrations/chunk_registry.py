@@ -0,0 +1,126 @@
+"""Backfill per-document chunk registry sets for existing document indices.
+
+Migration intent:
+- Build ``{prefix}_chunks:{document_hash}`` sets from chunk keys written
+  before ingestion started maintaining them, so ``DocumentDeduplicator``
+  lookups stop scanning the keyspace.
+- Run once per index (the deduplicator's ready marker doubles as the
+  completion marker) and be safe for startup automation (lock).
+"""
+
+from __future__ import annotations
+
+import logging
+import socket
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+from redis_sre_agent.core.redis import (
+    get_knowledge_index,
+    get_redis_client,
+    get_skills_index,
+    get_support_tickets_index,
+)
+from redis_sre_agent.pipelines.ingestion.deduplication import DocumentDeduplicator
+
+logger = logging.getLogger(__name__)
+
+MIGRATION_NAME = "chunk_registry_v1"
+MIGRATION_VERSION = 1
+MIGRATION_LOCK_KEY = "sre:migration:chunk_registry:v1:lock"
+MIGRATION_LOCK_TTL_SECONDS = 600
+
+
+@dataclass
+class ChunkRegistryBackfillSummary:
+    migration: str = MIGRATION_NAME
+    version: int = MIGRATION_VERSION
+    source: str = "startup"
+    force: bool = False
+    run_id: str = ""
+    started_at: str = ""
+    finished_at: str = ""
+    # key_prefix -> {"documents": n, "chunks": n}
+    indices: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    skipped_ready: List[str] = field(default_factory=list)
+    skipped_due_lock: bool = False
+    errors: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+async def _build_deduplicators() -> List[DocumentDeduplicator]:
+    return [
+        DocumentDeduplicator(await get_knowledge_index(), key_prefix="sre_knowledge"),
+        DocumentDeduplicator(await get_skills_index(), key_prefix="sre_skills"),
+        DocumentDeduplicator(await get_support_tickets_index(), key_prefix="sre_support_tickets"),
+    ]
+
+
+async def _release_lock(client, lock_token: str) -> None:
+    try:
+        await client.eval(
+            "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) else return 0 end",
+            1,
+            MIGRATION_LOCK_KEY,
+            lock_token,
+        )
+    except Exception:
+        return
+
+
+async def run_chunk_registry_backfill(
+    *,
+    force: bool = False,
+    source: str = "startup",
+    batch_size: int = 1000,
+) -> ChunkRegistryBackfillSummary:
+    """Backfill chunk registry sets for every document index that lacks them."""
+    summary = ChunkRegistryBackfillSummary(
+        source=source,
+        force=force,
+        run_id=str(uuid.uuid4()),
+        started_at=_now_iso(),
+    )
+    client = get_redis_client()
+    lock_token = f"{socket.gethostname()}:{summary.run_id}"
+    lock_acquired = False
+
+    try:
+        lock_acquired = bool(
+            await client.set(
+                MIGRATION_LOCK_KEY,
+                lock_token,
+                nx=True,
+                ex=MIGRATION_LOCK_TTL_SECONDS,
+            )
+        )
+        if not lock_acquired:
+            summary.skipped_due_lock = True
+            return summary
+
+        for deduplicator in await _build_deduplicators():
+            if not force and await deduplicator.is_chunk_registry_ready():
+                summary.skipped_ready.append(deduplicator.key_prefix)
+                continue
+            try:
+                summary.indices[
+                    deduplicator.key_prefix
+                ] = await deduplicator.backfill_chunk_registry(batch_size=batch_size)
+            except Exception as exc:
+                logger.warning(
+                    "Chunk registry backfill failed for %s: %s", deduplicator.key_prefix, exc
+                )
+                summary.errors.append(f"{deduplicator.key_prefix}: {exc}")
+        return summary
+    finally:
+        if lock_acquired:
+            await _release_lock(client, lock_token)
+        summary.finished_at = _now_iso()
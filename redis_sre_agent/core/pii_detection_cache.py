@@ -0,0 +1,146 @@
+"""Content-hash cache of PII span detections.
+
+Outbound LLM requests repeat most of their text blocks from one turn to the
+next (system prompt, earlier messages, tool outputs). Detections are cached
+by detector fingerprint (model, categories, chunking) and the SHA-256 of the
+block text in a bounded, TTL-limited in-process LRU, and optionally in Redis
+so other workers can reuse them.
+
+Cached values hold span offsets, categories and scores but never the matched
+text; Redis entries are additionally encrypted with the master key.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from redis_sre_agent.core.encryption import EncryptionError, decrypt_secret, encrypt_secret
+from redis_sre_agent.core.keys import RedisKeys
+
+logger = logging.getLogger(__name__)
+
+# (category, start, end, confidence, raw_entity)
+CachedSpan = Tuple[str, int, int, Optional[float], Optional[str]]
+
+
+def text_digest(text: str) -> str:
+    """Return the SHA-256 hex digest used to key a text block."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def detector_fingerprint(model_name: str, categories: Iterable[str], *extra: Any) -> str:
+    """Return a short stable ID for a detector configuration."""
+    payload = json.dumps([model_name, sorted(categories), *extra], default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class PIIDetectionCache:
+    """LRU of span detections per text digest, optionally backed by Redis."""
+
+    def __init__(
+        self,
+        *,
+        fingerprint: str,
+        max_entries: int,
+        ttl_seconds: int,
+        redis_enabled: bool = False,
+    ) -> None:
+        self.fingerprint = fingerprint
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.redis_enabled = redis_enabled
+        # digest -> (expires_at, spans), least recently used first
+        self._entries: "OrderedDict[str, Tuple[float, List[CachedSpan]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_many(self, digests: Sequence[str]) -> Dict[str, List[CachedSpan]]:
+        """Return cached spans for the digests that have a live entry."""
+        now = time.monotonic()
+        found: Dict[str, List[CachedSpan]] = {}
+        missing: List[str] = []
+        for digest in digests:
+            entry = self._entries.get(digest)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(digest)
+                found[digest] = entry[1]
+            else:
+                if entry is not None:
+                    del self._entries[digest]
+                missing.append(digest)
+
+        if missing and self.redis_enabled:
+            from_redis = await self._redis_get_many(missing)
+            for digest, spans in from_redis.items():
+                self._remember(digest, spans)
+            found.update(from_redis)
+        return found
+
+    async def set_many(self, entries: Dict[str, List[CachedSpan]]) -> None:
+        """Cache spans for each digest."""
+        for digest, spans in entries.items():
+            self._remember(digest, spans)
+        if entries and self.redis_enabled:
+            await self._redis_set_many(entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _remember(self, digest: str, spans: List[CachedSpan]) -> None:
+        self._entries[digest] = (time.monotonic() + self.ttl_seconds, spans)
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _disable_redis(self, exc: Exception) -> None:
+        logger.warning("Disabling Redis-backed PII detection cache: %s", exc)
+        self.redis_enabled = False
+
+    async def _redis_get_many(self, digests: Sequence[str]) -> Dict[str, List[CachedSpan]]:
+        from redis_sre_agent.core.redis import get_redis_client
+
+        try:
+            values = await get_redis_client().mget(
+                [RedisKeys.pii_detection(self.fingerprint, digest) for digest in digests]
+            )
+        except Exception as exc:
+            logger.warning("PII detection cache read failed: %s", exc)
+            return {}
+
+        found: Dict[str, List[CachedSpan]] = {}
+        for digest, value in zip(digests, values):
+            if not value:
+                continue
+            try:
+                raw = value.decode() if isinstance(value, bytes) else value
+                found[digest] = [tuple(span) for span in json.loads(decrypt_secret(raw))]
+            except Exception as exc:
+                # Undecryptable (e.g. rotated master key) entries are treated as misses
+                logger.debug("Ignoring unreadable PII detection cache entry: %s", exc)
+        return found
+
+    async def _redis_set_many(self, entries: Dict[str, List[CachedSpan]]) -> None:
+        from redis_sre_agent.core.redis import get_redis_client
+
+        try:
+            encrypted = {
+                RedisKeys.pii_detection(self.fingerprint, digest): encrypt_secret(json.dumps(spans))
+                for digest, spans in entries.items()
+            }
+        except EncryptionError as exc:
+            self._disable_redis(exc)
+            return
+
+        try:
+            async with get_redis_client().pipeline(transaction=False) as pipe:
+                for key, value in encrypted.items():
+                    pipe.set(key, value, ex=self.ttl_seconds)
+                await pipe.execute()
+        except Exception as exc:
+            logger.warning("PII detection cache write failed: %s", exc)
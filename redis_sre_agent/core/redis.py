@@ -1,9 +1,19 @@
-"""Redis connection management - no caching to avoid event loop issues."""
+"""Redis connection management.
 
+Connection pools and RedisVL search indices are shared per event loop. redis-py
+asyncio connections are bound to the loop that opened them, so each loop (the
+API server, the Docket worker, every ``asyncio.run`` in the CLI) gets its own
+pool keyed by Redis URL, and its own cached ``AsyncSearchIndex`` objects.
+"""
+
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Any, Optional
+import weakref
+from typing import Any, Dict, Optional, Tuple
 
-from redis.asyncio import Redis
+from redis.asyncio import ConnectionPool, Redis
 from redisvl.extensions.cache.embeddings.embeddings import (
     EmbeddingsCache as EmbeddingsCache,  # noqa: F401
 )
@@ -12,7 +22,7 @@ from redisvl.utils.vectorize import HFTextVectorizer as HFTextVectorizer  # noqa
 from redisvl.utils.vectorize import OpenAITextVectorizer as OpenAITextVectorizer  # noqa: F401
 
 from redis_sre_agent.core.config import Settings, settings
-from redis_sre_agent.core.vectorizer_helpers import Vectorizer, create_vectorizer
+from redis_sre_agent.core.vectorizer_helpers import Vectorizer, get_cached_vectorizer
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +47,25 @@ SRE_TARGETS_INDEX = "sre_targets"
 SRE_QA_INDEX = "sre_qa"
 
 
+def _document_vector_attrs() -> dict[str, Any]:
+    """Vector field attrs for the document indices, from the vector index settings."""
+    attrs: dict[str, Any] = {
+        "dims": settings.vector_dim,
+        "distance_metric": "cosine",
+        "algorithm": settings.vector_index_algorithm,
+        "datatype": settings.vector_datatype,
+    }
+    if settings.vector_index_algorithm == "hnsw":
+        attrs.update(
+            {
+                "m": settings.vector_hnsw_m,
+                "ef_construction": settings.vector_hnsw_ef_construction,
+                "ef_runtime": settings.vector_hnsw_ef_runtime,
+            }
+        )
+    return attrs
+
+
 def _build_document_schema(index_name: str, include_pinned: bool) -> dict:
     """Build a search schema for chunked source documents."""
     fields = [
@@ -107,12 +136,7 @@ def _build_document_schema(index_name: str, include_pinned: bool) -> dict:
         {
             "name": "vector",
             "type": "vector",
-            "attrs": {
-                "dims": settings.vector_dim,
-                "distance_metric": "cosine",
-                "algorithm": "flat",
-                "datatype": "float32",
-            },
+            "attrs": _document_vector_attrs(),
         },
     ]
     if include_pinned:
@@ -390,6 +414,25 @@ def _coerce_optional_int(value: Any) -> Any:
         return value
 
 
+def parse_generation(value: Any) -> Optional[int]:
+    """Parse a generation counter reply from GET/INCR; None when it is not an integer."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, (bytes, bytearray, str)):
+        try:
+            return int(value)
+        except ValueError:
+            return None
+    return None
+
+
+# HNSW build parameters compared for drift when FT.INFO reports them. EF_RUNTIME
+# is only a query-time default and is not reported, so it never triggers drift.
+_HNSW_BUILD_ATTRS = ("m", "ef_construction")
+
+
 def _expected_field_definitions(schema: dict[str, Any]) -> dict[str, dict[str, Any]]:
     """Build comparable field metadata from a schema dict."""
     definitions: dict[str, dict[str, Any]] = {}
@@ -409,6 +452,9 @@ def _expected_field_definitions(schema: dict[str, Any]) -> dict[str, dict[str, A
                 "dim": _coerce_optional_int(attrs.get("dims")),
                 "distance_metric": str(attrs.get("distance_metric", "")).strip().upper(),
             }
+            for key in _HNSW_BUILD_ATTRS:
+                if attrs.get(key) is not None:
+                    definition["attrs"][key] = _coerce_optional_int(attrs[key])
         definitions[name] = definition
     return definitions
 
@@ -434,6 +480,11 @@ def _actual_field_definitions(raw_info: list[Any]) -> dict[str, dict[str, Any]]:
                 "dim": _coerce_optional_int(attr_dict.get("dim")),
                 "distance_metric": str(attr_dict.get("distance_metric", "")).strip().upper(),
             }
+            # FT.INFO reports HNSW build parameters as M / ef_construction
+            for key in _HNSW_BUILD_ATTRS:
+                value = attr_dict.get(key, attr_dict.get(key.upper()))
+                if value is not None:
+                    definition["attrs"][key] = _coerce_optional_int(value)
         definitions[name] = definition
 
     return definitions
@@ -454,6 +505,18 @@ def _compare_index_schema(
     for field_name in sorted(expected_names & actual_names):
         expected = expected_fields[field_name]
         actual = actual_fields[field_name]
+        if "attrs" in expected and "attrs" in actual:
+            # Servers that do not report HNSW parameters cannot drift on them
+            missing = [
+                key
+                for key in _HNSW_BUILD_ATTRS
+                if key in expected["attrs"] and key not in actual["attrs"]
+            ]
+            if missing:
+                expected = {
+                    **expected,
+                    "attrs": {k: v for k, v in expected["attrs"].items() if k not in missing},
+                }
         if expected != actual:
             mismatched_fields[field_name] = {"expected": expected, "actual": actual}
 
@@ -466,11 +529,40 @@ def _compare_index_schema(
     }
 
 
+# Per-loop registries keyed by event loop; entries disappear with their loop.
+# Pools are keyed by Redis URL, indices by (Redis URL, index name, schema
+# fingerprint) so a changed schema never reuses an index built from the old one.
+_connection_pools: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_search_indices: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _get_connection_pool(redis_url: str) -> Optional[ConnectionPool]:
+    """Return the shared pool for ``redis_url`` on the running loop, if any."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+    pools: Dict[str, ConnectionPool] = _connection_pools.setdefault(loop, {})
+    pool = pools.get(redis_url)
+    if pool is None:
+        pool = ConnectionPool.from_url(
+            redis_url,
+            decode_responses=False,  # Keep as bytes for RedisVL compatibility
+        )
+        pools[redis_url] = pool
+    return pool
+
+
 def get_redis_client(
     url: Optional[str] = None,
     config: Optional[Settings] = None,
 ) -> Redis:
-    """Get Redis client (creates fresh client to avoid event loop issues).
+    """Get a Redis client backed by the running loop's shared connection pool.
+
+    Clients are cheap wrappers around the pool, so callers may ``aclose()``
+    them without affecting other users. Outside a running event loop a
+    standalone client is returned instead.
 
     Args:
         url: Optional Redis URL. If provided, takes precedence over config.
@@ -483,10 +575,52 @@ def get_redis_client(
     """
     cfg = config or settings
     redis_url = url or cfg.redis_url.get_secret_value()
-    return Redis.from_url(
-        url=redis_url,
-        decode_responses=False,  # Keep as bytes for RedisVL compatibility
-    )
+    pool = _get_connection_pool(redis_url)
+    if pool is None:
+        return Redis.from_url(
+            url=redis_url,
+            decode_responses=False,  # Keep as bytes for RedisVL compatibility
+        )
+    return Redis(connection_pool=pool)
+
+
+def _schema_fingerprint(schema: dict) -> str:
+    """Return a short ID for the full contents of an index schema."""
+    payload = json.dumps(schema, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _get_search_index(schema: dict, redis_url: str) -> AsyncSearchIndex:
+    """Return the running loop's cached index for ``schema`` on ``redis_url``."""
+    from redisvl.schema import IndexSchema
+
+    loop = asyncio.get_running_loop()
+    indices: Dict[Tuple[str, str, str], AsyncSearchIndex] = _search_indices.setdefault(loop, {})
+    key = (redis_url, schema["index"]["name"], _schema_fingerprint(schema))
+    index = indices.get(key)
+    if index is None:
+        index = AsyncSearchIndex(
+            schema=IndexSchema.from_dict(schema),
+            redis_client=get_redis_client(url=redis_url),
+        )
+        indices[key] = index
+    return index
+
+
+async def close_redis_connections() -> None:
+    """Drop cached indices and disconnect pooled connections for the running loop.
+
+    Called from the API lifespan, the Docket worker and the MCP server on
+    shutdown. Later calls on the same loop lazily build fresh pools.
+    """
+    loop = asyncio.get_running_loop()
+    _search_indices.pop(loop, None)
+    pools = _connection_pools.pop(loop, {})
+    for pool in pools.values():
+        try:
+            await pool.disconnect()
+        except Exception as e:
+            logger.warning(f"Failed to disconnect Redis connection pool: {e}")
 
 
 def get_vectorizer(config: Optional[Settings] = None) -> Vectorizer:
@@ -507,13 +641,14 @@ def get_vectorizer(config: Optional[Settings] = None) -> Vectorizer:
         - 'local': Uses HuggingFace sentence-transformers (no API needed, air-gap compatible)
 
     The default implementation uses a stable Redis-backed embeddings cache with
-    TTL configured by settings.embeddings_cache_ttl.
+    TTL configured by settings.embeddings_cache_ttl. Instances are cached per
+    event loop and configuration, so repeated calls are cheap.
     """
-    return create_vectorizer(config=config)
+    return get_cached_vectorizer(config=config)
 
 
 async def get_knowledge_index(config: Optional[Settings] = None) -> AsyncSearchIndex:
-    """Get SRE knowledge base index (creates fresh to avoid event loop issues).
+    """Get SRE knowledge base index (shared per event loop).
 
     Args:
         config: Optional Settings object. If not provided, uses global settings.
@@ -523,45 +658,20 @@ async def get_knowledge_index(config: Optional[Settings] = None) -> AsyncSearchI
     Returns:
         AsyncSearchIndex for the knowledge base.
     """
-    from redisvl.schema import IndexSchema
-
     cfg = config or settings
-    redis_url = cfg.redis_url.get_secret_value()
-
-    # Create Redis client once and pass to index
-    redis_client = Redis.from_url(redis_url, decode_responses=False)
-
-    # Convert schema dict to IndexSchema object
-    schema = IndexSchema.from_dict(SRE_KNOWLEDGE_SCHEMA)
-
-    # Create index with the shared client
-    index = AsyncSearchIndex(schema=schema, redis_client=redis_client)
-
-    return index
+    return _get_search_index(SRE_KNOWLEDGE_SCHEMA, cfg.redis_url.get_secret_value())
 
 
 async def get_skills_index(config: Optional[Settings] = None) -> AsyncSearchIndex:
-    """Get SRE skills index (creates fresh to avoid event loop issues)."""
-    from redisvl.schema import IndexSchema
-
+    """Get SRE skills index (shared per event loop)."""
     cfg = config or settings
-    redis_url = cfg.redis_url.get_secret_value()
-    redis_client = Redis.from_url(redis_url, decode_responses=False)
-    schema = IndexSchema.from_dict(SRE_SKILLS_SCHEMA)
-    index = AsyncSearchIndex(schema=schema, redis_client=redis_client)
-    return index
+    return _get_search_index(SRE_SKILLS_SCHEMA, cfg.redis_url.get_secret_value())
 
 
 async def get_support_tickets_index(config: Optional[Settings] = None) -> AsyncSearchIndex:
-    """Get SRE support tickets index (creates fresh to avoid event loop issues)."""
-    from redisvl.schema import IndexSchema
-
+    """Get SRE support tickets index (shared per event loop)."""
     cfg = config or settings
-    redis_url = cfg.redis_url.get_secret_value()
-    redis_client = Redis.from_url(redis_url, decode_responses=False)
-    schema = IndexSchema.from_dict(SRE_SUPPORT_TICKETS_SCHEMA)
-    index = AsyncSearchIndex(schema=schema, redis_client=redis_client)
-    return index
+    return _get_search_index(SRE_SUPPORT_TICKETS_SCHEMA, cfg.redis_url.get_secret_value())
 
 
 async def get_tasks_index(config: Optional[Settings] = None) -> AsyncSearchIndex:
@@ -575,15 +685,8 @@ async def get_tasks_index(config: Optional[Settings] = None) -> AsyncSearchIndex
     Returns:
         AsyncSearchIndex for tasks.
     """
-    from redisvl.schema import IndexSchema
-
     cfg = config or settings
-    redis_url = cfg.redis_url.get_secret_value()
-
-    redis_client = Redis.from_url(redis_url, decode_responses=False)
-    schema = IndexSchema.from_dict(SRE_TASKS_SCHEMA)
-    index = AsyncSearchIndex(schema=schema, redis_client=redis_client)
-    return index
+    return _get_search_index(SRE_TASKS_SCHEMA, cfg.redis_url.get_secret_value())
 
 
 async def get_instances_index(config: Optional[Settings] = None) -> AsyncSearchIndex:
@@ -597,15 +700,8 @@ async def get_instances_index(config: Optional[Settings] = None) -> AsyncSearchI
     Returns:
         AsyncSearchIndex for instances.
     """
-    from redisvl.schema import IndexSchema
-
     cfg = config or settings
-    redis_url = cfg.redis_url.get_secret_value()
-
-    redis_client = Redis.from_url(redis_url, decode_responses=False)
-    schema = IndexSchema.from_dict(SRE_INSTANCES_SCHEMA)
-    index = AsyncSearchIndex(schema=schema, redis_client=redis_client)
-    return index
+    return _get_search_index(SRE_INSTANCES_SCHEMA, cfg.redis_url.get_secret_value())
 
 
 async def get_clusters_index(config: Optional[Settings] = None) -> AsyncSearchIndex:
@@ -619,28 +715,14 @@ async def get_clusters_index(config: Optional[Settings] = None) -> AsyncSearchIn
     Returns:
         AsyncSearchIndex for clusters.
     """
-    from redisvl.schema import IndexSchema
-
     cfg = config or settings
-    redis_url = cfg.redis_url.get_secret_value()
-
-    redis_client = Redis.from_url(redis_url, decode_responses=False)
-    schema = IndexSchema.from_dict(SRE_CLUSTERS_SCHEMA)
-    index = AsyncSearchIndex(schema=schema, redis_client=redis_client)
-    return index
+    return _get_search_index(SRE_CLUSTERS_SCHEMA, cfg.redis_url.get_secret_value())
 
 
 async def get_targets_index(config: Optional[Settings] = None) -> AsyncSearchIndex:
     """Get SRE unified targets index (async)."""
-    from redisvl.schema import IndexSchema
-
     cfg = config or settings
-    redis_url = cfg.redis_url.get_secret_value()
-
-    redis_client = Redis.from_url(redis_url, decode_responses=False)
-    schema = IndexSchema.from_dict(SRE_TARGETS_SCHEMA)
-    index = AsyncSearchIndex(schema=schema, redis_client=redis_client)
-    return index
+    return _get_search_index(SRE_TARGETS_SCHEMA, cfg.redis_url.get_secret_value())
 
 
 async def get_threads_index(config: Optional[Settings] = None) -> AsyncSearchIndex:
@@ -654,31 +736,19 @@ async def get_threads_index(config: Optional[Settings] = None) -> AsyncSearchInd
     Returns:
         AsyncSearchIndex for threads.
     """
-    from redisvl.schema import IndexSchema
-
     cfg = config or settings
-    redis_url = cfg.redis_url.get_secret_value()
-
-    redis_client = Redis.from_url(redis_url, decode_responses=False)
-    schema = IndexSchema.from_dict(SRE_THREADS_SCHEMA)
-    index = AsyncSearchIndex(schema=schema, redis_client=redis_client)
-    return index
+    return _get_search_index(SRE_THREADS_SCHEMA, cfg.redis_url.get_secret_value())
 
 
 async def get_qa_index() -> AsyncSearchIndex:
     """Get Q&A index for vector search on questions and answers."""
-    from redisvl.schema import IndexSchema
-
     # Build Redis URL with password if needed
     redis_url = settings.redis_url.get_secret_value()
     redis_password = settings.redis_password.get_secret_value() if settings.redis_password else None
     if redis_password and "@" not in redis_url:
         redis_url = redis_url.replace("redis://", f"redis://:{redis_password}@")
 
-    redis_client = Redis.from_url(redis_url, decode_responses=False)
-    schema = IndexSchema.from_dict(SRE_QA_SCHEMA)
-    index = AsyncSearchIndex(schema=schema, redis_client=redis_client)
-    return index
+    return _get_search_index(SRE_QA_SCHEMA, redis_url)
 
 
 async def get_schedules_index(config: Optional[Settings] = None) -> AsyncSearchIndex:
@@ -692,21 +762,8 @@ async def get_schedules_index(config: Optional[Settings] = None) -> AsyncSearchI
     Returns:
         AsyncSearchIndex for schedules.
     """
-    from redisvl.schema import IndexSchema
-
     cfg = config or settings
-    redis_url = cfg.redis_url.get_secret_value()
-
-    # Create Redis client once and pass to index
-    redis_client = Redis.from_url(redis_url, decode_responses=False)
-
-    # Convert schema dict to IndexSchema object
-    schema = IndexSchema.from_dict(SRE_SCHEDULES_SCHEMA)
-
-    # Create index with the shared client
-    index = AsyncSearchIndex(schema=schema, redis_client=redis_client)
-
-    return index
+    return _get_search_index(SRE_SCHEDULES_SCHEMA, cfg.redis_url.get_secret_value())
 
 
 async def test_redis_connection(
@@ -817,15 +874,83 @@ async def get_index_schema_status(
     return result
 
 
+def _vector_datatype_change(status: dict[str, Any]) -> Optional[Tuple[str, str, int]]:
+    """Return (from, to, dim) when drift includes a vector datatype change."""
+    mismatch = (status.get("mismatched_fields") or {}).get("vector")
+    if not mismatch:
+        return None
+    expected = mismatch["expected"].get("attrs") or {}
+    actual = mismatch["actual"].get("attrs") or {}
+    source = str(actual.get("data_type", "")).lower()
+    target = str(expected.get("data_type", "")).lower()
+    dim = actual.get("dim")
+    if not source or not target or source == target or not isinstance(dim, int):
+        return None
+    return source, target, dim
+
+
+async def _reencode_document_vectors(
+    client: Redis,
+    prefix: str,
+    source_dtype: str,
+    target_dtype: str,
+    dim: int,
+    batch_size: int = 500,
+) -> int:
+    """Rewrite stored ``vector`` blobs under ``prefix`` from one datatype to another.
+
+    Blobs whose length does not match ``dim`` values of ``source_dtype`` are left
+    untouched, so an interrupted migration can simply be re-run.
+    """
+    import numpy as np
+
+    source = np.dtype(source_dtype)
+    target = np.dtype(target_dtype)
+    source_size = dim * source.itemsize
+    converted = 0
+
+    async def _convert(keys: list[Any]) -> int:
+        async with client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.hget(key, "vector")
+            # Non-hash keys sharing the prefix come back as errors and are skipped
+            blobs = await pipe.execute(raise_on_error=False)
+        updates = [
+            (key, np.frombuffer(blob, dtype=source).astype(target).tobytes())
+            for key, blob in zip(keys, blobs)
+            if isinstance(blob, bytes) and len(blob) == source_size
+        ]
+        if updates:
+            async with client.pipeline(transaction=False) as pipe:
+                for key, blob in updates:
+                    pipe.hset(key, "vector", blob)
+                await pipe.execute()
+        return len(updates)
+
+    batch: list[Any] = []
+    async for key in client.scan_iter(match=f"{prefix}*", count=batch_size):
+        batch.append(key)
+        if len(batch) >= batch_size:
+            converted += await _convert(batch)
+            batch = []
+    if batch:
+        converted += await _convert(batch)
+    return converted
+
+
 async def sync_index_schemas(
     index_name: str | None = None,
     config: Optional[Settings] = None,
 ) -> dict[str, Any]:
-    """Create or recreate only indices whose schema has drifted."""
+    """Create or recreate only indices whose schema has drifted.
+
+    When the drift includes a vector datatype change (for example float32 to
+    float16), stored vectors are re-encoded in place before the index is rebuilt.
+    """
     status_result = await get_index_schema_status(index_name=index_name, config=config)
     result: dict[str, Any] = {"success": status_result["success"], "indices": {}}
 
-    for name, idx_name, get_fn, _schema in _iter_index_configs():
+    for name, idx_name, get_fn, schema in _iter_index_configs():
         if index_name and name != index_name:
             continue
 
@@ -852,6 +977,23 @@ async def sync_index_schemas(
             idx = await get_fn(config=config)
             if status.get("exists"):
                 await idx._redis_client.execute_command("FT.DROPINDEX", idx_name)
+                datatype_change = _vector_datatype_change(status)
+                if datatype_change is not None:
+                    source_dtype, target_dtype, dim = datatype_change
+                    entry["reencoded_vectors"] = await _reencode_document_vectors(
+                        idx._redis_client,
+                        schema["index"]["prefix"],
+                        source_dtype,
+                        target_dtype,
+                        dim,
+                    )
+                    logger.info(
+                        "Re-encoded %d vectors in %s from %s to %s",
+                        entry["reencoded_vectors"],
+                        idx_name,
+                        source_dtype,
+                        target_dtype,
+                    )
                 await idx.create()
                 entry["action"] = "recreated"
             else:
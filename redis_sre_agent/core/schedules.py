@@ -1,12 +1,17 @@
 """
 Schedule domain model and storage helpers.
+
+A single-node (non-cluster) application Redis is assumed: each schedule hash
+(``sre_schedules:{id}``) and the due set (``sre:schedules:due``) are updated
+together in MULTI/EXEC transactions and in the claim script, which Redis
+Cluster would reject as CROSSSLOT.
 """
 
 from __future__ import annotations
 
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 from redisvl.query import BaseQuery, FilterQuery
@@ -16,6 +21,51 @@ from .keys import RedisKeys
 
 logger = logging.getLogger(__name__)
 
+# Atomically claim the candidate schedules ARGV[3..] (hashes in KEYS[2..],
+# due set in KEYS[1]) that are still due at or before ARGV[1] and move each one
+# to its next slot. A candidate whose due-set score changed since it was read
+# is skipped. The next slot is derived from the claimed slot rather than from
+# "now" so recurring runs do not drift; slots missed while no scheduler was
+# running collapse into a single catch-up run. Disabled, deleted or malformed
+# schedules are dropped from the due set instead of being returned. Returns
+# the claimed rows.
+_CLAIM_DUE_SCHEDULES_SCRIPT = """
+local units = {minutes = 60, hours = 3600, days = 86400, weeks = 604800}
+local horizon = tonumber(ARGV[1])
+local now = tonumber(ARGV[2])
+local claimed = {}
+for i = 3, #ARGV do
+    local schedule_id = ARGV[i]
+    local key = KEYS[i - 1]
+    local score = redis.call('ZSCORE', KEYS[1], schedule_id)
+    local due_at = score and tonumber(score)
+    if due_at and due_at <= horizon then
+        local fields = redis.call('HMGET', key, 'enabled', 'interval_type', 'interval_value', 'name', 'instructions', 'redis_instance_id')
+        local unit = units[fields[2]]
+        local count = tonumber(fields[3])
+        if fields[1] ~= 'true' or not unit or not count or count < 1 then
+            redis.call('ZREM', KEYS[1], schedule_id)
+        else
+            local step = unit * count
+            local next_run = due_at + step
+            if next_run <= now then
+                next_run = due_at + step * (math.floor((now - due_at) / step) + 1)
+            end
+            local due_at_str = string.format('%.6f', due_at)
+            redis.call('HSET', key, 'next_run_at', string.format('%.6f', next_run), 'last_run_at', due_at_str, 'updated_at', ARGV[2])
+            redis.call('ZADD', KEYS[1], next_run, schedule_id)
+            table.insert(claimed, {schedule_id, due_at_str, fields[4] or '', fields[5] or '', fields[6] or ''})
+        end
+    end
+end
+return claimed
+"""
+
+_SCHEDULE_KEY_PREFIX = RedisKeys.schedule_key("")
+
+# Set once this process has confirmed the due set was backfilled.
+_due_index_ready = False
+
 
 class Schedule(BaseModel):
     """Schedule model for automated agent runs."""
@@ -158,9 +208,16 @@ async def store_schedule(schedule_data: Dict) -> bool:
             if value is None:
                 redis_data[key_name] = ""
 
-        # Store in Redis hash
-        key = f"sre_schedules:{schedule_id}"
-        await client.hset(key, mapping=redis_data)
+        # Store the hash and keep the due set in step with it. Only enabled
+        # schedules are due; a missing next_run_at (0) makes one due immediately.
+        key = RedisKeys.schedule_key(schedule_id)
+        pipe = client.pipeline(transaction=True)
+        pipe.hset(key, mapping=redis_data)
+        if redis_data["enabled"] == "true":
+            pipe.zadd(RedisKeys.schedules_due(), {schedule_id: float(redis_data["next_run_at"])})
+        else:
+            pipe.zrem(RedisKeys.schedules_due(), schedule_id)
+        await pipe.execute()
 
         logger.info(f"Stored schedule {schedule_id} in Redis")
         return True
@@ -170,40 +227,45 @@ async def store_schedule(schedule_data: Dict) -> bool:
         return False
 
 
+def _decode_schedule_hash(data: Dict[Any, Any]) -> Dict[str, Any]:
+    """Convert a raw schedule hash into the dict shape used by the API."""
+    # Convert bytes to strings and restore proper types
+    schedule: Dict[str, Any] = {}
+    for k, v in data.items():
+        key_str = k.decode() if isinstance(k, bytes) else k
+        val_str = v.decode() if isinstance(v, bytes) else v
+        schedule[key_str] = val_str
+
+    # Convert numeric fields back to datetime strings
+    for field in ["created_at", "updated_at", "last_run_at", "next_run_at"]:
+        if schedule.get(field) and schedule[field] != "0":
+            timestamp = float(schedule[field])
+            if timestamp > 0:
+                dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+                schedule[field] = dt.isoformat()
+            else:
+                schedule[field] = None
+        else:
+            schedule[field] = None
+
+    # Convert string fields back to proper types
+    schedule["enabled"] = schedule.get("enabled", "true") == "true"
+    schedule["interval_value"] = int(schedule.get("interval_value", 0))
+
+    return schedule
+
+
 async def get_schedule(schedule_id: str) -> Optional[Dict]:
     """Retrieve a schedule from Redis."""
     try:
         client = get_redis_client()
-        key = f"sre_schedules:{schedule_id}"
+        key = RedisKeys.schedule_key(schedule_id)
 
         data = await client.hgetall(key)
         if not data:
             return None
 
-        # Convert bytes to strings and restore proper types
-        schedule = {}
-        for k, v in data.items():
-            key_str = k.decode() if isinstance(k, bytes) else k
-            val_str = v.decode() if isinstance(v, bytes) else v
-            schedule[key_str] = val_str
-
-        # Convert numeric fields back to datetime strings
-        for field in ["created_at", "updated_at", "last_run_at", "next_run_at"]:
-            if schedule.get(field) and schedule[field] != "0":
-                timestamp = float(schedule[field])
-                if timestamp > 0:
-                    dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
-                    schedule[field] = dt.isoformat()
-                else:
-                    schedule[field] = None
-            else:
-                schedule[field] = None
-
-        # Convert string fields back to proper types
-        schedule["enabled"] = schedule.get("enabled", "true") == "true"
-        schedule["interval_value"] = int(schedule.get("interval_value", 0))
-
-        return schedule
+        return _decode_schedule_hash(data)
 
     except Exception as e:
         logger.error(f"Failed to get schedule {schedule_id}: {e}")
@@ -221,7 +283,10 @@ async def delete_schedule(schedule_id: str) -> bool:
         client = get_redis_client()
         key = RedisKeys.schedule_key(schedule_id)
 
-        result = await client.delete(key)
+        pipe = client.pipeline(transaction=True)
+        pipe.delete(key)
+        pipe.zrem(RedisKeys.schedules_due(), schedule_id)
+        result, _ = await pipe.execute()
         if result:
             logger.info(f"Deleted schedule {schedule_id} from Redis")
             return True
@@ -234,59 +299,200 @@ async def delete_schedule(schedule_id: str) -> bool:
         return False
 
 
+async def ensure_schedule_due_index(*, force: bool = False, batch_size: int = 500) -> int:
+    """Add schedules stored before the due set existed to it, once.
+
+    Scans ``sre_schedules:*`` a single time, adds every enabled schedule with
+    its ``next_run_at`` score and records a ready marker so later calls cost
+    one EXISTS (and nothing once this process has seen the marker).
+
+    Returns:
+        Number of schedules added to the due set.
+    """
+    global _due_index_ready
+
+    if _due_index_ready and not force:
+        return 0
+
+    client = get_redis_client()
+    if not force and await client.exists(RedisKeys.schedules_due_ready()):
+        _due_index_ready = True
+        return 0
+
+    added = 0
+    keys: List[Any] = []
+
+    async def _flush() -> int:
+        pipe = client.pipeline(transaction=False)
+        for key in keys:
+            pipe.hmget(key, "enabled", "next_run_at")
+        rows = await pipe.execute()
+
+        members: Dict[str, float] = {}
+        for key, (enabled, next_run_at) in zip(keys, rows):
+            key_str = key.decode() if isinstance(key, bytes) else key
+            enabled = enabled.decode() if isinstance(enabled, bytes) else enabled
+            if enabled != "true":
+                continue
+            try:
+                score = float(next_run_at or 0)
+            except (TypeError, ValueError):
+                score = 0.0
+            members[key_str[len(_SCHEDULE_KEY_PREFIX) :]] = score
+        keys.clear()
+        if members:
+            await client.zadd(RedisKeys.schedules_due(), members)
+        return len(members)
+
+    async for key in client.scan_iter(match=f"{_SCHEDULE_KEY_PREFIX}*", count=batch_size):
+        keys.append(key)
+        if len(keys) >= batch_size:
+            added += await _flush()
+    if keys:
+        added += await _flush()
+
+    await client.set(RedisKeys.schedules_due_ready(), datetime.now(timezone.utc).isoformat())
+    _due_index_ready = True
+    logger.info(f"Added {added} existing schedules to the due set")
+    return added
+
+
 async def find_schedules_needing_runs(current_time: datetime) -> List[Dict]:
-    """Find schedules that need to have runs created based on current time."""
-    current_timestamp = current_time.timestamp()
-
-    # Create a filter query for enabled schedules where next_run_at <= current_time
-    # Using RedisVL FilterQuery for non-vector searches
-    query = FilterQuery(
-        return_fields=[
-            "id",
-            "name",
-            "description",
-            "interval_type",
-            "interval_value",
-            "redis_instance_id",
-            "instructions",
-            "enabled",
-            "created_at",
-            "updated_at",
-            "last_run_at",
-            "next_run_at",
-        ],
-        filter_expression=f"@enabled:{{true}} @next_run_at:[0 {current_timestamp}]",
+    """Find schedules that need to have runs created based on current time.
+
+    Read-only view of the due set; ``claim_due_schedules`` is what the
+    scheduler uses to take ownership of due runs.
+    """
+    client = get_redis_client()
+    schedule_ids = await client.zrangebyscore(
+        RedisKeys.schedules_due(), "-inf", current_time.timestamp()
     )
+    if not schedule_ids:
+        logger.info("Found 0 schedules needing runs")
+        return []
+
+    pipe = client.pipeline(transaction=False)
+    for schedule_id in schedule_ids:
+        if isinstance(schedule_id, bytes):
+            schedule_id = schedule_id.decode()
+        pipe.hgetall(RedisKeys.schedule_key(schedule_id))
+    rows = await pipe.execute()
+
+    schedules_needing_runs = []
+    for schedule_id, data in zip(schedule_ids, rows):
+        if not data:
+            continue
+        try:
+            schedule = _decode_schedule_hash(data)
+        except (ValueError, TypeError) as e:
+            logger.error(f"Failed to process schedule {schedule_id}: {e}")
+            continue
+        if schedule["enabled"]:
+            schedules_needing_runs.append(schedule)
 
-    schedules_needing_runs = await _get_schedules(query)
     logger.info(f"Found {len(schedules_needing_runs)} schedules needing runs")
-
     return schedules_needing_runs
 
 
+async def claim_due_schedules(
+    horizon: datetime,
+    *,
+    current_time: Optional[datetime] = None,
+    batch_size: int = 500,
+) -> List[Dict[str, Any]]:
+    """Claim schedules due at or before ``horizon`` and advance them.
+
+    Reads up to ``batch_size`` due schedule IDs, then one script call claims
+    them and moves each to its next slot, so concurrent schedulers never claim
+    the same run and edits to a schedule cannot interleave with its claim.
+    ``horizon`` may lie ahead of ``current_time``; callers submit each claimed
+    run for its exact ``scheduled_at`` rather than waiting for the next poll.
+    A short interval can therefore yield more than one run of a schedule
+    before ``horizon``.
+
+    Returns:
+        Claimed runs, each with ``id``, ``name``, ``instructions``,
+        ``redis_instance_id`` and ``scheduled_at`` (datetime).
+    """
+    now = current_time or datetime.now(timezone.utc)
+    client = get_redis_client()
+    due_key = RedisKeys.schedules_due()
+
+    claimed: List[Dict[str, Any]] = []
+    while True:
+        schedule_ids = [
+            v.decode() if isinstance(v, bytes) else v
+            for v in await client.zrangebyscore(
+                due_key, "-inf", horizon.timestamp(), start=0, num=int(batch_size)
+            )
+        ]
+        if not schedule_ids:
+            return claimed
+
+        rows = await client.eval(
+            _CLAIM_DUE_SCHEDULES_SCRIPT,
+            1 + len(schedule_ids),
+            due_key,
+            *(RedisKeys.schedule_key(schedule_id) for schedule_id in schedule_ids),
+            repr(horizon.timestamp()),
+            repr(now.timestamp()),
+            *schedule_ids,
+        )
+        for row in rows or []:
+            schedule_id, due_at, name, instructions, redis_instance_id = (
+                v.decode() if isinstance(v, bytes) else v for v in row
+            )
+            claimed.append(
+                {
+                    "id": schedule_id,
+                    "name": name,
+                    "instructions": instructions,
+                    "redis_instance_id": redis_instance_id or None,
+                    "scheduled_at": datetime.fromtimestamp(float(due_at), tz=timezone.utc),
+                }
+            )
+        # Claimed entries move past their slot, so a full batch means more may
+        # still be due; a short one means the due range is drained.
+        if len(schedule_ids) < batch_size:
+            return claimed
+
+
+async def release_schedule_claims(runs: List[Dict[str, Any]]) -> None:
+    """Put claimed runs that could not be submitted back into the due set.
+
+    Each schedule is moved back to the earliest released ``scheduled_at`` so
+    the next scheduler pass claims it again. Schedules deleted or disabled in
+    the meantime are not re-added.
+    """
+    if not runs:
+        return
+    members: Dict[str, float] = {}
+    for run in runs:
+        score = run["scheduled_at"].timestamp()
+        members[run["id"]] = min(score, members.get(run["id"], score))
+    # XX keeps removed schedules out; LT only ever moves a schedule earlier
+    await get_redis_client().zadd(RedisKeys.schedules_due(), members, xx=True, lt=True)
+
+
 async def update_schedule_next_run(schedule_id: str, next_run_time: datetime) -> bool:
     """Update the next_run_at time for a schedule."""
     try:
         client = get_redis_client()
-        key = f"sre_schedules:{schedule_id}"
+        key = RedisKeys.schedule_key(schedule_id)
 
-        logger.info(
-            f"Updating schedule {schedule_id} next_run_at to {next_run_time} (timestamp: {next_run_time.timestamp()})"
+        pipe = client.pipeline(transaction=True)
+        pipe.hset(
+            key,
+            mapping={
+                "next_run_at": next_run_time.timestamp(),
+                "updated_at": datetime.now(timezone.utc).timestamp(),
+            },
         )
+        # XX: only reschedule schedules that are already due-tracked (enabled)
+        pipe.zadd(RedisKeys.schedules_due(), {schedule_id: next_run_time.timestamp()}, xx=True)
+        await pipe.execute()
 
-        # Update the next_run_at field
-        result1 = await client.hset(key, "next_run_at", next_run_time.timestamp())
-        result2 = await client.hset(key, "updated_at", datetime.now(timezone.utc).timestamp())
-
-        logger.info(f"Redis hset results: next_run_at={result1}, updated_at={result2}")
-
-        # Verify the update
-        updated_value = await client.hget(key, "next_run_at")
-        logger.info(f"Verified next_run_at value in Redis: {updated_value}")
-
-        logger.info(
-            f"Successfully updated next run time for schedule {schedule_id} to {next_run_time}"
-        )
+        logger.debug(f"Updated next run time for schedule {schedule_id} to {next_run_time}")
         return True
 
     except Exception as e:
@@ -298,11 +504,15 @@ async def update_schedule_last_run(schedule_id: str, last_run_time: datetime) ->
     """Update the last_run_at time for a schedule."""
     try:
         client = get_redis_client()
-        key = f"sre_schedules:{schedule_id}"
+        key = RedisKeys.schedule_key(schedule_id)
 
-        # Update the last_run_at field
-        await client.hset(key, "last_run_at", last_run_time.timestamp())
-        await client.hset(key, "updated_at", datetime.now(timezone.utc).timestamp())
+        await client.hset(
+            key,
+            mapping={
+                "last_run_at": last_run_time.timestamp(),
+                "updated_at": datetime.now(timezone.utc).timestamp(),
+            },
+        )
 
         logger.debug(f"Updated last run time for schedule {schedule_id} to {last_run_time}")
         return True
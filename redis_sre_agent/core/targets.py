@@ -9,7 +9,17 @@ import re
 import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence
+from typing import (
+    AbstractSet,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+)
 from urllib.parse import urlparse
 
 from pydantic import BaseModel, Field
@@ -27,7 +37,13 @@ from redis_sre_agent.core.instances import (
     get_instances,
     get_instances_strict,
 )
-from redis_sre_agent.core.redis import SRE_TARGETS_INDEX, get_redis_client, get_targets_index
+from redis_sre_agent.core.keys import RedisKeys
+from redis_sre_agent.core.redis import (
+    SRE_TARGETS_INDEX,
+    get_redis_client,
+    get_targets_index,
+    parse_generation,
+)
 from redis_sre_agent.core.threads import ThreadManager
 from redis_sre_agent.targets import (
     TargetBindingService,
@@ -69,6 +85,7 @@ _TYPE_HINTS = {
     "clustered": "oss_cluster",
 }
 _HEALTHY_STATUSES = {"healthy", "ok", "active", "available", "connected"}
+_IDENTIFIER_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_-")
 _AUTHORITATIVE_TARGET_CATALOG_CACHE_TTL_SECONDS = 30.0
 _authoritative_target_catalog_snapshot_cache: Optional[AuthoritativeTargetCatalogSnapshot] = None
 _authoritative_target_catalog_snapshot_cache_expires_at = 0.0
@@ -109,6 +126,31 @@ def _get_cached_authoritative_target_catalog_snapshot() -> Optional[
     return copy.deepcopy(_authoritative_target_catalog_snapshot_cache)
 
 
+async def bump_target_catalog_generation(client: Any = None) -> Optional[int]:
+    """Increment the shared catalog generation so every process rebuilds its index."""
+    try:
+        client = client or get_redis_client()
+        return parse_generation(await client.incr(RedisKeys.target_catalog_generation()))
+    except Exception:
+        logger.debug("Failed to bump target catalog generation", exc_info=True)
+        return None
+
+
+async def _read_target_catalog_generation() -> Optional[int]:
+    """Return the shared catalog generation, or None when it cannot be read."""
+    try:
+        raw = await get_redis_client().get(RedisKeys.target_catalog_generation())
+    except Exception:
+        return None
+    if raw is None:
+        return 0
+    return parse_generation(raw)
+
+
+def _sort_target_catalog_docs(docs: Iterable[TargetCatalogDoc]) -> List[TargetCatalogDoc]:
+    return sorted(docs, key=lambda doc: _to_epoch(doc.updated_at), reverse=True)
+
+
 class TargetCatalogDoc(BaseModel):
     """Safe denormalized metadata used for natural-language discovery."""
 
@@ -909,6 +951,8 @@ async def sync_target_catalog(
                 docs=docs,
             )
         )
+        generation = await bump_target_catalog_generation(client)
+        _target_index.update(_sort_target_catalog_docs(docs), generation=generation)
         return True
     except Exception:
         logger.exception("Failed to sync unified target catalog")
@@ -919,26 +963,70 @@ async def get_target_catalog(
     *,
     user_id: Optional[str] = None,
 ) -> List[TargetCatalogDoc]:
-    """Return all safe target docs from the unified discovery index."""
+    """Return all safe target docs from the unified discovery index.
+
+    Docs are served from the in-process ``TargetIndex`` while the shared
+    catalog generation is unchanged (bounded by the snapshot TTL); a bump
+    from any process triggers a reload and an incremental index update.
+    """
     try:
-        await _ensure_targets_index_exists()
-        index = await get_targets_index()
-        client = get_redis_client()
-        try:
-            total = await index.query(CountQuery(filter_expression="*"))
-        except Exception:
-            total = 1000
-
-        docs: List[TargetCatalogDoc] = []
-        if total:
-            q = FilterQuery(
-                filter_expression="*",
-                return_fields=["data"],
-                num_results=int(total) if isinstance(total, int) else 1000,
-            ).sort_by("updated_at", asc=False)
-            results = await index.query(q)
-            for doc in results or []:
-                raw = doc.get("data")
+        generation = await _read_target_catalog_generation()
+        if _target_index.is_current(generation):
+            return _target_index.docs(user_id=user_id)
+
+        version = _target_index.version
+        docs = await _load_target_catalog_docs(
+            refresh_authoritative=(
+                _target_index.generation is not None and generation != _target_index.generation
+            )
+        )
+        # A drift repair during the load already synced the index with a newer generation.
+        if _target_index.version == version:
+            _target_index.update(_sort_target_catalog_docs(docs), generation=generation)
+        return _target_index.docs(user_id=user_id)
+    except Exception:
+        logger.exception("Failed to load target catalog")
+        return []
+
+
+async def _load_target_catalog_docs(
+    *, refresh_authoritative: bool = False
+) -> List[TargetCatalogDoc]:
+    """Read the target index, repairing drift against authoritative records."""
+    await _ensure_targets_index_exists()
+    index = await get_targets_index()
+    client = get_redis_client()
+    try:
+        total = await index.query(CountQuery(filter_expression="*"))
+    except Exception:
+        total = 1000
+
+    docs: List[TargetCatalogDoc] = []
+    if total:
+        q = FilterQuery(
+            filter_expression="*",
+            return_fields=["data"],
+            num_results=int(total) if isinstance(total, int) else 1000,
+        ).sort_by("updated_at", asc=False)
+        results = await index.query(q)
+        for doc in results or []:
+            raw = doc.get("data")
+            if not raw:
+                continue
+            if isinstance(raw, bytes):
+                raw = raw.decode("utf-8")
+            try:
+                docs.append(TargetCatalogDoc.model_validate_json(raw))
+            except Exception:
+                continue
+
+    if not docs:
+        cursor = 0
+        prefix = f"{SRE_TARGETS_INDEX}:"
+        while True:
+            cursor, batch = await client.scan(cursor=cursor, match=f"{prefix}*")
+            for key in batch or []:
+                raw = await client.hget(key, "data")
                 if not raw:
                     continue
                 if isinstance(raw, bytes):
@@ -947,59 +1035,34 @@ async def get_target_catalog(
                     docs.append(TargetCatalogDoc.model_validate_json(raw))
                 except Exception:
                     continue
+            if cursor == 0:
+                break
 
-        if not docs:
-            cursor = 0
-            prefix = f"{SRE_TARGETS_INDEX}:"
-            while True:
-                cursor, batch = await client.scan(cursor=cursor, match=f"{prefix}*")
-                for key in batch or []:
-                    raw = await client.hget(key, "data")
-                    if not raw:
-                        continue
-                    if isinstance(raw, bytes):
-                        raw = raw.decode("utf-8")
-                    try:
-                        docs.append(TargetCatalogDoc.model_validate_json(raw))
-                    except Exception:
-                        continue
-                if cursor == 0:
-                    break
+    authoritative_snapshot: Optional[AuthoritativeTargetCatalogSnapshot] = None
+    try:
+        authoritative_snapshot = await load_authoritative_target_catalog_snapshot(
+            force_refresh=refresh_authoritative
+        )
+    except Exception:
+        logger.debug(
+            "Skipping target catalog drift repair because authoritative records were unavailable",
+            exc_info=True,
+        )
 
-        authoritative_snapshot: Optional[AuthoritativeTargetCatalogSnapshot] = None
+    if authoritative_snapshot and not _target_catalog_matches_authoritative_docs(
+        docs, authoritative_snapshot.docs
+    ):
+        logger.info("Target catalog drift detected; using authoritative instance/cluster records")
         try:
-            authoritative_snapshot = await load_authoritative_target_catalog_snapshot()
-        except Exception:
-            logger.debug(
-                "Skipping target catalog drift repair because authoritative records were unavailable",
-                exc_info=True,
+            await sync_target_catalog(
+                instances=authoritative_snapshot.instances,
+                clusters=authoritative_snapshot.clusters,
             )
+        except Exception:
+            logger.debug("Best-effort target catalog drift repair failed", exc_info=True)
+        docs = authoritative_snapshot.docs
 
-        if authoritative_snapshot and not _target_catalog_matches_authoritative_docs(
-            docs, authoritative_snapshot.docs
-        ):
-            logger.info(
-                "Target catalog drift detected; using authoritative instance/cluster records"
-            )
-            try:
-                await sync_target_catalog(
-                    instances=authoritative_snapshot.instances,
-                    clusters=authoritative_snapshot.clusters,
-                )
-            except Exception:
-                logger.debug("Best-effort target catalog drift repair failed", exc_info=True)
-            docs = authoritative_snapshot.docs
-
-        filtered: List[TargetCatalogDoc] = []
-        for parsed in docs:
-            if user_id and parsed.user_id not in {None, "", user_id}:
-                continue
-            filtered.append(parsed)
-        filtered.sort(key=lambda doc: _to_epoch(doc.updated_at), reverse=True)
-        return filtered
-    except Exception:
-        logger.exception("Failed to load target catalog")
-        return []
+    return docs
 
 
 def build_public_target_inventory_entry(
@@ -1098,7 +1161,7 @@ def _parse_query_hints(query: str) -> Dict[str, Any]:
         for match in _HOSTNAME_RE.finditer(normalized)
         if _looks_like_hostname_term(match.group(0))
     }
-    return {
+    hints = {
         "normalized": normalized,
         "token_list": token_list,
         "tokens": tokens,
@@ -1108,6 +1171,18 @@ def _parse_query_hints(query: str) -> Dict[str, Any]:
         "target_types": target_types,
         "hostname_terms": hostname_terms,
     }
+    hints["hint_tokens"] = _query_hint_tokens(hints)
+    return hints
+
+
+def _query_hint_tokens(hints: Dict[str, Any]) -> set[str]:
+    """Tokens consumed by attribute hints and excluded from free-text overlap."""
+    return (
+        set(hints["environments"])
+        | set(hints["usages"])
+        | set(hints["preferred_kinds"])
+        | {token for target_type in hints["target_types"] for token in _tokenize(target_type)}
+    )
 
 
 def _exact_target_terms(doc: TargetCatalogDoc) -> set[str]:
@@ -1152,48 +1227,100 @@ def _query_contains_exact_term(normalized_query: str, normalized_term: str) -> b
     """Return True when an exact target term appears on identifier boundaries."""
     if not normalized_query or not normalized_term:
         return False
-    pattern = re.compile(rf"(?<![a-z0-9_-]){re.escape(normalized_term)}(?![a-z0-9_-])")
-    return bool(pattern.search(normalized_query))
+    start = normalized_query.find(normalized_term)
+    while start != -1:
+        end = start + len(normalized_term)
+        if (start == 0 or normalized_query[start - 1] not in _IDENTIFIER_CHARS) and (
+            end == len(normalized_query) or normalized_query[end] not in _IDENTIFIER_CHARS
+        ):
+            return True
+        start = normalized_query.find(normalized_term, start + 1)
+    return False
 
 
-def _query_mentions_exact_target(doc: TargetCatalogDoc, hints: Dict[str, Any]) -> bool:
-    """Detect exact target mentions embedded inside a larger user query."""
+@dataclass
+class _TargetFeatures:
+    """Normalized terms and attributes of one catalog doc, computed once per doc."""
+
+    doc: TargetCatalogDoc
+    exact_terms: set[str]
+    # (first token, term) for exact terms spanning two or more tokens.
+    mention_terms: List[tuple[str, str]]
+    names: set[str]
+    aliases: List[tuple[str, str, frozenset[str]]]
+    tokens: set[str]
+    environment: str
+    usage: str
+    target_type: str
+    capabilities: set[str]
+    healthy: bool
+
+    @classmethod
+    def from_doc(cls, doc: TargetCatalogDoc) -> "_TargetFeatures":
+        exact_terms = _exact_target_terms(doc)
+        mention_terms: List[tuple[str, str]] = []
+        for term in exact_terms:
+            term_tokens = _tokenize(term)
+            if len(term_tokens) >= 2:
+                mention_terms.append((term_tokens[0], term))
+        aliases = [
+            (alias, _normalize(alias), frozenset(_tokenize(alias))) for alias in doc.search_aliases
+        ]
+        tokens = (
+            set(_tokenize(doc.display_name))
+            | set(_tokenize(doc.name))
+            | set(_tokenize(doc.search_text))
+        )
+        for _, _, alias_tokens in aliases:
+            tokens.update(alias_tokens)
+        return cls(
+            doc=doc,
+            exact_terms=exact_terms,
+            mention_terms=mention_terms,
+            names={_normalize(doc.display_name), _normalize(doc.name)},
+            aliases=aliases,
+            tokens=tokens,
+            environment=_normalize_environment(doc.environment),
+            usage=_normalize(doc.usage),
+            target_type=_normalize(doc.target_type),
+            capabilities={_normalize(capability) for capability in doc.capabilities},
+            healthy=_normalize(doc.status) in _HEALTHY_STATUSES,
+        )
+
+
+def _features_mention_exact_target(features: _TargetFeatures, hints: Dict[str, Any]) -> bool:
     normalized = hints["normalized"]
-    exact_terms = _exact_target_terms(doc)
-    if normalized and normalized in exact_terms:
+    if normalized and normalized in features.exact_terms:
         return True
-    for term in exact_terms:
-        term_tokens = _tokenize(term)
-        if len(term_tokens) < 2:
-            continue
-        if _query_contains_exact_term(normalized, term):
-            return True
-    return False
+    return any(_query_contains_exact_term(normalized, term) for _, term in features.mention_terms)
 
 
-def _score_target_doc(
-    query: str,
-    doc: TargetCatalogDoc,
-    *,
-    preferred_capabilities: Optional[Sequence[str]] = None,
-    hints: Optional[Dict[str, Any]] = None,
+def _query_mentions_exact_target(doc: TargetCatalogDoc, hints: Dict[str, Any]) -> bool:
+    """Detect exact target mentions embedded inside a larger user query."""
+    return _features_mention_exact_target(_TargetFeatures.from_doc(doc), hints)
+
+
+def _normalize_capabilities(capabilities: Optional[Sequence[str]]) -> set[str]:
+    return {_normalize(capability) for capability in capabilities or [] if capability}
+
+
+def _score_target_features(
+    features: _TargetFeatures,
+    hints: Dict[str, Any],
+    preferred_capabilities: Optional[set[str]] = None,
+    exact_target_mentioned: Optional[bool] = None,
 ) -> tuple[float, List[str]]:
-    hints = hints or _parse_query_hints(query)
+    doc = features.doc
     normalized = hints["normalized"]
     query_tokens = hints["tokens"]
     hostname_terms = set(hints.get("hostname_terms") or [])
     reasons: List[str] = []
     score = 0.0
 
-    name_tokens = set(_tokenize(doc.display_name)) | set(_tokenize(doc.name))
-    alias_tokens = set()
-    for alias in doc.search_aliases:
-        alias_tokens.update(_tokenize(alias))
-
-    exact_target_mentioned = _query_mentions_exact_target(doc, hints)
+    if exact_target_mentioned is None:
+        exact_target_mentioned = _features_mention_exact_target(features, hints)
     if hostname_terms:
-        exact_terms = _exact_target_terms(doc)
-        exact_hostname_matches = sorted(hostname_terms & exact_terms)
+        exact_hostname_matches = sorted(hostname_terms & features.exact_terms)
         if not exact_hostname_matches and not exact_target_mentioned:
             return 0.0, []
         if exact_hostname_matches:
@@ -1206,50 +1333,41 @@ def _score_target_doc(
         score += 7.5
         reasons.append("matched exact target reference")
 
-    if normalized and normalized in {_normalize(doc.display_name), _normalize(doc.name)}:
+    if normalized and normalized in features.names:
         score += 8.0
         reasons.append("matched exact target name")
 
-    exact_alias_matches = [alias for alias in doc.search_aliases if _normalize(alias) == normalized]
+    exact_alias_matches = [alias for alias, norm, _ in features.aliases if norm == normalized]
     if exact_alias_matches:
         score += 7.0
         reasons.append(f"matched alias={exact_alias_matches[0]}")
 
     partial_alias_matches: List[str] = []
-    for alias in doc.search_aliases:
-        alias_token_set = set(_tokenize(alias))
+    for alias, norm, alias_token_set in features.aliases:
         if not alias_token_set:
             continue
-        if alias_token_set <= query_tokens and _normalize(alias) != normalized:
+        if alias_token_set <= query_tokens and norm != normalized:
             partial_alias_matches.append(alias)
     if partial_alias_matches and not exact_alias_matches:
         score += 3.0
         reasons.append(f"matched alias={partial_alias_matches[0]}")
 
-    hint_tokens = (
-        set(hints["environments"])
-        | set(hints["usages"])
-        | set(hints["preferred_kinds"])
-        | {token for target_type in hints["target_types"] for token in _tokenize(target_type)}
-    )
-    token_overlap = sorted(
-        (query_tokens - hint_tokens)
-        & (name_tokens | alias_tokens | set(_tokenize(doc.search_text)))
-    )
+    hint_tokens = hints.get("hint_tokens")
+    if hint_tokens is None:
+        hint_tokens = _query_hint_tokens(hints)
+    token_overlap = sorted((query_tokens - hint_tokens) & features.tokens)
     if token_overlap:
         overlap_score = min(4.0, len(token_overlap) * 0.9)
         score += overlap_score
         reasons.append(f"matched tokens={','.join(token_overlap[:4])}")
 
-    normalized_environment = _normalize_environment(doc.environment)
-    if normalized_environment and normalized_environment in hints["environments"]:
+    if features.environment and features.environment in hints["environments"]:
         score += 3.0
-        reasons.append(f"matched environment={normalized_environment}")
+        reasons.append(f"matched environment={features.environment}")
 
-    normalized_usage = _normalize(doc.usage)
-    if normalized_usage and normalized_usage in hints["usages"]:
+    if features.usage and features.usage in hints["usages"]:
         score += 2.5
-        reasons.append(f"matched usage={normalized_usage}")
+        reasons.append(f"matched usage={features.usage}")
 
     if hints["preferred_kinds"]:
         if doc.target_kind in hints["preferred_kinds"]:
@@ -1258,24 +1376,37 @@ def _score_target_doc(
         else:
             score -= 0.5
 
-    if hints["target_types"] and _normalize(doc.target_type) in hints["target_types"]:
+    if hints["target_types"] and features.target_type in hints["target_types"]:
         score += 2.0
         reasons.append(f"matched type={doc.target_type}")
 
     if preferred_capabilities:
-        preferred = {_normalize(capability) for capability in preferred_capabilities if capability}
-        supported = {_normalize(capability) for capability in doc.capabilities}
-        matched = sorted(preferred & supported)
+        matched = sorted(preferred_capabilities & features.capabilities)
         if matched:
             score += min(2.0, len(matched) * 0.75)
             reasons.append(f"matched capabilities={','.join(matched[:3])}")
 
-    if _normalize(doc.status) in _HEALTHY_STATUSES:
+    if features.healthy:
         score += 0.2
 
     return score, reasons
 
 
+def _score_target_doc(
+    query: str,
+    doc: TargetCatalogDoc,
+    *,
+    preferred_capabilities: Optional[Sequence[str]] = None,
+    hints: Optional[Dict[str, Any]] = None,
+) -> tuple[float, List[str]]:
+    hints = hints or _parse_query_hints(query)
+    return _score_target_features(
+        _TargetFeatures.from_doc(doc),
+        hints,
+        _normalize_capabilities(preferred_capabilities),
+    )
+
+
 def _confidence_from_score(score: float) -> float:
     if score <= 0:
         return 0.0
@@ -1284,6 +1415,275 @@ def _confidence_from_score(score: float) -> float:
     return round(min(0.99, 0.45 + (score / 20.0)), 2)
 
 
+# Highest score a doc can reach without a postings hit or two of the
+# kind/type/capability bitsets: one 2.0 attribute bonus plus the 0.2 health bonus.
+_UNMATCHED_SCORE_CEILING = 2.2
+
+
+def _bit_positions(bits: int) -> List[int]:
+    """Return the set bit positions of ``bits`` in ascending order."""
+    text = bin(bits)[:1:-1]
+    positions: List[int] = []
+    position = text.find("1")
+    while position != -1:
+        positions.append(position)
+        position = text.find("1", position + 1)
+    return positions
+
+
+class _TargetCatalogView(list):
+    """Catalog docs returned by ``TargetIndex.docs`` that remember their source index."""
+
+    def __init__(
+        self,
+        docs: Iterable[TargetCatalogDoc],
+        index: "TargetIndex",
+        within: Optional[frozenset[int]],
+    ):
+        super().__init__(docs)
+        self.index = index
+        self.version = index.version
+        self.within = within
+
+
+class TargetIndex:
+    """In-process inverted index over the unified target catalog.
+
+    Each doc occupies a stable slot. Free-text tokens, exact identifiers
+    (names, aliases, hostnames) and multi-token mention terms map to sets of
+    slots; low-cardinality attributes (environment, usage, kind, type,
+    capability, owner) map to integer bitsets over the same slots. ``update``
+    re-tokenizes only docs that changed, so a catalog generation bump costs
+    time proportional to the edit rather than the catalog size.
+    """
+
+    def __init__(
+        self,
+        docs: Iterable[TargetCatalogDoc] = (),
+        *,
+        generation: Optional[int] = None,
+    ) -> None:
+        self.generation: Optional[int] = None
+        self.version = 0
+        self.built_at = 0.0
+        self._slots: Dict[str, int] = {}
+        self._features: List[Optional[_TargetFeatures]] = []
+        self._free_slots: List[int] = []
+        self._order: List[int] = []
+        self._rank: Dict[int, int] = {}
+        self._tokens: Dict[str, set[int]] = {}
+        self._exact: Dict[str, set[int]] = {}
+        self._mentions: Dict[str, Dict[str, set[int]]] = {}
+        self._environments: Dict[str, int] = {}
+        self._usages: Dict[str, int] = {}
+        self._kinds: Dict[str, int] = {}
+        self._types: Dict[str, int] = {}
+        self._capabilities: Dict[str, int] = {}
+        self._owners: Dict[str, int] = {}
+        self.update(docs, generation=generation)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def is_current(self, generation: Optional[int]) -> bool:
+        """Return whether this index reflects ``generation`` and is within the TTL."""
+        return (
+            generation is not None
+            and self.generation == generation
+            and time.monotonic() - self.built_at < _AUTHORITATIVE_TARGET_CATALOG_CACHE_TTL_SECONDS
+        )
+
+    def features(self, target_id: str) -> Optional[_TargetFeatures]:
+        slot = self._slots.get(target_id)
+        return self._features[slot] if slot is not None else None
+
+    def _postings(self, slot: int, features: _TargetFeatures, add: bool) -> None:
+        bit = 1 << slot
+        doc = features.doc
+
+        def _set(mapping: Dict[str, set[int]], key: str) -> None:
+            if add:
+                mapping.setdefault(key, set()).add(slot)
+                return
+            slots = mapping.get(key)
+            if slots is not None:
+                slots.discard(slot)
+                if not slots:
+                    del mapping[key]
+
+        def _bit(mapping: Dict[str, int], key: str, *, allow_empty: bool = False) -> None:
+            if not key and not allow_empty:
+                return
+            value = mapping.get(key, 0)
+            value = value | bit if add else value & ~bit
+            if value:
+                mapping[key] = value
+            else:
+                mapping.pop(key, None)
+
+        for token in features.tokens:
+            _set(self._tokens, token)
+        for term in features.exact_terms:
+            _set(self._exact, term)
+        for first_token, term in features.mention_terms:
+            terms = self._mentions.setdefault(first_token, {})
+            _set(terms, term)
+            if not terms:
+                del self._mentions[first_token]
+        _bit(self._environments, features.environment)
+        _bit(self._usages, features.usage)
+        _bit(self._kinds, doc.target_kind)
+        _bit(self._types, features.target_type)
+        for capability in features.capabilities:
+            _bit(self._capabilities, capability)
+        _bit(self._owners, doc.user_id or "", allow_empty=True)
+
+    def update(
+        self,
+        docs: Iterable[TargetCatalogDoc],
+        *,
+        generation: Optional[int] = None,
+    ) -> None:
+        """Sync the index with ``docs`` (in catalog order), re-indexing only changed docs."""
+        order: List[int] = []
+        seen: set[str] = set()
+        for doc in docs:
+            if doc.target_id in seen:
+                continue
+            seen.add(doc.target_id)
+            slot = self._slots.get(doc.target_id)
+            current = self._features[slot] if slot is not None else None
+            if current is None or (current.doc is not doc and current.doc != doc):
+                if current is not None:
+                    self._postings(slot, current, add=False)
+                elif self._free_slots:
+                    slot = self._free_slots.pop()
+                else:
+                    slot = len(self._features)
+                    self._features.append(None)
+                features = _TargetFeatures.from_doc(doc)
+                self._features[slot] = features
+                self._slots[doc.target_id] = slot
+                self._postings(slot, features, add=True)
+            order.append(slot)
+
+        for target_id in [target_id for target_id in self._slots if target_id not in seen]:
+            slot = self._slots.pop(target_id)
+            self._postings(slot, self._features[slot], add=False)
+            self._features[slot] = None
+            self._free_slots.append(slot)
+
+        self._order = order
+        self._rank = {slot: rank for rank, slot in enumerate(order)}
+        self.generation = generation
+        self.version += 1
+        self.built_at = time.monotonic()
+
+    def docs(self, *, user_id: Optional[str] = None) -> List[TargetCatalogDoc]:
+        """Return catalog docs visible to ``user_id`` in catalog order."""
+        slots = self._order
+        within: Optional[frozenset[int]] = None
+        if user_id:
+            owned = self._owners.get("", 0) | self._owners.get(user_id, 0)
+            within = frozenset(_bit_positions(owned))
+            slots = [slot for slot in slots if slot in within]
+        return _TargetCatalogView((self._features[slot].doc for slot in slots), self, within)
+
+    def _mentioned(self, hints: Dict[str, Any]) -> set[int]:
+        """Slots whose exact terms equal or appear inside the query."""
+        normalized = hints["normalized"]
+        mentioned = set(self._exact.get(normalized, ()))
+        for token in hints["tokens"]:
+            for term, slots in self._mentions.get(token, {}).items():
+                if _query_contains_exact_term(normalized, term):
+                    mentioned |= slots
+        return mentioned
+
+    def _candidates(
+        self,
+        hints: Dict[str, Any],
+        preferred_capabilities: set[str],
+        mentioned: set[int],
+    ) -> set[int]:
+        """Slots that can score above ``_UNMATCHED_SCORE_CEILING`` for this query."""
+        candidates = set(mentioned)
+        for token in hints["tokens"]:
+            candidates |= self._tokens.get(token, set())
+
+        bits = 0
+        for environment in hints["environments"]:
+            bits |= self._environments.get(environment, 0)
+        for usage in hints["usages"]:
+            bits |= self._usages.get(usage, 0)
+        kinds = types = capabilities = 0
+        for kind in hints["preferred_kinds"]:
+            kinds |= self._kinds.get(kind, 0)
+        for target_type in hints["target_types"]:
+            types |= self._types.get(target_type, 0)
+        for capability in preferred_capabilities:
+            capabilities |= self._capabilities.get(capability, 0)
+        bits |= (kinds & types) | (kinds & capabilities) | (types & capabilities)
+        candidates.update(_bit_positions(bits))
+
+        hostname_terms = hints.get("hostname_terms")
+        if hostname_terms:
+            gate = set(mentioned)
+            for term in hostname_terms:
+                gate |= self._exact.get(term, set())
+            candidates &= gate
+        return candidates
+
+    def search(
+        self,
+        hints: Dict[str, Any],
+        *,
+        preferred_capabilities: Optional[Sequence[str]] = None,
+        min_score: float = 2.5,
+        within: Optional[AbstractSet[int]] = None,
+    ) -> List[tuple[_TargetFeatures, float, List[str]]]:
+        """Score matching docs, returning those at or above ``min_score`` in catalog order.
+
+        ``within`` restricts the search to a set of slots, such as those of a
+        ``docs(user_id=...)`` view.
+        """
+        preferred = _normalize_capabilities(preferred_capabilities)
+        mentioned = self._mentioned(hints)
+        if min_score > _UNMATCHED_SCORE_CEILING:
+            slots = sorted(
+                self._candidates(hints, preferred, mentioned), key=self._rank.__getitem__
+            )
+        else:
+            slots = self._order
+        if within is not None:
+            slots = [slot for slot in slots if slot in within]
+
+        results: List[tuple[_TargetFeatures, float, List[str]]] = []
+        for slot in slots:
+            features = self._features[slot]
+            score, reasons = _score_target_features(
+                features, hints, preferred, exact_target_mentioned=slot in mentioned
+            )
+            if score >= min_score:
+                results.append((features, score, reasons))
+        return results
+
+
+_target_index = TargetIndex()
+
+
+def _target_index_for_docs(
+    docs: Sequence[TargetCatalogDoc],
+) -> tuple[TargetIndex, Optional[frozenset[int]]]:
+    """Return an index covering exactly ``docs`` and the slots to search within.
+
+    Views returned by ``get_target_catalog`` reuse the shared index; any other
+    doc list (patched catalogs, eval fixtures) gets a throwaway index.
+    """
+    if isinstance(docs, _TargetCatalogView) and docs.version == docs.index.version:
+        return docs.index, docs.within
+    return TargetIndex(docs), None
+
+
 async def resolve_target_query(
     *,
     query: str,
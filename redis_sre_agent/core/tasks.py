@@ -6,11 +6,16 @@ We persist per-task status, progress updates, and a final result.
 
 from __future__ import annotations
 
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from pydantic import BaseModel, Field
+from redis.exceptions import ResponseError
 from redisvl.query import FilterQuery
 from redisvl.query.filter import Tag
 from ulid import ULID
@@ -20,6 +25,14 @@ from redis_sre_agent.core.keys import RedisKeys
 from redis_sre_agent.core.redis import get_redis_client, get_tasks_index
 from redis_sre_agent.core.threads import ThreadManager
 
+logger = logging.getLogger(__name__)
+
+# Task search docs expire 24 hours after their last refresh
+TASK_SEARCH_DOC_TTL_SECONDS = 86400
+
+# Set once this process has confirmed the tasks FT index exists
+_tasks_index_ready = False
+
 
 class TaskMetadata(BaseModel):
     created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
@@ -61,9 +74,193 @@ class TaskState(BaseModel):
     metadata: TaskMetadata = Field(default_factory=TaskMetadata)
 
 
+@dataclass
+class _PendingTaskUpdate:
+    task_id: str
+    thread_id: Optional[str]
+    update: TaskUpdate
+    refresh_search_doc: bool
+    future: asyncio.Future
+
+
+class TaskUpdateWriter:
+    """Coalesce task progress updates into pipelined Redis round trips.
+
+    Updates submitted within ``flush_interval`` seconds of each other are
+    buffered and written together in one MULTI/EXEC: a single RPUSH per task,
+    the metadata ``updated_at`` bump, the search doc ``updated_at`` refresh,
+    and the XADDs that feed WebSocket subscribers. Callers still await their
+    own update and receive the resulting update list length, or the error
+    that affected their own update; stream publish errors are only logged.
+    """
+
+    def __init__(self, redis_client, flush_interval: float = 0.005):
+        self._redis = redis_client
+        self._flush_interval = max(0.0, flush_interval)
+        self._pending: List[_PendingTaskUpdate] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def submit(
+        self,
+        task_id: str,
+        update: TaskUpdate,
+        *,
+        thread_id: Optional[str],
+        refresh_search_doc: bool,
+    ) -> int:
+        """Buffer an update and wait until the batch containing it is flushed."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append(
+            _PendingTaskUpdate(
+                task_id=task_id,
+                thread_id=thread_id,
+                update=update,
+                refresh_search_doc=refresh_search_doc,
+                future=future,
+            )
+        )
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_interval())
+        return await future
+
+    async def flush(self) -> None:
+        """Write all buffered updates now."""
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        try:
+            outcomes = await self._write_batch(batch)
+        except Exception as e:
+            outcomes = {id(pending): e for pending in batch}
+        for pending in batch:
+            if pending.future.done():
+                continue
+            outcome = outcomes[id(pending)]
+            if isinstance(outcome, Exception):
+                pending.future.set_exception(outcome)
+            else:
+                pending.future.set_result(outcome)
+
+    async def _flush_after_interval(self) -> None:
+        try:
+            if self._flush_interval:
+                await asyncio.sleep(self._flush_interval)
+        finally:
+            self._flush_task = None
+            await self.flush()
+
+    async def _write_batch(
+        self, batch: List[_PendingTaskUpdate]
+    ) -> Dict[int, Union[int, Exception]]:
+        """Write a batch; returns each update's list length or error by ``id``."""
+        outcomes: Dict[int, Union[int, Exception]] = {}
+        by_task: Dict[str, List[Tuple[_PendingTaskUpdate, str]]] = {}
+        for pending in batch:
+            try:
+                payload = json.dumps(pending.update.model_dump())
+            except Exception as e:
+                outcomes[id(pending)] = e
+                continue
+            by_task.setdefault(pending.task_id, []).append((pending, payload))
+        if not by_task:
+            return outcomes
+
+        try:
+            outcomes.update(await self._write_tasks(by_task))
+        except ResponseError:
+            if len(by_task) == 1:
+                raise
+            # A command rejected while queueing aborts the whole MULTI without
+            # applying anything, so write each task alone to isolate it.
+            for task_id, updates in by_task.items():
+                try:
+                    outcomes.update(await self._write_tasks({task_id: updates}))
+                except Exception as e:
+                    outcomes.update({id(pending): e for pending, _ in updates})
+        return outcomes
+
+    async def _write_tasks(
+        self, by_task: Dict[str, List[Tuple[_PendingTaskUpdate, str]]]
+    ) -> Dict[int, Union[int, Exception]]:
+        from redis_sre_agent.api.websockets import (
+            TASK_STREAM_TTL_SECONDS,
+            encode_task_stream_event,
+        )
+        from redis_sre_agent.core.redis import SRE_TASKS_INDEX
+
+        now = datetime.now(timezone.utc)
+        streams: set[str] = set()
+        # Number of commands queued per task before the stream writes
+        command_counts: Dict[str, int] = {}
+        async with self._redis.pipeline(transaction=True) as pipe:
+            for task_id, updates in by_task.items():
+                pipe.rpush(RedisKeys.task_updates(task_id), *[payload for _, payload in updates])
+                pipe.hset(RedisKeys.task_metadata(task_id), "updated_at", now.isoformat())
+                command_counts[task_id] = 2
+                if any(pending.refresh_search_doc for pending, _ in updates):
+                    # Only updated_at changes on a progress update; the other
+                    # indexed fields were written by the last full upsert.
+                    search_key = f"{SRE_TASKS_INDEX}:{task_id}"
+                    pipe.hset(search_key, "updated_at", now.timestamp())
+                    pipe.expire(search_key, TASK_SEARCH_DOC_TTL_SECONDS)
+                    command_counts[task_id] += 2
+            for updates in by_task.values():
+                for pending, _ in updates:
+                    if not pending.thread_id:
+                        continue
+                    try:
+                        fields = encode_task_stream_event(
+                            pending.thread_id,
+                            pending.update.update_type,
+                            {
+                                "message": pending.update.message,
+                                "update_type": pending.update.update_type,
+                                "metadata": pending.update.metadata or {},
+                                "timestamp": pending.update.timestamp,
+                                "task_id": pending.task_id,
+                            },
+                        )
+                    except Exception as e:
+                        logger.warning(
+                            f"Failed to publish stream update for {pending.thread_id}: {e}"
+                        )
+                        continue
+                    stream_key = RedisKeys.task_stream(pending.thread_id)
+                    pipe.xadd(stream_key, fields)
+                    streams.add(stream_key)
+            for stream_key in streams:
+                pipe.expire(stream_key, TASK_STREAM_TTL_SECONDS)
+            results = await pipe.execute(raise_on_error=False)
+
+        # Results start with each task's RPUSH and HSET (plus the optional
+        # search doc HSET/EXPIRE); map list lengths back to updates.
+        outcomes: Dict[int, Union[int, Exception]] = {}
+        cursor = 0
+        for task_id, updates in by_task.items():
+            task_results = results[cursor : cursor + command_counts[task_id]]
+            cursor += command_counts[task_id]
+            error = next((r for r in task_results if isinstance(r, Exception)), None)
+            final_length = 0 if error else int(task_results[0] or 0)
+            for offset, (pending, _) in enumerate(updates):
+                outcomes[id(pending)] = error or final_length - (len(updates) - 1 - offset)
+        for result in results[cursor:]:
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to publish task stream update: {result}")
+        return outcomes
+
+
 class TaskManager:
-    def __init__(self, redis_client=None):
+    def __init__(self, redis_client=None, update_flush_interval: Optional[float] = None):
         self._redis = redis_client or get_redis_client()
+        if update_flush_interval is None:
+            from redis_sre_agent.core.config import settings
+
+            update_flush_interval = settings.task_update_flush_interval_ms / 1000.0
+        self._update_writer = TaskUpdateWriter(self._redis, flush_interval=update_flush_interval)
+        # A task's thread never changes, so cache it for the life of the manager
+        self._task_thread_ids: Dict[str, str] = {}
+        # Last indexed fields (minus updated_at) written to each task's search doc
+        self._search_doc_fields: Dict[str, Tuple[str, ...]] = {}
 
     async def create_task(
         self, *, thread_id: str, user_id: Optional[str] = None, subject: Optional[str] = None
@@ -85,6 +282,7 @@ class TaskManager:
             RedisKeys.thread_tasks_index(thread_id),
             {task_id: datetime.now(timezone.utc).timestamp()},
         )
+        self._task_thread_ids[task_id] = thread_id
         # Upsert search doc
         await self._upsert_task_search_doc(task_id)
         return task_id
@@ -104,40 +302,41 @@ class TaskManager:
         update_type: str = "progress",
         metadata: Optional[Dict[str, Any]] = None,
     ) -> bool:
-        import json
+        """Append a progress update to the task.
 
+        The update list, metadata timestamp, search doc timestamp and the
+        WebSocket stream entry are written in one pipelined round trip, shared
+        with any other updates submitted within the flush interval.
+        """
         update = TaskUpdate(message=message, update_type=update_type, metadata=metadata)
 
-        ok = await self._redis.rpush(
-            RedisKeys.task_updates(task_id), json.dumps(update.model_dump())
-        )
-        await self._redis.hset(
-            RedisKeys.task_metadata(task_id), "updated_at", datetime.now(timezone.utc).isoformat()
+        thread_id = await self._get_task_thread_id(task_id)
+        search_doc_seeded = task_id in self._search_doc_fields
+        length = await self._update_writer.submit(
+            task_id,
+            update,
+            thread_id=thread_id,
+            refresh_search_doc=search_doc_seeded,
         )
-        await self._upsert_task_search_doc(task_id)
+        if not search_doc_seeded:
+            await self._upsert_task_search_doc(task_id)
 
-        # Publish to stream for WebSocket real-time updates
-        thread_id = await self._get_task_thread_id(task_id)
-        if thread_id:
-            await self._publish_stream_update(
-                thread_id,
-                update_type,
-                {
-                    "message": message,
-                    "update_type": update_type,
-                    "metadata": metadata or {},
-                    "timestamp": update.timestamp,
-                    "task_id": task_id,
-                },
-            )
+        return bool(length)
 
-        return bool(ok)
+    async def flush_task_updates(self) -> None:
+        """Write any buffered task updates immediately."""
+        await self._update_writer.flush()
 
     async def _get_task_thread_id(self, task_id: str) -> Optional[str]:
         """Get the thread_id for a task from its metadata."""
+        cached = self._task_thread_ids.get(task_id)
+        if cached:
+            return cached
         thread_id = await self._redis.hget(RedisKeys.task_metadata(task_id), "thread_id")
         if thread_id and isinstance(thread_id, bytes):
             thread_id = thread_id.decode()
+        if thread_id:
+            self._task_thread_ids[task_id] = thread_id
         return thread_id
 
     async def _publish_stream_update(
@@ -243,16 +442,19 @@ class TaskManager:
 
     async def _upsert_task_search_doc(self, task_id: str) -> bool:
         """Upsert a simplified task document into the tasks FT index (hash)."""
+        global _tasks_index_ready
         try:
             from redis_sre_agent.core.redis import SRE_TASKS_INDEX, get_tasks_index
 
-            # Ensure index exists (best-effort)
-            try:
-                index = await get_tasks_index()
-                if not await index.exists():
-                    await index.create()
-            except Exception:
-                pass
+            # Ensure index exists (best-effort, once per process)
+            if not _tasks_index_ready:
+                try:
+                    index = await get_tasks_index()
+                    if not await index.exists():
+                        await index.create()
+                    _tasks_index_ready = True
+                except Exception:
+                    pass
 
             status = await self._redis.get(RedisKeys.task_status(task_id))
             md_raw = await self._redis.hgetall(RedisKeys.task_metadata(task_id))
@@ -290,18 +492,32 @@ class TaskManager:
                 updated_ts = datetime.now(timezone.utc).timestamp()
 
             key = f"{SRE_TASKS_INDEX}:{task_id}"
-            await self._redis.hset(
-                key,
-                mapping={
-                    "status": status_s,
-                    "subject": subject or "",
-                    "user_id": user_id or "",
-                    "thread_id": thread_id or "",
-                    "created_at": created_ts,
-                    "updated_at": updated_ts,
-                },
+            indexed_fields = (
+                status_s,
+                subject or "",
+                user_id or "",
+                thread_id or "",
+                str(created_ts),
             )
-            await self._redis.expire(key, 86400)
+            if self._search_doc_fields.get(task_id) == indexed_fields:
+                # Nothing but the timestamp changed since our last write
+                await self._redis.hset(key, "updated_at", updated_ts)
+            else:
+                await self._redis.hset(
+                    key,
+                    mapping={
+                        "status": status_s,
+                        "subject": subject or "",
+                        "user_id": user_id or "",
+                        "thread_id": thread_id or "",
+                        "created_at": created_ts,
+                        "updated_at": updated_ts,
+                    },
+                )
+            await self._redis.expire(key, TASK_SEARCH_DOC_TTL_SECONDS)
+            self._search_doc_fields[task_id] = indexed_fields
+            if thread_id:
+                self._task_thread_ids[task_id] = thread_id
             return True
         except Exception:
             return False
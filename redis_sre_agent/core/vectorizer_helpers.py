@@ -1,9 +1,20 @@
-"""Helper functions for creating vectorizers with consistent configuration."""
+"""Helper functions for creating vectorizers with consistent configuration.
 
+``get_cached_vectorizer`` keeps one vectorizer per event loop and (provider,
+model, config fingerprint), so repeated lookups are cheap and each embedding
+cache uses its loop's pooled Redis connections instead of opening a client.
+"""
+
+import asyncio
+import hashlib
 import importlib
+import json
 import logging
-from typing import Any, Optional, Protocol
+import threading
+import weakref
+from typing import Any, Dict, Optional, Protocol, Tuple
 
+from pydantic import SecretStr
 from redisvl.extensions.cache.embeddings.embeddings import EmbeddingsCache
 
 from redis_sre_agent.core.config import Settings, settings
@@ -37,6 +48,11 @@ _vectorizer_factory: Optional[VectorizerFactory] = None
 _settings_vectorizer_factory: Optional[VectorizerFactory] = None
 _factory_initialized: bool = False
 
+# event loop -> (provider, model, config fingerprint) -> vectorizer; entries
+# disappear with their loop, like the Redis pools their caches borrow
+_vectorizers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_vectorizers_lock = threading.Lock()
+
 
 def _resolve_factory_from_path(factory_path: str) -> VectorizerFactory:
     """Resolve a vectorizer factory from a dot-path import string."""
@@ -81,6 +97,7 @@ def set_vectorizer_factory(factory: Optional[VectorizerFactory]) -> None:
     _vectorizer_factory = factory
     _settings_vectorizer_factory = None
     _factory_initialized = True
+    clear_vectorizer_cache()
 
 
 def get_vectorizer_factory() -> Optional[VectorizerFactory]:
@@ -91,10 +108,18 @@ def get_vectorizer_factory() -> Optional[VectorizerFactory]:
 
 
 def _build_embeddings_cache(config: Settings) -> EmbeddingsCache:
-    """Build the shared Redis-backed embeddings cache for a vectorizer instance."""
+    """Build the shared Redis-backed embeddings cache for a vectorizer instance.
+
+    The cache borrows the running loop's pooled client (a standalone client
+    outside a loop) rather than opening its own.
+    """
+    from redis_sre_agent.core.redis import get_redis_client
+
+    redis_url = config.redis_url.get_secret_value()
     return EmbeddingsCache(
         name="sre_embeddings_cache",
-        redis_url=config.redis_url.get_secret_value(),
+        redis_url=redis_url,
+        async_redis_client=get_redis_client(url=redis_url),
         ttl=config.embeddings_cache_ttl,
     )
 
@@ -121,6 +146,7 @@ def _default_vectorizer_factory(
         return redis_core.HFTextVectorizer(
             model=resolved_model,
             cache=cache,
+            dtype=config.vector_datatype,
             **kwargs,
         )
 
@@ -136,6 +162,7 @@ def _default_vectorizer_factory(
                 "api_key": config.openai_api_key,
                 **({"base_url": config.openai_base_url} if config.openai_base_url else {}),
             },
+            dtype=config.vector_datatype,
             **kwargs,
         )
 
@@ -179,12 +206,14 @@ def _validate_vectorizer_instance(vectorizer: Any) -> Vectorizer:
 def create_vectorizer(
     config: Optional[Settings] = None,
     model: Optional[str] = None,
+    cache: Optional[EmbeddingsCache] = None,
     **kwargs,
 ) -> Vectorizer:
     """Create a vectorizer using the registered factory or the default implementation."""
     cfg = config or settings
     factory = _resolve_factory(cfg, explicit_config=config is not None)
-    cache = _build_embeddings_cache(cfg)
+    if cache is None:
+        cache = _build_embeddings_cache(cfg)
     active_factory = factory if factory is not None else _default_vectorizer_factory
     vectorizer = active_factory(
         provider=cfg.embedding_provider,
@@ -194,3 +223,105 @@ def create_vectorizer(
         **kwargs,
     )
     return _validate_vectorizer_instance(vectorizer)
+
+
+def _plain_secret(value: Any) -> Any:
+    """Unwrap a ``SecretStr``; its ``str()`` is a mask shared by every secret."""
+    return value.get_secret_value() if isinstance(value, SecretStr) else value
+
+
+def _config_fingerprint(
+    config: Settings, factory: Optional[VectorizerFactory], kwargs: Dict[str, Any]
+) -> str:
+    """Return a short ID for the settings that shape a vectorizer instance."""
+    factory_id = (
+        f"{getattr(factory, '__module__', '')}.{getattr(factory, '__qualname__', id(factory))}"
+        if factory is not None
+        else None
+    )
+    payload = json.dumps(
+        [
+            config.redis_url.get_secret_value(),
+            config.embeddings_cache_ttl,
+            _plain_secret(config.openai_api_key),
+            config.openai_base_url,
+            config.vector_datatype,
+            factory_id,
+            sorted(kwargs.items()),
+        ],
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def get_cached_vectorizer(
+    config: Optional[Settings] = None,
+    model: Optional[str] = None,
+    **kwargs,
+) -> Vectorizer:
+    """Return the running loop's vectorizer for the effective configuration.
+
+    Instances are built with ``create_vectorizer`` on first use and then reused
+    on the same loop, keyed by provider, model and a fingerprint of the
+    settings that affect construction. Outside a running loop a new vectorizer
+    is returned on every call.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return create_vectorizer(config=config, model=model, **kwargs)
+    return _get_loop_vectorizer(loop, config, model, kwargs)
+
+
+def _get_loop_vectorizer(
+    loop: asyncio.AbstractEventLoop,
+    config: Optional[Settings],
+    model: Optional[str],
+    kwargs: Dict[str, Any],
+    cache: Optional[EmbeddingsCache] = None,
+) -> Vectorizer:
+    """Return ``loop``'s cached vectorizer, building it with ``cache`` if missing.
+
+    Construction happens under a lock so concurrent first calls, including
+    ones from worker threads, load a local model only once per loop.
+    """
+    cfg = config or settings
+    factory = _resolve_factory(cfg, explicit_config=config is not None)
+    resolved_model = model or cfg.embedding_model
+    key = (
+        str(cfg.embedding_provider).lower(),
+        resolved_model,
+        _config_fingerprint(cfg, factory, kwargs),
+    )
+    with _vectorizers_lock:
+        vectorizers: Dict[Tuple[str, str, str], Vectorizer] = _vectorizers.setdefault(loop, {})
+        vectorizer = vectorizers.get(key)
+        if vectorizer is None:
+            vectorizer = create_vectorizer(config=config, model=model, cache=cache, **kwargs)
+            vectorizers[key] = vectorizer
+            logger.info(
+                "Created %s vectorizer for model %s (fingerprint %s)", key[0], key[1], key[2]
+            )
+    return vectorizer
+
+
+def clear_vectorizer_cache() -> None:
+    """Drop all cached vectorizer instances (e.g. after a factory change)."""
+    with _vectorizers_lock:
+        _vectorizers.clear()
+
+
+async def prewarm_vectorizer(config: Optional[Settings] = None) -> Vectorizer:
+    """Build the cached vectorizer off the event loop and run one embedding.
+
+    Loading a local sentence-transformers model can take seconds, so startup
+    does it in a worker thread instead of stalling the first knowledge search.
+    """
+    # The embeddings cache must borrow this loop's pool, so build it here
+    # rather than in the worker thread
+    cache = _build_embeddings_cache(config or settings)
+    vectorizer = await asyncio.to_thread(
+        _get_loop_vectorizer, asyncio.get_running_loop(), config, None, {}, cache
+    )
+    await vectorizer.aembed("warmup")
+    return vectorizer
@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
-import base64
+import hashlib
 import json
 import shutil
 import subprocess
 import tempfile
 import uuid
 from pathlib import Path
-from typing import Any, Optional
-from zipfile import ZIP_DEFLATED, ZipFile
+from typing import IO, Any, AsyncIterator, Optional
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 from redis_sre_agent.core.config import Settings, settings
 from redis_sre_agent.core.redis import SRE_KNOWLEDGE_SCHEMA, get_knowledge_index
@@ -23,6 +23,7 @@ from .models import (
     AIRGAP_VECTOR_DIM,
     KNOWLEDGE_PACK_ACTIVE_REGISTRY_FILE,
     KNOWLEDGE_PACK_CHUNK_RECORDS_FILE,
+    KNOWLEDGE_PACK_CHUNK_VECTORS_FILE,
     KNOWLEDGE_PACK_DOCUMENT_META_FILE,
     KNOWLEDGE_PACK_SOURCE_META_FILE,
     STANDARD_PACK_PROFILE,
@@ -34,6 +35,8 @@ from .utils import utcnow
 
 _MANIFEST_FILE = "manifest.json"
 _CHECKSUMS_FILE = "checksums.txt"
+# Hashes fetched per pipeline round trip while exporting
+_HGETALL_BATCH_SIZE = 500
 
 
 def _git_rev_parse(target: str, cwd: Path) -> str | None:
@@ -50,21 +53,35 @@ def _json_dumps(payload: dict[str, Any]) -> str:
     return json.dumps(payload, sort_keys=True, separators=(",", ":"))
 
 
-def build_knowledge_schema(vector_dim: int) -> dict[str, Any]:
-    """Return the knowledge schema with an explicit vector dimension."""
+# Vector attributes that stored chunk vectors depend on. Index tuning (algorithm,
+# HNSW parameters) is applied when the index is created and does not affect
+# whether a pack's vectors can be restored, so it stays out of the schema hash.
+_RESTORE_VECTOR_ATTRS = ("dims", "distance_metric", "datatype")
+
+
+def build_knowledge_schema(
+    vector_dim: int, vector_datatype: Optional[str] = None
+) -> dict[str, Any]:
+    """Return the restore-relevant knowledge schema for one vector dimension.
+
+    The vector field keeps only ``_RESTORE_VECTOR_ATTRS``; ``vector_datatype``
+    overrides the configured datatype when given.
+    """
     schema = json.loads(json.dumps(SRE_KNOWLEDGE_SCHEMA))
     for field in schema.get("fields", []):
         if field.get("name") == "vector":
-            field.setdefault("attrs", {})["dims"] = vector_dim
+            attrs = field.get("attrs", {})
+            field["attrs"] = {key: attrs[key] for key in _RESTORE_VECTOR_ATTRS if key in attrs}
+            field["attrs"]["dims"] = vector_dim
+            if vector_datatype is not None:
+                field["attrs"]["datatype"] = vector_datatype
     return schema
 
 
-def compute_schema_hash(vector_dim: int) -> str:
-    """Return a stable schema hash for one vector dimension."""
-    import hashlib
-
+def compute_schema_hash(vector_dim: int, vector_datatype: Optional[str] = None) -> str:
+    """Return a stable schema hash for one vector dimension and datatype."""
     return hashlib.sha256(
-        _json_dumps(build_knowledge_schema(vector_dim)).encode("utf-8")
+        _json_dumps(build_knowledge_schema(vector_dim, vector_datatype)).encode("utf-8")
     ).hexdigest()
 
 
@@ -76,8 +93,6 @@ def compute_embedding_fingerprint(
     schema_hash: str,
 ) -> str:
     """Return a stable fingerprint describing restore compatibility."""
-    import hashlib
-
     payload = _json_dumps(
         {
             "embedding_provider": embedding_provider,
@@ -120,7 +135,7 @@ def _normalize_hash_mapping(raw_mapping: dict[Any, Any]) -> dict[str, Any]:
     return normalized
 
 
-def _normalize_chunk_payload(raw_mapping: dict[Any, Any]) -> tuple[dict[str, Any], str]:
+def _normalize_chunk_payload(raw_mapping: dict[Any, Any]) -> tuple[dict[str, Any], bytes]:
     mapping = _normalize_hash_mapping(raw_mapping)
     vector = mapping.pop("vector", b"")
     if isinstance(vector, str):
@@ -134,7 +149,7 @@ def _normalize_chunk_payload(raw_mapping: dict[Any, Any]) -> tuple[dict[str, Any
             payload[key] = value.decode("utf-8")
         else:
             payload[key] = value
-    return payload, base64.b64encode(vector_bytes).decode("ascii")
+    return payload, vector_bytes
 
 
 def _normalize_meta_mapping(raw_mapping: dict[Any, Any]) -> dict[str, str]:
@@ -148,23 +163,88 @@ def _normalize_meta_mapping(raw_mapping: dict[Any, Any]) -> dict[str, str]:
     return normalized
 
 
-async def _scan_chunk_records(redis_client: Any) -> list[dict[str, Any]]:
-    records: list[dict[str, Any]] = []
-    async for key in redis_client.scan_iter(match="sre_knowledge:*:chunk:*"):
-        normalized_key = key.decode("utf-8") if isinstance(key, bytes) else str(key)
-        raw_mapping = await redis_client.hgetall(key)
-        payload, vector_b64 = _normalize_chunk_payload(raw_mapping)
-        records.append({"key": normalized_key, "payload": payload, "vector_b64": vector_b64})
-    return sorted(records, key=lambda item: item["key"])
+async def _scan_keys(redis_client: Any, pattern: str) -> list[str]:
+    keys: set[str] = set()
+    async for key in redis_client.scan_iter(match=pattern, count=1000):
+        keys.add(key.decode("utf-8") if isinstance(key, bytes) else str(key))
+    return sorted(keys)
+
+
+async def _hgetall_batches(
+    redis_client: Any, keys: list[str]
+) -> AsyncIterator[list[tuple[str, dict[Any, Any]]]]:
+    """Yield ``(key, mapping)`` pairs, fetching one pipelined batch of hashes at a time."""
+    for idx in range(0, len(keys), _HGETALL_BATCH_SIZE):
+        batch = keys[idx : idx + _HGETALL_BATCH_SIZE]
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for key in batch:
+                pipe.hgetall(key)
+            mappings = await pipe.execute()
+        yield list(zip(batch, mappings))
+
+
+class _HashingWriter:
+    """Binary writer that tracks the sha256 of everything written through it."""
+
+    def __init__(self, handle: IO[bytes]) -> None:
+        self._handle = handle
+        self._digest = hashlib.sha256()
+
+    def write(self, data: bytes) -> None:
+        self._digest.update(data)
+        self._handle.write(data)
+
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
+
+
+async def _write_chunk_records(
+    redis_client: Any,
+    chunk_keys: list[str],
+    records: _HashingWriter,
+    vectors: _HashingWriter,
+) -> list[str]:
+    """Stream chunk hashes into the record stream and the vector sidecar.
+
+    Returns the keys actually written; chunks deleted after the key scan are skipped.
+    """
+    written: list[str] = []
+    offset = 0
+    async for batch in _hgetall_batches(redis_client, chunk_keys):
+        lines: list[str] = []
+        for key, raw_mapping in batch:
+            if not raw_mapping:
+                continue
+            payload, vector = _normalize_chunk_payload(raw_mapping)
+            vectors.write(vector)
+            lines.append(
+                json.dumps(
+                    {
+                        "key": key,
+                        "payload": payload,
+                        "vector_offset": offset,
+                        "vector_length": len(vector),
+                    },
+                    sort_keys=True,
+                )
+                + "\n"
+            )
+            offset += len(vector)
+            written.append(key)
+        records.write("".join(lines).encode("utf-8"))
+    return written
 
 
 async def _scan_meta_records(redis_client: Any, pattern: str) -> list[dict[str, Any]]:
+    keys = await _scan_keys(redis_client, pattern)
     records: list[dict[str, Any]] = []
-    async for key in redis_client.scan_iter(match=pattern):
-        normalized_key = key.decode("utf-8") if isinstance(key, bytes) else str(key)
-        raw_mapping = await redis_client.hgetall(key)
-        records.append({"key": normalized_key, "mapping": _normalize_meta_mapping(raw_mapping)})
-    return sorted(records, key=lambda item: item["key"])
+    async for batch in _hgetall_batches(redis_client, keys):
+        records.extend(
+            {"key": key, "mapping": _normalize_meta_mapping(raw_mapping)}
+            for key, raw_mapping in batch
+            if raw_mapping
+        )
+    return records
 
 
 def _write_ndjson(path: Path, records: list[dict[str, Any]]) -> None:
@@ -220,13 +300,9 @@ def _build_source_revisions(repo_root: Path, repo_sha: str | None) -> dict[str,
     return source_revisions
 
 
-def _zip_directory(source_root: Path, output_path: Path) -> None:
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with ZipFile(output_path, "w", compression=ZIP_DEFLATED) as archive:
-        for path in sorted(
-            candidate for candidate in source_root.rglob("*") if candidate.is_file()
-        ):
-            archive.write(path, path.relative_to(source_root).as_posix())
+def _add_directory_to_zip(archive: ZipFile, source_root: Path) -> None:
+    for path in sorted(candidate for candidate in source_root.rglob("*") if candidate.is_file()):
+        archive.write(path, path.relative_to(source_root).as_posix())
 
 
 async def build_knowledge_pack(
@@ -240,7 +316,13 @@ async def build_knowledge_pack(
     profile_name: str = STANDARD_PACK_PROFILE,
     config: Optional[Settings] = None,
 ) -> dict[str, Any]:
-    """Build a knowledge-pack zip from live knowledge-index state and raw artifacts."""
+    """Build a knowledge-pack zip from live knowledge-index state and raw artifacts.
+
+    Chunk hashes are fetched in pipelined batches and streamed straight into
+    the zip: records into ``KNOWLEDGE_PACK_CHUNK_RECORDS_FILE`` and raw vectors
+    into the uncompressed ``KNOWLEDGE_PACK_CHUNK_VECTORS_FILE`` sidecar, so
+    memory stays bounded by one batch regardless of pack size.
+    """
     cfg = config or settings
     repo_root = Path.cwd()
     source_batch_path = artifacts_path / batch_date
@@ -252,7 +334,7 @@ async def build_knowledge_pack(
         )
 
     manifest_profile = resolve_pack_embedding_profile(config=cfg, profile_name=profile_name)
-    schema_hash = compute_schema_hash(manifest_profile["vector_dim"])
+    schema_hash = compute_schema_hash(manifest_profile["vector_dim"], cfg.vector_datatype)
     embedding_fingerprint = compute_embedding_fingerprint(
         embedding_provider=manifest_profile["embedding_provider"],
         embedding_model=manifest_profile["embedding_model"],
@@ -265,7 +347,7 @@ async def build_knowledge_pack(
 
     index = await get_knowledge_index(config=cfg)
     redis_client = index.client
-    chunk_records = await _scan_chunk_records(redis_client)
+    chunk_keys = await _scan_keys(redis_client, "sre_knowledge:*:chunk:*")
     document_meta_records = await _scan_meta_records(redis_client, pattern="sre_knowledge_meta:*")
     source_meta_records = [
         record
@@ -278,60 +360,88 @@ async def build_knowledge_pack(
         if not record["key"].startswith("sre_knowledge_meta:source:")
     ]
 
-    if not chunk_records:
+    if not chunk_keys:
         raise ValueError(
             "Knowledge index is empty; ingest the target batch before building a pack."
         )
 
     pack_id = uuid.uuid4().hex
-    active_registry = ActiveKnowledgePackRegistry(
-        pack_id=pack_id,
-        release_tag=release_tag,
-        pack_profile=manifest_profile["pack_profile"],
-        loaded_at=utcnow(),
-        batch_date=batch_date,
-        schema_hash=schema_hash,
-        embedding_fingerprint=embedding_fingerprint,
-        chunk_keys=[record["key"] for record in chunk_records],
-        document_meta_keys=[record["key"] for record in document_meta_records],
-        source_meta_keys=[record["key"] for record in source_meta_records],
-    )
-
-    with tempfile.TemporaryDirectory(prefix="knowledge-pack-build-") as tmpdir:
-        root = Path(tmpdir)
-        artifact_documents = _copy_batch_artifacts(source_batch_path, root)
-        _write_ndjson(root / KNOWLEDGE_PACK_CHUNK_RECORDS_FILE, chunk_records)
-        _write_ndjson(root / KNOWLEDGE_PACK_DOCUMENT_META_FILE, document_meta_records)
-        _write_ndjson(root / KNOWLEDGE_PACK_SOURCE_META_FILE, source_meta_records)
-        _write_json(root / KNOWLEDGE_PACK_ACTIVE_REGISTRY_FILE, active_registry.model_dump())
-
-        manifest = KnowledgePackManifest(
-            pack_id=pack_id,
-            pack_profile=manifest_profile["pack_profile"],
-            release_tag=release_tag,
-            repo_sha=effective_repo_sha,
-            created_at=utcnow(),
-            batch_date=batch_date,
-            schema_hash=schema_hash,
-            embedding_provider=manifest_profile["embedding_provider"],
-            embedding_model=manifest_profile["embedding_model"],
-            vector_dim=manifest_profile["vector_dim"],
-            embedding_fingerprint=embedding_fingerprint,
-            scrapers_run=scrapers_run or [],
-            source_documents_git_sha=effective_repo_sha,
-            source_revisions=source_revisions,
-            record_counts=RecordCounts(
-                artifact_documents=artifact_documents,
-                chunk_records=len(chunk_records),
-                document_meta_records=len(document_meta_records),
-                source_meta_records=len(source_meta_records),
-            ),
-        )
-        _write_json(root / _MANIFEST_FILE, manifest.model_dump())
-
-        checksums = build_checksums_for_directory(root, exclude={_CHECKSUMS_FILE})
-        write_checksums_file(root / _CHECKSUMS_FILE, checksums)
-        _zip_directory(root, output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with (
+            tempfile.TemporaryDirectory(prefix="knowledge-pack-build-") as tmpdir,
+            ZipFile(output_path, "w", compression=ZIP_DEFLATED) as archive,
+        ):
+            root = Path(tmpdir) / "pack"
+            vectors_spool = Path(tmpdir) / "vectors.bin"
+            with (
+                archive.open(KNOWLEDGE_PACK_CHUNK_RECORDS_FILE, "w", force_zip64=True) as member,
+                vectors_spool.open("wb") as spool,
+            ):
+                records_writer = _HashingWriter(member)
+                vectors_writer = _HashingWriter(spool)
+                chunk_keys = await _write_chunk_records(
+                    redis_client, chunk_keys, records_writer, vectors_writer
+                )
+            if not chunk_keys:
+                raise ValueError(
+                    "Knowledge index is empty; ingest the target batch before building a pack."
+                )
+            archive.write(
+                vectors_spool, KNOWLEDGE_PACK_CHUNK_VECTORS_FILE, compress_type=ZIP_STORED
+            )
+            vectors_spool.unlink()
+
+            active_registry = ActiveKnowledgePackRegistry(
+                pack_id=pack_id,
+                release_tag=release_tag,
+                pack_profile=manifest_profile["pack_profile"],
+                loaded_at=utcnow(),
+                batch_date=batch_date,
+                schema_hash=schema_hash,
+                embedding_fingerprint=embedding_fingerprint,
+                chunk_keys=chunk_keys,
+                document_meta_keys=[record["key"] for record in document_meta_records],
+                source_meta_keys=[record["key"] for record in source_meta_records],
+            )
+            artifact_documents = _copy_batch_artifacts(source_batch_path, root)
+            _write_ndjson(root / KNOWLEDGE_PACK_DOCUMENT_META_FILE, document_meta_records)
+            _write_ndjson(root / KNOWLEDGE_PACK_SOURCE_META_FILE, source_meta_records)
+            _write_json(root / KNOWLEDGE_PACK_ACTIVE_REGISTRY_FILE, active_registry.model_dump())
+
+            manifest = KnowledgePackManifest(
+                pack_id=pack_id,
+                pack_profile=manifest_profile["pack_profile"],
+                release_tag=release_tag,
+                repo_sha=effective_repo_sha,
+                created_at=utcnow(),
+                batch_date=batch_date,
+                schema_hash=schema_hash,
+                embedding_provider=manifest_profile["embedding_provider"],
+                embedding_model=manifest_profile["embedding_model"],
+                vector_dim=manifest_profile["vector_dim"],
+                vector_datatype=cfg.vector_datatype,
+                embedding_fingerprint=embedding_fingerprint,
+                scrapers_run=scrapers_run or [],
+                source_documents_git_sha=effective_repo_sha,
+                source_revisions=source_revisions,
+                record_counts=RecordCounts(
+                    artifact_documents=artifact_documents,
+                    chunk_records=len(chunk_keys),
+                    document_meta_records=len(document_meta_records),
+                    source_meta_records=len(source_meta_records),
+                ),
+            )
+            _write_json(root / _MANIFEST_FILE, manifest.model_dump())
+
+            checksums = build_checksums_for_directory(root, exclude={_CHECKSUMS_FILE})
+            checksums[KNOWLEDGE_PACK_CHUNK_RECORDS_FILE] = records_writer.hexdigest()
+            checksums[KNOWLEDGE_PACK_CHUNK_VECTORS_FILE] = vectors_writer.hexdigest()
+            write_checksums_file(root / _CHECKSUMS_FILE, checksums)
+            _add_directory_to_zip(archive, root)
+    except BaseException:
+        output_path.unlink(missing_ok=True)
+        raise
 
     return {
         "pack_id": pack_id,
@@ -57,7 +57,12 @@ def verify_zip_checksums(zip_path: Path) -> dict[str, str]:
         checksums_text = archive.read("checksums.txt").decode("utf-8")
         checksums = parse_checksums_text(checksums_text)
         for relative_path, expected_digest in checksums.items():
-            actual_digest = sha256_bytes(archive.read(relative_path))
+            # Hash members in chunks so large vector sidecars are never held in memory
+            digest = hashlib.sha256()
+            with archive.open(relative_path) as handle:
+                for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                    digest.update(chunk)
+            actual_digest = digest.hexdigest()
             if actual_digest != expected_digest:
                 raise ValueError(
                     f"Checksum mismatch for {relative_path}: expected {expected_digest}, got {actual_digest}"
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import hashlib
+import io
 import json
+import mmap
+import struct
+from itertools import islice
 from pathlib import Path
-from typing import Any, Iterable, Optional
-from zipfile import ZipFile
+from typing import Any, Iterable, Iterator, Optional
+from zipfile import ZIP_STORED, ZipFile
 
 from redis_sre_agent.core.config import Settings, settings
 from redis_sre_agent.core.keys import RedisKeys
@@ -21,6 +26,7 @@ from .checksums import verify_zip_checksums
 from .models import (
     KNOWLEDGE_PACK_ACTIVE_REGISTRY_FILE,
     KNOWLEDGE_PACK_CHUNK_RECORDS_FILE,
+    KNOWLEDGE_PACK_CHUNK_VECTORS_FILE,
     KNOWLEDGE_PACK_DOCUMENT_META_FILE,
     KNOWLEDGE_PACK_SOURCE_META_FILE,
     ActiveKnowledgePackRegistry,
@@ -29,14 +35,97 @@ from .models import (
 )
 from .utils import utcnow
 
+# Records per restore write transaction and the number of those kept in flight
+_RESTORE_BATCH_SIZE = 200
+_RESTORE_LOAD_CONCURRENCY = 4
+_ZIP_LOCAL_HEADER = struct.Struct("<4s22xHH")
 
-def _iter_ndjson_lines(raw_text: str) -> list[dict[str, Any]]:
-    records: list[dict[str, Any]] = []
-    for raw_line in raw_text.splitlines():
-        line = raw_line.strip()
-        if line:
-            records.append(json.loads(line))
-    return records
+
+def _iter_ndjson_member(archive: ZipFile, name: str) -> Iterator[dict[str, Any]]:
+    """Stream records from one NDJSON zip member without reading it whole."""
+    with archive.open(name) as raw, io.TextIOWrapper(raw, encoding="utf-8") as handle:
+        for raw_line in handle:
+            line = raw_line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def _batched(records: Iterable[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    iterator = iter(records)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class _VectorSidecar:
+    """Random access to a pack's vector sidecar.
+
+    The builder stores the sidecar uncompressed, so its bytes sit contiguously
+    in the zip file and are memory-mapped rather than read into memory. v1
+    packs have no sidecar (vectors are base64 inline in the records).
+    """
+
+    def __init__(self, pack_path: Path, archive: ZipFile) -> None:
+        self._mmap: mmap.mmap | None = None
+        self._data: bytes = b""
+        self._start = 0
+        try:
+            info = archive.getinfo(KNOWLEDGE_PACK_CHUNK_VECTORS_FILE)
+        except KeyError:
+            self.available = False
+            self._size = 0
+            return
+
+        self.available = True
+        self._size = info.file_size
+        if info.compress_type != ZIP_STORED or not info.file_size:
+            self._data = archive.read(KNOWLEDGE_PACK_CHUNK_VECTORS_FILE)
+            return
+
+        with pack_path.open("rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        signature, name_length, extra_length = _ZIP_LOCAL_HEADER.unpack_from(
+            self._mmap, info.header_offset
+        )
+        if signature != b"PK\x03\x04":
+            self.close()
+            raise ValueError(f"Invalid zip entry header for {KNOWLEDGE_PACK_CHUNK_VECTORS_FILE}")
+        self._start = info.header_offset + _ZIP_LOCAL_HEADER.size + name_length + extra_length
+
+    def read(self, offset: int, length: int) -> bytes:
+        if offset < 0 or length < 0 or offset + length > self._size:
+            raise ValueError(
+                f"Vector range {offset}+{length} is outside the {self._size}-byte sidecar"
+            )
+        if self._mmap is not None:
+            return self._mmap[self._start + offset : self._start + offset + length]
+        return self._data[offset : offset + length]
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+
+def _chunk_payload(record: dict[str, Any], vectors: _VectorSidecar) -> dict[str, Any]:
+    payload = dict(record["payload"])
+    if "vector_offset" in record:
+        if not vectors.available:
+            raise ValueError(
+                f"Knowledge pack is missing {KNOWLEDGE_PACK_CHUNK_VECTORS_FILE} "
+                f"required by chunk {record['key']}"
+            )
+        payload["vector"] = vectors.read(int(record["vector_offset"]), int(record["vector_length"]))
+    else:
+        payload["vector"] = base64.b64decode(record["vector_b64"])
+    return payload
+
+
+def _raise_first_failure(tasks: Iterable[asyncio.Task]) -> None:
+    # Retrieve every exception so none is reported as unhandled, then raise the first
+    failures = [task.exception() for task in tasks if not task.cancelled()]
+    for failure in failures:
+        if failure is not None:
+            raise failure
 
 
 def _unique_preserving_order(keys: Iterable[str]) -> list[str]:
@@ -51,7 +140,7 @@ def _unique_preserving_order(keys: Iterable[str]) -> list[str]:
 
 
 def _current_embedding_fingerprint(cfg: Settings) -> str:
-    schema_hash = compute_schema_hash(cfg.vector_dim)
+    schema_hash = compute_schema_hash(cfg.vector_dim, cfg.vector_datatype)
     return compute_embedding_fingerprint(
         embedding_provider=cfg.embedding_provider,
         embedding_model=cfg.embedding_model,
@@ -71,10 +160,24 @@ def get_restore_compatibility(
     if current_fingerprint == manifest.embedding_fingerprint:
         return True, "current embedding settings match the pack fingerprint"
 
-    reason = (
-        "current runtime embedding settings do not match the pack fingerprint "
-        f"(runtime={cfg.embedding_provider}/{cfg.embedding_model}/{cfg.vector_dim}, "
-        f"pack={manifest.embedding_provider}/{manifest.embedding_model}/{manifest.vector_dim})"
+    compared = (
+        ("embedding_provider", cfg.embedding_provider, manifest.embedding_provider),
+        ("embedding_model", cfg.embedding_model, manifest.embedding_model),
+        ("vector_dim", cfg.vector_dim, manifest.vector_dim),
+        ("vector_datatype", cfg.vector_datatype, manifest.vector_datatype),
+        (
+            "schema_hash",
+            compute_schema_hash(cfg.vector_dim, cfg.vector_datatype),
+            manifest.schema_hash,
+        ),
+    )
+    differences = [
+        f"{name} (runtime={runtime}, pack={pack})"
+        for name, runtime, pack in compared
+        if runtime != pack
+    ]
+    reason = "current runtime embedding settings do not match the pack fingerprint: " + (
+        "; ".join(differences) or "embedding_fingerprint differs"
     )
     return False, reason
 
@@ -145,7 +248,7 @@ async def _delete_keys(redis_client: Any, keys: Iterable[str]) -> int:
 
 
 def _runtime_registry_fields(config: Settings) -> dict[str, str]:
-    schema_hash = compute_schema_hash(config.vector_dim)
+    schema_hash = compute_schema_hash(config.vector_dim, config.vector_datatype)
     embedding_fingerprint = compute_embedding_fingerprint(
         embedding_provider=config.embedding_provider,
         embedding_model=config.embedding_model,
@@ -166,6 +269,34 @@ def _registry_key_set(registry: ActiveKnowledgePackRegistry | None) -> set[str]:
     )
 
 
+def _queue_chunk_registry(pipe: Any, command: str, keys: Iterable[str]) -> None:
+    """Queue ``command`` (sadd/srem) of chunk keys on their documents' registry sets."""
+    chunk_key_head = RedisKeys.knowledge_document("")
+    by_document: dict[str, list[str]] = {}
+    for key in keys:
+        if not key.startswith(chunk_key_head) or ":chunk:" not in key:
+            continue
+        document_hash = key[len(chunk_key_head) :].split(":chunk:", 1)[0]
+        by_document.setdefault(document_hash, []).append(key)
+    for document_hash, members in by_document.items():
+        getattr(pipe, command)(RedisKeys.knowledge_chunk_registry(document_hash), *members)
+
+
+async def _delete_chunk_keys(redis_client: Any, keys: Iterable[str]) -> int:
+    """Delete chunk keys and drop them from the chunk registry in the same transaction."""
+    normalized = [key for key in keys if key]
+    deleted = 0
+    batch_size = 500
+    for idx in range(0, len(normalized), batch_size):
+        batch = normalized[idx : idx + batch_size]
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.delete(*batch)
+            _queue_chunk_registry(pipe, "srem", batch)
+            results = await pipe.execute()
+        deleted += int(results[0])
+    return deleted
+
+
 async def _delete_registry_keys(
     redis_client: Any,
     registry: ActiveKnowledgePackRegistry,
@@ -174,7 +305,7 @@ async def _delete_registry_keys(
 ) -> dict[str, int]:
     preserved = set(preserve_keys)
     return {
-        "chunk_keys": await _delete_keys(
+        "chunk_keys": await _delete_chunk_keys(
             redis_client, (key for key in registry.chunk_keys if key not in preserved)
         ),
         "document_meta_keys": await _delete_keys(
@@ -200,8 +331,14 @@ async def _snapshot_registry_hashes(
 
 
 async def _restore_hash_snapshots(redis_client: Any, snapshots: dict[str, dict[Any, Any]]) -> None:
-    for key, mapping in snapshots.items():
-        await redis_client.hset(key, mapping=mapping)
+    """Rewrite snapshotted hashes and re-register the chunk keys among them."""
+    if not snapshots:
+        return
+    async with redis_client.pipeline(transaction=True) as pipe:
+        for key, mapping in snapshots.items():
+            await pipe.hset(key, mapping=mapping)
+        _queue_chunk_registry(pipe, "sadd", snapshots)
+        await pipe.execute()
 
 
 def _knowledge_source_meta_key(source_document_path: str) -> str:
@@ -284,59 +421,77 @@ async def _restore_from_pack(
             "Pass --replace-existing to proceed without deleting unknown keys."
         )
 
-    with ZipFile(pack_path) as archive:
-        chunk_records = _iter_ndjson_lines(
-            archive.read(KNOWLEDGE_PACK_CHUNK_RECORDS_FILE).decode("utf-8")
-        )
-        document_meta_records = _iter_ndjson_lines(
-            archive.read(KNOWLEDGE_PACK_DOCUMENT_META_FILE).decode("utf-8")
-        )
-        source_meta_records = _iter_ndjson_lines(
-            archive.read(KNOWLEDGE_PACK_SOURCE_META_FILE).decode("utf-8")
-        )
-        registry_payload = ActiveKnowledgePackRegistry.model_validate_json(
-            archive.read(KNOWLEDGE_PACK_ACTIVE_REGISTRY_FILE)
-        )
-
-    registry = ActiveKnowledgePackRegistry(
-        **registry_payload.model_dump(exclude={"loaded_at"}),
-        loaded_at=utcnow(),
-    )
+    counts = {"chunk_records": 0, "document_meta_records": 0, "source_meta_records": 0}
+    pending: set[asyncio.Task] = set()
 
-    batch_size = 200
+    async def _load_chunk_batch(keys: list[str], payloads: list[dict[str, Any]]) -> None:
+        # Chunk hashes and their registry entries land in one transaction so
+        # deduplication can always find every restored chunk.
+        async with redis_client.pipeline(transaction=True) as pipe:
+            for key, payload in zip(keys, payloads):
+                await pipe.hset(key, mapping=payload)
+            _queue_chunk_registry(pipe, "sadd", keys)
+            await pipe.execute()
 
-    async def _restore_meta_records(records: list[dict[str, Any]]) -> None:
-        if not records:
-            return
-        for idx in range(0, len(records), batch_size):
-            batch = records[idx : idx + batch_size]
+    async def _restore_meta_records(archive: ZipFile, name: str, count_key: str) -> None:
+        for batch in _batched(_iter_ndjson_member(archive, name), _RESTORE_BATCH_SIZE):
             async with redis_client.pipeline(transaction=False) as pipe:
                 for record in batch:
                     await pipe.hset(record["key"], mapping=record["mapping"])
                 await pipe.execute()
+            counts[count_key] += len(batch)
 
-    try:
-        for idx in range(0, len(chunk_records), batch_size):
-            records_batch = chunk_records[idx : idx + batch_size]
-            keys = [record["key"] for record in records_batch]
-            payloads = []
-            for record in records_batch:
-                payload = dict(record["payload"])
-                payload["vector"] = base64.b64decode(record["vector_b64"])
-                payloads.append(payload)
-            await index.load(data=payloads, id_field="id", keys=keys)
-
-        await _restore_meta_records(document_meta_records)
-        await _restore_meta_records(source_meta_records)
-        await _store_registry(redis_client, registry)
-    except Exception:
-        if active_registry is not None or current_index_stats["num_docs"] == 0:
-            await _delete_registry_keys(
-                redis_client,
-                registry,
-                preserve_keys=_registry_key_set(active_registry),
+    with ZipFile(pack_path) as archive:
+        registry_payload = ActiveKnowledgePackRegistry.model_validate_json(
+            archive.read(KNOWLEDGE_PACK_ACTIVE_REGISTRY_FILE)
+        )
+        registry = ActiveKnowledgePackRegistry(
+            **registry_payload.model_dump(exclude={"loaded_at"}),
+            loaded_at=utcnow(),
+        )
+
+        try:
+            # Stream chunk records with at most _RESTORE_LOAD_CONCURRENCY batches
+            # in memory, each written by its own transaction pipeline.
+            vectors = _VectorSidecar(pack_path, archive)
+            try:
+                for records_batch in _batched(
+                    _iter_ndjson_member(archive, KNOWLEDGE_PACK_CHUNK_RECORDS_FILE),
+                    _RESTORE_BATCH_SIZE,
+                ):
+                    if len(pending) >= _RESTORE_LOAD_CONCURRENCY:
+                        done, pending = await asyncio.wait(
+                            pending, return_when=asyncio.FIRST_COMPLETED
+                        )
+                        _raise_first_failure(done)
+                    keys = [record["key"] for record in records_batch]
+                    payloads = [_chunk_payload(record, vectors) for record in records_batch]
+                    pending.add(asyncio.create_task(_load_chunk_batch(keys, payloads)))
+                    counts["chunk_records"] += len(records_batch)
+                if pending:
+                    done, pending = await asyncio.wait(pending)
+                    _raise_first_failure(done)
+            finally:
+                vectors.close()
+
+            await _restore_meta_records(
+                archive, KNOWLEDGE_PACK_DOCUMENT_META_FILE, "document_meta_records"
             )
-        raise
+            await _restore_meta_records(
+                archive, KNOWLEDGE_PACK_SOURCE_META_FILE, "source_meta_records"
+            )
+            await _store_registry(redis_client, registry)
+        except Exception:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            if active_registry is not None or current_index_stats["num_docs"] == 0:
+                await _delete_registry_keys(
+                    redis_client,
+                    registry,
+                    preserve_keys=_registry_key_set(active_registry),
+                )
+            raise
 
     if active_registry is not None:
         deleted = await _delete_registry_keys(
@@ -348,9 +503,9 @@ async def _restore_from_pack(
     return {
         "mode": "restore",
         "deleted": deleted,
-        "chunk_records_loaded": len(chunk_records),
-        "document_meta_records_loaded": len(document_meta_records),
-        "source_meta_records_loaded": len(source_meta_records),
+        "chunk_records_loaded": counts["chunk_records"],
+        "document_meta_records_loaded": counts["document_meta_records"],
+        "source_meta_records_loaded": counts["source_meta_records"],
     }
 
 
@@ -6,7 +6,7 @@ from typing import Any, Literal, Optional
 
 from pydantic import BaseModel, Field
 
-PACK_FORMAT_VERSION = 1
+PACK_FORMAT_VERSION = 2
 KNOWLEDGE_PACK_KIND = "knowledge_pack"
 STANDARD_PACK_PROFILE = "runtime"
 AIRGAP_PACK_PROFILE = "airgap"
@@ -14,6 +14,9 @@ AIRGAP_EMBEDDING_PROVIDER = "local"
 AIRGAP_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
 AIRGAP_VECTOR_DIM = 384
 KNOWLEDGE_PACK_CHUNK_RECORDS_FILE = "restore/knowledge_chunks.ndjson"
+# Format v2: raw chunk vectors stored back to back (uncompressed, so restore can
+# memory-map them); chunk records carry vector_offset/vector_length into it.
+KNOWLEDGE_PACK_CHUNK_VECTORS_FILE = "restore/knowledge_chunk_vectors.bin"
 KNOWLEDGE_PACK_DOCUMENT_META_FILE = "restore/knowledge_document_meta.ndjson"
 KNOWLEDGE_PACK_SOURCE_META_FILE = "restore/knowledge_source_meta.ndjson"
 KNOWLEDGE_PACK_ACTIVE_REGISTRY_FILE = "restore/active_pack_registry.json"
@@ -46,6 +49,7 @@ class KnowledgePackManifest(BaseModel):
     embedding_provider: str
     embedding_model: str
     vector_dim: int
+    vector_datatype: str = "float32"
     embedding_fingerprint: str
     scrapers_run: list[str] = Field(default_factory=list)
     source_documents_git_sha: Optional[str] = None
@@ -1934,6 +1934,20 @@ async def redis_sre_sync_index_schemas(
         }
 
 
+@mcp.tool()
+async def redis_sre_backfill_chunk_registry(force: bool = False) -> Dict[str, Any]:
+    """Build per-document chunk key sets so ingestion stops scanning the keyspace."""
+    from redis_sre_agent.core.index_helpers import backfill_chunk_registry_helper
+
+    logger.info("MCP backfill_chunk_registry: force=%s", force)
+
+    try:
+        return await backfill_chunk_registry_helper(force=force)
+    except Exception as e:
+        logger.error("Chunk registry backfill failed: %s", e)
+        return {"success": False, "status": "failed", "error": str(e)}
+
+
 @mcp.tool()
 async def redis_sre_get_support_ticket(ticket_id: str) -> Dict[str, Any]:
     """Retrieve complete support-ticket content by ticket id.
@@ -3113,14 +3127,58 @@ async def redis_sre_list_feedback(
 # ============================================================================
 
 
+async def _serve_and_close_redis(serve: Any) -> None:
+    """Await an MCP transport and release pooled Redis and HTTP connections afterwards."""
+    from redis_sre_agent.core.redis import close_redis_connections
+    from redis_sre_agent.tools.http import close_http_clients
+
+    try:
+        await serve
+    finally:
+        try:
+            await close_redis_connections()
+        finally:
+            await close_http_clients()
+
+
+def _close_redis_on_shutdown(asgi_app: Any) -> Any:
+    """Wrap an ASGI app's lifespan so pooled Redis and HTTP connections close on shutdown."""
+    from contextlib import asynccontextmanager
+
+    from redis_sre_agent.core.redis import close_redis_connections
+    from redis_sre_agent.tools.http import close_http_clients
+
+    original_lifespan = asgi_app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app):
+        async with original_lifespan(app) as state:
+            try:
+                yield state
+            finally:
+                try:
+                    await close_redis_connections()
+                finally:
+                    await close_http_clients()
+
+    asgi_app.router.lifespan_context = lifespan
+    return asgi_app
+
+
 def run_stdio():
     """Run the MCP server in stdio mode."""
-    mcp.run(transport="stdio")
+    import asyncio
+
+    asyncio.run(_serve_and_close_redis(mcp.run_stdio_async()))
 
 
 def run_sse(host: str = "127.0.0.1", port: int = 8080):
     """Run the MCP server in SSE mode (legacy, use HTTP instead)."""
-    mcp.run(transport="sse", host=host, port=port)
+    import asyncio
+
+    mcp.settings.host = host
+    mcp.settings.port = port
+    asyncio.run(_serve_and_close_redis(mcp.run_sse_async()))
 
 
 def run_http(host: str = "0.0.0.0", port: int = 8081):
@@ -3138,7 +3196,7 @@ def run_http(host: str = "0.0.0.0", port: int = 8081):
 
     mcp.settings.host = host
     mcp.settings.port = port
-    asyncio.run(mcp.run_streamable_http_async())
+    asyncio.run(_serve_and_close_redis(mcp.run_streamable_http_async()))
 
 
 def get_http_app():
@@ -3149,9 +3207,9 @@ def get_http_app():
 
     The MCP endpoint will be available at /mcp
     """
-    return mcp.streamable_http_app()
+    return _close_redis_on_shutdown(mcp.streamable_http_app())
 
 
 # ASGI app for uvicorn deployment
 # Usage: uvicorn redis_sre_agent.mcp_server.server:app --host 0.0.0.0 --port 8081
-app = mcp.streamable_http_app()
+app = get_http_app()
@@ -26,6 +26,26 @@ PII_REMEDIATION_LATENCY = Histogram(
     labelnames=("mode", "request_kind"),
 )
 
+PII_REMEDIATION_CACHE_LOOKUPS = Counter(
+    "sre_agent_pii_remediation_cache_lookups_total",
+    "PII detection cache lookups for outbound text blocks",
+    labelnames=("result",),
+)
+
+
+def record_pii_detection_cache_lookups(*, hits: int, misses: int) -> None:
+    """Record detection cache hits and misses for one remediation pass."""
+
+    if hits:
+        PII_REMEDIATION_CACHE_LOOKUPS.labels(result="hit").inc(hits)
+    if misses:
+        PII_REMEDIATION_CACHE_LOOKUPS.labels(result="miss").inc(misses)
+
+    span = trace.get_current_span()
+    if span and span.is_recording():
+        span.set_attribute("pii.cache_hits", hits)
+        span.set_attribute("pii.cache_misses", misses)
+
 
 def record_pii_remediation_metrics(
     *,
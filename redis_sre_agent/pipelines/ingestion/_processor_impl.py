@@ -3,22 +3,155 @@
 import asyncio
 import json
 import logging
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 # Avoid importing Redis/vectorizer at module import time to keep optional deps lazy
 from ...pipelines.scraper.base import ArtifactStorage, ScrapedDocument
 from .deduplication import DocumentDeduplicator
 from .document_processor import DocumentProcessor
+from .embedding_batcher import EmbeddingBatcher
 from .pipeline_workflow_mixin import PipelineWorkflowMixin
 from .processor_indexing_helpers import index_processed_document
 
 logger = logging.getLogger(__name__)
 
 
+# Artifacts summarized per worker-thread call when no batch documents file covers them
+ARTIFACT_READ_CHUNK_SIZE = 64
+
+
+@dataclass
+class ArtifactSummary:
+    """The fields of one artifact that are needed before it is indexed.
+
+    The latest-only filter and the collision guard run over a whole category
+    before any document is indexed; they keep only this summary, and a worker
+    reads the document back by its batch documents file offset.
+    """
+
+    source_url: str
+    relative_path: str
+    # Resolved as indexing will resolve it; None when the artifact is not a valid document
+    source_document_path: Optional[str]
+
+
+def summarize_artifact(doc_data: Dict[str, Any]) -> ArtifactSummary:
+    """Summarize one parsed artifact."""
+    meta = doc_data.get("metadata", {})
+    try:
+        # Resolve the identity exactly as indexing will: ScrapedDocument
+        # construction applies the explicit-path-or-derive_stable_path rule,
+        # and the tracking side strips the value (get_source_tracking_fields),
+        # so strip here too — otherwise paths differing only by surrounding
+        # whitespace would slip the guard yet share one tracking key.
+        resolved = ScrapedDocument.from_dict(doc_data)
+        source_document_path: Optional[str] = str(
+            resolved.metadata.get("source_document_path") or ""
+        ).strip()
+    except Exception as e:
+        logger.debug("Could not resolve artifact identity: %s", e)
+        source_document_path = None
+    return ArtifactSummary(
+        source_url=str(doc_data.get("source_url") or ""),
+        relative_path=str(meta.get("relative_path", "")) if isinstance(meta, dict) else "",
+        source_document_path=source_document_path,
+    )
+
+
+def _summarize_artifacts(paths: List[Path]) -> List[Union[ArtifactSummary, Exception]]:
+    """Parse and summarize artifact files, returning the exception for unreadable ones."""
+    summaries: List[Union[ArtifactSummary, Exception]] = []
+    for path in paths:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                summaries.append(summarize_artifact(json.load(f)))
+        except Exception as e:
+            summaries.append(e)
+    return summaries
+
+
+class BatchDocumentIndex:
+    """Byte offsets and summaries of the records in a batch documents file.
+
+    Built in one streaming pass, either over the existing file or while
+    ``ArtifactStorage.rewrite_batch_documents`` rewrites it from the artifacts.
+    Documents are read back by offset when they are processed, so the batch
+    is never held in memory.
+    """
+
+    def __init__(
+        self,
+        storage: ArtifactStorage,
+        batch_date: str,
+        batch_path: Path,
+        records: Optional[Iterable[Tuple[int, str, Dict[str, Any]]]] = None,
+    ):
+        self._storage = storage
+        self._batch_date = batch_date
+        self._entries: Dict[Path, Tuple[int, ArtifactSummary]] = {}
+        if records is None:
+            records = storage.iter_batch_records(batch_date)
+        for offset, relative_path, doc_data in records:
+            self._entries[batch_path / relative_path] = (offset, summarize_artifact(doc_data))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, path: Path) -> bool:
+        return path in self._entries
+
+    def summary(self, path: Path) -> ArtifactSummary:
+        return self._entries[path][1]
+
+    def read(self, path: Path) -> Dict[str, Any]:
+        return self._storage.read_batch_document(self._batch_date, self._entries[path][0])
+
+
+def read_artifact(path: Path, batch_index: Optional[BatchDocumentIndex] = None) -> Dict[str, Any]:
+    """Parse one artifact, from the batch documents file when it covers ``path``."""
+    if batch_index is not None and path in batch_index:
+        return batch_index.read(path)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+async def summarize_artifact_documents(
+    json_files: List[Path],
+    batch_index: Optional[BatchDocumentIndex] = None,
+) -> Dict[Path, Union[ArtifactSummary, Exception]]:
+    """Summarize each artifact off the event loop without keeping its document.
+
+    Files covered by ``batch_index`` are not opened. The rest are parsed in
+    worker threads in chunks of ``ARTIFACT_READ_CHUNK_SIZE``. Unreadable files
+    map to their exception so callers can report them at the point the file
+    would have been processed.
+    """
+    summaries: Dict[Path, Union[ArtifactSummary, Exception]] = {}
+    missing: List[Path] = []
+    for json_file in json_files:
+        if batch_index is not None and json_file in batch_index:
+            summaries[json_file] = batch_index.summary(json_file)
+        else:
+            missing.append(json_file)
+
+    chunks = [
+        missing[i : i + ARTIFACT_READ_CHUNK_SIZE]
+        for i in range(0, len(missing), ARTIFACT_READ_CHUNK_SIZE)
+    ]
+    parsed = await asyncio.gather(
+        *(asyncio.to_thread(_summarize_artifacts, chunk) for chunk in chunks)
+    )
+    for chunk, chunk_summaries in zip(chunks, parsed):
+        summaries.update(zip(chunk, chunk_summaries))
+    return summaries
+
+
 def detect_source_path_collisions(
     json_files: List[Path],
+    summaries: Optional[Dict[Path, Union[ArtifactSummary, Exception]]] = None,
 ) -> tuple[List[Path], Dict[str, List[Path]]]:
     """Detect distinct documents that resolve to the same source_document_path.
 
@@ -31,6 +164,8 @@ def detect_source_path_collisions(
     Returns ``(files_to_process, collisions)`` where ``collisions`` maps a
     colliding path to every file that resolved to it (first kept, rest skipped).
     Files with an empty effective path (untracked branch) are never collided.
+    ``summaries`` optionally supplies already-computed artifact summaries (as
+    returned by ``summarize_artifact_documents``) so files are not read again.
     """
     by_path: Dict[str, List[Path]] = {}
     files_to_process: List[Path] = []
@@ -38,15 +173,16 @@ def detect_source_path_collisions(
     # skip-list is reproducible in audit logs regardless of directory order.
     for json_file in sorted(json_files):
         try:
-            with open(json_file, "r", encoding="utf-8") as f:
-                doc_data = json.load(f)
-            # Resolve the identity exactly as indexing will: ScrapedDocument
-            # construction applies the explicit-path-or-derive_stable_path rule,
-            # and the tracking side strips the value (get_source_tracking_fields),
-            # so strip here too — otherwise paths differing only by surrounding
-            # whitespace would slip the guard yet share one tracking key.
-            resolved = ScrapedDocument.from_dict(doc_data)
-            path = str(resolved.metadata.get("source_document_path") or "").strip()
+            if summaries is not None and json_file in summaries:
+                summary = summaries[json_file]
+                if isinstance(summary, Exception):
+                    raise summary
+            else:
+                with open(json_file, "r", encoding="utf-8") as f:
+                    summary = summarize_artifact(json.load(f))
+            if summary.source_document_path is None:
+                raise ValueError("not a valid scraped document")
+            path = summary.source_document_path
         except Exception as e:  # unreadable/invalid file: defer the error to processing
             logger.warning("Collision scan could not read %s: %s", json_file.name, e)
             files_to_process.append(json_file)
@@ -120,6 +256,24 @@ class IngestionPipeline(PipelineWorkflowMixin):
             ),
         }
 
+    def _build_embedding_batcher(self, vectorizer: Any) -> EmbeddingBatcher:
+        """Wrap the vectorizer so chunks from concurrent documents share embed calls."""
+        from ...core.config import settings
+
+        return EmbeddingBatcher(
+            vectorizer,
+            max_batch_size=int(
+                self.config.get("embedding_batch_size") or settings.embedding_batch_size
+            ),
+            max_batch_tokens=int(
+                self.config.get("embedding_batch_max_tokens") or settings.embedding_batch_max_tokens
+            ),
+            max_concurrency=int(
+                self.config.get("embedding_batch_concurrency")
+                or settings.embedding_batch_concurrency
+            ),
+        )
+
     async def _list_tracked_source_documents(
         self, deduplicators: Dict[str, DocumentDeduplicator]
     ) -> Dict[str, List[Dict[str, Any]]]:
@@ -255,12 +409,18 @@ class IngestionPipeline(PipelineWorkflowMixin):
             "success": False,
         }
 
+        vectorizer: Optional[EmbeddingBatcher] = None
         try:
             deduplicators = await self._build_deduplicators()
-            vectorizer = get_vectorizer()
+            vectorizer = self._build_embedding_batcher(get_vectorizer())
             tracked_source_documents = await self._list_tracked_source_documents(deduplicators)
             current_source_paths: set[str] = set()
             source_scope_prefixes: set[str] = set()
+            # Index the batch documents file in one streaming pass instead of
+            # opening every artifact; a missing or stale file is rewritten first
+            batch_index = await asyncio.to_thread(
+                self._index_batch_documents, batch_date, batch_path
+            )
 
             # Process each category
             for category in ["oss", "enterprise", "shared"]:
@@ -274,6 +434,7 @@ class IngestionPipeline(PipelineWorkflowMixin):
                     vectorizer,
                     deduplicators,
                     tracked_source_documents=tracked_source_documents,
+                    batch_index=batch_index,
                 )
 
                 ingestion_stats["categories_processed"][category] = category_stats
@@ -311,6 +472,7 @@ class IngestionPipeline(PipelineWorkflowMixin):
             ingestion_stats["source_document_changes"]["scope_prefixes"] = sorted(
                 source_scope_prefixes
             )
+            ingestion_stats["embedding_batches"] = dict(vectorizer.stats)
 
             ingestion_stats["completed_at"] = datetime.now(timezone.utc).isoformat()
             ingestion_stats["success"] = True
@@ -325,9 +487,37 @@ class IngestionPipeline(PipelineWorkflowMixin):
             ingestion_stats["error"] = str(e)
             ingestion_stats["completed_at"] = datetime.now(timezone.utc).isoformat()
             raise
+        finally:
+            # Embed anything still queued and wait for in-flight batches, so no
+            # embedding task outlives the batch that queued it
+            if vectorizer is not None:
+                await vectorizer.aclose()
 
         return ingestion_stats
 
+    def _index_batch_documents(
+        self, batch_date: str, batch_path: Path
+    ) -> Optional[BatchDocumentIndex]:
+        """Index the batch documents file, rewriting it first when it is missing or stale.
+
+        Returns None when the file can be neither read nor rewritten; every
+        artifact is then read directly.
+        """
+        try:
+            if self.storage.batch_documents_current(batch_date):
+                records = None
+            else:
+                logger.info(f"Rewriting batch documents file for {batch_date}")
+                records = self.storage.rewrite_batch_documents(batch_date)
+            batch_index = BatchDocumentIndex(self.storage, batch_date, batch_path, records)
+        except Exception as e:
+            logger.warning(f"Could not index batch documents file for {batch_date}: {e}")
+            return None
+        if not len(batch_index):
+            return None
+        logger.info(f"Indexed {len(batch_index)} documents from batch documents file")
+        return batch_index
+
     async def _process_category(
         self,
         category_path: Path,
@@ -335,8 +525,15 @@ class IngestionPipeline(PipelineWorkflowMixin):
         vectorizer: Any,
         deduplicators: Dict[str, DocumentDeduplicator],
         tracked_source_documents: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        batch_index: Optional[BatchDocumentIndex] = None,
     ) -> Dict[str, Any]:
-        """Process all documents in a category folder."""
+        """Process all documents in a category folder.
+
+        The latest-only filter and the collision guard work from artifact
+        summaries (taken from ``batch_index`` or parsed off the event loop).
+        Each worker then parses only the document it is processing, so memory
+        is bounded by the worker count rather than the category size.
+        """
         logger.info(f"Processing category: {category}")
 
         stats = {
@@ -352,18 +549,17 @@ class IngestionPipeline(PipelineWorkflowMixin):
 
         # Find all JSON files in category
         json_files = list(category_path.glob("*.json"))
+        summaries = await summarize_artifact_documents(json_files, batch_index)
 
         # Optionally filter to latest-only
         if self.config.get("latest_only"):
 
             def include_file(path: Path) -> bool:
                 try:
-                    with open(path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                    src = data.get("source_url") or ""
-                    meta = data.get("metadata", {})
-                    rel = str(meta.get("relative_path", ""))
-                    blob = f"{src} {rel}"
+                    summary = summaries[path]
+                    if isinstance(summary, Exception):
+                        raise summary
+                    blob = f"{summary.source_url} {summary.relative_path}"
                     import re
 
                     # Skip versioned paths like /7.8/
@@ -389,7 +585,7 @@ class IngestionPipeline(PipelineWorkflowMixin):
         # call): two distinct docs sharing one source_document_path would clobber
         # each other on the tracked dedup branch. Keep the first, skip the rest,
         # and surface the collision instead of silently dropping a document.
-        json_files, collisions = detect_source_path_collisions(json_files)
+        json_files, collisions = detect_source_path_collisions(json_files, summaries)
         for path, files in collisions.items():
             kept = files[0].name
             skipped = ", ".join(f.name for f in files[1:])
@@ -407,8 +603,7 @@ class IngestionPipeline(PipelineWorkflowMixin):
             source_document_path = ""
             source_document_scope = ""
             try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    doc_data = json.load(f)
+                doc_data = await asyncio.to_thread(read_artifact, json_file, batch_index)
 
                 metadata = doc_data.get("metadata", {})
                 if isinstance(metadata, dict):
@@ -446,30 +641,44 @@ class IngestionPipeline(PipelineWorkflowMixin):
                     "error": error_msg,
                 }
 
-        # Process documents in parallel batches (e.g., 10 at a time)
-        batch_size = 10
-        for i in range(0, len(json_files), batch_size):
-            batch = json_files[i : i + batch_size]
-            logger.info(
-                f"Processing batch {i // batch_size + 1}/{(len(json_files) + batch_size - 1) // batch_size} ({len(batch)} documents)"
-            )
+        # Stream documents through a fixed pool of workers; embeddings for their
+        # changed chunks are coalesced by the vectorizer's EmbeddingBatcher.
+        from ...core.config import settings
 
-            # Process batch in parallel
-            results = await asyncio.gather(*[process_document(f) for f in batch])
-
-            # Aggregate stats
-            for result in results:
-                if result.get("source_document_path"):
-                    stats["source_document_paths"].append(result["source_document_path"])
-                    stats["source_document_scopes"].append(result.get("source_document_scope", ""))
-                if result["success"]:
-                    stats["documents_processed"] += 1
-                    stats["chunks_created"] += result["chunks_created"]
-                    stats["chunks_indexed"] += result["chunks_indexed"]
-                    if result.get("source_document_change"):
-                        stats["source_document_changes"].append(result["source_document_change"])
-                else:
-                    stats["errors"].append(result["error"])
+        concurrency = max(
+            1, int(self.config.get("ingestion_concurrency") or settings.ingestion_concurrency)
+        )
+        results: List[Dict[str, Any]] = [{} for _ in json_files]
+        queue = iter(enumerate(json_files))
+        completed = 0
+
+        async def worker() -> None:
+            nonlocal completed
+            for position, json_file in queue:
+                results[position] = await process_document(json_file)
+                completed += 1
+                if completed % 100 == 0:
+                    logger.info(f"Processed {completed}/{len(json_files)} documents in {category}")
+
+        logger.info(
+            f"Processing {len(json_files)} documents in {category} "
+            f"with {min(concurrency, len(json_files))} workers"
+        )
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, len(json_files)))))
+
+        # Aggregate stats in file order
+        for result in results:
+            if result.get("source_document_path"):
+                stats["source_document_paths"].append(result["source_document_path"])
+                stats["source_document_scopes"].append(result.get("source_document_scope", ""))
+            if result["success"]:
+                stats["documents_processed"] += 1
+                stats["chunks_created"] += result["chunks_created"]
+                stats["chunks_indexed"] += result["chunks_indexed"]
+                if result.get("source_document_change"):
+                    stats["source_document_changes"].append(result["source_document_change"])
+            else:
+                stats["errors"].append(result["error"])
 
         return stats
 
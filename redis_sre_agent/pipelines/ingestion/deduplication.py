@@ -52,6 +52,11 @@ class DocumentDeduplicator:
         self.key_prefix = key_prefix
         self.meta_prefix = f"{key_prefix}_meta"
         self.source_meta_prefix = f"{self.meta_prefix}:source"
+        # Per-document sets of chunk keys, kept outside the meta namespace so
+        # scans of "{prefix}_meta:*" keep seeing only hashes.
+        self.chunk_registry_prefix = f"{key_prefix}_chunks"
+        self.chunk_registry_ready_key = f"{self.chunk_registry_prefix}:backfilled"
+        self._chunk_registry_ready = False
 
     def generate_deterministic_chunk_key(self, document_hash: str, chunk_index: int) -> str:
         """Generate deterministic key for a document chunk."""
@@ -66,6 +71,14 @@ class DocumentDeduplicator:
         path_hash = hashlib.sha256(source_document_path.encode("utf-8")).hexdigest()[:16]
         return f"{self.source_meta_prefix}:{path_hash}"
 
+    def generate_chunk_registry_key(self, document_hash: str) -> str:
+        """Generate key for the set of chunk keys stored for a document."""
+        return f"{self.chunk_registry_prefix}:{document_hash}"
+
+    @staticmethod
+    def _decode_key(key: Any) -> str:
+        return key.decode("utf-8") if isinstance(key, bytes) else str(key)
+
     @staticmethod
     def _decode_mapping(mapping: Dict[Any, Any]) -> Dict[str, Any]:
         """Normalize Redis hash keys/values into strings."""
@@ -76,29 +89,81 @@ class DocumentDeduplicator:
             for k, v in mapping.items()
         }
 
+    async def is_chunk_registry_ready(self) -> bool:
+        """Return True once every stored document has a chunk registry set.
+
+        The marker is written by ``backfill_chunk_registry``; until then a
+        missing set may just mean the document predates the registry.
+        """
+        if self._chunk_registry_ready:
+            return True
+        try:
+            self._chunk_registry_ready = bool(
+                await self.index.client.exists(self.chunk_registry_ready_key)
+            )
+        except Exception as e:
+            logger.debug(f"Chunk registry marker lookup failed for {self.key_prefix}: {e}")
+        return self._chunk_registry_ready
+
+    async def register_chunks(self, document_hash: str, chunk_keys: List[str]) -> None:
+        """Record chunk keys in the document's chunk registry set."""
+        if not chunk_keys:
+            return
+        try:
+            await self.index.client.sadd(
+                self.generate_chunk_registry_key(document_hash), *chunk_keys
+            )
+        except Exception as e:
+            logger.error(f"Failed to register chunks for {document_hash}: {e}")
+
+    async def load_chunks(
+        self, document_hash: str, documents: List[Dict[str, Any]], keys: List[str]
+    ) -> None:
+        """Store chunk hashes and register their keys in one transaction.
+
+        The hashes are written the way ``index.load`` stores them, but in the
+        same MULTI/EXEC as the registry update, so a chunk can never exist
+        without being findable through ``find_existing_chunks``.
+        """
+        if len(documents) != len(keys):
+            raise ValueError("Length of keys does not match the length of documents")
+        if not keys:
+            return
+        async with self.index.client.pipeline(transaction=True) as pipe:
+            for key, document in zip(keys, documents):
+                pipe.hset(key, mapping=document)
+            pipe.sadd(self.generate_chunk_registry_key(document_hash), *keys)
+            await pipe.execute()
+
+    async def _scan_existing_chunks(self, document_hash: str) -> List[str]:
+        """Find chunk keys by keyspace scan (documents indexed before the registry)."""
+        redis_client = self.index.client
+        existing_keys: List[str] = []
+        try:
+            current_pattern = f"{self.key_prefix}:{document_hash}:chunk:*"
+            async for key in redis_client.scan_iter(match=current_pattern):
+                existing_keys.append(self._decode_key(key))
+        except Exception as e:
+            logger.debug(f"scan_iter current pattern failed for {document_hash}: {e}")
+        return existing_keys
+
     async def find_existing_chunks(self, document_hash: str) -> List[str]:
         """Find all existing chunk keys for a document.
 
-        Supports both current and legacy key formats to avoid duplicate leftovers
-        after schema changes:
-        - Current: {prefix}:{document_hash}:chunk:{index}
-        - Legacy:  {prefix}:{document_hash}_{index}
+        Reads the document's chunk registry set. Until the registry has been
+        backfilled for this index, an empty set falls back to scanning
+        ``{prefix}:{document_hash}:chunk:*`` and registers what it finds.
         """
         try:
             # Get Redis client from the index (already initialized)
             redis_client = self.index.client
 
-            existing_keys: List[str] = []
+            members = await redis_client.smembers(self.generate_chunk_registry_key(document_hash))
+            existing_keys = sorted(self._decode_key(key) for key in members or ())
 
-            # Current key format
-            try:
-                current_pattern = f"{self.key_prefix}:{document_hash}:chunk:*"
-                async for key in redis_client.scan_iter(match=current_pattern):
-                    if isinstance(key, bytes):
-                        key = key.decode("utf-8")
-                    existing_keys.append(key)
-            except Exception as e:
-                logger.debug(f"scan_iter current pattern failed for {document_hash}: {e}")
+            if not existing_keys and not await self.is_chunk_registry_ready():
+                existing_keys = await self._scan_existing_chunks(document_hash)
+                await self.register_chunks(document_hash, existing_keys)
 
             logger.debug(f"Found {len(existing_keys)} existing chunks for document {document_hash}")
             return existing_keys
@@ -108,7 +173,7 @@ class DocumentDeduplicator:
             return []
 
     async def delete_existing_chunks(self, document_hash: str) -> int:
-        """Delete all existing chunks for a document."""
+        """Delete all existing chunks for a document, plus its chunk registry set."""
         existing_keys = await self.find_existing_chunks(document_hash)
 
         if not existing_keys:
@@ -117,6 +182,7 @@ class DocumentDeduplicator:
         try:
             redis_client = self.index.client
             deleted_count = await redis_client.delete(*existing_keys)
+            await redis_client.delete(self.generate_chunk_registry_key(document_hash))
             logger.info(f"Deleted {deleted_count} existing chunks for document {document_hash}")
             return int(deleted_count)
 
@@ -124,6 +190,44 @@ class DocumentDeduplicator:
             logger.error(f"Failed to delete existing chunks for {document_hash}: {e}")
             return 0
 
+    async def backfill_chunk_registry(self, batch_size: int = 1000) -> Dict[str, int]:
+        """Build chunk registry sets from the keys already stored for this index.
+
+        Scans ``{prefix}:*:chunk:*`` once, adds each key to its document's set
+        in pipelined batches, then writes the marker that lets
+        ``find_existing_chunks`` trust an empty set.
+        """
+        redis_client = self.index.client
+        key_head = f"{self.key_prefix}:"
+        documents: set[str] = set()
+        chunk_count = 0
+        batch: List[str] = []
+
+        async def _flush() -> None:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for key in batch:
+                    document_hash = key[len(key_head) :].split(":chunk:", 1)[0]
+                    documents.add(document_hash)
+                    pipe.sadd(self.generate_chunk_registry_key(document_hash), key)
+                await pipe.execute()
+
+        async for key in redis_client.scan_iter(
+            match=f"{self.key_prefix}:*:chunk:*", count=batch_size
+        ):
+            batch.append(self._decode_key(key))
+            chunk_count += 1
+            if len(batch) >= batch_size:
+                await _flush()
+                batch = []
+        if batch:
+            await _flush()
+
+        await redis_client.set(
+            self.chunk_registry_ready_key, datetime.now(timezone.utc).isoformat()
+        )
+        self._chunk_registry_ready = True
+        return {"documents": len(documents), "chunks": chunk_count}
+
     async def update_document_metadata(self, document_hash: str, metadata: Dict[str, Any]) -> None:
         """Update document-level metadata tracking."""
         try:
@@ -258,23 +362,20 @@ class DocumentDeduplicator:
         """Get existing chunks with their content hashes and embeddings for reuse."""
         try:
             redis_client = self.index.client
-            pattern = f"{self.key_prefix}:{document_hash}:chunk:*"
+            keys = await self.find_existing_chunks(document_hash)
 
             existing_chunks = {}
-            async for key in redis_client.scan_iter(match=pattern):
-                if isinstance(key, bytes):
-                    key = key.decode("utf-8")
-
-                # Get the chunk data (hash storage)
-                chunk_data = await redis_client.hgetall(key)
-                if chunk_data:
-                    # Extract content_hash and vector
-                    content_hash = chunk_data.get(b"content_hash") or chunk_data.get("content_hash")
+            if keys:
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    for key in keys:
+                        pipe.hmget(key, "content_hash", "vector")
+                    rows = await pipe.execute()
+
+                for key, row in zip(keys, rows):
+                    content_hash, vector = row if row else (None, None)
                     if isinstance(content_hash, bytes):
                         content_hash = content_hash.decode("utf-8")
 
-                    vector = chunk_data.get(b"vector") or chunk_data.get("vector")
-
                     if content_hash and vector:
                         existing_chunks[key] = {
                             "content_hash": content_hash,
@@ -473,8 +574,8 @@ class DocumentDeduplicator:
             # Step 8: Create deterministic keys for Redis
             keys = [chunk["chunk_key"] for chunk in prepared_chunks]
 
-            # Step 9: Index in Redis
-            await self.index.load(data=documents_to_index, id_field="id", keys=keys)
+            # Step 9: Index in Redis and record the chunk keys for this document
+            await self.load_chunks(document_hash, documents_to_index, keys)
 
             # Step 10: Update document metadata tracking
             await self.update_document_metadata(
@@ -0,0 +1,207 @@
+"""Cross-document embedding batching for the ingestion pipeline.
+
+Each document's ``replace_document_chunks`` embeds only its own changed
+chunks, usually a handful of texts. ``EmbeddingBatcher`` wraps the vectorizer
+with the same ``aembed_many`` interface, queues those requests for a short
+linger window, packs them into batches bounded by text count and estimated
+tokens, embeds a bounded number of batches concurrently, and resolves each
+caller with its own slice of the results.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token) used to size batches."""
+    return max(1, (len(text) + 3) // 4)
+
+
+@dataclass
+class _EmbedRequest:
+    texts: List[str]
+    as_buffer: bool
+    future: asyncio.Future
+    results: List[Any] = field(init=False)
+    remaining: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.results = [None] * len(self.texts)
+        self.remaining = len(self.texts)
+
+
+# (request, position within the request)
+_BatchItem = Tuple[_EmbedRequest, int]
+
+
+class EmbeddingBatcher:
+    """Coalesce ``aembed_many`` calls from concurrent documents into shared batches."""
+
+    def __init__(
+        self,
+        vectorizer: Any,
+        *,
+        max_batch_size: int = 256,
+        max_batch_tokens: int = 100_000,
+        max_concurrency: int = 4,
+        linger_seconds: float = 0.02,
+    ) -> None:
+        self.vectorizer = vectorizer
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_batch_tokens = max(1, max_batch_tokens)
+        self.linger_seconds = linger_seconds
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._pending: List[_EmbedRequest] = []
+        self._pending_texts = 0
+        self._pending_tokens = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+        self.stats: Dict[str, int] = {"requests": 0, "texts": 0, "batches": 0}
+
+    async def aembed(self, text: str, **kwargs: Any) -> Any:
+        """Single embeddings are not batched."""
+        return await self.vectorizer.aembed(text, **kwargs)
+
+    async def aembed_many(self, texts: List[str], as_buffer: bool = False, **kwargs: Any) -> Any:
+        """Queue ``texts`` for the next shared batch and wait for their embeddings."""
+        if not texts:
+            return []
+        if kwargs:
+            # Provider-specific options cannot be shared across callers
+            return await self.vectorizer.aembed_many(texts, as_buffer=as_buffer, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        request = _EmbedRequest(list(texts), as_buffer, loop.create_future())
+        self._pending.append(request)
+        self._pending_texts += len(request.texts)
+        self._pending_tokens += sum(estimate_tokens(text) for text in request.texts)
+        self.stats["requests"] += 1
+        self.stats["texts"] += len(request.texts)
+
+        if (
+            self._pending_texts >= self.max_batch_size
+            or self._pending_tokens >= self.max_batch_tokens
+        ):
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.linger_seconds, self.flush)
+
+        return await request.future
+
+    def flush(self) -> None:
+        """Start embedding everything queued so far."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+        self._pending_texts = 0
+        self._pending_tokens = 0
+
+        for batch in self._pack(pending):
+            task = asyncio.create_task(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def aclose(self) -> None:
+        """Flush queued requests and wait for in-flight batches."""
+        self.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _pack(self, requests: List[_EmbedRequest]) -> List[List[_BatchItem]]:
+        """Split queued texts into batches within the count and token limits."""
+        batches: List[List[_BatchItem]] = []
+        # Buffer and list outputs cannot share one vectorizer call
+        for as_buffer in (True, False):
+            batch: List[_BatchItem] = []
+            batch_tokens = 0
+            for request in requests:
+                if request.as_buffer is not as_buffer:
+                    continue
+                for position, text in enumerate(request.texts):
+                    tokens = estimate_tokens(text)
+                    if batch and (
+                        len(batch) >= self.max_batch_size
+                        or batch_tokens + tokens > self.max_batch_tokens
+                    ):
+                        batches.append(batch)
+                        batch, batch_tokens = [], 0
+                    batch.append((request, position))
+                    batch_tokens += tokens
+            if batch:
+                batches.append(batch)
+        return batches
+
+    async def _embed(self, texts: List[str], as_buffer: bool) -> List[Any]:
+        async with self._semaphore:
+            self.stats["batches"] += 1
+            embeddings = await self.vectorizer.aembed_many(texts, as_buffer=as_buffer)
+        if len(embeddings) != len(texts):
+            raise ValueError(
+                f"Vectorizer returned {len(embeddings)} embeddings for {len(texts)} texts"
+            )
+        return embeddings
+
+    async def _run_batch(self, batch: List[_BatchItem]) -> None:
+        try:
+            await self._embed_batch(batch)
+        except BaseException as exc:
+            # Cancellation or a non-Exception error must still release every
+            # caller waiting on this batch before propagating.
+            for request, _ in batch:
+                if request.future.done():
+                    continue
+                if isinstance(exc, asyncio.CancelledError):
+                    request.future.cancel()
+                else:
+                    request.future.set_exception(exc)
+            raise
+
+    async def _embed_batch(self, batch: List[_BatchItem]) -> None:
+        texts = [request.texts[position] for request, position in batch]
+        as_buffer = batch[0][0].as_buffer
+        try:
+            self._deliver(batch, await self._embed(texts, as_buffer))
+            return
+        except Exception as exc:
+            if len({id(request) for request, _ in batch}) == 1:
+                self._fail(batch, exc)
+                return
+            logger.warning(
+                "Embedding batch of %s texts failed (%s); retrying per document", len(texts), exc
+            )
+
+        # Retry each document's share separately so one bad input only fails its own caller
+        by_request: Dict[int, List[_BatchItem]] = {}
+        for item in batch:
+            by_request.setdefault(id(item[0]), []).append(item)
+        for items in by_request.values():
+            try:
+                embeddings = await self._embed(
+                    [request.texts[position] for request, position in items], as_buffer
+                )
+            except Exception as exc:
+                self._fail(items, exc)
+            else:
+                self._deliver(items, embeddings)
+
+    @staticmethod
+    def _fail(items: List[_BatchItem], exc: Exception) -> None:
+        logger.error("Embedding %s texts failed: %s", len(items), exc)
+        for request, _ in items:
+            if not request.future.done():
+                request.future.set_exception(exc)
+
+    @staticmethod
+    def _deliver(items: List[_BatchItem], embeddings: List[Any]) -> None:
+        for (request, position), embedding in zip(items, embeddings):
+            if request.future.done():
+                continue
+            request.results[position] = embedding
+            request.remaining -= 1
+            if request.remaining == 0:
+                request.future.set_result(request.results)
@@ -7,11 +7,15 @@ from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# One NDJSON record per artifact ({"path": "<category>/<file>.json", "document": {...}}),
+# written next to batch_manifest.json so ingestion can stream a batch in one read.
+BATCH_DOCUMENTS_FILE = "batch_documents.ndjson"
+
 
 def derive_stable_path(source_url: str) -> str:
     """Derive a stable, content-independent logical identity from a source URL.
@@ -170,6 +174,15 @@ class ScrapedDocument:
         return doc
 
 
+def _artifact_paths(batch_path: Path) -> List[Path]:
+    """Artifact JSON files of a batch, excluding its manifests, in path order."""
+    return [
+        path
+        for path in sorted(batch_path.rglob("*.json"))
+        if path.name not in {"batch_manifest.json", "ingestion_manifest.json"}
+    ]
+
+
 class ArtifactStorage:
     """Manages artifact storage with dated folders."""
 
@@ -226,16 +239,23 @@ class ArtifactStorage:
         logger.info(f"Saved document: {file_path}")
         return file_path
 
-    def save_batch_manifest(self) -> Path:
-        """Save manifest file with a summary of the full current batch contents."""
+    def save_batch_manifest(self, write_documents_file: bool = True) -> Path:
+        """Save manifest file with a summary of the full current batch contents.
+
+        When ``write_documents_file`` is set, also writes every artifact to
+        ``BATCH_DOCUMENTS_FILE`` so ingestion can stream the batch instead of
+        opening each JSON file.
+        """
         self._ensure_dirs()
         stored_documents: List[dict[str, Any]] = []
+        stored_paths: List[str] = []
         if self.current_batch_path.exists():
-            for document_path in sorted(self.current_batch_path.rglob("*.json")):
-                if document_path.name in {"batch_manifest.json", "ingestion_manifest.json"}:
-                    continue
+            for document_path in _artifact_paths(self.current_batch_path):
                 try:
                     stored_documents.append(json.loads(document_path.read_text(encoding="utf-8")))
+                    stored_paths.append(
+                        document_path.relative_to(self.current_batch_path).as_posix()
+                    )
                 except Exception as exc:
                     logger.warning(
                         "Skipping invalid artifact while building batch manifest: %s", exc
@@ -262,6 +282,16 @@ class ArtifactStorage:
             if source_url and source_url not in manifest["sources"]:
                 manifest["sources"].append(source_url)
 
+        if write_documents_file:
+            documents_path = self.current_batch_path / BATCH_DOCUMENTS_FILE
+            tmp_path = documents_path.with_suffix(".ndjson.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for path, doc in zip(stored_paths, stored_documents):
+                    f.write(json.dumps({"path": path, "document": doc}, ensure_ascii=False))
+                    f.write("\n")
+            tmp_path.replace(documents_path)
+            manifest["documents_file"] = BATCH_DOCUMENTS_FILE
+
         manifest_path = self.current_batch_path / "batch_manifest.json"
         with open(manifest_path, "w", encoding="utf-8") as f:
             json.dump(manifest, f, indent=2)
@@ -281,6 +311,88 @@ class ArtifactStorage:
 
         return sorted(batches)
 
+    def iter_batch_documents(self, batch_date: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Stream ``(relative_path, document)`` pairs from a batch's documents file.
+
+        Yields nothing when the batch has no documents file; malformed lines
+        are skipped so callers fall back to reading those artifacts directly.
+        """
+        for _, relative_path, document in self.iter_batch_records(batch_date):
+            yield relative_path, document
+
+    def iter_batch_records(self, batch_date: str) -> Iterator[Tuple[int, str, Dict[str, Any]]]:
+        """Like ``iter_batch_documents``, also yielding each record's byte offset.
+
+        The offset can be passed to ``read_batch_document`` to parse that one
+        record again later.
+        """
+        documents_path = self.base_path / batch_date / BATCH_DOCUMENTS_FILE
+        if not documents_path.exists():
+            return
+        offset = 0
+        with open(documents_path, "rb") as f:
+            for line_number, line in enumerate(f, start=1):
+                line_offset, offset = offset, offset + len(line)
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    yield line_offset, str(record["path"]), record["document"]
+                except (ValueError, KeyError, TypeError) as exc:
+                    logger.warning(
+                        "Skipping invalid record %s in %s: %s", line_number, documents_path, exc
+                    )
+
+    def batch_documents_current(self, batch_date: str) -> bool:
+        """Whether the batch documents file exists and no artifact is newer than it.
+
+        Artifacts edited, added or re-scraped after the file was written make
+        it stale; ingestion then rewrites it with ``rewrite_batch_documents``.
+        """
+        batch_path = self.base_path / batch_date
+        documents_path = batch_path / BATCH_DOCUMENTS_FILE
+        try:
+            written_at = documents_path.stat().st_mtime
+        except FileNotFoundError:
+            return False
+        return all(path.stat().st_mtime <= written_at for path in _artifact_paths(batch_path))
+
+    def rewrite_batch_documents(self, batch_date: str) -> Iterator[Tuple[int, str, Dict[str, Any]]]:
+        """Rewrite a batch's documents file from its artifacts, yielding each record.
+
+        Yields the same ``(offset, relative_path, document)`` triples as
+        ``iter_batch_records``, so each artifact is parsed once while the file
+        is rewritten. Invalid artifacts are left out. The offsets are valid
+        once the generator is exhausted and the new file has replaced the old.
+        """
+        batch_path = self.base_path / batch_date
+        documents_path = batch_path / BATCH_DOCUMENTS_FILE
+        tmp_path = documents_path.with_suffix(".ndjson.tmp")
+        offset = 0
+        with open(tmp_path, "wb") as f:
+            for document_path in _artifact_paths(batch_path):
+                try:
+                    document = json.loads(document_path.read_text(encoding="utf-8"))
+                except Exception as exc:
+                    logger.warning("Skipping invalid artifact %s: %s", document_path, exc)
+                    continue
+                relative_path = document_path.relative_to(batch_path).as_posix()
+                line = (
+                    json.dumps({"path": relative_path, "document": document}, ensure_ascii=False)
+                    + "\n"
+                ).encode("utf-8")
+                f.write(line)
+                yield offset, relative_path, document
+                offset += len(line)
+        tmp_path.replace(documents_path)
+
+    def read_batch_document(self, batch_date: str, offset: int) -> Dict[str, Any]:
+        """Parse the document of the batch documents file record at ``offset``."""
+        documents_path = self.base_path / batch_date / BATCH_DOCUMENTS_FILE
+        with open(documents_path, "rb") as f:
+            f.seek(offset)
+            return json.loads(f.readline())["document"]
+
     def get_batch_manifest(self, batch_date: str) -> Optional[Dict[str, Any]]:
         """Get manifest for a specific batch."""
         manifest_path = self.base_path / batch_date / "batch_manifest.json"
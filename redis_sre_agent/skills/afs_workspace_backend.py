@@ -4,16 +4,16 @@ from __future__ import annotations
 
 import hashlib
 import json
-import math
 import os
 import re
-from dataclasses import dataclass
-from typing import Any, Callable, Mapping
-from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable, Mapping
+
+import httpx
+import numpy as np
 
 from redis_sre_agent import __version__
+from redis_sre_agent.core.config import Settings
 from redis_sre_agent.skills.backend import (
     normalize_skill_search_type,
     unsupported_skill_search_type_result,
@@ -23,13 +23,7 @@ from redis_sre_agent.skills.contracts import (
     extract_output_contract,
     extract_workflow_contract,
 )
-
-try:
-    import httpx
-except ModuleNotFoundError:  # pragma: no cover - runtime image fallback
-    httpx = None  # type: ignore[assignment]
-
-from redis_sre_agent.core.config import Settings
+from redis_sre_agent.tools.http import get_http_client
 
 _GATEWAY_QUERY_TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
 _GATEWAY_QUERY_STOPWORDS = {
@@ -57,6 +51,8 @@ _GATEWAY_QUERY_STOPWORDS = {
     "you",
 }
 _SEMANTIC_SKILL_FETCH_LIMIT = 500
+# Cached skill embeddings are dropped wholesale past this many entries.
+_MAX_CACHED_SKILL_EMBEDDINGS = 4 * _SEMANTIC_SKILL_FETCH_LIMIT
 _AFS_SUPPORTED_SEARCH_TYPES: tuple[str, ...] = ("semantic", "keyword")
 
 
@@ -127,9 +123,24 @@ def _parse_event_stream_payload(raw_body: str) -> dict[str, Any]:
     return dict(parsed)
 
 
+@dataclass
+class _CatalogSnapshot:
+    """Skills API catalog page last fetched for one version filter."""
+
+    limit: int
+    etag: str
+    skills: list[Mapping[str, Any]]
+
+
 @dataclass
 class AFSWorkspaceSkillBackend:
-    """Runtime skill backend backed by the workspace-scoped skills facade."""
+    """Runtime skill backend backed by the workspace-scoped skills facade.
+
+    Requests go through the pooled HTTP client for ``base_url`` unless a
+    ``client_factory`` is given. Semantic ranking keeps skill embeddings keyed
+    by (slug, version, ranking-text hash) and reuses the stacked matrix while
+    the catalog is unchanged; the API catalog is revalidated with its ETag.
+    """
 
     base_url: str
     tenant_id: str
@@ -141,9 +152,16 @@ class AFSWorkspaceSkillBackend:
     gateway_url: str | None = None
     gateway_token: str | None = None
     workspace_id: str | None = None
-    client_factory: Callable[..., Any] | None = httpx.AsyncClient if httpx is not None else None
+    client_factory: Callable[..., Any] | None = None
     _gateway_session_id: str | None = None
     _gateway_protocol_version: str | None = None
+    _api_catalogs: dict[str | None, _CatalogSnapshot] = field(default_factory=dict, repr=False)
+    _skill_embeddings: dict[tuple[Hashable, ...], np.ndarray] = field(
+        default_factory=dict, repr=False
+    )
+    _ranking_matrix: tuple[list[tuple[Hashable, ...]], np.ndarray] | None = field(
+        default=None, repr=False
+    )
 
     @classmethod
     def from_settings(cls, config: Settings) -> "AFSWorkspaceSkillBackend":
@@ -400,38 +418,57 @@ class AFSWorkspaceSkillBackend:
         minimum_count: int,
     ) -> list[Mapping[str, Any]]:
         initial_limit = min(max(minimum_count, 100), _SEMANTIC_SKILL_FETCH_LIMIT)
-        payload = await self._request_json(
-            "GET",
-            self._base_path(),
-            params={
-                "limit": initial_limit,
-                "offset": 0,
-                **({"version": version} if version else {}),
-            },
-        )
-        data = self._data_payload(payload)
+        cached = self._api_catalogs.get(version)
+        if cached is not None and cached.limit >= initial_limit:
+            # Ask for the page we hold so an unchanged catalog costs one 304
+            payload, etag = await self._request_catalog_page(
+                version=version, limit=cached.limit, etag=cached.etag
+            )
+            if payload is None:
+                return cached.skills
+            initial_limit = cached.limit
+        else:
+            payload, etag = await self._request_catalog_page(version=version, limit=initial_limit)
+        page_limit = initial_limit
+        data = self._data_payload(payload or {})
         raw_skills = data.get("skills", [])
         if not isinstance(raw_skills, list):
             raw_skills = []
 
         total = int(data.get("total", len(raw_skills)))
         if total > len(raw_skills) and len(raw_skills) < _SEMANTIC_SKILL_FETCH_LIMIT:
-            expanded_limit = min(total, _SEMANTIC_SKILL_FETCH_LIMIT)
-            payload = await self._request_json(
-                "GET",
-                self._base_path(),
-                params={
-                    "limit": expanded_limit,
-                    "offset": 0,
-                    **({"version": version} if version else {}),
-                },
-            )
-            data = self._data_payload(payload)
+            page_limit = min(total, _SEMANTIC_SKILL_FETCH_LIMIT)
+            payload, etag = await self._request_catalog_page(version=version, limit=page_limit)
+            data = self._data_payload(payload or {})
             raw_skills = data.get("skills", [])
             if not isinstance(raw_skills, list):
                 raw_skills = []
 
-        return [skill for skill in raw_skills if isinstance(skill, Mapping)]
+        skills = [skill for skill in raw_skills if isinstance(skill, Mapping)]
+        if etag:
+            self._api_catalogs[version] = _CatalogSnapshot(page_limit, etag, skills)
+        else:
+            self._api_catalogs.pop(version, None)
+        return skills
+
+    async def _request_catalog_page(
+        self,
+        *,
+        version: str | None,
+        limit: int,
+        etag: str | None = None,
+    ) -> tuple[dict[str, Any] | None, str | None]:
+        """Fetch one catalog page; ``(None, etag)`` means it is unchanged since ``etag``."""
+        response = await self._request(
+            "GET",
+            self._base_path(),
+            params={"limit": limit, "offset": 0, **({"version": version} if version else {})},
+            headers={"If-None-Match": etag} if etag else None,
+        )
+        response_etag = (getattr(response, "headers", None) or {}).get("etag") or None
+        if response.status_code == 304:
+            return None, response_etag or etag
+        return self._response_json(response), response_etag
 
     async def _semantic_rank_skills(
         self,
@@ -442,8 +479,6 @@ class AFSWorkspaceSkillBackend:
         query_text = query.strip()
         if not query_text:
             return list(skills)
-
-        fallback_matches = self._filter_skills_keyword(skills, query=query)
         if not skills:
             return []
 
@@ -451,32 +486,75 @@ class AFSWorkspaceSkillBackend:
             from redis_sre_agent.core.redis import get_vectorizer
 
             vectorizer = get_vectorizer()
-            ranking_texts = [self._skill_ranking_text(skill) for skill in skills]
-            embeddings = await vectorizer.aembed_many([query_text, *ranking_texts])
+            matrix, query_vector = await self._embed_for_ranking(vectorizer, skills, query_text)
         except Exception:
-            return fallback_matches or list(skills)
-
-        if len(embeddings) != len(skills) + 1:
-            return fallback_matches or list(skills)
-
-        query_embedding = embeddings[0]
-        scored: list[tuple[float, str, str, Mapping[str, Any]]] = []
-        for skill, embedding in zip(skills, embeddings[1:]):
-            semantic_score = self._cosine_similarity(query_embedding, embedding)
-            lexical_score = self._lexical_overlap_score(skill, query_text)
-            combined_score = semantic_score + (0.05 * lexical_score)
-            scored.append(
-                (
-                    -combined_score,
-                    str(skill.get("displayName", skill.get("skillSlug", ""))).strip().lower(),
-                    str(skill.get("version", "")).strip().lower(),
-                    skill,
-                )
+            matrix = query_vector = None
+        if matrix is None or query_vector is None:
+            return self._filter_skills_keyword(skills, query=query) or list(skills)
+
+        semantic_scores = matrix @ query_vector
+        scored = sorted(
+            (
+                -(float(semantic_score) + 0.05 * self._lexical_overlap_score(skill, query_text)),
+                str(skill.get("displayName", skill.get("skillSlug", ""))).strip().lower(),
+                str(skill.get("version", "")).strip().lower(),
+                position,
+            )
+            for position, (skill, semantic_score) in enumerate(zip(skills, semantic_scores))
+        )
+        return [skills[item[3]] for item in scored]
+
+    async def _embed_for_ranking(
+        self,
+        vectorizer: Any,
+        skills: list[Mapping[str, Any]],
+        query_text: str,
+    ) -> tuple[np.ndarray | None, np.ndarray | None]:
+        """Return unit-norm skill embeddings (one row per skill) and the query vector.
+
+        Only skills whose (slug, version, ranking text) changed are embedded,
+        in the same vectorizer call as the query.
+        """
+        model = str(getattr(vectorizer, "model", "") or type(vectorizer).__name__)
+        ranking_texts = [self._skill_ranking_text(skill) for skill in skills]
+        keys = [
+            (
+                model,
+                str(skill.get("skillSlug", "")).strip(),
+                str(skill.get("version", "")).strip(),
+                hashlib.sha256(text.encode("utf-8")).hexdigest(),
             )
+            for skill, text in zip(skills, ranking_texts)
+        ]
+        missing: dict[tuple[Hashable, ...], str] = {}
+        for key, text in zip(keys, ranking_texts):
+            if key not in self._skill_embeddings:
+                missing.setdefault(key, text)
+
+        embeddings = await vectorizer.aembed_many([query_text, *missing.values()])
+        if len(embeddings) != len(missing) + 1:
+            return None, None
+        try:
+            vectors = _unit_rows(embeddings)
+        except (TypeError, ValueError):
+            return None, None
 
-        scored.sort(key=lambda item: item[:3])
-        ranked = [item[3] for item in scored]
-        return ranked or fallback_matches or list(skills)
+        if len(self._skill_embeddings) + len(missing) > _MAX_CACHED_SKILL_EMBEDDINGS:
+            self._skill_embeddings = {
+                key: self._skill_embeddings[key] for key in keys if key in self._skill_embeddings
+            }
+        for key, vector in zip(missing, vectors[1:]):
+            self._skill_embeddings[key] = vector
+
+        if self._ranking_matrix is not None and self._ranking_matrix[0] == keys:
+            matrix = self._ranking_matrix[1]
+        else:
+            rows = [self._skill_embeddings[key] for key in keys]
+            if any(row.shape != vectors[0].shape for row in rows):
+                return None, None
+            matrix = np.vstack(rows)
+            self._ranking_matrix = (keys, matrix)
+        return matrix, vectors[0]
 
     def _filter_skills_keyword(
         self,
@@ -544,22 +622,6 @@ class AFSWorkspaceSkillBackend:
         matched_tokens = sum(1 for token in query_tokens if token in haystack)
         return matched_tokens / len(query_tokens)
 
-    def _cosine_similarity(self, left: Any, right: Any) -> float:
-        try:
-            left_values = [float(value) for value in left]
-            right_values = [float(value) for value in right]
-        except Exception:
-            return 0.0
-        if not left_values or len(left_values) != len(right_values):
-            return 0.0
-
-        numerator = sum(a * b for a, b in zip(left_values, right_values))
-        left_norm = math.sqrt(sum(a * a for a in left_values))
-        right_norm = math.sqrt(sum(b * b for b in right_values))
-        if left_norm == 0.0 or right_norm == 0.0:
-            return 0.0
-        return numerator / (left_norm * right_norm)
-
     async def _get_skill_via_api(self, *, skill_name: str, version: str | None) -> dict[str, Any]:
         try:
             payload = await self._request_json(
@@ -887,9 +949,7 @@ class AFSWorkspaceSkillBackend:
             "method": "tools/call",
             "params": {"name": tool_name, "arguments": dict(arguments)},
         }
-        payload = self._stdlib_request_json(
-            "POST",
-            self._gateway_endpoint(),
+        payload, _ = await self._gateway_post(
             headers=self._gateway_headers(session_id=session_id),
             body=payload_body,
         )
@@ -933,12 +993,7 @@ class AFSWorkspaceSkillBackend:
         }
         headers = self._gateway_headers()
         response_headers: Mapping[str, str]
-        payload, response_headers = self._stdlib_request_json_with_headers(
-            "POST",
-            self._gateway_endpoint(),
-            headers=headers,
-            body=body,
-        )
+        payload, response_headers = await self._gateway_post(headers=headers, body=body)
         if not isinstance(payload, Mapping):
             raise ValueError("AFS gateway initialize returned a non-object response")
         error = payload.get("error")
@@ -994,70 +1049,84 @@ class AFSWorkspaceSkillBackend:
         *,
         params: Mapping[str, Any] | None = None,
     ) -> dict[str, Any]:
+        return self._response_json(await self._request(method, path, params=params))
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> Any:
+        """Send a skills API request; 304 responses are returned, other errors raised."""
+        params = {k: v for k, v in params.items() if v is not None} if params else None
         if self.client_factory is not None:
             async with self.client_factory(
                 base_url=self.base_url,
                 headers=self._headers(),
                 timeout=self.timeout_seconds,
             ) as client:
-                response = await client.request(method, path, params=params)
-                response.raise_for_status()
-                payload = response.json()
+                extra = {"headers": dict(headers)} if headers else {}
+                response = await client.request(method, path, params=params, **extra)
         else:
-            query = (
-                f"?{urlencode({k: v for k, v in (params or {}).items() if v is not None})}"
-                if params
-                else ""
-            )
-            payload = self._stdlib_request_json(
-                method,
-                f"{self.base_url.rstrip('/')}{path}{query}",
-                headers=self._headers(),
-                body=None,
+            client = get_http_client(
+                self.base_url, headers=self._headers(), timeout=self.timeout_seconds
             )
+            try:
+                response = await client.request(
+                    method,
+                    path,
+                    params=params,
+                    headers=dict(headers or {}),
+                    timeout=self.timeout_seconds,
+                )
+            except httpx.RequestError as exc:
+                raise ValueError(f"HTTP request failed: {exc}") from exc
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+
+    @staticmethod
+    def _response_json(response: Any) -> dict[str, Any]:
+        payload = response.json()
         if not isinstance(payload, Mapping):
             raise ValueError("skills API returned a non-object response")
         return dict(payload)
 
-    def _stdlib_request_json(
+    async def _gateway_post(
         self,
-        method: str,
-        url: str,
         *,
         headers: Mapping[str, str],
-        body: Mapping[str, Any] | None,
-    ) -> dict[str, Any]:
-        payload, _ = self._stdlib_request_json_with_headers(method, url, headers=headers, body=body)
-        return payload
-
-    def _stdlib_request_json_with_headers(
-        self,
-        method: str,
-        url: str,
-        *,
-        headers: Mapping[str, str],
-        body: Mapping[str, Any] | None,
+        body: Mapping[str, Any],
     ) -> tuple[dict[str, Any], Mapping[str, str]]:
-        data = json.dumps(body).encode("utf-8") if body is not None else None
-        request = Request(url, data=data, headers=dict(headers), method=method)
+        endpoint = self._gateway_endpoint()
+        client = get_http_client(endpoint, timeout=self.timeout_seconds)
         try:
-            with urlopen(request, timeout=self.timeout_seconds) as response:
-                raw_body = response.read().decode("utf-8")
-                response_headers = {
-                    str(key).lower(): str(value) for key, value in response.headers.items()
-                }
-                content_type = response_headers.get("content-type", "")
-                if "text/event-stream" in content_type:
-                    parsed = _parse_event_stream_payload(raw_body)
-                else:
-                    parsed = json.loads(raw_body) if raw_body else {}
-                if not isinstance(parsed, Mapping):
-                    raise ValueError("HTTP request returned a non-object response")
-                return dict(parsed), response_headers
-        except HTTPError:
-            raise
-        except URLError as exc:
-            raise ValueError(f"HTTP request failed: {exc.reason}") from exc
+            response = await client.post(
+                endpoint, json=dict(body), headers=dict(headers), timeout=self.timeout_seconds
+            )
+        except httpx.RequestError as exc:
+            raise ValueError(f"HTTP request failed: {exc}") from exc
+        response.raise_for_status()
+        response_headers = {key.lower(): value for key, value in response.headers.items()}
+        raw_body = response.text
+        if "text/event-stream" in response_headers.get("content-type", ""):
+            parsed = _parse_event_stream_payload(raw_body)
+        else:
+            parsed = json.loads(raw_body) if raw_body else {}
+        if not isinstance(parsed, Mapping):
+            raise ValueError("HTTP request returned a non-object response")
+        return dict(parsed), response_headers
+
+
+def _unit_rows(embeddings: Any) -> np.ndarray:
+    """Stack embeddings into float32 rows scaled to unit length (zero rows stay zero)."""
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    if matrix.ndim != 2 or matrix.shape[1] == 0:
+        raise ValueError("embeddings must be non-empty vectors of equal length")
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
 
 
 def _status_code(exc: Exception) -> int | None:
@@ -1065,6 +1134,4 @@ def _status_code(exc: Exception) -> int | None:
     status_code = getattr(response, "status_code", None)
     if isinstance(status_code, int):
         return status_code
-    if isinstance(exc, HTTPError):
-        return int(exc.code)
     return None
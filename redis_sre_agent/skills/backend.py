@@ -166,6 +166,7 @@ class RedisSkillBackend:
             if distance_threshold is not None:
                 query_obj = helpers.VectorRangeQuery(
                     vector=query_vector,
+                    dtype=settings.vector_datatype,
                     vector_field_name="vector",
                     return_fields=return_fields,
                     num_results=fetch_limit,
@@ -174,6 +175,7 @@ class RedisSkillBackend:
             else:
                 query_obj = helpers.VectorQuery(
                     vector=query_vector,
+                    dtype=settings.vector_datatype,
                     vector_field_name="vector",
                     return_fields=return_fields,
                     num_results=fetch_limit,
@@ -195,6 +197,7 @@ class RedisSkillBackend:
                 candidates = await index.query(
                     helpers.HybridQuery(
                         vector=query_vector,
+                        dtype=settings.vector_datatype,
                         vector_field_name="vector",
                         text_field_name="content",
                         text=query or "",
@@ -45,11 +45,10 @@ class RedisCatalogDiscoveryBackend:
     async def resolve(self, request: DiscoveryRequest) -> DiscoveryResponse:
         from redis_sre_agent.core.targets import (
             _confidence_from_score,
-            _exact_target_terms,
+            _features_mention_exact_target,
             _normalize,
             _parse_query_hints,
-            _query_mentions_exact_target,
-            _score_target_doc,
+            _target_index_for_docs,
             build_public_match_from_doc,
             get_target_catalog,
         )
@@ -61,17 +60,16 @@ class RedisCatalogDiscoveryBackend:
         registry = get_target_integration_registry()
         normalized_query = _normalize(request.query)
         hints = _parse_query_hints(request.query)
+        target_index, within = _target_index_for_docs(docs)
         ranked: List[DiscoveryCandidate] = []
         exact_ranked: List[DiscoveryCandidate] = []
-        for doc in docs:
-            score, reasons = _score_target_doc(
-                request.query,
-                doc,
-                preferred_capabilities=request.preferred_capabilities,
-                hints=hints,
-            )
-            if score < 2.5:
-                continue
+        for features, score, reasons in target_index.search(
+            hints,
+            preferred_capabilities=request.preferred_capabilities,
+            min_score=2.5,
+            within=within,
+        ):
+            doc = features.doc
             public_match = build_public_match_from_doc(
                 doc,
                 confidence=_confidence_from_score(score),
@@ -88,9 +86,9 @@ class RedisCatalogDiscoveryBackend:
                 confidence=public_match.confidence,
             )
             ranked.append(candidate)
-            exact_query_match = normalized_query and normalized_query in _exact_target_terms(doc)
+            exact_query_match = normalized_query and normalized_query in features.exact_terms
             if exact_query_match or (
-                request.allow_multiple and _query_mentions_exact_target(doc, hints)
+                request.allow_multiple and _features_mention_exact_target(features, hints)
             ):
                 exact_ranked.append(candidate)
 
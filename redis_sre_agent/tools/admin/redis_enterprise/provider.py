@@ -5,6 +5,8 @@ It provides read-only tools for cluster inspection, database information, node s
 and other administrative functions exposed by the Redis Enterprise admin API.
 """
 
+import asyncio
+import hashlib
 import inspect
 import logging
 import re
@@ -29,6 +31,8 @@ from redis_sre_agent.tools.decorators import status_update
 from redis_sre_agent.tools.models import ToolCapability, ToolDefinition
 from redis_sre_agent.tools.protocols import ToolProvider
 
+from .snapshot import get_snapshot_cache, project
+
 logger = logging.getLogger(__name__)
 _API_ERROR_CODE_RE = re.compile(r"\(code:\s*(\d+)\)")
 # BDB field names are seeded from the Redis Enterprise REST API BDB object docs
@@ -233,6 +237,8 @@ class RedisEnterpriseAdminConfig(BaseSettings):
 
     Automatically loads from environment variables with TOOLS_REDIS_ENTERPRISE_ADMIN_ prefix:
     - TOOLS_REDIS_ENTERPRISE_ADMIN_VERIFY_SSL
+    - TOOLS_REDIS_ENTERPRISE_ADMIN_SNAPSHOT_TTL_SECONDS
+    - TOOLS_REDIS_ENTERPRISE_ADMIN_MAX_CONCURRENCY
 
     Example:
         # Loads from environment automatically
@@ -248,6 +254,18 @@ class RedisEnterpriseAdminConfig(BaseSettings):
         default=False,
         description="Verify SSL certificates (default: False to support self-signed certs in Docker Compose)",
     )
+    snapshot_ttl_seconds: float = Field(
+        default=10.0,
+        description=(
+            "How long cluster, database, node and shard listings are shared between "
+            "tool calls against the same cluster (0 disables)"
+        ),
+    )
+    max_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Max concurrent admin API requests for snapshot and action-detail fan-out",
+    )
 
 
 class RedisEnterpriseAdminToolProvider(ToolProvider):
@@ -328,17 +346,9 @@ class RedisEnterpriseAdminToolProvider(ToolProvider):
                 ) from _ENTERPRISE_CLIENT_IMPORT_ERROR
 
             # Get credentials from the instance
-            from pydantic import SecretStr
-
             admin_url = self.redis_instance.admin_url
             admin_username = self.redis_instance.admin_username or ""
-
-            # Extract secret value if it's a SecretStr
-            admin_password_field = self.redis_instance.admin_password
-            if isinstance(admin_password_field, SecretStr):
-                admin_password = admin_password_field.get_secret_value()
-            else:
-                admin_password = admin_password_field or ""
+            admin_password = self._admin_password()
 
             if not admin_username:
                 logger.warning(
@@ -415,6 +425,68 @@ class RedisEnterpriseAdminToolProvider(ToolProvider):
             response = httpx.Response(status_code, request=request, text=str(exc))
             raise httpx.HTTPStatusError(str(exc), request=request, response=response) from exc
 
+    def _admin_password(self) -> str:
+        from pydantic import SecretStr
+
+        # Extract secret value if it's a SecretStr
+        admin_password_field = self.redis_instance.admin_password
+        if isinstance(admin_password_field, SecretStr):
+            return admin_password_field.get_secret_value()
+        return admin_password_field or ""
+
+    @property
+    def _cluster_key(self) -> Tuple[str, str, str]:
+        # The password fingerprint keeps callers with other credentials for the
+        # same cluster from being served listings they could not fetch.
+        return (
+            str(self.redis_instance.admin_url).rstrip("/"),
+            self.redis_instance.admin_username or "",
+            hashlib.sha256(self._admin_password().encode("utf-8")).hexdigest(),
+        )
+
+    async def _get_snapshot(self, path: str, fields: Optional[str] = None) -> Any:
+        """Read a topology listing through the per-cluster snapshot memo.
+
+        A projection is served from a fresh memoized full listing when there is
+        one; otherwise only the requested fields are fetched. Admin API versions
+        that reject ``fields`` (400/406) get the full payload instead.
+        """
+        cache = get_snapshot_cache()
+        cluster = self._cluster_key
+        ttl = self.config.snapshot_ttl_seconds
+        if fields:
+            hit, full = cache.peek((cluster, path))
+            if hit:
+                return project(full, fields)
+            try:
+                # Project locally too, for versions that ignore ``fields``
+                return project(
+                    await cache.get(
+                        (cluster, f"{path}?fields={fields}"),
+                        lambda: self._get_json(path, params={"fields": fields}),
+                        ttl,
+                    ),
+                    fields,
+                )
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in (406, 400):
+                    raise
+                logger.warning(
+                    f"GET {path} with fields={fields} failed ({e.response.status_code}); "
+                    "retrying without fields"
+                )
+        return await cache.get((cluster, path), lambda: self._get_json(path), ttl)
+
+    def _snapshot_item(self, path: str, uid: Any, fields: Optional[str] = None) -> Optional[Any]:
+        """Return one object from a fresh memoized listing at ``path``, if present."""
+        hit, rows = get_snapshot_cache().peek((self._cluster_key, path))
+        if not hit or not isinstance(rows, list):
+            return None
+        for row in rows:
+            if isinstance(row, dict) and str(row.get("uid")) == str(uid):
+                return project(row, fields)
+        return None
+
     async def _close_client(self) -> None:
         if self._client is None:
             return None
@@ -474,6 +546,45 @@ class RedisEnterpriseAdminToolProvider(ToolProvider):
                     "required": [],
                 },
             ),
+            ToolDefinition(
+                name=self._make_tool_name("get_cluster_snapshot"),
+                description=(
+                    "Get a topology snapshot of the Redis Enterprise cluster in one call: "
+                    "cluster info, databases (BDBs), nodes and shards, fetched concurrently. "
+                    "Prefer this over separate list_databases, list_nodes and list_shards "
+                    "calls when triaging several databases or checking shard placement. "
+                    "Use the *_fields parameters to return only the attributes you need."
+                ),
+                capability=ToolCapability.DIAGNOSTICS,
+                parameters={
+                    "type": "object",
+                    "properties": {
+                        "include_cluster": {
+                            "type": "boolean",
+                            "description": "Include /v1/cluster information (default: true)",
+                        },
+                        "database_fields": {
+                            "type": "string",
+                            "description": _BDB_FIELDS_PARAMETER_DESCRIPTION,
+                        },
+                        "node_fields": {
+                            "type": "string",
+                            "description": (
+                                "Comma-separated list of node field names to return. "
+                                "Leave empty to return all fields."
+                            ),
+                        },
+                        "shard_fields": {
+                            "type": "string",
+                            "description": (
+                                "Comma-separated list of shard field names to return. "
+                                "Leave empty to return all fields."
+                            ),
+                        },
+                    },
+                    "required": [],
+                },
+            ),
             ToolDefinition(
                 name=self._make_tool_name("list_databases"),
                 description=(
@@ -953,7 +1064,7 @@ class RedisEnterpriseAdminToolProvider(ToolProvider):
         """
         logger.info("Getting Redis Enterprise cluster info")
         try:
-            data = await self._get_json("/v1/cluster")
+            data = await self._get_snapshot("/v1/cluster")
 
             return {
                 "status": "success",
@@ -983,6 +1094,72 @@ class RedisEnterpriseAdminToolProvider(ToolProvider):
                 "error": error_msg,
             }
 
+    @status_update("I'm fetching a cluster topology snapshot via the Redis Enterprise Admin API.")
+    async def get_cluster_snapshot(
+        self,
+        include_cluster: bool = True,
+        database_fields: Optional[str] = None,
+        node_fields: Optional[str] = None,
+        shard_fields: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Get cluster info, databases, nodes and shards in one call.
+
+        The listings are fetched concurrently (bounded by ``max_concurrency``)
+        through the per-cluster snapshot memo, so later list/get calls in the
+        same turn are served without another round trip. A failed section is
+        reported under ``errors`` without failing the others.
+
+        Args:
+            include_cluster: Include /v1/cluster information
+            database_fields: Comma-separated BDB fields to return
+            node_fields: Comma-separated node fields to return
+            shard_fields: Comma-separated shard fields to return
+
+        Returns:
+            Snapshot with one key per section plus counts
+        """
+        logger.info("Getting cluster topology snapshot")
+        sections: List[Tuple[str, str, Optional[str]]] = [
+            ("databases", "/v1/bdbs", database_fields),
+            ("nodes", "/v1/nodes", node_fields),
+            ("shards", "/v1/shards", shard_fields),
+        ]
+        if include_cluster:
+            sections.insert(0, ("cluster", "/v1/cluster", None))
+
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        async def _fetch(path: str, fields: Optional[str]) -> Any:
+            async with semaphore:
+                return await self._get_snapshot(path, fields)
+
+        results = await asyncio.gather(
+            *(_fetch(path, fields) for _, path, fields in sections), return_exceptions=True
+        )
+
+        snapshot: Dict[str, Any] = {"status": "success"}
+        counts: Dict[str, int] = {}
+        errors: Dict[str, str] = {}
+        for (section, _, _), result in zip(sections, results):
+            if isinstance(result, httpx.HTTPStatusError):
+                errors[section] = f"HTTP {result.response.status_code}: {result.response.text}"
+            elif isinstance(result, Exception):
+                errors[section] = str(result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                snapshot[section] = result
+                if isinstance(result, list):
+                    counts[section] = len(result)
+        if errors:
+            logger.error(f"Failed to fetch cluster snapshot sections: {errors}")
+            snapshot["errors"] = errors
+            if len(errors) == len(sections):
+                snapshot["status"] = "error"
+        snapshot["counts"] = counts
+        snapshot["timestamp"] = datetime.now(timezone.utc).isoformat()
+        return snapshot
+
     @status_update("I'm listing databases via the Redis Enterprise Admin API.")
     async def list_databases(self, fields: Optional[str] = None) -> Dict[str, Any]:
         """List all databases in the cluster.
@@ -995,22 +1172,7 @@ class RedisEnterpriseAdminToolProvider(ToolProvider):
         """
         logger.info(f"Listing databases (fields={fields})")
         try:
-            params = {}
-            if fields:
-                params["fields"] = fields
-
-            try:
-                databases = await self._get_json("/v1/bdbs", params=params)
-            except httpx.HTTPStatusError as e:
-                # Some Redis Enterprise versions do not accept 'fields' on this endpoint
-                if e.response.status_code in (406, 400) and fields:
-                    logger.warning(
-                        f"list_databases(fields={fields}) failed with {e.response.status_code}; retrying without fields"
-                    )
-                    databases = await self._get_json("/v1/bdbs")
-                else:
-                    raise
-
+            databases = await self._get_snapshot("/v1/bdbs", fields)
             return {
                 "status": "success",
                 "count": len(databases) if isinstance(databases, list) else 1,
@@ -1049,17 +1211,20 @@ class RedisEnterpriseAdminToolProvider(ToolProvider):
             if fields:
                 params["fields"] = fields
 
-            try:
-                database = await self._get_json(f"/v1/bdbs/{uid}", params=params)
-            except httpx.HTTPStatusError as e:
-                # Some Redis Enterprise versions return 406 when 'fields' is not supported on this endpoint
-                if e.response.status_code in (406, 400) and fields:
-                    logger.warning(
-                        f"get_database({uid}) with fields failed ({e.response.status_code}); retrying without fields"
-                    )
-                    database = await self._get_json(f"/v1/bdbs/{uid}")
-                else:
-                    raise
+            # A fresh memoized database listing already holds this BDB
+            database = self._snapshot_item("/v1/bdbs", uid, fields)
+            if database is None:
+                try:
+                    database = await self._get_json(f"/v1/bdbs/{uid}", params=params)
+                except httpx.HTTPStatusError as e:
+                    # Some Redis Enterprise versions return 406 when 'fields' is not supported on this endpoint
+                    if e.response.status_code in (406, 400) and fields:
+                        logger.warning(
+                            f"get_database({uid}) with fields failed ({e.response.status_code}); retrying without fields"
+                        )
+                        database = await self._get_json(f"/v1/bdbs/{uid}")
+                    else:
+                        raise
 
             return {
                 "status": "success",
@@ -1264,11 +1429,7 @@ class RedisEnterpriseAdminToolProvider(ToolProvider):
         """
         logger.info(f"Listing nodes (fields={fields})")
         try:
-            params = {}
-            if fields:
-                params["fields"] = fields
-
-            nodes = await self._get_json("/v1/nodes", params=params)
+            nodes = await self._get_snapshot("/v1/nodes", fields)
             return {
                 "status": "success",
                 "count": len(nodes),
@@ -1307,9 +1468,12 @@ class RedisEnterpriseAdminToolProvider(ToolProvider):
             if fields:
                 params["fields"] = fields
 
+            node = self._snapshot_item("/v1/nodes", uid, fields)
+            if node is None:
+                node = await self._get_json(f"/v1/nodes/{uid}", params=params)
             return {
                 "status": "success",
-                "node": await self._get_json(f"/v1/nodes/{uid}", params=params),
+                "node": node,
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             }
         except httpx.HTTPStatusError as e:
@@ -1574,11 +1738,7 @@ class RedisEnterpriseAdminToolProvider(ToolProvider):
         """
         logger.info(f"Listing shards (fields={fields})")
         try:
-            params = {}
-            if fields:
-                params["fields"] = fields
-
-            shards = await self._get_json("/v1/shards", params=params)
+            shards = await self._get_snapshot("/v1/shards", fields)
             return {
                 "status": "success",
                 "count": len(shards),
@@ -1603,7 +1763,7 @@ class RedisEnterpriseAdminToolProvider(ToolProvider):
         from redis_sre_agent.tools.models import SystemHost
 
         try:
-            nodes = await self._get_json("/v1/nodes") or []
+            nodes = await self._get_snapshot("/v1/nodes") or []
             results: List[SystemHost] = []
             for n in nodes:
                 try:
@@ -1665,26 +1825,28 @@ class RedisEnterpriseAdminToolProvider(ToolProvider):
         """Identify rebalance-related actions, including fast SMUpdateBDB cases.
 
         - Consumes /v2/actions
-        - Optionally fetches /v2/actions/{uid} for ambiguous SMUpdateBDB actions
+        - Optionally fetches /v2/actions/{uid} for ambiguous SMUpdateBDB actions,
+          concurrently (bounded by ``max_concurrency``)
         - Optionally filters by database (db_uid or db_name)
         - Returns active and recently completed (within recent_seconds) results
         """
         import time as _time
 
         try:
-            # Resolve db_uid from db_name when requested
+            # Resolve db_uid from db_name (when requested) while fetching actions
             resolved_db_uid: Optional[int] = db_uid
             resolved_db_name: Optional[str] = None
             if db_name and not resolved_db_uid:
-                dbs = await self.list_databases(fields="uid,name")
+                dbs, actions_env = await asyncio.gather(
+                    self.list_databases(fields="uid,name"), self.list_actions()
+                )
                 for db in dbs.get("databases") or []:
                     if str(db.get("name") or "").lower() == str(db_name).lower():
                         resolved_db_uid = int(db.get("uid"))
                         resolved_db_name = db.get("name")
                         break
-
-            # Fetch actions
-            actions_env = await self.list_actions()
+            else:
+                actions_env = await self.list_actions()
             actions = actions_env.get("actions") or []
 
             now = int(_time.time())
@@ -1703,16 +1865,11 @@ class RedisEnterpriseAdminToolProvider(ToolProvider):
                     return None
                 return None
 
-            # Iterate and classify
+            # Classify from the list, collecting ambiguous SMUpdateBDB actions
+            candidates: List[Tuple[Dict[str, Any], Optional[int], bool, str]] = []
             for a in actions:
-                name = str(a.get("name") or "")
-                status = str(a.get("status") or "").lower()
-                creation_time = a.get("creation_time")  # epoch seconds (int)
-                obj_name = a.get("object_name")
-                action_uid = a.get("action_uid")
-
                 # Filter by db if requested
-                a_db_uid = _extract_db_uid(obj_name)
+                a_db_uid = _extract_db_uid(a.get("object_name"))
                 if (
                     resolved_db_uid is not None
                     and a_db_uid is not None
@@ -1720,12 +1877,39 @@ class RedisEnterpriseAdminToolProvider(ToolProvider):
                 ):
                     continue
                 # If object_name missing and filter requested, we'll still try to classify (can't filter by db)
-
                 is_reb, reason = self._is_action_rebalance_like(a)
+                candidates.append((a, a_db_uid, is_reb, reason))
+
+            # Fetch details for ambiguous SMUpdateBDB actions without clear ops, concurrently
+            ambiguous_uids = [
+                a.get("action_uid")
+                for a, _, is_reb, _ in candidates
+                if not is_reb
+                and str(a.get("name") or "").lower().startswith("smupdatebdb")
+                and a.get("action_uid")
+            ]
+            semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+            async def _get_action_detail(action_uid: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self.get_action(action_uid)
+
+            details = dict(
+                zip(
+                    ambiguous_uids,
+                    await asyncio.gather(*(_get_action_detail(uid) for uid in ambiguous_uids)),
+                )
+            )
+
+            for a, a_db_uid, is_reb, reason in candidates:
+                name = str(a.get("name") or "")
+                status = str(a.get("status") or "").lower()
+                creation_time = a.get("creation_time")  # epoch seconds (int)
+                obj_name = a.get("object_name")
+                action_uid = a.get("action_uid")
 
-                # If ambiguous SMUpdateBDB without clear ops, fetch details
-                if not is_reb and name.lower().startswith("smupdatebdb") and action_uid:
-                    detail = await self.get_action(action_uid)
+                if not is_reb and action_uid in details:
+                    detail = details[action_uid]
                     if detail.get("status") == "success":
                         d_action = detail.get("action") or {}
                         is_reb, reason = self._is_action_rebalance_like(d_action)
@@ -1789,9 +1973,12 @@ class RedisEnterpriseAdminToolProvider(ToolProvider):
         """
         logger.info(f"Getting shard {uid}")
         try:
+            shard = self._snapshot_item("/v1/shards", uid)
+            if shard is None:
+                shard = await self._get_json(f"/v1/shards/{uid}")
             return {
                 "status": "success",
-                "shard": await self._get_json(f"/v1/shards/{uid}"),
+                "shard": shard,
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             }
         except httpx.HTTPStatusError as e:
@@ -1819,7 +2006,7 @@ class RedisEnterpriseAdminToolProvider(ToolProvider):
         logger.info("Getting cluster alerts")
         try:
             # Get cluster info which includes alert_settings
-            cluster_data = await self._get_json("/v1/cluster")
+            cluster_data = await self._get_snapshot("/v1/cluster")
             return {
                 "status": "success",
                 "alert_settings": cluster_data.get("alert_settings", {}),
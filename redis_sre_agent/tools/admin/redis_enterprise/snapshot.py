@@ -0,0 +1,145 @@
+"""Short-lived, per-cluster memo of Redis Enterprise admin API topology reads.
+
+Triage over many databases calls ``list_databases``, ``list_nodes``,
+``list_shards`` and ``get_cluster_info`` repeatedly, often from concurrent tool
+calls in one turn and from concurrent turns against the same cluster. Provider
+instances are created per turn, so the memo lives at module level, keyed by
+cluster (admin URL, username and a fingerprint of the password) and request
+path.
+
+Entries expire after a short TTL. Concurrent misses for the same key on one
+event loop share a single request. Cached payloads are shared between callers
+and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+# Expired entries are swept once the memo holds more than this many entries.
+_MAX_ENTRIES_BEFORE_SWEEP = 512
+
+SnapshotKey = Tuple[Hashable, str]
+
+
+def parse_fields(fields: Optional[str]) -> List[str]:
+    """Split a comma-separated projection into unique field names, in order."""
+    names: List[str] = []
+    for name in (fields or "").split(","):
+        name = name.strip()
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def project(payload: Any, fields: Optional[str]) -> Any:
+    """Keep only the requested fields of an object or a list of objects.
+
+    Mirrors the admin API ``fields`` parameter: unknown fields are omitted
+    rather than reported as missing.
+    """
+    names = parse_fields(fields)
+    if not names:
+        return payload
+    if isinstance(payload, list):
+        return [project(item, fields) for item in payload]
+    if isinstance(payload, dict):
+        return {name: payload[name] for name in names if name in payload}
+    return payload
+
+
+class ClusterSnapshotCache:
+    """TTL memo of admin API responses with per-loop single-flight misses."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[SnapshotKey, Tuple[float, Any]] = {}
+        self._inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[SnapshotKey, asyncio.Future]]" = weakref.WeakKeyDictionary()
+
+    def peek(self, key: SnapshotKey) -> Tuple[bool, Any]:
+        """Return ``(True, value)`` for a fresh entry, else ``(False, None)``."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self._entries.pop(key, None)
+            return False, None
+        return True, value
+
+    async def get(
+        self,
+        key: SnapshotKey,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl_seconds: float,
+    ) -> Any:
+        """Return the memoized value for ``key``, fetching it at most once per miss.
+
+        Exceptions from ``fetch`` propagate to every waiter and are not cached.
+        A non-positive TTL disables memoization.
+        """
+        if ttl_seconds <= 0:
+            return await fetch()
+
+        hit, value = self.peek(key)
+        if hit:
+            return value
+
+        inflight = self._inflight.setdefault(asyncio.get_running_loop(), {})
+        while key in inflight:
+            future = inflight[key]
+            try:
+                # Shield so one waiter being cancelled does not cancel the rest
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The leader was cancelled; retry and possibly take over
+
+        future = asyncio.get_running_loop().create_future()
+        inflight[key] = future
+        try:
+            value = await fetch()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Mark retrieved so an unobserved failure is not logged twice
+                future.exception()
+            raise
+        else:
+            self._store(key, value, ttl_seconds)
+            future.set_result(value)
+            return value
+        finally:
+            if inflight.get(key) is future:
+                del inflight[key]
+
+    def _store(self, key: SnapshotKey, value: Any, ttl_seconds: float) -> None:
+        now = time.monotonic()
+        if len(self._entries) >= _MAX_ENTRIES_BEFORE_SWEEP:
+            self._entries = {k: v for k, v in self._entries.items() if v[0] > now}
+        self._entries[key] = (now + ttl_seconds, value)
+
+    def clear(self, cluster: Optional[Hashable] = None) -> None:
+        """Drop every entry, or only the entries of one cluster."""
+        if cluster is None:
+            self._entries.clear()
+        else:
+            self._entries = {k: v for k, v in self._entries.items() if k[0] != cluster}
+
+
+_snapshots = ClusterSnapshotCache()
+
+
+def get_snapshot_cache() -> ClusterSnapshotCache:
+    """Return the process-wide cluster snapshot memo."""
+    return _snapshots
+
+
+def clear_cluster_snapshots(cluster: Optional[Hashable] = None) -> None:
+    """Forget memoized admin API responses (all clusters by default)."""
+    _snapshots.clear(cluster)
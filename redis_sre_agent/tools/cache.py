@@ -2,12 +2,20 @@
 
 This module provides a shared cache for tool call outputs that persists
 across agent runs and threads. It uses Redis with TTL-based expiration.
+
+Cache misses are coalesced (single-flight): concurrent callers asking for the
+same (instance, tool, args) wait for one in-flight invocation in this process,
+and optionally for one across processes via a short Redis lock key.
 """
 
+import asyncio
 import hashlib
 import json
 import logging
-from typing import Any, Dict, Optional
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Optional
+from uuid import uuid4
 
 from redis.asyncio import Redis
 
@@ -39,6 +47,23 @@ DEFAULT_TOOL_TTLS: Dict[str, int] = {
 
 # Cache key prefix - can be overridden via settings
 CACHE_PREFIX = "sre_cache:tool"
+# Single-flight lock keys live outside CACHE_PREFIX so clear/stats ignore them
+LOCK_PREFIX = "sre_cache:toollock"
+# How often a waiter re-checks the cache while another process holds the lock
+LOCK_POLL_INTERVAL = 0.05
+
+# Release the lock only if we still own it
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# In-flight invocations per event loop, keyed by cache key
+_inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]]" = (
+    weakref.WeakKeyDictionary()
+)
 
 
 class ToolCache:
@@ -63,6 +88,7 @@ class ToolCache:
         instance_id: str,
         ttl_overrides: Optional[Dict[str, int]] = None,
         enabled: bool = True,
+        lock_ttl: Optional[int] = None,
     ):
         """Initialize the tool cache.
 
@@ -71,11 +97,14 @@ class ToolCache:
             instance_id: Redis instance ID to scope cache keys
             ttl_overrides: Custom TTLs for specific tools
             enabled: Whether caching is enabled
+            lock_ttl: Seconds to hold the cross-process single-flight lock
+                (defaults to settings.tool_cache_lock_ttl; 0 disables it)
         """
         self._redis = redis_client
         self._instance_id = instance_id
         self._ttl_overrides = ttl_overrides or {}
         self._enabled = enabled
+        self._lock_ttl = settings.tool_cache_lock_ttl if lock_ttl is None else lock_ttl
 
     def build_key(self, tool_name: str, args: Dict[str, Any]) -> str:
         """Build cache key from tool name and arguments.
@@ -167,6 +196,123 @@ class ToolCache:
             logger.warning(f"Cache set failed: {e}")
             return False
 
+    async def get_or_compute(
+        self,
+        tool_name: str,
+        args: Dict[str, Any],
+        compute: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the cached result, or run ``compute`` once and cache it.
+
+        Concurrent callers in this process with the same cache key await the
+        first caller's result instead of invoking the tool again. When a lock
+        TTL is configured, callers in other processes wait for the lock
+        holder to populate the cache, falling back to their own invocation if
+        the holder finishes without caching or the lock expires.
+
+        Exceptions raised by ``compute`` propagate to every waiter.
+        """
+        if not self._enabled:
+            return await compute()
+
+        key = self.build_key(tool_name, args)
+        inflight = _inflight.setdefault(asyncio.get_running_loop(), {})
+
+        while key in inflight:
+            future = inflight[key]
+            try:
+                # Shield so one waiter being cancelled does not cancel the rest
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The leader was cancelled; retry and possibly take over
+
+        future = asyncio.get_running_loop().create_future()
+        inflight[key] = future
+        try:
+            result = await self._get_or_compute_leader(tool_name, args, key, compute)
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Mark retrieved so an unobserved failure is not logged twice
+                future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if inflight.get(key) is future:
+                del inflight[key]
+
+    async def _get_or_compute_leader(
+        self,
+        tool_name: str,
+        args: Dict[str, Any],
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        cached = await self.get(tool_name, args)
+        if cached is not None:
+            return cached
+
+        lock_key = None
+        token = uuid4().hex
+        if self._lock_ttl > 0:
+            lock_key = f"{LOCK_PREFIX}:{key[len(CACHE_PREFIX) + 1 :]}"
+            if not await self._acquire_lock(lock_key, token):
+                cached = await self._wait_for_lock_holder(tool_name, args, lock_key)
+                if cached is not None:
+                    return cached
+                lock_key = None
+
+        try:
+            result = await compute()
+            await self.set(tool_name, args, result)
+            return result
+        finally:
+            if lock_key is not None:
+                await self._release_lock(lock_key, token)
+
+    async def _acquire_lock(self, lock_key: str, token: str) -> bool:
+        """Try to take the cross-process lock. Fails open on Redis errors."""
+        try:
+            return bool(await self._redis.set(lock_key, token, nx=True, ex=self._lock_ttl))
+        except Exception as e:
+            logger.warning(f"Cache lock acquire failed: {e}")
+            return True
+
+    async def _release_lock(self, lock_key: str, token: str) -> None:
+        try:
+            await self._redis.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+        except Exception as e:
+            logger.warning(f"Cache lock release failed: {e}")
+
+    async def _wait_for_lock_holder(
+        self, tool_name: str, args: Dict[str, Any], lock_key: str
+    ) -> Optional[Any]:
+        """Poll the cache while another process holds the lock.
+
+        Returns the cached result, or None once the lock is released or
+        expires without a cached value.
+        """
+        deadline = time.monotonic() + self._lock_ttl
+        while time.monotonic() < deadline:
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+            cached = await self.get(tool_name, args)
+            if cached is not None:
+                logger.debug(f"Cache filled by lock holder for {tool_name}")
+                return cached
+            try:
+                if not await self._redis.exists(lock_key):
+                    return None
+            except Exception as e:
+                logger.warning(f"Cache lock check failed: {e}")
+                return None
+        return None
+
     async def _scan_keys(self, pattern: str) -> list:
         """Scan for keys matching pattern using SCAN (production-safe).
 
@@ -0,0 +1,208 @@
+"""Merge per-host PromQL/LogQL queries into one regex-matcher query per chunk.
+
+Host telemetry templates select a host with an equality matcher such as
+``instance="{host}"``. Rather than one upstream request per host, the matcher is
+rewritten to ``instance=~"a|b|c"`` and the returned series (Prometheus) or
+streams (Loki) are split back per host by that label.
+
+Merging is only attempted when every ``{host}`` token in a template is such a
+matcher on one label and the template has no function whose result depends on
+the whole selected set (``topk``, ``scalar``, ...). Callers fall back to
+per-host queries whenever a merged result cannot be attributed to hosts, e.g.
+an aggregation dropped the host label.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from redis_sre_agent.tools.logs.loki.provider import reduce_streams_response
+from redis_sre_agent.tools.models import ENVELOPE_ONLY_KEY
+
+HOST_TOKEN = "{host}"
+
+_HOST_MATCHER = re.compile(r"""([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(["'`])\{host\}\2""")
+# Functions whose per-series output depends on the other selected series.
+_SET_DEPENDENT_FUNCTION = re.compile(
+    r"\b(?:topk|bottomk|limitk|limit_ratio|scalar|absent|absent_over_time|vector|"
+    r"count_values|quantile|sort|sort_desc|sort_by_label|sort_by_label_desc)\s*\("
+)
+_RE2_SPECIAL = frozenset(r"\.+*?()|[]{}^$")
+
+
+def unique_hosts(hosts: Sequence[str]) -> List[str]:
+    """Non-empty host strings, deduplicated in order."""
+    return list(dict.fromkeys(h for h in hosts if isinstance(h, str) and h))
+
+
+def chunk_hosts(hosts: Sequence[str], size: int) -> List[List[str]]:
+    size = max(1, size)
+    return [list(hosts[i : i + size]) for i in range(0, len(hosts), size)]
+
+
+def host_label(template: str) -> Optional[str]:
+    """Label that every ``{host}`` token of ``template`` matches on, if mergeable."""
+    if _SET_DEPENDENT_FUNCTION.search(template):
+        return None
+    labels = {match.group(1) for match in _HOST_MATCHER.finditer(template)}
+    if len(labels) != 1:
+        return None
+    if len(_HOST_MATCHER.findall(template)) != template.count(HOST_TOKEN):
+        return None
+    return labels.pop()
+
+
+def _host_alternation(hosts: Sequence[str]) -> str:
+    """RE2 alternation of literal hosts, escaped for a double-quoted string."""
+    pattern = "|".join("".join(f"\\{c}" if c in _RE2_SPECIAL else c for c in h) for h in hosts)
+    return pattern.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def merge_host_matchers(template: str, hosts: Sequence[str]) -> str:
+    """Rewrite each ``label="{host}"`` matcher of ``template`` to match all ``hosts``."""
+    alternation = _host_alternation(hosts)
+    return _HOST_MATCHER.sub(lambda m: f'{m.group(1)}=~"{alternation}"', template)
+
+
+# --------------------------------- Prometheus ---------------------------------
+
+
+def _split_series(
+    items: Any, label: str, hosts: Sequence[str]
+) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    if not isinstance(items, list):
+        return None
+    out: Dict[str, List[Dict[str, Any]]] = {h: [] for h in hosts}
+    for item in items:
+        metric = item.get("metric") if isinstance(item, dict) else None
+        host = metric.get(label) if isinstance(metric, dict) else None
+        if host not in out:
+            return None
+        out[host].append(item)
+    return out
+
+
+def split_matrix_by_host(
+    response: Any, label: str, hosts: Sequence[str]
+) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Split a merged ``query_range`` response into per-host responses.
+
+    Understands reduced (``series`` plus envelope-only ``data``) and raw
+    (``data``) matrix responses. Errors are shared by every host. Returns None
+    when any series cannot be attributed to one of ``hosts``.
+    """
+    if not isinstance(response, dict):
+        return None
+    if response.get("status") != "success":
+        return {h: response for h in hosts}
+
+    envelope = response.get(ENVELOPE_ONLY_KEY)
+    parts: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+    if "series" in response:
+        parts["series"] = _split_series(response["series"], label, hosts)
+    if isinstance(envelope, dict) and "data" in envelope:
+        parts["envelope"] = _split_series(envelope["data"], label, hosts)
+    elif "data" in response:
+        parts["data"] = _split_series(response["data"], label, hosts)
+    if not parts or any(split is None for split in parts.values()):
+        return None
+
+    out: Dict[str, Dict[str, Any]] = {}
+    for host in hosts:
+        per_host = dict(response)
+        if "series" in parts:
+            per_host["series"] = parts["series"][host]
+            if "series_count" in per_host:
+                per_host["series_count"] = len(
+                    parts["envelope" if "envelope" in parts else "series"][host]
+                )
+        if "envelope" in parts:
+            per_host[ENVELOPE_ONLY_KEY] = dict(envelope, data=parts["envelope"][host])
+        if "data" in parts:
+            per_host["data"] = parts["data"][host]
+        out[host] = per_host
+    return out
+
+
+# ------------------------------------ Loki ------------------------------------
+
+
+def _stream_payload(response: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], bool]:
+    """Raw Loki payload of a ``query_range`` response and whether it was reduced."""
+    envelope = response.get(ENVELOPE_ONLY_KEY)
+    if isinstance(envelope, dict) and isinstance(envelope.get("data"), dict):
+        return envelope["data"], True
+    payload = response.get("data")
+    return (payload if isinstance(payload, dict) else None), False
+
+
+def _truncate_streams(
+    streams: List[Dict[str, Any]], limit: int, direction: str
+) -> List[Dict[str, Any]]:
+    """Keep the first ``limit`` entries across ``streams`` in query order."""
+    ranked = sorted(
+        (
+            (int(entry[0]), i, j)
+            for i, stream in enumerate(streams)
+            for j, entry in enumerate(stream.get("values") or [])
+        ),
+        reverse=direction != "forward",
+    )[:limit]
+    keep: Dict[int, set] = {}
+    for _, i, j in ranked:
+        keep.setdefault(i, set()).add(j)
+    return [
+        dict(stream, values=[v for j, v in enumerate(stream.get("values") or []) if j in keep[i]])
+        for i, stream in enumerate(streams)
+        if i in keep
+    ]
+
+
+def split_streams_by_host(
+    response: Any,
+    label: str,
+    hosts: Sequence[str],
+    limit: int,
+    direction: str,
+) -> Optional[Tuple[Dict[str, Dict[str, Any]], List[str]]]:
+    """Split a merged Loki ``query_range`` response into per-host responses.
+
+    The merged query was sent with ``limit * len(hosts)``; each host keeps at
+    most ``limit`` entries. When the merged result hit its limit, hosts with
+    fewer than ``limit`` entries may have been crowded out by noisier hosts and
+    are returned in the second element so the caller can query them alone.
+    Reduced responses are re-reduced per host. Returns None when the response
+    is not a streams result or a stream lacks a requested host label.
+    """
+    if not isinstance(response, dict):
+        return None
+    if response.get("status") != "success":
+        return {h: response for h in hosts}, []
+
+    payload, reduced = _stream_payload(response)
+    data = payload.get("data") if payload else None
+    if not isinstance(data, dict) or data.get("resultType") != "streams":
+        return None
+
+    by_host: Dict[str, List[Dict[str, Any]]] = {h: [] for h in hosts}
+    for stream in data.get("result") or []:
+        labels = stream.get("stream") if isinstance(stream, dict) else None
+        host = labels.get(label) if isinstance(labels, dict) else None
+        if host not in by_host:
+            return None
+        by_host[host].append(stream)
+
+    counts = {h: sum(len(s.get("values") or []) for s in streams) for h, streams in by_host.items()}
+    saturated = sum(counts.values()) >= limit * len(hosts)
+    crowded_out = [h for h in hosts if saturated and counts[h] < limit]
+
+    base = {k: v for k, v in response.items() if k not in ("data", ENVELOPE_ONLY_KEY)}
+    out: Dict[str, Dict[str, Any]] = {}
+    for host in hosts:
+        streams = by_host[host]
+        if counts[host] > limit:
+            streams = _truncate_streams(streams, limit, direction)
+        raw = dict(base, data=dict(payload, data=dict(data, result=streams)))
+        out[host] = reduce_streams_response(raw) if reduced else raw
+    return out, crowded_out
@@ -5,6 +5,10 @@ existing metrics/logs/diagnostics providers via ToolManager capability lookup.
 
 Defaults target Prometheus (metrics) and Loki (logs). Users supply hostnames
 (or label values) explicitly or let us derive them from diagnostics if available.
+
+Per-host queries whose template selects the host with a single label matcher
+are merged into one regex-matcher query per chunk of hosts and split back per
+host (see ``merging``); every upstream call runs under a concurrency bound.
 """
 
 from __future__ import annotations
@@ -15,7 +19,16 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
-from redis_sre_agent.tools.models import ToolCapability, ToolDefinition
+from redis_sre_agent.tools.host_telemetry.merging import (
+    HOST_TOKEN,
+    chunk_hosts,
+    host_label,
+    merge_host_matchers,
+    split_matrix_by_host,
+    split_streams_by_host,
+    unique_hosts,
+)
+from redis_sre_agent.tools.models import ENVELOPE_ONLY_KEY, ToolCapability, ToolDefinition
 from redis_sre_agent.tools.protocols import (
     DiagnosticsProviderProtocol,
     LogsProviderProtocol,
@@ -35,6 +48,11 @@ class HostTelemetryPromConfig(BaseModel):
         description="Mapping of logical metric keys to PromQL templates containing {host}",
     )
     default_step: str = Field(default="30s")
+    max_hosts_per_query: int = Field(
+        default=50,
+        ge=1,
+        description="Hosts merged into one regex-matcher query per metric alias",
+    )
 
 
 class HostTelemetryLokiConfig(BaseModel):
@@ -44,10 +62,21 @@ class HostTelemetryLokiConfig(BaseModel):
     )
     direction: str = Field(default="backward")
     limit: int = Field(default=1000)
+    max_entries_per_query: int = Field(
+        default=5000,
+        ge=1,
+        description=(
+            "Entry limit a merged multi-host query may request (Loki's "
+            "max_entries_limit_per_query); bounds hosts merged per query to this // limit"
+        ),
+    )
 
 
 class HostTelemetryConfig(BaseModel):
     hosts: Optional[List[str]] = None
+    max_concurrency: int = Field(
+        default=8, ge=1, description="Maximum concurrent upstream metrics/logs queries"
+    )
     metrics: HostTelemetryPromConfig = Field(default_factory=HostTelemetryPromConfig)
     logs: HostTelemetryLokiConfig = Field(default_factory=HostTelemetryLokiConfig)
 
@@ -196,10 +225,41 @@ class HostTelemetryToolProvider(ToolProvider):
                     continue
         return list(hosts)
 
+    @staticmethod
+    def _collect_results(
+        outcomes: Dict[tuple, tuple], order: List[tuple], fields: tuple
+    ) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Build result entries in ``order``, lifting raw envelope data aside.
+
+        ``outcomes`` maps ``(provider, host[, key])`` to ``(query, result)``,
+        where an exception result becomes an ``error`` entry.
+        """
+        results: List[Dict[str, Any]] = []
+        raw_results: List[Dict[str, Any]] = []
+        for slot in order:
+            query, res = outcomes[slot]
+            ids = dict(zip(fields, (slot[0].provider_name, *slot[1:])))
+            if isinstance(res, Exception):
+                results.append(ids | {"query": query, "error": str(res)})
+                continue
+            if isinstance(res, dict) and ENVELOPE_ONLY_KEY in res:
+                res = dict(res)
+                raw_results.append(ids | res.pop(ENVELOPE_ONLY_KEY))
+            results.append(ids | {"query": query, "result": res})
+        return results, raw_results
+
     def _build_loki_query(self, host: str, keywords: Optional[List[str]]) -> str:
         cfg: HostTelemetryConfig = self.instance_config or HostTelemetryConfig()
         tmpl = cfg.logs.stream_selector_template or ""
-        selector = tmpl.replace("{host}", host)
+        return self._with_keywords(tmpl.replace(HOST_TOKEN, host), keywords)
+
+    def _build_merged_loki_query(self, hosts: List[str], keywords: Optional[List[str]]) -> str:
+        cfg: HostTelemetryConfig = self.instance_config or HostTelemetryConfig()
+        tmpl = cfg.logs.stream_selector_template or ""
+        return self._with_keywords(merge_host_matchers(tmpl, hosts), keywords)
+
+    @staticmethod
+    def _with_keywords(selector: str, keywords: Optional[List[str]]) -> str:
         if keywords:
             # Combine into single OR regex and escape quotes minimally
             safe = [k.replace('"', "'") for k in keywords if isinstance(k, str) and k]
@@ -298,40 +358,64 @@ class HostTelemetryToolProvider(ToolProvider):
             return {"status": "error", "error": "No metrics providers available"}
 
         step_val = step or (cfg.metrics.default_step or "30s")
+        hosts = unique_hosts(hosts or [])
+        semaphore = asyncio.Semaphore(cfg.max_concurrency)
+        outcomes: Dict[tuple, tuple] = {}
+
+        async def fetch(provider: MetricsProviderProtocol, q: str) -> Any:
+            async with semaphore:
+                return await provider.query_range(
+                    query=q, start_time=start_time, end_time=end_time, step=step_val
+                )
 
         async def run_query(provider: MetricsProviderProtocol, host: str, key: str):
-            tmpl = aliases[key] or ""
             # Avoid Python format() clashing with PromQL braces; only replace our token
-            q = tmpl.replace("{host}", host)
+            q = (aliases[key] or "").replace(HOST_TOKEN, host)
             try:
-                res = await provider.query_range(
-                    query=q, start_time=start_time, end_time=end_time, step=step_val
-                )
-                return {
-                    "provider": provider.provider_name,
-                    "host": host,
-                    "key": key,
-                    "query": q,
-                    "result": res,
-                }
+                outcomes[(provider, host, key)] = (q, await fetch(provider, q))
             except Exception as e:
-                return {
-                    "provider": provider.provider_name,
-                    "host": host,
-                    "key": key,
-                    "query": q,
-                    "error": str(e),
-                }
-
-        tasks = [run_query(p, h, k) for p in providers for h in hosts for k in metric_keys]
-        results = await asyncio.gather(*tasks)
-        return {
+                outcomes[(provider, host, key)] = (q, e)
+
+        async def run_chunk(provider: MetricsProviderProtocol, key: str, chunk: List[str]):
+            tmpl = aliases[key] or ""
+            label = host_label(tmpl)
+            if label is None or len(chunk) == 1:
+                await asyncio.gather(*(run_query(provider, h, key) for h in chunk))
+                return
+            q = merge_host_matchers(tmpl, chunk)
+            try:
+                res = await fetch(provider, q)
+            except Exception as e:
+                outcomes.update({(provider, h, key): (q, e) for h in chunk})
+                return
+            split = split_matrix_by_host(res, label, chunk)
+            if split is None:
+                # e.g. an aggregation dropped the host label; ask per host instead
+                logger.debug("Merged host query not splittable by %s; querying per host", label)
+                await asyncio.gather(*(run_query(provider, h, key) for h in chunk))
+                return
+            outcomes.update({(provider, h, key): (q, split[h]) for h in chunk})
+
+        chunks = chunk_hosts(hosts, cfg.metrics.max_hosts_per_query)
+        await asyncio.gather(
+            *(run_chunk(p, k, c) for p in providers for k in metric_keys for c in chunks)
+        )
+        # Raw matrices from reducing providers stay envelope-only here too
+        results, raw_results = self._collect_results(
+            outcomes,
+            [(p, h, k) for p in providers for h in hosts for k in metric_keys],
+            ("provider", "host", "key"),
+        )
+        response = {
             "status": "success",
             "start_time": start_time,
             "end_time": end_time,
             "step": step_val,
             "results": results,
         }
+        if raw_results:
+            response[ENVELOPE_ONLY_KEY] = {"raw_results": raw_results}
+        return response
 
     async def get_host_logs(
         self,
@@ -349,27 +433,51 @@ class HostTelemetryToolProvider(ToolProvider):
 
         direction = direction or cfg.logs.direction
         limit = limit or cfg.logs.limit
+        hosts = unique_hosts(hosts or [])
+        semaphore = asyncio.Semaphore(cfg.max_concurrency)
+        outcomes: Dict[tuple, tuple] = {}
+
+        async def fetch(provider: LogsProviderProtocol, q: str, entries: int) -> Any:
+            async with semaphore:
+                return await provider.query_range(
+                    query=q, start=start, end=end, direction=direction, limit=entries
+                )
 
         async def run_query(provider: LogsProviderProtocol, host: str):
             q = self._build_loki_query(host, keywords)
             try:
-                res = await provider.query_range(
-                    query=q, start=start, end=end, direction=direction, limit=limit
-                )
-                return {
-                    "provider": provider.provider_name,
-                    "host": host,
-                    "query": q,
-                    "result": res,
-                }
+                outcomes[(provider, host)] = (q, await fetch(provider, q, limit))
+            except Exception as e:
+                outcomes[(provider, host)] = (q, e)
+
+        async def run_chunk(provider: LogsProviderProtocol, chunk: List[str]):
+            label = host_label(cfg.logs.stream_selector_template or "")
+            if label is None or len(chunk) == 1:
+                await asyncio.gather(*(run_query(provider, h) for h in chunk))
+                return
+            q = self._build_merged_loki_query(chunk, keywords)
+            try:
+                res = await fetch(provider, q, limit * len(chunk))
             except Exception as e:
-                return {
-                    "provider": provider.provider_name,
-                    "host": host,
-                    "query": q,
-                    "error": str(e),
-                }
-
-        tasks = [run_query(p, h) for p in providers for h in hosts]
-        results = await asyncio.gather(*tasks)
-        return {"status": "success", "start": start, "end": end, "results": results}
+                outcomes.update({(provider, h): (q, e) for h in chunk})
+                return
+            split = split_streams_by_host(res, label, chunk, limit, direction)
+            if split is None:
+                logger.debug("Merged host query not splittable by %s; querying per host", label)
+                await asyncio.gather(*(run_query(provider, h) for h in chunk))
+                return
+            per_host, crowded_out = split
+            outcomes.update({(provider, h): (q, per_host[h]) for h in chunk})
+            # Noisier hosts used up the merged limit; quieter ones may be missing entries
+            await asyncio.gather(*(run_query(provider, h) for h in crowded_out))
+
+        chunks = chunk_hosts(hosts, cfg.logs.max_entries_per_query // max(1, limit))
+        await asyncio.gather(*(run_chunk(p, c) for p in providers for c in chunks))
+        # Raw streams from reducing providers stay envelope-only here too
+        results, raw_results = self._collect_results(
+            outcomes, [(p, h) for p in providers for h in hosts], ("provider", "host")
+        )
+        response = {"status": "success", "start": start, "end": end, "results": results}
+        if raw_results:
+            response[ENVELOPE_ONLY_KEY] = {"raw_results": raw_results}
+        return response
@@ -0,0 +1,93 @@
+"""Shared HTTP connection pools for tool providers.
+
+Providers that talk to HTTP backends (Prometheus, Loki, ...) share one
+``httpx.AsyncClient`` per event loop and backend, so repeated tool calls reuse
+keep-alive connections instead of opening a new connection per request.
+httpx pools are bound to the loop that opened them, so, like the Redis pools in
+``core.redis``, clients are registered per loop and keyed by base URL, TLS
+verification and default headers/auth.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from typing import Dict, Hashable, Mapping, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT_SECONDS = 30.0
+DEFAULT_POOL_LIMITS = httpx.Limits(
+    max_connections=64,
+    max_keepalive_connections=16,
+    keepalive_expiry=60.0,
+)
+
+# Per-loop registry keyed by event loop; entries disappear with their loop.
+_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _client_key(
+    base_url: str,
+    verify: bool,
+    headers: Optional[Mapping[str, str]],
+    auth: Optional[Tuple[str, str]],
+) -> Tuple[Hashable, ...]:
+    return (
+        base_url.rstrip("/"),
+        verify,
+        tuple(sorted((headers or {}).items())),
+        auth,
+    )
+
+
+def get_http_client(
+    base_url: str,
+    *,
+    verify: bool = True,
+    headers: Optional[Mapping[str, str]] = None,
+    auth: Optional[Tuple[str, str]] = None,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+) -> httpx.AsyncClient:
+    """Return the running loop's pooled client for ``base_url``.
+
+    Callers must not close the returned client; use ``close_http_clients`` on
+    shutdown. ``timeout`` only applies when the client is first created, so
+    pass a per-request ``timeout=`` for calls that need a different one.
+
+    Raises:
+        RuntimeError: If called outside a running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    clients: Dict[Tuple[Hashable, ...], httpx.AsyncClient] = _clients.setdefault(loop, {})
+    key = _client_key(base_url, verify, headers, auth)
+    client = clients.get(key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=base_url.rstrip("/"),
+            verify=verify,
+            headers=dict(headers or {}),
+            auth=auth,
+            timeout=timeout,
+            limits=DEFAULT_POOL_LIMITS,
+        )
+        clients[key] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close pooled HTTP clients for the running loop.
+
+    Called alongside ``close_redis_connections`` on API, worker and MCP server
+    shutdown. Later calls on the same loop lazily build fresh clients.
+    """
+    loop = asyncio.get_running_loop()
+    clients = _clients.pop(loop, {})
+    for client in clients.values():
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning(f"Failed to close pooled HTTP client: {e}")
@@ -13,6 +13,10 @@ Configuration via environment (automatically loaded):
 - TOOLS_LOKI_URL (default: http://localhost:3100)
 - TOOLS_LOKI_TENANT_ID (optional; sent as X-Scope-OrgID)
 - TOOLS_LOKI_TIMEOUT (seconds, default: 30)
+
+Requests share a pooled HTTP client (see ``tools.http``). Log (``streams``)
+results of ``query`` and ``query_range`` are reduced to mined line templates by
+default; the raw streams are kept envelope-only.
 """
 
 from __future__ import annotations
@@ -22,17 +26,48 @@ import re
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
-import httpx
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from redis_sre_agent.tools.decorators import status_update
-from redis_sre_agent.tools.models import ToolCapability, ToolDefinition
+from redis_sre_agent.tools.http import get_http_client
+from redis_sre_agent.tools.logs.reduction import reduce_log_lines
+from redis_sre_agent.tools.models import ENVELOPE_ONLY_KEY, ToolCapability, ToolDefinition
 from redis_sre_agent.tools.protocols import ToolProvider
 
 logger = logging.getLogger(__name__)
 
 
+def reduce_streams_response(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace a ``streams`` result with mined templates; keep raw data envelope-only."""
+    payload = response.get("data")
+    data = payload.get("data") if isinstance(payload, dict) else None
+    if response.get("status") != "success" or not isinstance(data, dict):
+        return response
+    if data.get("resultType") != "streams":
+        return response
+
+    streams = data.get("result") or []
+
+    def _lines():
+        for stream in streams:
+            for entry in stream.get("values") or []:
+                ts = datetime.fromtimestamp(int(entry[0]) / 1e9, tz=timezone.utc)
+                yield ts.isoformat(), entry[1]
+
+    reduced = dict(response)
+    reduced["data"] = {
+        "resultType": "streams",
+        "streams": [
+            {"stream": stream.get("stream", {}), "lines": len(stream.get("values") or [])}
+            for stream in streams
+        ],
+        "log_templates": reduce_log_lines(_lines()),
+    }
+    reduced[ENVELOPE_ONLY_KEY] = {"data": payload}
+    return reduced
+
+
 class LokiConfig(BaseSettings):
     """Configuration for the Loki provider (loaded from env).
 
@@ -188,6 +223,15 @@ class LokiToolProvider(ToolProvider):
                             "enum": ["forward", "backward"],
                             "description": "Sort order for logs (default: backward)",
                         },
+                        "reduce": {
+                            "type": "boolean",
+                            "description": (
+                                "For log queries, return mined line templates (count, "
+                                "first/last seen, samples) instead of every line. Set to false "
+                                "only when the exact lines are needed."
+                            ),
+                            "default": True,
+                        },
                     },
                     "required": ["query"],
                 },
@@ -221,6 +265,15 @@ class LokiToolProvider(ToolProvider):
                             "enum": ["forward", "backward"],
                             "description": "Sort order for logs (default: backward)",
                         },
+                        "reduce": {
+                            "type": "boolean",
+                            "description": (
+                                "For log queries, return mined line templates (count, "
+                                "first/last seen, samples) instead of every line. Set to false "
+                                "only when the exact lines are needed."
+                            ),
+                            "default": True,
+                        },
                     },
                     "required": ["query", "start", "end"],
                 },
@@ -335,12 +388,11 @@ class LokiToolProvider(ToolProvider):
     async def _request(
         self, method: str, path: str, params: Dict[str, Any] | None = None, data: Any | None = None
     ) -> Dict[str, Any]:
-        url = self.config.url.rstrip("/") + path
         try:
-            async with httpx.AsyncClient(
-                timeout=self.config.timeout, headers=self._headers()
-            ) as client:
-                resp = await client.request(method, url, params=params, data=data)
+            client = get_http_client(self.config.url, headers=self._headers())
+            resp = await client.request(
+                method, path, params=params, data=data, timeout=self.config.timeout
+            )
             if resp.headers.get("content-type", "").startswith("application/json"):
                 payload = resp.json()
             else:
@@ -418,6 +470,7 @@ class LokiToolProvider(ToolProvider):
         time: Optional[str] = None,
         limit: Optional[int] = None,
         direction: Optional[str] = None,
+        reduce: bool = True,
     ) -> Dict[str, Any]:
         safe_query = self._fix_empty_stream_selector(query)
         params: Dict[str, Any] = {"query": safe_query}
@@ -427,7 +480,8 @@ class LokiToolProvider(ToolProvider):
             params["limit"] = int(limit)
         if direction:
             params["direction"] = direction
-        return await self._request("GET", "/loki/api/v1/query", params=params)
+        result = await self._request("GET", "/loki/api/v1/query", params=params)
+        return reduce_streams_response(result) if reduce else result
 
     @status_update("I'm querying Loki for logs over a time range.")
     async def query_range(
@@ -439,6 +493,7 @@ class LokiToolProvider(ToolProvider):
         limit: Optional[int] = None,
         interval: Optional[str] = None,
         direction: Optional[str] = None,
+        reduce: bool = True,
     ) -> Dict[str, Any]:
         start_ns = self._parse_time_to_epoch_ns(start)
         end_ns = self._parse_time_to_epoch_ns(end) or self._now_epoch_ns()
@@ -452,7 +507,8 @@ class LokiToolProvider(ToolProvider):
             params["interval"] = interval
         if direction:
             params["direction"] = direction
-        return await self._request("GET", "/loki/api/v1/query_range", params=params)
+        result = await self._request("GET", "/loki/api/v1/query_range", params=params)
+        return reduce_streams_response(result) if reduce else result
 
     @status_update("I'm querying Loki for available labels.")
     async def labels(
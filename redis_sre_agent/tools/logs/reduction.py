@@ -0,0 +1,197 @@
+"""Streaming log template mining shared by log tool providers.
+
+Log tools routinely return thousands of lines that differ only in ids,
+addresses, counters and timestamps. ``LogTemplateMiner`` clusters lines into
+templates in a single pass using a Drain-style fixed-depth prefix tree
+(He et al., "Drain: An Online Log Parsing Approach with Fixed Depth Tree"):
+lines are masked and tokenized, routed by token count and leading tokens to a
+small set of candidate clusters, and merged into the most similar one, whose
+template keeps ``<*>`` wherever its members differ. Each template records its
+count, first/last timestamps and a few sample lines, which is what the LLM
+needs instead of the raw lines.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+WILDCARD = "<*>"
+
+# Variable fragments masked before tokenization (UUIDs, IPv4[:port], hex).
+_MASK = re.compile(
+    r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b"
+    r"|\b\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?\b"
+    r"|\b0x[0-9a-fA-F]+\b"
+)
+# Any remaining whitespace-delimited token containing a digit is a parameter.
+_DIGIT_TOKEN = re.compile(r"(?<!\S)[^\s\d]*\d\S*")
+_LEADING_TIMESTAMP = re.compile(
+    r"^\[?(\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?)\]?"
+)
+
+
+def extract_timestamp(line: str) -> Tuple[Optional[str], str]:
+    """Split a leading ISO-like timestamp off ``line``, if present."""
+    match = _LEADING_TIMESTAMP.match(line)
+    if not match:
+        return None, line
+    return match.group(1), line[match.end() :].lstrip()
+
+
+def _tokenize(line: str) -> List[str]:
+    return _DIGIT_TOKEN.sub(WILDCARD, _MASK.sub(WILDCARD, line)).split()
+
+
+@dataclass
+class LogTemplate:
+    """One mined template and the lines it has absorbed."""
+
+    tokens: List[str]
+    count: int = 0
+    first_seen: Any = None
+    last_seen: Any = None
+    samples: List[str] = field(default_factory=list)
+
+    @property
+    def template(self) -> str:
+        return " ".join(self.tokens)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "template": self.template,
+            "count": self.count,
+            "first_seen": self.first_seen,
+            "last_seen": self.last_seen,
+            "samples": list(self.samples),
+        }
+
+
+class LogTemplateMiner:
+    """Incremental Drain-style log template miner.
+
+    Args:
+        depth: Tree depth; lines are routed by token count and the first
+            ``depth - 2`` tokens.
+        similarity_threshold: Minimum fraction of matching tokens for a line
+            to join an existing template.
+        max_children: Maximum distinct tokens per tree node before further
+            tokens share a ``<*>`` branch.
+        max_samples: Raw lines kept per template.
+        max_exact_lines: Distinct masked lines remembered for the exact-match
+            shortcut; the least recently seen are forgotten first.
+    """
+
+    def __init__(
+        self,
+        depth: int = 4,
+        similarity_threshold: float = 0.5,
+        max_children: int = 100,
+        max_samples: int = 3,
+        max_exact_lines: int = 10_000,
+    ):
+        self.depth = max(depth, 3)
+        self.similarity_threshold = similarity_threshold
+        self.max_children = max_children
+        self.max_samples = max_samples
+        self.max_exact_lines = max_exact_lines
+        self.total_lines = 0
+        self._root: Dict[int, Dict[str, Any]] = {}
+        self._templates: List[LogTemplate] = []
+        # Exact masked-line LRU: repeated lines skip the tree walk entirely.
+        self._exact: "OrderedDict[Tuple[str, ...], LogTemplate]" = OrderedDict()
+
+    def _leaf(self, tokens: List[str]) -> List[LogTemplate]:
+        node = self._root.setdefault(len(tokens), {})
+        for token in tokens[: self.depth - 2]:
+            if token not in node and len(node) >= self.max_children:
+                token = WILDCARD
+            node = node.setdefault(token, {})
+        return node.setdefault("", [])
+
+    def _similarity(self, template: List[str], tokens: List[str]) -> Tuple[float, int]:
+        """Fraction of exactly matching constant tokens, and the template's wildcard count.
+
+        Wildcards do not count as matches, so a template that has already
+        absorbed many parameters cannot swallow unrelated lines of equal length.
+        """
+        same = params = 0
+        for a, b in zip(template, tokens):
+            if a == WILDCARD:
+                params += 1
+            elif a == b:
+                same += 1
+        return (same / len(tokens) if tokens else 1.0), params
+
+    def add(self, line: str, timestamp: Any = None, sample: Optional[str] = None) -> LogTemplate:
+        """Add one log line and return the template it joined.
+
+        ``sample`` is kept in place of ``line`` if the line becomes a sample,
+        e.g. to label it with its source.
+        """
+        self.total_lines += 1
+        tokens = _tokenize(line)
+        key = tuple(tokens)
+        cluster = self._exact.get(key)
+        if cluster is not None:
+            self._exact.move_to_end(key)
+        else:
+            leaf = self._leaf(tokens)
+            best: Optional[LogTemplate] = None
+            best_score: Tuple[float, int] = (-1.0, -1)
+            for candidate in leaf:
+                score = self._similarity(candidate.tokens, tokens)
+                if score > best_score:
+                    best, best_score = candidate, score
+            if best is not None and best_score[0] >= self.similarity_threshold:
+                cluster = best
+                cluster.tokens = [a if a == b else WILDCARD for a, b in zip(cluster.tokens, tokens)]
+            else:
+                cluster = LogTemplate(tokens=list(tokens))
+                leaf.append(cluster)
+                self._templates.append(cluster)
+            self._exact[key] = cluster
+            if len(self._exact) > self.max_exact_lines:
+                self._exact.popitem(last=False)
+
+        cluster.count += 1
+        if timestamp is not None:
+            # Track min/max so backward-ordered sources report the same window.
+            if cluster.first_seen is None or timestamp < cluster.first_seen:
+                cluster.first_seen = timestamp
+            if cluster.last_seen is None or timestamp > cluster.last_seen:
+                cluster.last_seen = timestamp
+        if len(cluster.samples) < self.max_samples:
+            cluster.samples.append(line if sample is None else sample)
+        return cluster
+
+    def templates(self) -> List[LogTemplate]:
+        """Mined templates, most frequent first."""
+        return sorted(self._templates, key=lambda t: t.count, reverse=True)
+
+    def summary(self, max_templates: int = 50) -> Dict[str, Any]:
+        """Compact, JSON-ready view of the mined templates."""
+        ranked = self.templates()
+        shown = ranked[:max_templates]
+        return {
+            "total_lines": self.total_lines,
+            "template_count": len(ranked),
+            "compression_ratio": round(self.total_lines / max(len(ranked), 1), 1),
+            "templates": [t.to_dict() for t in shown],
+            "omitted_template_lines": sum(t.count for t in ranked[max_templates:]),
+        }
+
+
+def reduce_log_lines(
+    lines: Iterable[Tuple[Any, str]],
+    *,
+    max_templates: int = 50,
+    max_samples: int = 3,
+) -> Dict[str, Any]:
+    """Mine templates from ``(timestamp, line)`` pairs in one pass."""
+    miner = LogTemplateMiner(max_samples=max_samples)
+    for timestamp, line in lines:
+        miner.add(line, timestamp)
+    return miner.summary(max_templates=max_templates)
@@ -7,12 +7,14 @@ This module provides the ToolManager class which handles:
 4. Routing LLM tool calls to the correct provider
 """
 
+import asyncio
 import logging
 import shutil
+import weakref
 from contextlib import AsyncExitStack
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from langgraph.errors import GraphInterrupt
 from opentelemetry import trace
@@ -67,6 +69,21 @@ _SENSITIVE_ARG_KEYS = {
 }
 _DEFAULT_LLM_TOOL_LIMIT = 128
 
+# READ tool-call semaphores per event loop, shared by every ToolManager so
+# concurrent agent turns are bounded together. Keyed by (provider, limit);
+# provider None is the global pool.
+_call_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[Optional[str], int], asyncio.Semaphore]]" = weakref.WeakKeyDictionary()
+
+
+def _call_semaphore(provider_key: Optional[str], limit: int) -> asyncio.Semaphore:
+    """Return the running loop's semaphore for ``provider_key`` (None: global)."""
+    semaphores = _call_semaphores.setdefault(asyncio.get_running_loop(), {})
+    key = (provider_key, limit)
+    semaphore = semaphores.get(key)
+    if semaphore is None:
+        semaphore = semaphores[key] = asyncio.Semaphore(limit)
+    return semaphore
+
 
 def interrupt(payload: Any) -> Any:
     """Call LangGraph interrupt through a patchable module seam."""
@@ -1439,14 +1456,14 @@ class ToolManager:
             if cacheable and cache_key in self._call_cache:
                 return self._call_cache[cache_key]
 
-            if cacheable and self._shared_cache:
-                cached_result = await self._shared_cache.get(tool_name, normalized_args)
-                if cached_result is not None:
-                    self._call_cache[cache_key] = cached_result
-                    return cached_result
-
             try:
-                result = await tool.invoke(normalized_args)
+                if cacheable and self._shared_cache:
+                    # Coalesces concurrent identical calls across runs onto one invocation
+                    result = await self._shared_cache.get_or_compute(
+                        tool_name, normalized_args, lambda: tool.invoke(normalized_args)
+                    )
+                else:
+                    result = await tool.invoke(normalized_args)
             except Exception as exc:
                 if approval_manager is not None and ledger is not None:
                     await approval_manager.save_execution_ledger(
@@ -1462,9 +1479,6 @@ class ToolManager:
         if cacheable:
             self._call_cache[cache_key] = result
 
-        if cacheable and self._shared_cache:
-            await self._shared_cache.set(tool_name, normalized_args, result)
-
         if approval_manager is not None and ledger is not None:
             await approval_manager.save_execution_ledger(
                 ledger.model_copy(
@@ -1478,48 +1492,158 @@ class ToolManager:
 
         return result
 
-    async def execute_tool_calls(self, tool_calls: List[Dict[str, Any]]) -> List[Any]:
-        """Execute a batch of tool calls returned by an LLM."""
-        results: List[Any] = []
-        for tc in tool_calls or []:
-            try:
-                name = tc.get("name")
-                if not name and isinstance(tc.get("function"), dict):
-                    name = tc["function"].get("name")
-
-                args = tc.get("args")
-                if args is None and isinstance(tc.get("function"), dict):
-                    arguments = tc["function"].get("arguments")
-                    if isinstance(arguments, str):
-                        try:
-                            import json
-
-                            args = json.loads(arguments or "{}")
-                        except Exception:
-                            args = {}
-                    elif isinstance(arguments, dict):
-                        args = arguments
-
-                if not isinstance(args, dict):
+    @staticmethod
+    def _parse_tool_call(tc: Dict[str, Any]) -> tuple[Optional[str], Dict[str, Any]]:
+        """Extract the tool name and argument dict from an LLM tool call."""
+        name = tc.get("name")
+        if not name and isinstance(tc.get("function"), dict):
+            name = tc["function"].get("name")
+
+        args = tc.get("args")
+        if args is None and isinstance(tc.get("function"), dict):
+            arguments = tc["function"].get("arguments")
+            if isinstance(arguments, str):
+                try:
+                    import json
+
+                    args = json.loads(arguments or "{}")
+                except Exception:
                     args = {}
+            elif isinstance(arguments, dict):
+                args = arguments
 
-                if not name:
-                    logger.warning(f"Tool call missing name: {tc}")
-                    results.append({"status": "failed", "error": "missing tool name"})
-                    continue
+        if not isinstance(args, dict):
+            args = {}
+        return name, args
+
+    def _runs_concurrently(self, tool_name: str) -> bool:
+        """Return True if a call can run alongside its neighbours.
+
+        Only known READ tools qualify; WRITE and unclassified tools go through
+        the approval gate one at a time, in call order.
+        """
+        tool = self._tool_by_name.get(tool_name)
+        if tool is None or tool.metadata is None or tool_name not in self._routing_table:
+            return False
+        return tool.metadata.action_kind is ToolActionKind.READ
+
+    async def _execute_tool_call(
+        self, tc: Dict[str, Any], name: str, args: Dict[str, Any]
+    ) -> tuple[Any, bool]:
+        """Execute one call, returning ``(result, stop)``.
 
-                decision = await self.evaluate_tool_call(name, args)
-                result = await self.resolve_tool_call(name, args, decision=decision)
-                results.append(result)
-                if (
-                    isinstance(result, dict)
-                    and result.get("status") == "approval_required"
-                    and decision.mode is ToolExecutionMode.REQUIRE_APPROVAL
-                ):
-                    break
-            except (ApprovalRequiredError, GraphInterrupt):
+        ``stop`` is True when the call paused for approval and the rest of the
+        batch must not run.
+        """
+        try:
+            decision = await self.evaluate_tool_call(name, args)
+            result = await self.resolve_tool_call(name, args, decision=decision)
+        except (ApprovalRequiredError, GraphInterrupt):
+            raise
+        except Exception as e:
+            logger.exception(f"Tool call execution failed for {tc}")
+            return {"status": "failed", "error": str(e)}, False
+        stop = (
+            isinstance(result, dict)
+            and result.get("status") == "approval_required"
+            and decision.mode is ToolExecutionMode.REQUIRE_APPROVAL
+        )
+        return result, stop
+
+    async def _execute_read_calls(
+        self, calls: List[tuple[Dict[str, Any], str, Dict[str, Any]]]
+    ) -> tuple[List[Any], Optional[int]]:
+        """Execute READ tool calls concurrently, returning results in call order.
+
+        Concurrency is bounded per event loop, across every agent turn, by
+        ``tool_call_concurrency`` overall and ``tool_call_provider_concurrency``
+        per provider. Also returns the position of the first call that paused
+        for approval, if any; results after it are dropped and calls after it
+        that have not started yet are skipped, as if the batch had run one
+        call at a time.
+        """
+        global_limit = _call_semaphore(None, settings.tool_call_concurrency)
+        stop_at: Optional[int] = None
+
+        async def _run(pos: int, tc: Dict[str, Any], name: str, args: Dict[str, Any]) -> Any:
+            nonlocal stop_at
+            provider = self._routing_table[name]
+            provider_key = getattr(provider, "provider_name", None) or name
+            provider_limit = _call_semaphore(provider_key, settings.tool_call_provider_concurrency)
+            # Take the provider slot first so a saturated provider does not
+            # hold global slots other providers could use.
+            async with provider_limit, global_limit:
+                if stop_at is not None and stop_at < pos:
+                    return None
+                result, stop = await self._execute_tool_call(tc, name, args)
+            if stop and (stop_at is None or pos < stop_at):
+                stop_at = pos
+            return result
+
+        if len(calls) == 1:
+            results = [await _run(0, *calls[0])]
+        else:
+            tasks = [asyncio.ensure_future(_run(pos, *call)) for pos, call in enumerate(calls)]
+            try:
+                results = list(await asyncio.gather(*tasks))
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
                 raise
+        if stop_at is not None:
+            del results[stop_at + 1 :]
+        return results, stop_at
+
+    async def execute_tool_calls(self, tool_calls: List[Dict[str, Any]]) -> List[Any]:
+        """Execute a batch of tool calls returned by an LLM.
+
+        Consecutive READ calls run concurrently. WRITE and unclassified calls
+        run one at a time after every earlier call has finished. A call of
+        either kind that pauses for approval stops the rest of the batch.
+        Results are returned in call order.
+        """
+        results: List[Any] = []
+        pending_reads: List[tuple[int, Dict[str, Any], str, Dict[str, Any]]] = []
+
+        async def _flush_reads() -> bool:
+            """Run the pending READ calls; True if one paused for approval."""
+            if not pending_reads:
+                return False
+            read_results, stop_at = await self._execute_read_calls(
+                [(tc, name, args) for _, tc, name, args in pending_reads]
+            )
+            for (idx, *_), result in zip(pending_reads, read_results):
+                results[idx] = result
+            if stop_at is not None:
+                del results[pending_reads[stop_at][0] + 1 :]
+            pending_reads.clear()
+            return stop_at is not None
+
+        for tc in tool_calls or []:
+            idx = len(results)
+            results.append(None)
+            try:
+                name, args = self._parse_tool_call(tc)
             except Exception as e:
                 logger.exception(f"Tool call execution failed for {tc}")
-                results.append({"status": "failed", "error": str(e)})
+                results[idx] = {"status": "failed", "error": str(e)}
+                continue
+
+            if not name:
+                logger.warning(f"Tool call missing name: {tc}")
+                results[idx] = {"status": "failed", "error": "missing tool name"}
+                continue
+
+            if self._runs_concurrently(name):
+                pending_reads.append((idx, tc, name, args))
+                continue
+
+            if await _flush_reads():
+                return results
+            results[idx], stop = await self._execute_tool_call(tc, name, args)
+            if stop:
+                return results
+
+        await _flush_reads()
         return results
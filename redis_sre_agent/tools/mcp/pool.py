@@ -3,21 +3,34 @@
 This module provides a singleton connection pool that keeps MCP server
 connections warm between queries, avoiding the 2-3s connection overhead
 on each request.
+
+Each configured server gets ``mcp_pool_sessions_per_server`` sessions. Tool
+calls go through :meth:`MCPConnectionPool.call_tool`, which picks the
+least-busy healthy session and caps concurrent calls per session. A
+background health check pings sessions and reconnects servers that have
+fewer healthy sessions than configured.
+
+Every session is owned by a dedicated task that opens its transport, waits
+until the session is closed and then exits the transport contexts itself.
+anyio-based transports must be closed from the task that opened them, so
+sessions can be opened and closed from any caller (startup, health check,
+shutdown) without cross-task cleanup errors.
 """
 
 import asyncio
 import logging
 import os
 import time
-from contextlib import AsyncExitStack
+from contextlib import AsyncExitStack, asynccontextmanager
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from mcp import ClientSession, StdioServerParameters
 from mcp import types as mcp_types
 from mcp.client.sse import sse_client
 from mcp.client.stdio import stdio_client
 from mcp.client.streamable_http import streamablehttp_client
+from mcp.shared.exceptions import McpError
 
 from redis_sre_agent.core.runtime_overrides import get_active_mcp_servers
 
@@ -26,42 +39,132 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+CONNECT_TIMEOUT_SECONDS = 30.0
+CLOSE_TIMEOUT_SECONDS = 5.0
+PING_TIMEOUT_SECONDS = 5.0
+
+# list_tools results keyed by (configured server name, reported server name, version).
+_tools_cache: Dict[Tuple[str, str, str], List[mcp_types.Tool]] = {}
+
+
+class MCPPoolUnavailableError(RuntimeError):
+    """Raised when a server has no healthy pooled session."""
+
+
+def _server_identity(init_result: Any) -> Optional[Tuple[str, str]]:
+    """(name, version) reported by the server's initialize result, if any."""
+    info = getattr(init_result, "serverInfo", None)
+    name = getattr(info, "name", None)
+    version = getattr(info, "version", None)
+    if not isinstance(version, str) or not version:
+        return None
+    return (name if isinstance(name, str) else "", version)
+
+
+async def list_tools_cached(
+    server_name: str, session: ClientSession, init_result: Any
+) -> List[mcp_types.Tool]:
+    """List a server's tools, reusing an earlier result for the same server version.
+
+    Servers that do not report a version are always asked.
+    """
+    identity = _server_identity(init_result)
+    key = (server_name, *identity) if identity else None
+    if key is not None and key in _tools_cache:
+        return _tools_cache[key]
+    tools = (await session.list_tools()).tools
+    if key is not None:
+        _tools_cache[key] = tools
+    return tools
+
+
+def clear_tools_cache(server_name: Optional[str] = None) -> None:
+    """Drop cached list_tools results for one server, or all servers."""
+    for key in list(_tools_cache):
+        if server_name is None or key[0] == server_name:
+            del _tools_cache[key]
+
+
+async def _open_transport(
+    exit_stack: AsyncExitStack, server_name: str, config: "MCPServerConfig"
+) -> Tuple[Any, Any]:
+    """Enter the configured transport on ``exit_stack`` and return its streams."""
+    if config.command:
+        # Expand environment variable references like ${REDIS_URL} in env values
+        expanded_env = {
+            k: os.path.expandvars(v) if isinstance(v, str) else v
+            for k, v in (config.env or {}).items()
+        }
+        merged_env = {**os.environ, **expanded_env}
+        server_params = StdioServerParameters(
+            command=config.command,
+            args=config.args or [],
+            env=merged_env,
+        )
+        return await exit_stack.enter_async_context(stdio_client(server_params))
+
+    if config.url:
+        expanded_url = os.path.expandvars(config.url)
+        headers = None
+        if config.headers:
+            headers = {k: os.path.expandvars(v) for k, v in config.headers.items()}
+
+        transport_type = (config.transport or "streamable_http").lower()
+        if transport_type == "sse":
+            return await exit_stack.enter_async_context(sse_client(expanded_url, headers=headers))
+        (read_stream, write_stream, _) = await exit_stack.enter_async_context(
+            streamablehttp_client(expanded_url, headers=headers)
+        )
+        return read_stream, write_stream
+
+    raise ValueError(f"MCP server '{server_name}' needs 'command' or 'url'")
+
 
 @dataclass
 class PooledConnection:
-    """A pooled MCP connection with its session and metadata."""
+    """A pooled MCP session with its tools and dispatch metadata."""
 
     server_name: str
     session: ClientSession
     tools: List[mcp_types.Tool]
-    exit_stack: AsyncExitStack
+    exit_stack: Optional[AsyncExitStack] = None
     connected_at: float = field(default_factory=time.time)
     last_used: float = field(default_factory=time.time)
     call_count: int = 0
+    server_version: Optional[str] = None
+    in_flight: int = 0
+    healthy: bool = True
+    # Set by the owning task; closing is signalled rather than done in-place.
+    _close_event: Optional[asyncio.Event] = field(default=None, repr=False)
+    _task: Optional["asyncio.Task[None]"] = field(default=None, repr=False)
 
 
 class MCPConnectionPool:
     """Singleton pool managing persistent MCP server connections.
 
     Usage:
-        # During app startup (lifespan):
+        # During app/worker startup:
         pool = MCPConnectionPool.get_instance()
         await pool.start()
 
         # During query handling:
-        conn = pool.get_connection("github")
-        if conn:
-            result = await conn.session.call_tool("search_repos", {...})
+        if pool.is_connected("github"):
+            result = await pool.call_tool("github", "search_repos", {...})
 
-        # During app shutdown:
+        # During shutdown:
         await pool.shutdown()
     """
 
     _instance: Optional["MCPConnectionPool"] = None
 
     def __init__(self):
-        self._connections: Dict[str, PooledConnection] = {}
+        self._connections: Dict[str, List[PooledConnection]] = {}
         self._configs: Dict[str, "MCPServerConfig"] = {}
+        self._conditions: Dict[str, asyncio.Condition] = {}
+        self._refill_locks: Dict[str, asyncio.Lock] = {}
+        self._health_task: Optional["asyncio.Task[None]"] = None
+        self._sessions_per_server = 1
+        self._max_in_flight = 8
         self._started = False
 
     @classmethod
@@ -77,12 +180,15 @@ class MCPConnectionPool:
         cls._instance = None
 
     async def start(self) -> Dict[str, bool]:
-        """Start the pool and connect to all configured MCP servers."""
+        """Start the pool and connect to all configured MCP servers concurrently."""
         from redis_sre_agent.core.config import MCPServerConfig, settings
 
         if self._started:
             logger.warning("MCPConnectionPool already started")
-            return {name: True for name in self._connections}
+            return {name: self.is_connected(name) for name in self._configs}
+
+        self._sessions_per_server = settings.mcp_pool_sessions_per_server
+        self._max_in_flight = settings.mcp_pool_max_in_flight_per_session
 
         mcp_servers = get_active_mcp_servers(settings.mcp_servers)
         if not mcp_servers:
@@ -90,140 +196,315 @@ class MCPConnectionPool:
             self._started = True
             return {}
 
-        results: Dict[str, bool] = {}
         for server_name, server_config in mcp_servers.items():
             if isinstance(server_config, dict):
                 server_config = MCPServerConfig.model_validate(server_config)
             self._configs[server_name] = server_config
 
-            try:
-                await self._connect_server(server_name, server_config)
+        outcomes = await asyncio.gather(
+            *(self._connect_server(name, config) for name, config in self._configs.items()),
+            return_exceptions=True,
+        )
+
+        results: Dict[str, bool] = {}
+        for server_name, outcome in zip(self._configs, outcomes):
+            if isinstance(outcome, BaseException):
+                results[server_name] = False
+                logger.error(f"MCP pool: failed to connect to '{server_name}': {outcome}")
+            else:
                 results[server_name] = True
                 logger.info(f"MCP pool: connected to '{server_name}'")
-            except Exception as e:
-                results[server_name] = False
-                logger.error(f"MCP pool: failed to connect to '{server_name}': {e}")
 
         self._started = True
+        interval = settings.mcp_pool_health_check_interval
+        if interval > 0:
+            self._health_task = asyncio.create_task(
+                self._health_loop(interval), name="mcp-pool-health"
+            )
+
         connected = sum(1 for v in results.values() if v)
         logger.info(f"MCP connection pool started: {connected}/{len(results)} servers")
         return results
 
     async def _connect_server(
-        self, server_name: str, config: "MCPServerConfig"
-    ) -> PooledConnection:
-        """Connect to a single MCP server."""
-        exit_stack = AsyncExitStack()
-        await exit_stack.__aenter__()
+        self, server_name: str, config: "MCPServerConfig", count: Optional[int] = None
+    ) -> List[PooledConnection]:
+        """Open ``count`` sessions (default: the configured per-server count) concurrently.
 
-        try:
-            if config.command:
-                # Expand environment variable references like ${REDIS_URL} in env values
-                expanded_env = {
-                    k: os.path.expandvars(v) if isinstance(v, str) else v
-                    for k, v in (config.env or {}).items()
-                }
-                merged_env = {**os.environ, **expanded_env}
-                server_params = StdioServerParameters(
-                    command=config.command,
-                    args=config.args or [],
-                    env=merged_env,
-                )
-                read_stream, write_stream = await exit_stack.enter_async_context(
-                    stdio_client(server_params)
-                )
-            elif config.url:
-                expanded_url = os.path.expandvars(config.url)
-                headers = None
-                if config.headers:
-                    headers = {k: os.path.expandvars(v) for k, v in config.headers.items()}
-
-                transport_type = (config.transport or "streamable_http").lower()
-                if transport_type == "sse":
-                    read_stream, write_stream = await exit_stack.enter_async_context(
-                        sse_client(expanded_url, headers=headers)
-                    )
-                else:
-                    (read_stream, write_stream, _) = await exit_stack.enter_async_context(
-                        streamablehttp_client(expanded_url, headers=headers)
-                    )
-            else:
-                raise ValueError(f"MCP server '{server_name}' needs 'command' or 'url'")
+        Succeeds if at least one session connects; raises the first error otherwise.
+        """
+        count = self._sessions_per_server if count is None else count
+        outcomes = await asyncio.gather(
+            *(self._open_session(server_name, config) for _ in range(count)),
+            return_exceptions=True,
+        )
+        opened = [o for o in outcomes if isinstance(o, PooledConnection)]
+        errors = [o for o in outcomes if not isinstance(o, PooledConnection)]
+        if not opened and errors:
+            raise errors[0]
+        if errors:
+            logger.warning(
+                f"MCP pool: {len(errors)}/{count} sessions to '{server_name}' failed: {errors[0]}"
+            )
+        self._connections.setdefault(server_name, []).extend(opened)
+        await self._notify(server_name)
+        return opened
 
-            session = await exit_stack.enter_async_context(ClientSession(read_stream, write_stream))
-            await session.initialize()
-            tools_result = await session.list_tools()
+    async def _open_session(self, server_name: str, config: "MCPServerConfig") -> PooledConnection:
+        """Open one session in its own owner task and wait until it is ready."""
+        ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        closing = asyncio.Event()
 
-            conn = PooledConnection(
-                server_name=server_name,
-                session=session,
-                tools=tools_result.tools,
-                exit_stack=exit_stack,
-            )
-            self._connections[server_name] = conn
-            return conn
-        except Exception:
-            await exit_stack.aclose()
+        async def _own_session() -> None:
+            conn: Optional[PooledConnection] = None
+            try:
+                async with AsyncExitStack() as exit_stack:
+                    read_stream, write_stream = await _open_transport(
+                        exit_stack, server_name, config
+                    )
+                    session = await exit_stack.enter_async_context(
+                        ClientSession(read_stream, write_stream)
+                    )
+                    init_result = await session.initialize()
+                    tools = await list_tools_cached(server_name, session, init_result)
+                    identity = _server_identity(init_result)
+                    conn = PooledConnection(
+                        server_name=server_name,
+                        session=session,
+                        tools=tools,
+                        exit_stack=exit_stack,
+                        server_version=identity[1] if identity else None,
+                        _close_event=closing,
+                    )
+                    if ready.done():
+                        # The opener timed out or was cancelled
+                        return
+                    ready.set_result(conn)
+                    await closing.wait()
+            except BaseException as e:
+                if not ready.done():
+                    if isinstance(e, asyncio.CancelledError):
+                        ready.cancel()
+                    else:
+                        ready.set_exception(e)
+                elif not closing.is_set():
+                    logger.warning(f"MCP pool: session to '{server_name}' ended: {e}")
+                if not isinstance(e, Exception):
+                    raise
+            finally:
+                if conn is not None:
+                    conn.healthy = False
+
+        task = asyncio.create_task(_own_session(), name=f"mcp-pool-{server_name}")
+        try:
+            conn = await asyncio.wait_for(ready, timeout=CONNECT_TIMEOUT_SECONDS)
+        except BaseException:
+            task.cancel()
             raise
+        conn._task = task
+        return conn
+
+    def _condition(self, server_name: str) -> asyncio.Condition:
+        condition = self._conditions.get(server_name)
+        if condition is None:
+            condition = self._conditions[server_name] = asyncio.Condition()
+        return condition
+
+    def _refill_lock(self, server_name: str) -> asyncio.Lock:
+        """Serializes reconnects and top-ups so a server never exceeds its session count."""
+        lock = self._refill_locks.get(server_name)
+        if lock is None:
+            lock = self._refill_locks[server_name] = asyncio.Lock()
+        return lock
+
+    async def _notify(self, server_name: str) -> None:
+        """Wake callers waiting for a session of ``server_name``."""
+        condition = self._condition(server_name)
+        async with condition:
+            condition.notify_all()
+
+    def _healthy(self, server_name: str) -> List[PooledConnection]:
+        return [c for c in self._connections.get(server_name, []) if c.healthy]
+
+    def _least_busy(
+        self, server_name: str, below_limit: bool = False
+    ) -> Optional[PooledConnection]:
+        candidates = self._healthy(server_name)
+        if below_limit:
+            candidates = [c for c in candidates if c.in_flight < self._max_in_flight]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda c: (c.in_flight, c.last_used))
+
+    @asynccontextmanager
+    async def acquire(
+        self, server_name: str, timeout: Optional[float] = None
+    ) -> AsyncIterator[PooledConnection]:
+        """Reserve a slot on the least-busy healthy session of ``server_name``.
+
+        Waits while every healthy session is at its in-flight limit.
+
+        Raises:
+            MCPPoolUnavailableError: If the server has no healthy session.
+            asyncio.TimeoutError: If no slot frees up within ``timeout`` seconds.
+        """
+        condition = self._condition(server_name)
+        async with condition:
+            async with asyncio.timeout(timeout):
+                await condition.wait_for(
+                    lambda: (
+                        not self._healthy(server_name)
+                        or self._least_busy(server_name, below_limit=True) is not None
+                    )
+                )
+            conn = self._least_busy(server_name, below_limit=True)
+            if conn is None:
+                raise MCPPoolUnavailableError(
+                    f"MCP server '{server_name}' has no healthy pooled session"
+                )
+            conn.in_flight += 1
+            conn.call_count += 1
+            conn.last_used = time.time()
+        try:
+            yield conn
+        finally:
+            async with condition:
+                conn.in_flight -= 1
+                condition.notify()
+
+    async def call_tool(
+        self, server_name: str, tool_name: str, arguments: Dict[str, Any]
+    ) -> mcp_types.CallToolResult:
+        """Call a tool on the least-busy healthy session of ``server_name``.
+
+        Protocol errors from the server are raised as-is. Any other failure
+        means the session's transport is broken, so the session is retired and
+        the health check reconnects it; the call itself is not retried because
+        the tool may already have run.
+        """
+        async with self.acquire(server_name) as conn:
+            try:
+                return await conn.session.call_tool(tool_name, arguments=arguments)
+            except McpError:
+                raise
+            except Exception:
+                await self._retire(conn)
+                raise
 
     def get_connection(self, server_name: str) -> Optional[PooledConnection]:
-        """Get a pooled connection by server name."""
-        conn = self._connections.get(server_name)
+        """Get the least-busy healthy session of a server, without reserving it."""
+        conn = self._least_busy(server_name)
         if conn:
             conn.last_used = time.time()
-            conn.call_count += 1
         return conn
 
-    def get_all_connections(self) -> Dict[str, PooledConnection]:
-        """Get all active connections."""
-        return dict(self._connections)
+    def get_all_connections(self) -> Dict[str, List[PooledConnection]]:
+        """Get all pooled sessions, by server name."""
+        return {name: list(conns) for name, conns in self._connections.items()}
 
     def is_connected(self, server_name: str) -> bool:
-        """Check if a server is connected."""
-        return server_name in self._connections
+        """Check if a server has at least one healthy session."""
+        return bool(self._healthy(server_name))
 
     async def reconnect(self, server_name: str) -> bool:
-        """Reconnect to a specific server."""
+        """Replace all sessions of a specific server."""
         if server_name not in self._configs:
             logger.error(f"Cannot reconnect: '{server_name}' not in config")
             return False
 
-        if server_name in self._connections:
+        async with self._refill_lock(server_name):
             await self._disconnect_server(server_name)
+            clear_tools_cache(server_name)
 
-        try:
-            await self._connect_server(server_name, self._configs[server_name])
-            logger.info(f"MCP pool: reconnected to '{server_name}'")
-            return True
-        except Exception as e:
-            logger.error(f"MCP pool: reconnect to '{server_name}' failed: {e}")
-            return False
+            try:
+                await self._connect_server(server_name, self._configs[server_name])
+                logger.info(f"MCP pool: reconnected to '{server_name}'")
+                return True
+            except Exception as e:
+                logger.error(f"MCP pool: reconnect to '{server_name}' failed: {e}")
+                return False
 
-    async def _disconnect_server(self, server_name: str) -> None:
-        """Disconnect from a single server."""
-        conn = self._connections.pop(server_name, None)
-        if conn:
+    async def check_health(self) -> Dict[str, int]:
+        """Ping every session, retire failed ones and top up servers below target.
+
+        Returns:
+            Healthy session count per configured server after the check.
+        """
+        sessions = [c for conns in self._connections.values() for c in conns]
+        await asyncio.gather(*(self._ping(conn) for conn in sessions))
+
+        async def _refill(server_name: str) -> None:
+            async with self._refill_lock(server_name):
+                missing = self._sessions_per_server - len(self._healthy(server_name))
+                if missing <= 0:
+                    return
+                try:
+                    opened = await self._connect_server(
+                        server_name, self._configs[server_name], count=missing
+                    )
+                    logger.info(f"MCP pool: reopened {len(opened)} session(s) to '{server_name}'")
+                except Exception as e:
+                    logger.warning(f"MCP pool: reconnect to '{server_name}' failed: {e}")
+
+        await asyncio.gather(*(_refill(name) for name in list(self._configs)))
+        return {name: len(self._healthy(name)) for name in self._configs}
+
+    async def _health_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
             try:
-                # Use wait_for with timeout to prevent hanging on cleanup
-                await asyncio.wait_for(conn.exit_stack.aclose(), timeout=5.0)
-            except asyncio.TimeoutError:
-                logger.warning(f"Timeout closing '{server_name}'")
-            except asyncio.CancelledError:
-                logger.debug(f"Cleanup cancelled for '{server_name}' (expected during shutdown)")
-            except RuntimeError as e:
-                # This can happen when shutdown is called from a different task than startup
-                # (common in CLI mode where the process is exiting anyway)
-                if "different task" in str(e):
-                    logger.debug(f"Cross-task cleanup for '{server_name}' (expected in CLI mode)")
-                else:
-                    logger.warning(f"Runtime error closing '{server_name}': {e}")
-            except BaseExceptionGroup:
-                # anyio wraps exceptions in ExceptionGroups during cleanup
-                logger.debug(
-                    f"Cleanup exception group for '{server_name}' (expected during shutdown)"
-                )
+                await self.check_health()
+            except Exception as e:
+                logger.warning(f"MCP pool health check failed: {e}")
+
+    async def _ping(self, conn: PooledConnection) -> None:
+        if conn.healthy:
+            try:
+                await asyncio.wait_for(conn.session.send_ping(), timeout=PING_TIMEOUT_SECONDS)
             except Exception as e:
-                logger.warning(f"Error closing '{server_name}': {e}")
+                logger.warning(f"MCP pool: ping to '{conn.server_name}' failed: {e}")
+                conn.healthy = False
+        if not conn.healthy:
+            await self._retire(conn)
+
+    async def _retire(self, conn: PooledConnection) -> None:
+        """Remove a session from dispatch and close it."""
+        conn.healthy = False
+        remaining = [c for c in self._connections.get(conn.server_name, []) if c is not conn]
+        if remaining:
+            self._connections[conn.server_name] = remaining
+        else:
+            self._connections.pop(conn.server_name, None)
+        await self._notify(conn.server_name)
+        await self._close_connection(conn)
+
+    async def _disconnect_server(self, server_name: str) -> None:
+        """Disconnect all sessions of a single server."""
+        conns = self._connections.pop(server_name, [])
+        for conn in conns:
+            conn.healthy = False
+        await self._notify(server_name)
+        await asyncio.gather(*(self._close_connection(conn) for conn in conns))
+
+    async def _close_connection(self, conn: PooledConnection) -> None:
+        """Close one session, via its owner task when it has one."""
+        server_name = conn.server_name
+        try:
+            if conn._task is not None and conn._close_event is not None:
+                conn._close_event.set()
+                # wait_for cancels the owner task if it does not exit in time
+                await asyncio.wait_for(conn._task, timeout=CLOSE_TIMEOUT_SECONDS)
+            elif conn.exit_stack is not None:
+                await asyncio.wait_for(conn.exit_stack.aclose(), timeout=CLOSE_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.warning(f"Timeout closing '{server_name}'")
+        except asyncio.CancelledError:
+            logger.debug(f"Cleanup cancelled for '{server_name}' (expected during shutdown)")
+        except BaseExceptionGroup:
+            # anyio wraps exceptions in ExceptionGroups during cleanup
+            logger.debug(f"Cleanup exception group for '{server_name}' (expected during shutdown)")
+        except Exception as e:
+            logger.warning(f"Error closing '{server_name}': {e}")
 
     async def shutdown(self, force: bool = False) -> None:
         """Shutdown the pool and close all connections.
@@ -232,6 +513,14 @@ class MCPConnectionPool:
             force: If True, just clear connections without proper cleanup.
                    Use for CLI mode where the process is exiting anyway.
         """
+        if self._health_task is not None:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+            self._health_task = None
+
         if force:
             # Just abandon connections - process is exiting anyway
             logger.debug("Force-closing MCP connection pool (process exit)")
@@ -240,25 +529,33 @@ class MCPConnectionPool:
             return
 
         logger.info("Shutting down MCP connection pool...")
-        for server_name in list(self._connections.keys()):
-            await self._disconnect_server(server_name)
+        await asyncio.gather(
+            *(self._disconnect_server(name) for name in list(self._connections.keys()))
+        )
         self._started = False
         logger.info("MCP connection pool shut down")
 
     def stats(self) -> Dict[str, Any]:
         """Get pool statistics."""
         now = time.time()
+        connections: Dict[str, Any] = {}
+        for name, conns in self._connections.items():
+            if not conns:
+                continue
+            healthy = [c for c in conns if c.healthy]
+            connections[name] = {
+                "tools": len(conns[0].tools),
+                "server_version": conns[0].server_version,
+                "sessions": len(conns),
+                "healthy_sessions": len(healthy),
+                "in_flight": sum(c.in_flight for c in conns),
+                "call_count": sum(c.call_count for c in conns),
+                "age_seconds": round(now - min(c.connected_at for c in conns), 1),
+                "idle_seconds": round(now - max(c.last_used for c in conns), 1),
+            }
         return {
             "started": self._started,
             "servers_configured": len(self._configs),
-            "servers_connected": len(self._connections),
-            "connections": {
-                name: {
-                    "tools": len(conn.tools),
-                    "call_count": conn.call_count,
-                    "age_seconds": round(now - conn.connected_at, 1),
-                    "idle_seconds": round(now - conn.last_used, 1),
-                }
-                for name, conn in self._connections.items()
-            },
+            "servers_connected": sum(1 for name in connections if self.is_connected(name)),
+            "connections": connections,
         }
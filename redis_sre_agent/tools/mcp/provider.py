@@ -129,7 +129,8 @@ class MCPToolProvider(ToolProvider):
     async def _connect(self) -> None:
         """Connect to the MCP server and discover tools.
 
-        This method first tries to use a pooled connection if available.
+        This method first tries to use a pooled connection if available; tool
+        calls are then dispatched across the pool's sessions for this server.
         Falls back to creating a new connection if pool is empty or disabled.
         """
         eval_runtime = get_active_mcp_runtime()
@@ -236,11 +237,12 @@ class MCPToolProvider(ToolProvider):
             self._session = await self._exit_stack.enter_async_context(
                 ClientSession(read_stream, write_stream)
             )
-            await self._session.initialize()
+            init_result = await self._session.initialize()
 
-            # Discover tools from the server
-            tools_result = await self._session.list_tools()
-            self._mcp_tools = tools_result.tools
+            # Discover tools from the server (reused across connections for the same version)
+            from redis_sre_agent.tools.mcp.pool import list_tools_cached
+
+            self._mcp_tools = await list_tools_cached(self._server_name, self._session, init_result)
             self._tool_cache = []
 
             logger.info(
@@ -459,7 +461,7 @@ class MCPToolProvider(ToolProvider):
         Returns:
             The tool's result from the MCP server
         """
-        if not self._session:
+        if not self._session and not self._using_pooled_connection:
             return {
                 "status": "error",
                 "error": f"MCP server '{self._server_name}' is not connected",
@@ -467,7 +469,13 @@ class MCPToolProvider(ToolProvider):
 
         try:
             logger.info(f"Calling MCP tool '{tool_name}' with args: {args}")
-            result = await self._session.call_tool(tool_name, arguments=args)
+            if self._using_pooled_connection:
+                from redis_sre_agent.tools.mcp.pool import MCPConnectionPool
+
+                pool = MCPConnectionPool.get_instance()
+                result = await pool.call_tool(self._server_name, tool_name, args)
+            else:
+                result = await self._session.call_tool(tool_name, arguments=args)
 
             # Check for errors
             if result.isError:
@@ -1,11 +1,14 @@
 """Prometheus metrics tool provider.
 
-This provider uses the prometheus-api-client library to query Prometheus metrics.
-It provides tools for instant queries, range queries, and metric discovery.
+This provider queries the Prometheus HTTP API through a pooled async httpx client
+(prometheus-api-client remains as a metric-listing fallback). It provides tools
+for instant queries, range queries, and metric discovery. Range queries are
+reduced to per-series statistics by default; the raw matrix is kept envelope-only.
 """
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
@@ -16,11 +19,21 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from redis_sre_agent.core.instances import RedisInstance
 from redis_sre_agent.tools.decorators import status_update
-from redis_sre_agent.tools.models import ToolCapability, ToolDefinition
+from redis_sre_agent.tools.http import get_http_client
+from redis_sre_agent.tools.metrics.prometheus.reduction import summarize_matrix
+from redis_sre_agent.tools.models import ENVELOPE_ONLY_KEY, ToolCapability, ToolDefinition
 from redis_sre_agent.tools.protocols import ToolProvider
 
 logger = logging.getLogger(__name__)
 
+# Prometheus URLs that have reported active targets in this process, with the
+# monotonic time they did. Once a server has scraped, an empty result is an
+# answer rather than a cold start, so later queries skip the readiness wait and
+# the empty-result retries. Entries expire after READY_PROMETHEUS_TTL_SECONDS
+# and are dropped on a connection error, so a restarted server is probed again.
+READY_PROMETHEUS_TTL_SECONDS = 300.0
+_READY_PROMETHEUS_URLS: Dict[str, float] = {}
+
 
 class PrometheusConfig(BaseSettings):
     """Configuration for Prometheus metrics provider.
@@ -140,6 +153,15 @@ class PrometheusToolProvider(ToolProvider):
                             "description": "End time for the query (default: 'now')",
                             "default": "now",
                         },
+                        "reduce": {
+                            "type": "boolean",
+                            "description": (
+                                "Return per-series statistics (min, max, mean, p95, last, "
+                                "slope, change points) instead of every sample. Set to false "
+                                "only when individual samples are needed."
+                            ),
+                            "default": True,
+                        },
                     },
                     "required": ["query", "start_time"],
                 },
@@ -198,45 +220,46 @@ class PrometheusToolProvider(ToolProvider):
     async def __aexit__(self, _exc_type, _exc_val, _exc_tb):
         """Support async context manager (no-op, no cleanup needed)."""
 
-    async def _wait_for_targets(self, timeout_seconds: float = 10.0) -> None:
+    async def _wait_for_targets(self, timeout_seconds: float = 10.0) -> bool:
         """Wait until Prometheus reports at least one active target.
 
         This helps when a Prometheus instance has just started and hasn't scraped yet.
+        Returns True once targets are active; servers seen ready before return at once.
         """
-        import time
-
-        import requests
-
         base = self.config.url.rstrip("/")
-        deadline = time.time() + timeout_seconds
+        ready_at = _READY_PROMETHEUS_URLS.get(base)
+        if ready_at is not None and time.monotonic() - ready_at < READY_PROMETHEUS_TTL_SECONDS:
+            return True
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_seconds
         last_err = None
-        while time.time() < deadline:
-            try:
-                r = requests.get(f"{base}/api/v1/targets", timeout=2)
-                if r.status_code == 200:
-                    payload = r.json()
-                    if payload.get("status") == "success":
-                        active = payload.get("data", {}).get("activeTargets", [])
-                        if active:
-                            return
-            except Exception as e:  # best-effort readiness
-                last_err = e
+        while loop.time() < deadline:
+            payload = await self._http_get_json("/api/v1/targets", timeout=2.0)
+            if payload.get("status") == "success":
+                active = payload.get("data", {}).get("activeTargets", [])
+                if active:
+                    _READY_PROMETHEUS_URLS[base] = time.monotonic()
+                    return True
+            else:  # best-effort readiness
+                last_err = payload.get("error")
             await asyncio.sleep(0.5)
         # Do not raise; queries may still succeed even if this didn't detect targets
         if last_err:
             logger.debug(f"_wait_for_targets encountered: {last_err}")
+        return False
 
     async def _http_get_json(
-        self, path: str, params: Optional[Dict[str, Any]] = None
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = 5.0,
     ) -> Dict[str, Any]:
-        import requests
-
-        base = self.config.url.rstrip("/")
-        url = f"{base}{path}"
-        # Use a thread to avoid blocking the event loop
+        client = get_http_client(self.config.url, verify=not self.config.disable_ssl)
         try:
-            resp = await asyncio.to_thread(lambda: requests.get(url, params=params, timeout=5))
+            resp = await client.get(path, params=params, timeout=timeout)
         except Exception as e:
+            _READY_PROMETHEUS_URLS.pop(self.config.url.rstrip("/"), None)
             # Surface HTTP/network errors as an error payload instead of raising.
             # This lets callers fall back to retry paths (e.g., client.all_metrics()).
             return {"status": "error", "error": str(e)}
@@ -258,10 +281,10 @@ class PrometheusToolProvider(ToolProvider):
         logger.info(f"Prometheus instant query: {query}")
         try:
             # Best-effort wait for a first scrape to occur
-            await self._wait_for_targets(timeout_seconds=10.0)
+            targets_ready = await self._wait_for_targets(timeout_seconds=10.0)
 
             # Query directly via HTTP for reliability
-            delays = [0.5, 1.0, 1.5, 2.0, 2.0]  # seconds
+            delays = [] if targets_ready else [0.5, 1.0, 1.5, 2.0, 2.0]  # seconds
             payload = await self._http_get_json("/api/v1/query", params={"query": query})
             if payload.get("status") != "success":
                 return {
@@ -325,7 +348,12 @@ class PrometheusToolProvider(ToolProvider):
 
     @status_update("I'm querying Prometheus for metrics between {start_time} and {end_time}.")
     async def query_range(
-        self, query: str, start_time: str, end_time: str = "now", step: str = "15s"
+        self,
+        query: str,
+        start_time: str,
+        end_time: str = "now",
+        step: str = "15s",
+        reduce: bool = True,
     ) -> Dict[str, Any]:
         """Execute a range Prometheus query.
 
@@ -334,6 +362,8 @@ class PrometheusToolProvider(ToolProvider):
             start_time: Start time (relative like '1h' or absolute)
             end_time: End time (default: 'now')
             step: Query resolution step (default: '15s')
+            reduce: Return per-series statistics under ``series`` and keep the
+                raw matrix envelope-only (default: True)
 
         Returns:
             Query result with status and time-series data
@@ -343,7 +373,7 @@ class PrometheusToolProvider(ToolProvider):
         )
         try:
             # Best-effort wait for a first scrape to occur
-            await self._wait_for_targets(timeout_seconds=10.0)
+            targets_ready = await self._wait_for_targets(timeout_seconds=10.0)
 
             # Parse datetime strings
             parsed_start = parse_datetime(start_time)
@@ -382,8 +412,8 @@ class PrometheusToolProvider(ToolProvider):
                 }
             result = payload.get("data", {}).get("result", [])
 
-            # Retry if empty (Prometheus may not have data immediately)
-            if not result:
+            # Retry if empty and Prometheus has not scraped yet
+            if not result and not targets_ready:
                 for delay in [1.0, 1.5, 2.0]:
                     await asyncio.sleep(delay)
                     payload = await self._http_get_json("/api/v1/query_range", params=params)
@@ -417,15 +447,21 @@ class PrometheusToolProvider(ToolProvider):
                     }
                     result = [{"metric": metric, "values": values}]
 
-            return {
+            response = {
                 "status": "success",
                 "query": query,
                 "start_time": start_time,
                 "end_time": end_time,
                 "step": step,
-                "data": result,
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             }
+            if reduce:
+                response["series"] = summarize_matrix(result)
+                response["series_count"] = len(result)
+                response[ENVELOPE_ONLY_KEY] = {"data": result}
+            else:
+                response["data"] = result
+            return response
         except Exception as e:
             logger.error(f"Prometheus range query failed: {e}")
             return {
@@ -0,0 +1,148 @@
+"""Compact statistics for Prometheus range query results.
+
+A range query over a long window returns thousands of ``[timestamp, "value"]``
+pairs per series, most of which carry no information the agent needs. These
+helpers reduce each series to a handful of numbers (min/max/mean/p95/last,
+least-squares slope, and the largest level shifts) computed with NumPy, so the
+LLM sees a few hundred bytes per series instead of the raw matrix.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Maximum level shifts reported per series.
+MAX_CHANGE_POINTS = 3
+# A split is reported when the mean shift exceeds this many noise sigmas
+# (scaled by segment sizes, as in a two-sample t statistic).
+CHANGE_POINT_THRESHOLD = 6.0
+# Smallest number of samples on either side of a reported split.
+MIN_SEGMENT_SAMPLES = 3
+
+
+def _round(value: float) -> Optional[float]:
+    """Round to 6 significant digits; non-finite values become None."""
+    if not math.isfinite(value):
+        return None
+    return float(f"{value:.6g}")
+
+
+def _noise_sigma(values: np.ndarray) -> float:
+    """Robust noise estimate from first differences (insensitive to level shifts)."""
+    if values.size < 3:
+        return 0.0
+    diffs = np.diff(values)
+    mad = float(np.median(np.abs(diffs - np.median(diffs))))
+    return 1.4826 * mad / math.sqrt(2.0)
+
+
+def _best_split(values: np.ndarray) -> Optional[Tuple[int, float]]:
+    """Return the split index maximising the scaled mean difference, and its score."""
+    n = values.size
+    if n < 2 * MIN_SEGMENT_SAMPLES:
+        return None
+    csum = np.cumsum(values)
+    k = np.arange(MIN_SEGMENT_SAMPLES, n - MIN_SEGMENT_SAMPLES + 1)
+    left_mean = csum[k - 1] / k
+    right_mean = (csum[-1] - csum[k - 1]) / (n - k)
+    score = np.abs(left_mean - right_mean) * np.sqrt(k * (n - k) / n)
+    best = int(np.argmax(score))
+    return int(k[best]), float(score[best])
+
+
+def detect_change_points(
+    timestamps: np.ndarray,
+    values: np.ndarray,
+    max_points: int = MAX_CHANGE_POINTS,
+) -> List[Dict[str, Any]]:
+    """Find up to ``max_points`` level shifts by binary segmentation.
+
+    Each split is the point that best separates a segment into two different
+    means; it is kept only when the shift is large relative to the series'
+    sample-to-sample noise.
+    """
+    sigma = _noise_sigma(values)
+    # A noiseless series (e.g. a step function) still has meaningful shifts.
+    scale = sigma if sigma > 0 else max(float(np.ptp(values)) * 1e-9, 1e-12)
+
+    segments = [(0, values.size)]
+    splits: List[int] = []
+    while len(splits) < max_points:
+        best: Optional[Tuple[float, int, int]] = None
+        for seg_index, (start, end) in enumerate(segments):
+            found = _best_split(values[start:end])
+            if found is None:
+                continue
+            offset, score = found
+            if best is None or score > best[0]:
+                best = (score, seg_index, start + offset)
+        if best is None or best[0] / scale < CHANGE_POINT_THRESHOLD:
+            break
+        _, seg_index, split = best
+        start, end = segments.pop(seg_index)
+        segments.extend([(start, split), (split, end)])
+        splits.append(split)
+
+    bounds = sorted(splits)
+    edges = [0, *bounds, values.size]
+    points = []
+    for i, split in enumerate(bounds):
+        before = values[edges[i] : split]
+        after = values[split : edges[i + 2]]
+        points.append(
+            {
+                "timestamp": float(timestamps[split]),
+                "before_mean": _round(float(before.mean())),
+                "after_mean": _round(float(after.mean())),
+            }
+        )
+    return points
+
+
+def summarize_series(series: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce one matrix series (``{"metric": ..., "values": [[ts, "v"], ...]}``)."""
+    samples = series.get("values") or []
+    summary: Dict[str, Any] = {"metric": series.get("metric", {}), "samples": len(samples)}
+    if not samples:
+        return summary
+
+    timestamps = np.fromiter((float(s[0]) for s in samples), dtype=np.float64, count=len(samples))
+    values = np.array([s[1] for s in samples], dtype=np.float64)
+    finite = np.isfinite(values)
+    summary["start"] = float(timestamps[0])
+    summary["end"] = float(timestamps[-1])
+    if not finite.all():
+        summary["non_finite_samples"] = int((~finite).sum())
+        timestamps = timestamps[finite]
+        values = values[finite]
+    if values.size == 0:
+        return summary
+
+    summary.update(
+        {
+            "min": _round(float(values.min())),
+            "max": _round(float(values.max())),
+            "mean": _round(float(values.mean())),
+            "p95": _round(float(np.percentile(values, 95))),
+            "last": _round(float(values[-1])),
+        }
+    )
+
+    elapsed = timestamps - timestamps[0]
+    spread = float(np.dot(elapsed - elapsed.mean(), elapsed - elapsed.mean()))
+    if spread > 0:
+        slope = float(np.dot(elapsed - elapsed.mean(), values - values.mean())) / spread
+        summary["slope_per_second"] = _round(slope)
+
+    change_points = detect_change_points(timestamps, values)
+    if change_points:
+        summary["change_points"] = change_points
+    return summary
+
+
+def summarize_matrix(result: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Reduce every series of a ``resultType: matrix`` payload."""
+    return [summarize_series(series) for series in result]
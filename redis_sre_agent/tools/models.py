@@ -165,6 +165,12 @@ def infer_tool_action_kind(
     return ToolActionKind.UNKNOWN
 
 
+# Tool results may carry bulky raw evidence under this key. It is kept off the
+# LLM-visible ToolMessage content and merged back into the ResultEnvelope data,
+# so decision traces and expand_evidence still see it.
+ENVELOPE_ONLY_KEY = "envelope_only"
+
+
 class ToolMetadata(BaseModel):
     """Metadata about a concrete tool implementation.
 
@@ -0,0 +1,564 @@
+"""Indexed, memory-mapped access to support package log files.
+
+Support packages can carry multi-GB node logs, so log tools never read a file
+into memory. On first access each file is memory-mapped and indexed once:
+
+- line offsets (NumPy array; line ``i`` spans ``offsets[i]:offsets[i + 1]``)
+- a sparse timestamp index: the first timestamp found in every
+  ``TIMESTAMP_INDEX_STRIDE`` lines, for binary-searching time ranges
+- one packed bitmap per log level (built the first time that level is queried)
+
+Queries (head/tail, time range, level, regex) then touch only the lines they
+return. Regex queries run against the mapping itself, one match per line.
+Indexes are cached per file (keyed by path, size and mtime) and shared by every
+provider instance that opens the same extracted package. Readers lease an index
+while they use it; an index dropped from the cache is closed once its last lease
+is released.
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Lines between sparse timestamp index entries.
+TIMESTAMP_INDEX_STRIDE = 512
+# Bytes scanned per NumPy pass when locating newlines.
+NEWLINE_SCAN_CHUNK = 64 * 1024 * 1024
+# Lines scanned per regex block when searching from the end of a range.
+REGEX_TAIL_BLOCK_LINES = 65536
+# File indexes kept in the process-wide cache.
+MAX_CACHED_LOG_INDEXES = 64
+
+# Level words must start within this many bytes of the line start.
+LEVEL_PREFIX_BYTES = 160
+# Redis server log level symbols sit right after the timestamp.
+REDIS_SYMBOL_PREFIX_BYTES = 48
+
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_LEVEL_ALIASES = {
+    "TRACE": "DEBUG",
+    "VERBOSE": "DEBUG",
+    "DEBUG": "DEBUG",
+    "INFO": "INFO",
+    "NOTICE": "INFO",
+    "WARN": "WARNING",
+    "WARNING": "WARNING",
+    "ERR": "ERROR",
+    "ERROR": "ERROR",
+    "CRIT": "CRITICAL",
+    "CRITICAL": "CRITICAL",
+    "FATAL": "CRITICAL",
+    "ALERT": "CRITICAL",
+    "EMERG": "CRITICAL",
+}
+# Each pattern starts with a literal so the regex engine can skip ahead quickly;
+# the leading word boundary is checked separately with NumPy. Level words match
+# in any case ("error:", "Error", "ERROR").
+_LEVEL_WORDS = {
+    "DEBUG": (rb"DEBUG", rb"TRACE", rb"VERBOSE"),
+    "INFO": (rb"INFO", rb"NOTICE"),
+    "WARNING": (rb"WARN(?:ING)?",),
+    "ERROR": (rb"ERR(?:OR)?",),
+    "CRITICAL": (rb"CRIT(?:ICAL)?", rb"FATAL", rb"ALERT", rb"EMERG"),
+}
+_LEVEL_PATTERNS = {
+    level: tuple(re.compile(word + rb"(?![A-Za-z0-9_])", re.IGNORECASE) for word in words)
+    for level, words in _LEVEL_WORDS.items()
+}
+# Redis server logs (``pid:role date time <symbol> message``) mark levels with a symbol.
+_REDIS_LEVEL_PATTERNS = {
+    "DEBUG": (re.compile(rb" \. "), re.compile(rb" - ")),
+    "INFO": (re.compile(rb" \* "),),
+    "WARNING": (re.compile(rb" # "),),
+}
+_WORD_BYTES = np.zeros(256, dtype=bool)
+for _byte in b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_":
+    _WORD_BYTES[_byte] = True
+
+_ISO_TIMESTAMP = re.compile(
+    rb"^\[?(\d{4}-\d{2}-\d{2})[ T](\d{2}:\d{2}:\d{2})(?:[.,](\d{1,6}))?(Z|[+-]\d{2}:?\d{2})?"
+)
+_REDIS_TIMESTAMP = re.compile(
+    rb"^\d+:[XCSM] (\d{1,2} [A-Za-z]{3} \d{4} \d{2}:\d{2}:\d{2})(?:\.(\d+))?"
+)
+
+
+def normalize_level(level: str) -> str:
+    """Map a level name or alias (case-insensitive) to one of ``LEVELS``.
+
+    Raises:
+        ValueError: If the level is not recognised.
+    """
+    normalized = _LEVEL_ALIASES.get(level.strip().upper())
+    if normalized is None:
+        raise ValueError(f"Unknown log level '{level}'. Use one of: {', '.join(LEVELS)}")
+    return normalized
+
+
+def parse_line_timestamp(line: bytes) -> Optional[float]:
+    """Epoch seconds of a leading ISO-like or Redis server log timestamp.
+
+    Timestamps without an offset are taken as UTC.
+    """
+    match = _ISO_TIMESTAMP.match(line)
+    if match:
+        date, clock, fraction, offset = match.groups()
+        text = f"{date.decode()}T{clock.decode()}"
+        if offset:
+            tz = offset.decode()
+            text += "+00:00" if tz == "Z" else tz
+        try:
+            parsed = datetime.fromisoformat(text)
+        except ValueError:
+            return None
+    else:
+        match = _REDIS_TIMESTAMP.match(line)
+        if not match:
+            return None
+        clock, fraction = match.groups()
+        try:
+            parsed = datetime.strptime(clock.decode(), "%d %b %Y %H:%M:%S")
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    seconds = parsed.timestamp()
+    if fraction:
+        seconds += int(fraction) / 10 ** len(fraction)
+    return seconds
+
+
+class LogFileIndex:
+    """Line, timestamp and level index over one memory-mapped log file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        stat = path.stat()
+        self.size = stat.st_size
+        self.mtime_ns = stat.st_mtime_ns
+        self._mmap: Optional[mmap.mmap] = None
+        if self.size:
+            with path.open("rb") as handle:
+                self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self.offsets = self._index_lines()
+        self.line_count = len(self.offsets) - 1
+        self._ts_lines, self._ts_values = self._index_timestamps()
+        self._redis_format = bool(
+            len(self._ts_lines) and _REDIS_TIMESTAMP.match(self._raw_line(int(self._ts_lines[0])))
+        )
+        # Level bitmaps are built per level on first use and then cached.
+        self._level_bitmaps: Dict[str, np.ndarray] = {}
+        self._level_lock = threading.Lock()
+        # Active leases; a retired index closes when the last one is released.
+        self._leases = 0
+        self._retired = False
+        self._lease_lock = threading.Lock()
+
+    # ----------------------------- Index build -----------------------------
+
+    def _index_lines(self) -> np.ndarray:
+        if self._mmap is None:
+            return np.zeros(1, dtype=np.int64)
+        buffer = np.frombuffer(self._mmap, dtype=np.uint8)
+        try:
+            parts = [np.zeros(1, dtype=np.int64)]
+            for start in range(0, self.size, NEWLINE_SCAN_CHUNK):
+                newlines = np.flatnonzero(buffer[start : start + NEWLINE_SCAN_CHUNK] == 0x0A)
+                parts.append(newlines.astype(np.int64) + (start + 1))
+        finally:
+            # Release the buffer export so the mapping can be closed later.
+            del buffer
+        offsets = np.concatenate(parts)
+        if offsets[-1] != self.size:
+            offsets = np.append(offsets, self.size)
+        return offsets
+
+    def _index_timestamps(self) -> Tuple[np.ndarray, np.ndarray]:
+        lines: List[int] = []
+        values: List[float] = []
+        for block_start in range(0, self.line_count, TIMESTAMP_INDEX_STRIDE):
+            block_end = min(block_start + TIMESTAMP_INDEX_STRIDE, self.line_count)
+            for i in range(block_start, block_end):
+                ts = parse_line_timestamp(self._raw_line(i))
+                if ts is not None:
+                    lines.append(i)
+                    values.append(ts)
+                    break
+        return np.array(lines, dtype=np.int64), np.array(values, dtype=np.float64)
+
+    def _match_lines(self, pattern: re.Pattern, max_column: int, word_start: bool) -> np.ndarray:
+        """Lines where ``pattern`` matches within ``max_column`` bytes of the line start."""
+        assert self._mmap is not None
+        positions = np.fromiter((m.start() for m in pattern.finditer(self._mmap)), dtype=np.int64)
+        if not positions.size:
+            return positions
+        lines = np.searchsorted(self.offsets, positions, side="right") - 1
+        keep = positions - self.offsets[lines] < max_column
+        if word_start:
+            buffer = np.frombuffer(self._mmap, dtype=np.uint8)
+            try:
+                previous = buffer[np.maximum(positions - 1, 0)]
+            finally:
+                del buffer
+            keep &= (positions == self.offsets[lines]) | ~_WORD_BYTES[previous]
+        return lines[keep]
+
+    def _level_bitmap(self, level: str) -> np.ndarray:
+        with self._level_lock:
+            bitmap = self._level_bitmaps.get(level)
+            if bitmap is None:
+                bits = np.zeros(self.line_count, dtype=bool)
+                for pattern in _LEVEL_PATTERNS[level]:
+                    bits[self._match_lines(pattern, LEVEL_PREFIX_BYTES, True)] = True
+                if self._redis_format:
+                    for pattern in _REDIS_LEVEL_PATTERNS.get(level, ()):
+                        bits[self._match_lines(pattern, REDIS_SYMBOL_PREFIX_BYTES, False)] = True
+                bitmap = np.packbits(bits)
+                self._level_bitmaps[level] = bitmap
+            return bitmap
+
+    # ----------------------------- Line access -----------------------------
+
+    def _raw_line(self, i: int) -> bytes:
+        assert self._mmap is not None
+        return self._mmap[int(self.offsets[i]) : int(self.offsets[i + 1])].rstrip(b"\r\n")
+
+    def _line_end(self, i: int) -> int:
+        """Offset of line ``i``'s trailing newline (or of its end, if none)."""
+        assert self._mmap is not None
+        end = int(self.offsets[i + 1])
+        if end > int(self.offsets[i]) and self._mmap[end - 1] == 0x0A:
+            end -= 1
+        return end
+
+    def line(self, i: int) -> str:
+        """Decoded text of line ``i`` (0-based, without line ending)."""
+        return self._raw_line(i).decode("utf-8", errors="replace")
+
+    def timestamp(self, i: int) -> Optional[float]:
+        """Epoch seconds of line ``i``'s leading timestamp, if any."""
+        return parse_line_timestamp(self._raw_line(i))
+
+    # ----------------------------- Queries -----------------------------
+
+    def _first_line_after(self, bound: float, inclusive: bool) -> int:
+        """First line whose timestamp is >= ``bound`` (> when not inclusive).
+
+        Assumes timestamps are non-decreasing, as in append-only logs; the
+        sparse index narrows the search to one stride, which is then scanned.
+        """
+        side = "left" if inclusive else "right"
+        k = int(np.searchsorted(self._ts_values, bound, side=side))
+        begin = int(self._ts_lines[k - 1]) if k > 0 else 0
+        stop = int(self._ts_lines[k]) if k < len(self._ts_lines) else self.line_count
+        for i in range(begin, stop):
+            ts = self.timestamp(i)
+            if ts is not None and (ts >= bound if inclusive else ts > bound):
+                return i
+        return stop
+
+    def line_range(
+        self, start: Optional[float] = None, end: Optional[float] = None
+    ) -> Tuple[int, int]:
+        """Half-open line range covering timestamps in ``[start, end]``."""
+        lo = 0 if start is None else self._first_line_after(start, inclusive=True)
+        hi = self.line_count if end is None else self._first_line_after(end, inclusive=False)
+        return lo, max(lo, hi)
+
+    def level_mask(self, levels: Sequence[str]) -> np.ndarray:
+        """Boolean mask of lines at any of ``levels``.
+
+        A line is at a level when a level word (or alias such as WARN, FATAL)
+        starts within ``LEVEL_PREFIX_BYTES`` of the line start; Redis server
+        logs also use their level symbols.
+        """
+        mask = np.zeros(self.line_count, dtype=bool)
+        for level in {normalize_level(level) for level in levels}:
+            mask |= np.unpackbits(self._level_bitmap(level), count=self.line_count).astype(bool)
+        return mask
+
+    def _regex_lines(
+        self,
+        pattern: re.Pattern,
+        lo: int,
+        hi: int,
+        mask: Optional[np.ndarray],
+        limit: Optional[int],
+        tail: bool,
+    ) -> np.ndarray:
+        assert self._mmap is not None
+
+        def _scan(first: int, last: int, cap: Optional[int]) -> List[int]:
+            found: List[int] = []
+            pos, endpos = int(self.offsets[first]), int(self.offsets[last])
+            while pos < endpos:
+                match = pattern.search(self._mmap, pos, endpos)
+                if match is None:
+                    break
+                i = int(np.searchsorted(self.offsets, match.start(), side="right")) - 1
+                line_end = self._line_end(i)
+                if match.end() > line_end:
+                    # The match ran past the newline; retry within this line alone.
+                    line_start = max(pos, int(self.offsets[i]))
+                    match = pattern.search(self._mmap, line_start, line_end)
+                if match is not None and (mask is None or mask[i]):
+                    found.append(i)
+                    if cap is not None and len(found) >= cap:
+                        break
+                # One hit per line: resume at the next line.
+                pos = int(self.offsets[i + 1])
+            return found
+
+        if not tail or limit is None:
+            return np.array(_scan(lo, hi, limit), dtype=np.int64)
+
+        # Tail: scan blocks backwards until enough lines have matched.
+        collected: List[List[int]] = []
+        remaining = limit
+        block_end = hi
+        while block_end > lo and remaining > 0:
+            block_start = max(lo, block_end - REGEX_TAIL_BLOCK_LINES)
+            hits = _scan(block_start, block_end, None)
+            collected.append(hits[-remaining:])
+            remaining -= len(collected[-1])
+            block_end = block_start
+        return np.array([i for hits in reversed(collected) for i in hits], dtype=np.int64)
+
+    def select(
+        self,
+        *,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        levels: Optional[Sequence[str]] = None,
+        pattern: Optional[re.Pattern] = None,
+        limit: Optional[int] = None,
+        tail: bool = False,
+    ) -> np.ndarray:
+        """Indices of matching lines, ascending.
+
+        Args:
+            start: Earliest timestamp (epoch seconds, inclusive)
+            end: Latest timestamp (epoch seconds, inclusive)
+            levels: Keep only lines at any of these levels
+            pattern: Compiled bytes regex a line must match
+            limit: Maximum lines to return (None for all)
+            tail: Return the last ``limit`` matches instead of the first
+        """
+        if self.line_count == 0:
+            return np.zeros(0, dtype=np.int64)
+        lo, hi = self.line_range(start, end)
+        mask = self.level_mask(levels) if levels else None
+        if pattern is not None:
+            return self._regex_lines(pattern, lo, hi, mask, limit, tail)
+
+        if mask is None:
+            ids = np.arange(lo, hi, dtype=np.int64)
+        else:
+            ids = np.flatnonzero(mask[lo:hi]).astype(np.int64) + lo
+        if limit is not None:
+            ids = ids[-limit:] if tail else ids[:limit]
+        return ids
+
+    def acquire(self) -> None:
+        """Take a lease that keeps the mapping open until ``release``."""
+        with self._lease_lock:
+            self._leases += 1
+
+    def release(self) -> None:
+        with self._lease_lock:
+            self._leases -= 1
+            if self._retired and self._leases == 0:
+                self.close()
+
+    def retire(self) -> None:
+        """Close now if unleased, otherwise when the last lease is released."""
+        with self._lease_lock:
+            self._retired = True
+            if self._leases == 0:
+                self.close()
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+
+_cache_lock = threading.Lock()
+_file_indexes: "OrderedDict[Path, LogFileIndex]" = OrderedDict()
+
+
+def _cached_index(path: Path) -> LogFileIndex:
+    """Leased cached index for ``path``, re-indexed if its size or mtime changed."""
+    resolved = path.resolve()
+    stat = resolved.stat()
+    with _cache_lock:
+        index = _file_indexes.get(resolved)
+        if index is not None and (index.size, index.mtime_ns) == (
+            stat.st_size,
+            stat.st_mtime_ns,
+        ):
+            _file_indexes.move_to_end(resolved)
+        else:
+            if index is not None:
+                _file_indexes.pop(resolved).retire()
+            index = LogFileIndex(resolved)
+            _file_indexes[resolved] = index
+            while len(_file_indexes) > MAX_CACHED_LOG_INDEXES:
+                _, evicted = _file_indexes.popitem(last=False)
+                evicted.retire()
+        index.acquire()
+        return index
+
+
+@contextmanager
+def lease_log_file_index(path: Path) -> Iterator[LogFileIndex]:
+    """Cached index for ``path``, kept open until the block exits."""
+    index = _cached_index(path)
+    try:
+        yield index
+    finally:
+        index.release()
+
+
+def evict_log_indexes(directory: Path) -> None:
+    """Drop cached indexes for files under ``directory``.
+
+    Each index is closed now, or after its last active lease is released.
+    """
+    root = directory.resolve()
+    with _cache_lock:
+        for path in [p for p in _file_indexes if p.is_relative_to(root)]:
+            _file_indexes.pop(path).retire()
+
+
+def format_timestamp(timestamp: Optional[float]) -> Optional[str]:
+    """ISO 8601 (UTC) text for epoch seconds, or None."""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+@dataclass
+class LogLine:
+    """One log line returned by a support package log query."""
+
+    node_id: str
+    log_name: str
+    line_number: int
+    timestamp: Optional[float]
+    text: str
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "node_id": self.node_id,
+            "log_name": self.log_name,
+            "line_number": self.line_number,
+            "timestamp": format_timestamp(self.timestamp),
+            "text": self.text,
+        }
+
+
+class SupportPackageLogIndex:
+    """Log queries across the nodes of one extracted support package."""
+
+    def __init__(self, node_logs: Dict[str, Dict[str, Path]]):
+        """
+        Args:
+            node_logs: ``{node_id: {log_name: path}}`` for the package's nodes
+        """
+        self._node_logs = node_logs
+
+    def files(
+        self, log_name: str, node_ids: Optional[Sequence[str]] = None
+    ) -> List[Tuple[str, Path]]:
+        """``(node_id, path)`` for every selected node that has ``log_name``.
+
+        Indexes are leased one file at a time by the queries, so a query over
+        more files than the cache holds never loses an index it is reading.
+        """
+        selected = []
+        for node_id, logs in self._node_logs.items():
+            if node_ids is not None and node_id not in node_ids:
+                continue
+            path = logs.get(log_name)
+            if path is not None:
+                selected.append((node_id, path))
+        return selected
+
+    def query(
+        self,
+        log_name: str,
+        *,
+        node_ids: Optional[Sequence[str]] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        levels: Optional[Sequence[str]] = None,
+        pattern: Optional[str] = None,
+        limit: Optional[int] = None,
+        tail: bool = False,
+    ) -> List[LogLine]:
+        """Matching lines from ``log_name`` on every selected node.
+
+        Lines from several nodes are merged in timestamp order (lines without
+        a timestamp sort with the nearest preceding timestamped line of their
+        file); ``limit`` and ``tail`` apply to the merged result.
+
+        Raises:
+            ValueError: For an unknown level.
+            re.error: For an invalid regex.
+        """
+        compiled = re.compile(pattern.encode(), re.MULTILINE) if pattern else None
+        merged: List[Tuple[float, str, int, LogLine]] = []
+        for node_id, path in self.files(log_name, node_ids):
+            with lease_log_file_index(path) as index:
+                ids = index.select(
+                    start=start,
+                    end=end,
+                    levels=levels,
+                    pattern=compiled,
+                    limit=limit,
+                    tail=tail,
+                )
+                sort_key = float("-inf")
+                for i in ids.tolist():
+                    ts = index.timestamp(i)
+                    if ts is not None:
+                        sort_key = ts
+                    line = LogLine(node_id, log_name, i + 1, ts, index.line(i))
+                    merged.append((sort_key, node_id, i, line))
+        merged.sort(key=lambda item: item[:3])
+        lines = [item[3] for item in merged]
+        if limit is not None:
+            lines = lines[-limit:] if tail else lines[:limit]
+        return lines
+
+    def iter_matches(
+        self,
+        log_name: str,
+        *,
+        node_ids: Optional[Sequence[str]] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        levels: Optional[Sequence[str]] = None,
+        pattern: Optional[str] = None,
+    ) -> Iterator[Tuple[str, Optional[float], str]]:
+        """Stream ``(node_id, timestamp, text)`` for every matching line, file by file."""
+        compiled = re.compile(pattern.encode(), re.MULTILINE) if pattern else None
+        for node_id, path in self.files(log_name, node_ids):
+            with lease_log_file_index(path) as index:
+                ids = index.select(start=start, end=end, levels=levels, pattern=compiled)
+                for i in ids.tolist():
+                    yield node_id, index.timestamp(i), index.line(i)
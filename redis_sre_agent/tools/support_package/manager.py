@@ -5,6 +5,7 @@ import tarfile
 from pathlib import Path
 from typing import List, Optional
 
+from .log_index import evict_log_indexes
 from .provider import SupportPackageToolProvider
 from .storage.protocols import PackageMetadata, SupportPackageStorage
 
@@ -147,6 +148,8 @@ class SupportPackageManager:
         # Remove extracted files if they exist
         extract_path = self.extract_dir / package_id
         if extract_path.exists():
+            # Drop memory-mapped log indexes before their files go away
+            evict_log_indexes(extract_path)
             shutil.rmtree(extract_path)
 
         # Remove from storage
@@ -13,7 +13,9 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from .log_index import SupportPackageLogIndex
 
 
 class SupportPackageDatabase(BaseModel):
@@ -148,6 +150,8 @@ class SupportPackageNode(BaseModel):
     def read_log(self, log_name: str) -> Optional[str]:
         """Read content of a specific log file.
 
+        Loads the whole file; log tools query ``SupportPackage.log_index`` instead.
+
         Args:
             log_name: Name of the log file
 
@@ -174,6 +178,17 @@ class SupportPackage(BaseModel):
     class Config:
         arbitrary_types_allowed = True
 
+    _log_index: Optional[SupportPackageLogIndex] = PrivateAttr(default=None)
+
+    @property
+    def log_index(self) -> SupportPackageLogIndex:
+        """Indexed access to node logs; each file is indexed on first query."""
+        if self._log_index is None:
+            self._log_index = SupportPackageLogIndex(
+                {node.node_id: dict(node.log_files) for node in self.nodes}
+            )
+        return self._log_index
+
     @classmethod
     def from_directory(cls, directory: Path) -> "SupportPackage":
         """Parse a support package from an extracted directory.
@@ -6,18 +6,36 @@ providing access to database diagnostics, node logs, and cluster information.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import re
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from redis_sre_agent.tools.decorators import status_update
+from redis_sre_agent.tools.logs.reduction import LogTemplateMiner, extract_timestamp
 from redis_sre_agent.tools.models import ToolCapability, ToolDefinition
 from redis_sre_agent.tools.protocols import ToolProvider
 
+from .log_index import format_timestamp, normalize_level
 from .models import SupportPackage
 
 logger = logging.getLogger(__name__)
 
+# Logs with more matching lines than this are reduced to templates by default.
+LOG_REDUCE_MIN_LINES = 200
+
+
+def _parse_time_bound(value: Optional[str]) -> Optional[float]:
+    """Epoch seconds for an ISO 8601 time filter; naive values are UTC."""
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
 
 class SupportPackageToolProvider(ToolProvider):
     """Tool provider for analyzing Redis Enterprise support packages.
@@ -128,8 +146,10 @@ class SupportPackageToolProvider(ToolProvider):
             ToolDefinition(
                 name=self._make_tool_name("logs"),
                 description=(
-                    "Read log file from a node in the support package. "
-                    "Supports filtering by log level."
+                    "Query a log file on one node, or on all nodes, in the support package. "
+                    "Supports level, time range and regex filters and reading from the end "
+                    "(tail). Large results are summarized as line templates with counts, "
+                    "first/last timestamps and samples."
                 ),
                 capability=ToolCapability.LOGS,
                 parameters={
@@ -137,7 +157,7 @@ class SupportPackageToolProvider(ToolProvider):
                     "properties": {
                         "node_id": {
                             "type": "string",
-                            "description": "Node ID (e.g., '1')",
+                            "description": "Node ID (e.g., '1'). Omit to query every node.",
                         },
                         "log_name": {
                             "type": "string",
@@ -145,14 +165,42 @@ class SupportPackageToolProvider(ToolProvider):
                         },
                         "level": {
                             "type": "string",
-                            "description": "Filter by log level (INFO, WARNING, ERROR, CRITICAL)",
+                            "description": (
+                                "Filter by log level (DEBUG, INFO, WARNING, ERROR, CRITICAL); "
+                                "comma-separate several levels"
+                            ),
+                        },
+                        "start": {
+                            "type": "string",
+                            "description": "Earliest line timestamp (ISO 8601, UTC if no offset)",
+                        },
+                        "end": {
+                            "type": "string",
+                            "description": "Latest line timestamp (ISO 8601, UTC if no offset)",
+                        },
+                        "pattern": {
+                            "type": "string",
+                            "description": "Regular expression a line must match",
+                        },
+                        "tail": {
+                            "type": "boolean",
+                            "description": "Return the last matching lines instead of the first",
+                            "default": False,
                         },
                         "limit": {
                             "type": "integer",
-                            "description": "Maximum number of lines to return",
+                            "description": "Maximum number of raw lines to return",
+                        },
+                        "reduce": {
+                            "type": "boolean",
+                            "description": (
+                                "Summarize matching lines as templates (true) or return raw "
+                                f"lines (false). Default: summarize when more than "
+                                f"{LOG_REDUCE_MIN_LINES} lines match and no limit is given."
+                            ),
                         },
                     },
-                    "required": ["node_id", "log_name"],
+                    "required": ["log_name"],
                 },
             ),
             ToolDefinition(
@@ -276,58 +324,120 @@ class SupportPackageToolProvider(ToolProvider):
 
         return {"status": "success", "database_id": database_id, "data": db.clientlist_content}
 
-    @status_update("Reading log {log_name} from node {node_id}.")
+    @status_update("Reading log {log_name} from the support package.")
     async def logs(
         self,
-        node_id: str,
         log_name: str,
+        node_id: Optional[str] = None,
         level: Optional[str] = None,
         limit: Optional[int] = None,
+        reduce: Optional[bool] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        pattern: Optional[str] = None,
+        tail: bool = False,
     ) -> Dict[str, Any]:
-        """Read a log file from a node.
+        """Query a log file on one node or across all nodes.
+
+        Files are memory-mapped and indexed on first access (see
+        ``log_index``), so queries never load a whole log into memory.
+        Matching lines are mined into templates (see ``tools.logs.reduction``)
+        when ``reduce`` is True, or by default when more than
+        ``LOG_REDUCE_MIN_LINES`` lines match and no ``limit`` is given.
 
         Args:
-            node_id: Node ID
             log_name: Log file name
-            level: Optional log level filter
-            limit: Maximum number of lines
+            node_id: Node ID; None queries every node that has the log
+            level: Optional log level filter (comma-separated for several)
+            limit: Maximum number of raw lines
+            reduce: Return templates instead of raw lines
+            start: Earliest line timestamp (ISO 8601)
+            end: Latest line timestamp (ISO 8601)
+            pattern: Regular expression lines must match
+            tail: Return the last ``limit`` matching lines instead of the first
 
         Returns:
-            Dict with status and data
+            Dict with status and data (raw lines) or log_templates
         """
-        node = self.package.get_node(node_id)
-        if not node:
+        if node_id is not None and not self.package.get_node(node_id):
             return {
                 "status": "error",
                 "error": f"Node {node_id} not found in support package",
             }
-
-        log_content = node.read_log(log_name)
-        if not log_content:
+        node_ids = [node_id] if node_id is not None else None
+
+        try:
+            levels = [normalize_level(part) for part in level.split(",")] if level else None
+            start_ts = _parse_time_bound(start)
+            end_ts = _parse_time_bound(end)
+            if pattern:
+                re.compile(pattern)
+        except (ValueError, re.error) as e:
+            return {"status": "error", "error": f"Invalid log query: {e}"}
+
+        index = self.package.log_index
+        files = await asyncio.to_thread(index.files, log_name, node_ids)
+        if not files:
+            where = f"node {node_id}" if node_id is not None else "any node"
             return {
                 "status": "error",
-                "error": f"Log file {log_name} not found for node {node_id}",
+                "error": f"Log file {log_name} not found for {where}",
             }
 
-        lines = log_content.splitlines()
-
-        # Filter by level if specified
-        if level:
-            level_upper = level.upper()
-            lines = [line for line in lines if level_upper in line.upper()]
-
-        # Apply limit
-        if limit and limit > 0:
-            lines = lines[:limit]
-
-        return {
+        filters = {
+            "node_ids": node_ids,
+            "start": start_ts,
+            "end": end_ts,
+            "levels": levels,
+            "pattern": pattern,
+        }
+        result: Dict[str, Any] = {
             "status": "success",
             "node_id": node_id,
             "log_name": log_name,
-            "data": "\n".join(lines),
-            "line_count": len(lines),
+            "nodes": [file_node for file_node, _ in files],
         }
 
+        if reduce is None and not (limit and limit > 0):
+            probe = await asyncio.to_thread(
+                index.query, log_name, limit=LOG_REDUCE_MIN_LINES + 1, **filters
+            )
+            reduce = len(probe) > LOG_REDUCE_MIN_LINES
+        if reduce:
+
+            def _mine() -> Dict[str, Any]:
+                miner = LogTemplateMiner()
+                for file_node, timestamp, text in index.iter_matches(log_name, **filters):
+                    # The index parses ISO and Redis server timestamps; an ISO
+                    # prefix is also dropped from the text that is mined
+                    _, message = extract_timestamp(text)
+                    miner.add(message, timestamp, sample=f"[node {file_node}] {text}")
+                summary = miner.summary()
+                for template in summary["templates"]:
+                    template["first_seen"] = format_timestamp(template["first_seen"])
+                    template["last_seen"] = format_timestamp(template["last_seen"])
+                return summary
+
+            summary = await asyncio.to_thread(_mine)
+            result["line_count"] = summary["total_lines"]
+            result["log_templates"] = summary
+            return result
+
+        lines = await asyncio.to_thread(
+            index.query,
+            log_name,
+            limit=limit if limit and limit > 0 else None,
+            tail=tail,
+            **filters,
+        )
+        if len(files) > 1:
+            data = "\n".join(f"[node {line.node_id}] {line.text}" for line in lines)
+        else:
+            data = "\n".join(line.text for line in lines)
+        result["data"] = data
+        result["line_count"] = len(lines)
+        return result
+
     async def list_databases(self) -> Dict[str, Any]:
         """List all databases in the support package.
 
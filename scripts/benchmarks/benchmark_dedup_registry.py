@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Benchmark deduplicated ingestion with the chunk registry vs keyspace SCAN.
+
+Ingests ``--docs`` synthetic documents (``--chunks`` chunks each, random
+vectors, no embedding calls) through ``DocumentDeduplicator`` into a scratch
+index, then re-ingests ``--reingest`` of them with changed content so lookups
+and deletes hit existing chunks. ``scan`` mode replays the previous lookup
+(``scan_iter`` over ``{prefix}:{hash}:chunk:*`` per call); ``registry`` mode
+reads the per-document chunk set. SCAN cost grows with the whole keyspace,
+so ``scan`` mode at 100k documents takes a long time; use ``--modes`` to
+skip it. Scratch keys are deleted afterwards.
+
+Usage:
+    python scripts/benchmarks/benchmark_dedup_registry.py --docs 10000
+    python scripts/benchmarks/benchmark_dedup_registry.py --docs 100000 --modes registry
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+import statistics
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+from pydantic import SecretStr
+from redisvl.index import AsyncSearchIndex
+from redisvl.schema import IndexSchema
+
+from redis_sre_agent.core.config import settings
+from redis_sre_agent.core.redis import (
+    SRE_KNOWLEDGE_SCHEMA,
+    close_redis_connections,
+    get_redis_client,
+)
+from redis_sre_agent.pipelines.ingestion.deduplication import DocumentDeduplicator
+
+_PREFIX = "bench_dedup"
+
+
+class _ScanDeduplicator(DocumentDeduplicator):
+    """Deduplicator with the pre-registry SCAN lookup."""
+
+    async def find_existing_chunks(self, document_hash: str) -> List[str]:
+        return await self._scan_existing_chunks(document_hash)
+
+    async def register_chunks(self, document_hash: str, chunk_keys: List[str]) -> None:
+        return None
+
+
+class _RandomVectorizer:
+    def __init__(self, dim: int, dtype: str) -> None:
+        self._rng = np.random.default_rng(0)
+        self._dim = dim
+        self._dtype = dtype
+
+    async def aembed_many(self, texts: List[str], as_buffer: bool = False, **kwargs) -> List[Any]:
+        return [
+            self._rng.random(self._dim, dtype=np.float32).astype(self._dtype).tobytes()
+            for _ in texts
+        ]
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--redis-url",
+        default=settings.redis_url.get_secret_value(),
+        help="Redis URL to benchmark against (defaults to REDIS_URL).",
+    )
+    parser.add_argument("--docs", type=int, default=10_000, help="Documents to ingest.")
+    parser.add_argument("--chunks", type=int, default=3, help="Chunks per document.")
+    parser.add_argument("--reingest", type=int, default=1_000, help="Documents to replace.")
+    parser.add_argument("--modes", nargs="+", choices=["scan", "registry"], default=None)
+    return parser.parse_args()
+
+
+def _chunks(doc: int, chunk_count: int, revision: int) -> List[Dict[str, Any]]:
+    document_hash = f"{doc:016x}"
+    return [
+        {
+            "document_hash": document_hash,
+            "chunk_index": i,
+            "title": f"Benchmark doc {doc}",
+            "content": f"Benchmark doc {doc} chunk {i} revision {revision}",
+            "source": "benchmark",
+            "category": "shared",
+            "doc_type": "knowledge",
+            "severity": "medium",
+            "metadata": {},
+        }
+        for i in range(chunk_count)
+    ]
+
+
+async def _ingest(
+    deduplicator: DocumentDeduplicator,
+    vectorizer: _RandomVectorizer,
+    docs: range | List[int],
+    chunk_count: int,
+    revision: int,
+) -> List[float]:
+    latencies: List[float] = []
+    for doc in docs:
+        started = time.perf_counter()
+        await deduplicator.replace_document_chunks(_chunks(doc, chunk_count, revision), vectorizer)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+async def _cleanup(client: Any) -> None:
+    for pattern in (f"{_PREFIX}:*", f"{_PREFIX}_meta:*", f"{_PREFIX}_chunks:*"):
+        batch: List[bytes] = []
+        async for key in client.scan_iter(match=pattern, count=1000):
+            batch.append(key)
+            if len(batch) >= 1000:
+                await client.unlink(*batch)
+                batch = []
+        if batch:
+            await client.unlink(*batch)
+
+
+async def _run(args: argparse.Namespace) -> None:
+    settings.redis_url = SecretStr(args.redis_url)
+    schema_dict = copy.deepcopy(SRE_KNOWLEDGE_SCHEMA)
+    schema_dict["index"]["name"] = f"{_PREFIX}_index"
+    schema_dict["index"]["prefix"] = f"{_PREFIX}:"
+    client = get_redis_client()
+    index = AsyncSearchIndex(schema=IndexSchema.from_dict(schema_dict), redis_client=client)
+    vectorizer = _RandomVectorizer(settings.vector_dim, settings.vector_datatype)
+    modes = args.modes or ["scan", "registry"]
+    reingest = list(range(0, args.docs, max(1, args.docs // max(1, args.reingest))))
+
+    print(f"docs={args.docs} chunks/doc={args.chunks} reingest={len(reingest)}")
+    print(
+        f"{'mode':<9} {'ingest docs/s':>14} {'first p50 ms':>13} {'last p50 ms':>12} "
+        f"{'replace p50 ms':>15}"
+    )
+    try:
+        for mode in modes:
+            await index.create(overwrite=True, drop=True)
+            await _cleanup(client)
+            deduplicator_cls = _ScanDeduplicator if mode == "scan" else DocumentDeduplicator
+            deduplicator = deduplicator_cls(index, key_prefix=_PREFIX)
+            if mode == "registry":
+                await deduplicator.backfill_chunk_registry()
+
+            started = time.perf_counter()
+            latencies = await _ingest(deduplicator, vectorizer, range(args.docs), args.chunks, 0)
+            elapsed = time.perf_counter() - started
+            replaced = await _ingest(deduplicator, vectorizer, reingest, args.chunks, 1)
+
+            window = max(1, len(latencies) // 10)
+            print(
+                f"{mode:<9} {args.docs / elapsed:>14.1f} "
+                f"{statistics.median(latencies[:window]) * 1000:>13.2f} "
+                f"{statistics.median(latencies[-window:]) * 1000:>12.2f} "
+                f"{statistics.median(replaced) * 1000 if replaced else 0.0:>15.2f}"
+            )
+    finally:
+        await index.delete(drop=True)
+        await _cleanup(client)
+        await close_redis_connections()
+
+
+def main() -> None:
+    asyncio.run(_run(_parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""Count upstream requests and wall time of host telemetry fan-out.
+
+Starts a local stub serving both the Prometheus and the Loki range query APIs.
+Each request sleeps ``--latency-ms`` (one worker thread per request, as a real
+server would) and answers with one series or stream per host matched by the
+query's host matcher, so merged and per-host answers carry the same data.
+
+``get_host_metrics`` and ``get_host_logs`` are run for ``--hosts`` hosts in two
+modes through the real Prometheus and Loki providers:
+
+- per_host: one upstream query per host (and metric alias), all in flight at
+  once, as before merging
+- merged: one regex-matcher query per chunk of hosts, split back per host,
+  under the provider's default concurrency bound
+
+Usage:
+    python scripts/benchmarks/benchmark_host_telemetry.py
+    python scripts/benchmarks/benchmark_host_telemetry.py --hosts 300 --metrics 6 --latency-ms 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import collections
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+from urllib.parse import parse_qs, urlsplit
+
+from redis_sre_agent.tools.host_telemetry.provider import (
+    HostTelemetryConfig,
+    HostTelemetryToolProvider,
+)
+from redis_sre_agent.tools.http import close_http_clients
+from redis_sre_agent.tools.logs.loki.provider import LokiConfig, LokiToolProvider
+from redis_sre_agent.tools.metrics.prometheus.provider import (
+    PrometheusConfig,
+    PrometheusToolProvider,
+)
+from redis_sre_agent.tools.models import ToolCapability
+
+_MATCHER = re.compile(r'(?:instance|host)=~?"((?:[^"\\]|\\.)*)"')
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--hosts", type=int, default=100, help="Hosts to query.")
+    parser.add_argument("--metrics", type=int, default=6, help="Metric aliases per host.")
+    parser.add_argument("--points", type=int, default=120, help="Samples per series.")
+    parser.add_argument("--lines", type=int, default=50, help="Log lines per host.")
+    parser.add_argument("--log-limit", type=int, default=100, help="Log entries per host.")
+    parser.add_argument(
+        "--latency-ms", type=float, default=20.0, help="Stub server time per request."
+    )
+    return parser.parse_args()
+
+
+def _hosts_of(query: str) -> List[str]:
+    match = _MATCHER.search(query)
+    if not match:
+        return []
+    return [h.replace("\\\\", "") for h in match.group(1).split("|")]
+
+
+def _start_stub(args: argparse.Namespace, counts: collections.Counter) -> ThreadingHTTPServer:
+    lock = threading.Lock()
+
+    def _matrix(query: str) -> Dict[str, Any]:
+        result = [
+            {
+                "metric": {"__name__": "node_metric", "instance": host},
+                "values": [[1700000000 + 15 * i, str(i % 60)] for i in range(args.points)],
+            }
+            for host in _hosts_of(query)
+        ]
+        return {"status": "success", "data": {"resultType": "matrix", "result": result}}
+
+    def _streams(query: str, limit: int) -> Dict[str, Any]:
+        result = [
+            {
+                "stream": {"job": "syslog", "host": host},
+                "values": [
+                    [str((1700000000 + i) * 10**9), f"{host} kernel: event {i % 7} seq={i}"]
+                    for i in range(args.lines)
+                ][:limit],
+            }
+            for host in _hosts_of(query)
+        ]
+        return {"status": "success", "data": {"resultType": "streams", "result": result}}
+
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):  # noqa: N802
+            parts = urlsplit(self.path)
+            params = {k: v[0] for k, v in parse_qs(parts.query).items()}
+            if parts.path == "/api/v1/targets":
+                payload = {"status": "success", "data": {"activeTargets": [{"labels": {}}]}}
+            else:
+                with lock:
+                    counts[parts.path] += 1
+                time.sleep(args.latency_ms / 1000)
+                if parts.path == "/loki/api/v1/query_range":
+                    payload = _streams(params.get("query", ""), int(params.get("limit", 100)))
+                else:
+                    payload = _matrix(params.get("query", ""))
+            body = json.dumps(payload).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args):
+            return
+
+    class _Server(ThreadingHTTPServer):
+        # Per-host mode opens hundreds of connections at once
+        request_queue_size = 1024
+        daemon_threads = True
+
+    server = _Server(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class _Manager:
+    def __init__(self, url: str) -> None:
+        self._providers = {
+            ToolCapability.METRICS: [PrometheusToolProvider(config=PrometheusConfig(url=url))],
+            ToolCapability.LOGS: [LokiToolProvider(config=LokiConfig(url=url))],
+        }
+
+    def get_providers_for_capability(self, capability: ToolCapability) -> List[Any]:
+        return self._providers.get(capability, [])
+
+
+def _telemetry(url: str, args: argparse.Namespace, merged: bool) -> HostTelemetryToolProvider:
+    aliases = {
+        f"m{i}": f'rate(node_metric_{i}_total{{instance="{{host}}"}}[5m])'
+        for i in range(args.metrics)
+    }
+    config: Dict[str, Any] = {
+        "metrics": {"metric_aliases": aliases},
+        "logs": {"limit": args.log_limit},
+    }
+    if not merged:
+        config["max_concurrency"] = args.hosts * args.metrics
+        config["metrics"]["max_hosts_per_query"] = 1
+        config["logs"]["max_entries_per_query"] = args.log_limit
+    provider = HostTelemetryToolProvider()
+    provider.instance_config = HostTelemetryConfig(**config)
+    provider._manager = _Manager(url)
+    return provider
+
+
+async def _run(args: argparse.Namespace) -> None:
+    counts: collections.Counter = collections.Counter()
+    server = _start_stub(args, counts)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    hosts = [f"node-{i}.example.com:9100" for i in range(args.hosts)]
+    keys = [f"m{i}" for i in range(args.metrics)]
+
+    rows = []
+    try:
+        for mode in ("per_host", "merged"):
+            telemetry = _telemetry(url, args, merged=mode == "merged")
+            # Warm the client pool and Prometheus readiness probe outside the timings
+            await telemetry.get_host_metrics(hosts[:1], keys[:1], start_time="1h")
+            counts.clear()
+            started = time.perf_counter()
+            metrics = await telemetry.get_host_metrics(hosts, keys, start_time="1h")
+            metrics_s = time.perf_counter() - started
+            metrics_requests = counts["/api/v1/query_range"]
+
+            started = time.perf_counter()
+            logs = await telemetry.get_host_logs(hosts, start="1h", end="now")
+            logs_s = time.perf_counter() - started
+            logs_requests = counts["/loki/api/v1/query_range"]
+
+            ok = sum(
+                r.get("result", {}).get("status") == "success"
+                for r in metrics["results"] + logs["results"]
+            )
+            rows.append((mode, metrics_requests, metrics_s, logs_requests, logs_s, ok))
+    finally:
+        await close_http_clients()
+        server.shutdown()
+
+    total = args.hosts * (args.metrics + 1)
+    print(f"{args.hosts} hosts x {args.metrics} metrics, {args.latency_ms:g} ms/request upstream")
+    print(
+        f"{'mode':<10} {'prom reqs':>10} {'prom ms':>10} {'loki reqs':>10} {'loki ms':>10} "
+        f"{'results':>10}"
+    )
+    for mode, prom_reqs, prom_s, loki_reqs, loki_s, ok in rows:
+        print(
+            f"{mode:<10} {prom_reqs:>10,} {prom_s * 1000:>10,.0f} {loki_reqs:>10,} "
+            f"{loki_s * 1000:>10,.0f} {f'{ok}/{total}':>10}"
+        )
+
+
+def main() -> None:
+    asyncio.run(_run(_parse_args()))
+
+
+if __name__ == "__main__":
+    main()
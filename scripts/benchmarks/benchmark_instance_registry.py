@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Measure per-turn instance lookup cost with the process-local registry.
+
+Registers ``--instances`` synthetic instances whose connection URLs and admin
+passwords are envelope-encrypted, serves them from an in-memory stand-in for
+the instances search index (so the numbers isolate parsing, decryption and
+model construction, not network time), and replays ``--turns`` agent turns.
+Each turn calls ``get_instances`` twice, ``get_instance_map`` once and
+``get_instance_by_id`` twice, as the agent and tool manager do.
+
+``eager`` mode replays the previous behavior: every call re-parses every
+stored instance and decrypts every secret. ``registry`` mode uses the
+generation-versioned registry with lazily decrypted secrets; its first turn
+(cold load) is reported separately, and one secret per lookup is read to
+account for the decryptions a turn actually needs.
+
+Usage:
+    python scripts/benchmarks/benchmark_instance_registry.py
+    python scripts/benchmarks/benchmark_instance_registry.py --instances 20000 --turns 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import statistics
+import time
+from typing import Any, Dict, List, Optional
+
+from redis_sre_agent.core import instances as instances_module
+from redis_sre_agent.core.encryption import encrypt_secret, get_secret_value
+from redis_sre_agent.core.instances import (
+    RedisInstance,
+    clear_instance_registry,
+    get_instance_by_id,
+    get_instance_map,
+    get_instances,
+)
+from redis_sre_agent.core.redis import SRE_INSTANCES_INDEX
+
+
+class _StoredIndex:
+    """In-memory stand-in for the instances search index and Redis client."""
+
+    def __init__(self, docs: Dict[str, str]) -> None:
+        self._docs = docs
+        self.generation = b"1"
+
+    async def exists(self) -> bool:
+        return True
+
+    async def query(self, query: Any) -> Any:
+        if type(query).__name__ == "CountQuery":
+            return len(self._docs)
+        return [{"data": data} for data in self._docs.values()]
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.generation
+
+    async def hget(self, key: str, field: str) -> Optional[str]:
+        return self._docs.get(key.rsplit(":", 1)[-1])
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--instances", type=int, default=5_000, help="Registered instances.")
+    parser.add_argument("--turns", type=int, default=20, help="Agent turns to replay.")
+    return parser.parse_args()
+
+
+def _stored_docs(count: int) -> Dict[str, str]:
+    docs: Dict[str, str] = {}
+    for i in range(count):
+        enterprise = i % 5 == 0
+        data = {
+            "id": f"redis-{i}",
+            "name": f"instance-{i}",
+            "connection_url": encrypt_secret(f"redis://:pw{i}@redis-{i}.example.com:6379/0"),
+            "environment": ("production", "staging", "development")[i % 3],
+            "usage": ("cache", "session", "queue")[i % 3],
+            "description": f"Synthetic instance {i}",
+            "instance_type": "redis_enterprise" if enterprise else "oss_single",
+        }
+        if enterprise:
+            data.update(
+                admin_url=f"https://cluster-{i}.example.com:9443",
+                admin_username="admin@example.com",
+                admin_password=encrypt_secret(f"admin-pw-{i}"),
+            )
+        docs[data["id"]] = json.dumps(data)
+    return docs
+
+
+def _eager_instance(raw: str) -> RedisInstance:
+    inst_data = json.loads(raw)
+    for secret_field in ("connection_url", "admin_password"):
+        if inst_data.get(secret_field):
+            inst_data[secret_field] = get_secret_value(inst_data[secret_field])
+    return RedisInstance(**inst_data)
+
+
+async def _eager_turn(store: _StoredIndex, ids: List[str]) -> None:
+    for _ in range(2):
+        [_eager_instance(doc["data"]) for doc in await store.query(None)]
+    {i.id: i for i in (_eager_instance(doc["data"]) for doc in await store.query(None))}
+    for instance_id in ids:
+        _eager_instance(await store.hget(f"{SRE_INSTANCES_INDEX}:{instance_id}", "data"))
+
+
+async def _registry_turn(ids: List[str]) -> None:
+    for _ in range(2):
+        await get_instances()
+    await get_instance_map()
+    for instance_id in ids:
+        instance = await get_instance_by_id(instance_id)
+        instance.connection_url.get_secret_value()
+
+
+async def _main() -> None:
+    args = _parse_args()
+    os.environ.setdefault("REDIS_SRE_MASTER_KEY", base64.b64encode(os.urandom(32)).decode())
+    docs = _stored_docs(args.instances)
+    store = _StoredIndex(docs)
+
+    async def _get_index() -> _StoredIndex:
+        return store
+
+    async def _ensure_index() -> None:
+        return None
+
+    instances_module.get_instances_index = _get_index
+    instances_module._ensure_instances_index_exists = _ensure_index
+    instances_module.get_redis_client = lambda: store
+
+    targets = [f"redis-{i}" for i in (0, args.instances // 2)]
+
+    eager_ms: List[float] = []
+    for _ in range(args.turns):
+        started = time.perf_counter()
+        await _eager_turn(store, targets)
+        eager_ms.append((time.perf_counter() - started) * 1000)
+
+    clear_instance_registry()
+    started = time.perf_counter()
+    await _registry_turn(targets)
+    cold_ms = (time.perf_counter() - started) * 1000
+
+    registry_ms: List[float] = []
+    for turn in range(args.turns):
+        targets = [f"redis-{(turn * 7919 + offset) % args.instances}" for offset in (0, 1)]
+        started = time.perf_counter()
+        await _registry_turn(targets)
+        registry_ms.append((time.perf_counter() - started) * 1000)
+
+    store.generation = b"2"
+    started = time.perf_counter()
+    await _registry_turn(targets)
+    reload_ms = (time.perf_counter() - started) * 1000
+
+    eager_p50 = statistics.median(eager_ms)
+    registry_p50 = statistics.median(registry_ms)
+    print(f"{args.instances} instances, {args.turns} turns")
+    print(f"{'eager p50 ms/turn':<28} {eager_p50:>12,.2f}")
+    print(f"{'registry cold load ms':<28} {cold_ms:>12,.2f}")
+    print(f"{'registry p50 ms/turn':<28} {registry_p50:>12,.3f}")
+    print(f"{'registry reload ms':<28} {reload_ms:>12,.2f}")
+    print(f"{'speedup (warm turn)':<28} {eager_p50 / registry_p50:>11,.0f}x")
+
+
+def main() -> None:
+    asyncio.run(_main())
+
+
+if __name__ == "__main__":
+    main()
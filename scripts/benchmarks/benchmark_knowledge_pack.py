@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Benchmark knowledge-pack build and restore throughput.
+
+Loads ``--chunks`` synthetic knowledge chunks (random vectors, no embedding
+calls) into the knowledge index, builds a pack from them, deletes them, and
+restores the pack. Reports chunks/s for build, checksum verification and
+restore, the pack size, and the process peak RSS after each phase (the v2
+format streams records and memory-maps the vector sidecar, so peak RSS
+should stay flat as ``--chunks`` grows).
+
+The benchmark writes real ``sre_knowledge:*`` keys, so it refuses to run
+against a non-empty knowledge index; point ``--redis-url`` at a scratch
+database. Everything it wrote is deleted afterwards.
+
+Usage:
+    python scripts/benchmarks/benchmark_knowledge_pack.py --redis-url redis://localhost:6379/15
+    python scripts/benchmarks/benchmark_knowledge_pack.py --redis-url redis://localhost:6379/15 --chunks 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import resource
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+from pydantic import SecretStr
+
+from redis_sre_agent.core.config import settings
+from redis_sre_agent.core.keys import RedisKeys
+from redis_sre_agent.core.redis import (
+    close_redis_connections,
+    create_indices,
+    get_knowledge_index,
+)
+from redis_sre_agent.knowledge_pack.builder import build_knowledge_pack
+from redis_sre_agent.knowledge_pack.checksums import verify_zip_checksums
+from redis_sre_agent.knowledge_pack.loader import _knowledge_index_stats, load_knowledge_pack
+
+_BATCH_DATE = "2026-01-01"
+_LOAD_BATCH_SIZE = 1000
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--redis-url",
+        required=True,
+        help="Scratch Redis URL; the knowledge index there must be empty.",
+    )
+    parser.add_argument("--chunks", type=int, default=200_000, help="Chunks in the pack.")
+    parser.add_argument("--chunks-per-doc", type=int, default=4, help="Chunks per document.")
+    return parser.parse_args()
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _chunk(doc: int, chunk_index: int, vector: bytes) -> Dict[str, Any]:
+    document_hash = f"{doc:016x}"
+    return {
+        "id": f"{document_hash}-{chunk_index}",
+        "document_hash": document_hash,
+        "chunk_index": chunk_index,
+        "title": f"Benchmark doc {doc}",
+        "content": f"Benchmark doc {doc} chunk {chunk_index} " + "lorem ipsum " * 40,
+        "source": "benchmark",
+        "category": "shared",
+        "doc_type": "knowledge",
+        "severity": "medium",
+        "vector": vector,
+    }
+
+
+async def _populate(index: Any, chunk_count: int, chunks_per_doc: int) -> None:
+    rng = np.random.default_rng(0)
+    for start in range(0, chunk_count, _LOAD_BATCH_SIZE):
+        positions = range(start, min(start + _LOAD_BATCH_SIZE, chunk_count))
+        vectors = rng.random((len(positions), settings.vector_dim), dtype=np.float32).astype(
+            settings.vector_datatype
+        )
+        chunks = [
+            _chunk(position // chunks_per_doc, position % chunks_per_doc, vector.tobytes())
+            for position, vector in zip(positions, vectors)
+        ]
+        keys = [
+            RedisKeys.knowledge_chunk(chunk["document_hash"], chunk["chunk_index"])
+            for chunk in chunks
+        ]
+        await index.load(data=chunks, keys=keys)
+
+
+async def _cleanup(client: Any) -> None:
+    for pattern in ("sre_knowledge:*", "sre_knowledge_meta:*", "sre_knowledge_chunks:*"):
+        batch: List[bytes] = []
+        async for key in client.scan_iter(match=pattern, count=1000):
+            batch.append(key)
+            if len(batch) >= 1000:
+                await client.unlink(*batch)
+                batch = []
+        if batch:
+            await client.unlink(*batch)
+    await client.unlink(RedisKeys.knowledge_pack_active())
+
+
+def _report(phase: str, chunks: int, elapsed: float) -> None:
+    print(
+        f"{phase:<9} {elapsed:>9.2f} {chunks / elapsed if elapsed else 0.0:>10.0f} "
+        f"{_peak_rss_mb():>12.1f}"
+    )
+
+
+async def _run(args: argparse.Namespace) -> None:
+    settings.redis_url = SecretStr(args.redis_url)
+    await create_indices()
+    index = await get_knowledge_index()
+    client = index.client
+    stats = await _knowledge_index_stats(settings)
+    if stats["num_docs"] > 0:
+        raise SystemExit(
+            f"Knowledge index at {args.redis_url} holds {stats['num_docs']} documents; "
+            "use an empty scratch database."
+        )
+
+    try:
+        with tempfile.TemporaryDirectory(prefix="knowledge-pack-bench-") as tmpdir:
+            artifacts_path = Path(tmpdir) / "artifacts"
+            (artifacts_path / _BATCH_DATE).mkdir(parents=True)
+            (artifacts_path / _BATCH_DATE / "batch_manifest.json").write_text(
+                json.dumps({"batch_date": _BATCH_DATE, "total_documents": 0}),
+                encoding="utf-8",
+            )
+            pack_path = Path(tmpdir) / "pack.zip"
+
+            started = time.perf_counter()
+            await _populate(index, args.chunks, args.chunks_per_doc)
+            print(
+                f"populated {args.chunks} chunks ({settings.vector_dim} dims, "
+                f"{settings.vector_datatype}) in {time.perf_counter() - started:.1f}s"
+            )
+            print(f"{'phase':<9} {'seconds':>9} {'chunks/s':>10} {'peak RSS MB':>12}")
+
+            started = time.perf_counter()
+            await build_knowledge_pack(
+                batch_date=_BATCH_DATE,
+                output_path=pack_path,
+                artifacts_path=artifacts_path,
+                repo_sha="benchmark",
+            )
+            _report("build", args.chunks, time.perf_counter() - started)
+
+            started = time.perf_counter()
+            verify_zip_checksums(pack_path)
+            _report("verify", args.chunks, time.perf_counter() - started)
+
+            await _cleanup(client)
+            started = time.perf_counter()
+            result = await load_knowledge_pack(
+                pack_path=pack_path,
+                mode="restore",
+                artifacts_path=artifacts_path,
+                skip_checksums=True,
+            )
+            _report("restore", result["chunk_records_loaded"], time.perf_counter() - started)
+            print(f"pack size: {pack_path.stat().st_size / (1024 * 1024):.1f} MB")
+    finally:
+        await _cleanup(client)
+        await close_redis_connections()
+
+
+def main() -> None:
+    asyncio.run(_run(_parse_args()))
+
+
+if __name__ == "__main__":
+    main()
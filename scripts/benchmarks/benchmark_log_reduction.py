@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Measure log template mining throughput and compression.
+
+Generates a synthetic Redis/Redis Enterprise style log (``--lines`` lines drawn
+from a few dozen message shapes with varying ids, addresses, counters and
+timestamps), streams it through ``LogTemplateMiner`` and reports:
+
+- lines/second of the mining pass
+- line compression (lines per template)
+- byte compression (raw log bytes vs. the JSON summary the LLM would see)
+
+Usage:
+    python scripts/benchmarks/benchmark_log_reduction.py
+    python scripts/benchmarks/benchmark_log_reduction.py --lines 200000 --max-templates 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Iterator
+
+from redis_sre_agent.tools.logs.reduction import LogTemplateMiner, extract_timestamp
+
+_SHAPES = (
+    "INFO Accepted connection from {ip}:{port}",
+    "INFO Client id={id} addr={ip}:{port} closed connection",
+    "INFO Background saving started by pid {pid}",
+    "INFO Background saving terminated with success",
+    "INFO DB saved on disk in {ms} ms",
+    "INFO {n} changes in {s} seconds. Saving...",
+    "WARNING Replica {ip}:{port} lag is {s} seconds",
+    "INFO Synchronization with replica {ip}:{port} succeeded",
+    "INFO Partial resynchronization request from {ip}:{port} accepted offset {offset}",
+    "WARNING Client {uuid} output buffer exceeded soft limit {n} bytes",
+    "ERROR Failed to connect to master {ip}:{port} error {errno}",
+    "INFO shard:{shard} slot migration {n} completed in {ms} ms",
+    "INFO proxy {proxy} endpoint {id} reconnected after {ms} ms",
+    "WARNING node:{shard} cpu usage {pct} percent exceeds threshold",
+    "CRITICAL EventLog: node {shard} failed health check rc={errno}",
+    "INFO AOF rewrite child pid {pid} finished with {n} bytes",
+    "INFO memory usage {n} bytes fragmentation ratio {ratio}",
+    "INFO Slowlog entry id={id} duration={ms}us command=GET key:{id}",
+    "INFO Started heartbeat for shard {shard} session {hex}",
+    "WARNING Eviction policy evicted {n} keys in last {s} seconds",
+)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=1_000_000, help="Synthetic log lines.")
+    parser.add_argument("--max-templates", type=int, default=50, help="Templates in summary.")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed.")
+    return parser.parse_args()
+
+
+def _synthetic_log(lines: int, seed: int) -> Iterator[str]:
+    rng = random.Random(seed)
+    weights = [rng.randint(1, 50) for _ in _SHAPES]
+    started = datetime(2025, 11, 24, tzinfo=timezone.utc)
+    for i in range(lines):
+        shape = rng.choices(_SHAPES, weights)[0]
+        message = shape.format(
+            ip=f"10.{rng.randint(0, 3)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}",
+            port=rng.randint(1024, 65535),
+            id=rng.randint(1, 10**6),
+            pid=rng.randint(100, 99999),
+            ms=rng.randint(1, 5000),
+            s=rng.randint(1, 300),
+            n=rng.randint(1, 10**7),
+            offset=rng.randint(0, 10**12),
+            uuid=f"{rng.getrandbits(128):032x}",
+            errno=rng.randint(1, 150),
+            shard=rng.randint(1, 64),
+            proxy=rng.randint(1, 8),
+            pct=rng.randint(50, 100),
+            ratio=f"{rng.uniform(1, 3):.2f}",
+            hex=f"0x{rng.getrandbits(32):08x}",
+        )
+        ts = started + timedelta(milliseconds=i * 50)
+        yield f"{ts:%Y-%m-%d %H:%M:%S}.{ts.microsecond // 1000:03d} {message}"
+
+
+def main() -> None:
+    args = _parse_args()
+    log = list(_synthetic_log(args.lines, args.seed))
+    raw_bytes = sum(len(line) + 1 for line in log)
+
+    miner = LogTemplateMiner()
+    started = time.perf_counter()
+    for line in log:
+        timestamp, message = extract_timestamp(line)
+        miner.add(message, timestamp)
+    elapsed = time.perf_counter() - started
+
+    summary = miner.summary(max_templates=args.max_templates)
+    summary_bytes = len(json.dumps(summary))
+
+    print(f"{args.lines} lines, {raw_bytes / 1e6:.1f} MB raw")
+    print(f"{'lines/second':<22} {args.lines / elapsed:>14,.0f}")
+    print(f"{'templates':<22} {summary['template_count']:>14}")
+    print(f"{'lines per template':<22} {summary['compression_ratio']:>14,.1f}")
+    print(f"{'summary bytes':<22} {summary_bytes:>14,}")
+    print(f"{'byte compression':<22} {raw_bytes / summary_bytes:>13,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Microbenchmark PII detection throughput for 1, 16 and 64 block requests.
+
+Compares the per-block path (one executor hop and one pipeline call per text
+block) with ``DefaultPrivacyFilterPIIRemediator.remediate``, which classifies
+all blocks of a request in batches of ``--batch-size``.
+
+Loads the model named by ``--model`` (defaults to PII_REMEDIATION_MODEL), so
+``transformers`` and the model weights must be available locally.
+
+Usage:
+    python scripts/benchmarks/benchmark_pii_batching.py
+    python scripts/benchmarks/benchmark_pii_batching.py --batch-size 32 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from redis_sre_agent.core.config import settings
+from redis_sre_agent.core.default_pii_remediator import DefaultPrivacyFilterPIIRemediator
+from redis_sre_agent.core.pii_remediation import (
+    PIIRemediationMode,
+    PIIRemediationRequest,
+    PIITextBlock,
+)
+
+_SAMPLE_BLOCKS = [
+    "Customer Alice Johnson (alice.johnson@example.com) reported latency spikes on "
+    "redis-prod-1 after the 10:42 deploy.",
+    "INFO memory: used_memory_human:3.21G maxmemory_human:4.00G mem_fragmentation_ratio:1.42",
+    "Please call Bob at +1 415 555 0100 before restarting the primary in us-east-1.",
+    "SLOWLOG GET 10 shows KEYS user:* taking 812ms from client 10.0.4.17:53122.",
+]
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model", default=settings.pii_remediation_model)
+    parser.add_argument("--batch-size", type=int, default=settings.pii_remediation_batch_size)
+    parser.add_argument("--repeat", type=int, default=3, help="Requests per measurement.")
+    return parser.parse_args()
+
+
+def _request(block_count: int) -> PIIRemediationRequest:
+    blocks = [
+        PIITextBlock(
+            block_id=f"b{i}",
+            path=f"messages[{i}].content",
+            role="user",
+            text=_SAMPLE_BLOCKS[i % len(_SAMPLE_BLOCKS)],
+        )
+        for i in range(block_count)
+    ]
+    return PIIRemediationRequest(
+        mode=PIIRemediationMode.DETECT,
+        request_kind="benchmark",
+        blocks=blocks,
+        categories=sorted(settings.pii_remediation_categories),
+    )
+
+
+async def _per_block(
+    remediator: DefaultPrivacyFilterPIIRemediator, request: PIIRemediationRequest
+) -> None:
+    """Replay the pre-batching path: one executor hop per block."""
+    loop = asyncio.get_running_loop()
+    for block in request.blocks:
+        await loop.run_in_executor(remediator._executor, remediator._detect_spans, block.text)
+
+
+async def _measure(fn, remediator, request: PIIRemediationRequest, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        await fn(remediator, request)
+    elapsed = time.perf_counter() - started
+    return len(request.blocks) * repeat / elapsed
+
+
+async def _run(args: argparse.Namespace) -> None:
+    remediator = DefaultPrivacyFilterPIIRemediator(
+        model_name=args.model, batch_size=args.batch_size
+    )
+    # Load the model and warm up before timing
+    await remediator.remediate(_request(1))
+
+    async def _batched(remediator, request):
+        await remediator.remediate(request)
+
+    print(f"model={args.model} batch_size={args.batch_size} repeat={args.repeat}")
+    print(f"{'blocks':>6} {'per-block blk/s':>16} {'batched blk/s':>14} {'speedup':>8}")
+    try:
+        for block_count in (1, 16, 64):
+            request = _request(block_count)
+            sequential = await _measure(_per_block, remediator, request, args.repeat)
+            batched = await _measure(_batched, remediator, request, args.repeat)
+            print(
+                f"{block_count:>6} {sequential:>16.1f} {batched:>14.1f} "
+                f"{batched / sequential:>7.2f}x"
+            )
+    finally:
+        remediator.shutdown()
+
+
+def main() -> None:
+    asyncio.run(_run(_parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Measure Prometheus range query latency and LLM-visible result size.
+
+Starts a local stub Prometheus that serves a synthetic matrix and compares:
+
+- legacy: ``requests.get`` inside ``asyncio.to_thread`` (a new connection per
+  call, occupying default executor threads), raw matrix returned
+- pooled: ``PrometheusToolProvider.query_range`` over the shared httpx client,
+  with and without server-side reduction
+
+Reported size is the JSON the LLM would see (envelope-only data excluded).
+
+Usage:
+    python scripts/benchmarks/benchmark_prometheus_provider.py
+    python scripts/benchmarks/benchmark_prometheus_provider.py --series 20 --points 2880 --calls 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from redis_sre_agent.tools.http import close_http_clients
+from redis_sre_agent.tools.metrics.prometheus.provider import (
+    PrometheusConfig,
+    PrometheusToolProvider,
+)
+from redis_sre_agent.tools.models import ENVELOPE_ONLY_KEY
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--series", type=int, default=10, help="Series per range result.")
+    parser.add_argument(
+        "--points", type=int, default=1440, help="Samples per series (1440 = 6h at 15s)."
+    )
+    parser.add_argument("--calls", type=int, default=100, help="Range queries per mode.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Queries in flight at once.")
+    return parser.parse_args()
+
+
+def _build_payloads(series: int, points: int) -> dict[str, bytes]:
+    start = 1700000000
+    result = []
+    for s in range(series):
+        values = [
+            [start + 15 * i, str(1000 + s + (i % 60) + (200 if i > points // 2 else 0))]
+            for i in range(points)
+        ]
+        result.append({"metric": {"__name__": "redis_ops", "instance": f"r{s}"}, "values": values})
+    return {
+        "/api/v1/query_range": json.dumps(
+            {"status": "success", "data": {"resultType": "matrix", "result": result}}
+        ).encode(),
+        "/api/v1/targets": json.dumps(
+            {"status": "success", "data": {"activeTargets": [{"labels": {"job": "redis"}}]}}
+        ).encode(),
+    }
+
+
+def _start_stub(payloads: dict[str, bytes]) -> ThreadingHTTPServer:
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):  # noqa: N802
+            body = payloads.get(self.path.split("?", 1)[0], b'{"status": "error"}')
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args):
+            return
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def _bounded(calls: int, concurrency: int, fn) -> tuple[float, int]:
+    semaphore = asyncio.Semaphore(concurrency)
+    sizes: list[int] = []
+
+    async def _one():
+        async with semaphore:
+            sizes.append(await fn())
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_one() for _ in range(calls)))
+    return time.perf_counter() - started, sizes[-1]
+
+
+async def _run(args: argparse.Namespace) -> None:
+    server = _start_stub(_build_payloads(args.series, args.points))
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    params = {"query": "redis_ops", "start": 1700000000, "end": 1700021600, "step": "15s"}
+
+    async def _legacy() -> int:
+        resp = await asyncio.to_thread(
+            lambda: requests.get(f"{url}/api/v1/query_range", params=params, timeout=5)
+        )
+        return len(json.dumps(resp.json()["data"]["result"]))
+
+    provider = PrometheusToolProvider(config=PrometheusConfig(url=url))
+
+    def _pooled(reduce: bool):
+        async def _call() -> int:
+            result = await provider.query_range(
+                "redis_ops", "2023-11-14T22:13:20Z", "2023-11-15T04:13:20Z", reduce=reduce
+            )
+            result.pop(ENVELOPE_ONLY_KEY, None)
+            return len(json.dumps(result, default=str))
+
+        return _call
+
+    try:
+        rows = [
+            ("legacy", *await _bounded(args.calls, args.concurrency, _legacy)),
+            ("pooled_raw", *await _bounded(args.calls, args.concurrency, _pooled(False))),
+            ("pooled_reduced", *await _bounded(args.calls, args.concurrency, _pooled(True))),
+        ]
+    finally:
+        await close_http_clients()
+        server.shutdown()
+
+    print(f"{args.calls} range queries, {args.series} series x {args.points} points")
+    print(f"{'mode':<16} {'ms/query':>10} {'LLM-visible bytes':>18}")
+    for mode, elapsed, size in rows:
+        print(f"{mode:<16} {elapsed * 1000 / args.calls:>10.2f} {size:>18}")
+
+
+def main() -> None:
+    asyncio.run(_run(_parse_args()))
+
+
+if __name__ == "__main__":
+    main()
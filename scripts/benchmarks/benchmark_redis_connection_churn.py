@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Measure Redis connection churn per simulated request.
+
+Each simulated request looks up a task, pings the knowledge index and reads a
+thread, the way API handlers and agent turns do. Two modes are compared:
+
+- ``fresh``: a new ``Redis.from_url`` client and ``AsyncSearchIndex`` per
+  request, closed at the end (the behaviour before pooled clients).
+- ``pooled``: ``get_redis_client`` and ``get_knowledge_index`` from
+  ``redis_sre_agent.core.redis``, which share one pool per event loop.
+
+New TCP connections are counted by instrumenting ``AbstractConnection.connect``.
+
+Usage:
+    python scripts/benchmarks/benchmark_redis_connection_churn.py --redis-url redis://localhost:6379/0
+    python scripts/benchmarks/benchmark_redis_connection_churn.py --requests 2000 --concurrency 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from pydantic import SecretStr
+from redis.asyncio import Redis
+from redis.asyncio.connection import AbstractConnection
+from redisvl.index import AsyncSearchIndex
+from redisvl.schema import IndexSchema
+
+from redis_sre_agent.core.config import settings
+from redis_sre_agent.core.keys import RedisKeys
+from redis_sre_agent.core.redis import (
+    SRE_KNOWLEDGE_SCHEMA,
+    close_redis_connections,
+    get_knowledge_index,
+    get_redis_client,
+)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--redis-url",
+        default=settings.redis_url.get_secret_value(),
+        help="Redis URL to benchmark against (defaults to REDIS_URL).",
+    )
+    parser.add_argument("--requests", type=int, default=500, help="Simulated requests.")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=16,
+        help="Number of requests in flight at the same time.",
+    )
+    return parser.parse_args()
+
+
+class _ConnectCounter:
+    def __init__(self) -> None:
+        self.count = 0
+
+
+@contextmanager
+def _count_connects() -> Iterator[_ConnectCounter]:
+    counter = _ConnectCounter()
+    original = AbstractConnection.connect
+
+    async def _counting_connect(self):
+        if not self.is_connected:
+            counter.count += 1
+        return await original(self)
+
+    AbstractConnection.connect = _counting_connect
+    try:
+        yield counter
+    finally:
+        AbstractConnection.connect = original
+
+
+async def _request(client: Redis, index: AsyncSearchIndex, n: int) -> None:
+    await client.get(RedisKeys.task_status(f"bench-task-{n}"))
+    await index.exists()
+    await client.hgetall(RedisKeys.thread_metadata(f"bench-thread-{n}"))
+
+
+async def _fresh_request(redis_url: str, n: int) -> None:
+    client = Redis.from_url(redis_url)
+    index = AsyncSearchIndex(
+        schema=IndexSchema.from_dict(SRE_KNOWLEDGE_SCHEMA), redis_url=redis_url
+    )
+    try:
+        await _request(client, index, n)
+    finally:
+        await index.disconnect()
+        await client.aclose()
+
+
+async def _pooled_request(n: int) -> None:
+    await _request(get_redis_client(), await get_knowledge_index(), n)
+
+
+async def _drive(make_request, requests: int, concurrency: int) -> tuple[int, float]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _bounded(n: int) -> None:
+        async with semaphore:
+            await make_request(n)
+
+    with _count_connects() as counter:
+        started = time.perf_counter()
+        await asyncio.gather(*(_bounded(n) for n in range(requests)))
+        elapsed = time.perf_counter() - started
+    return counter.count, elapsed
+
+
+async def _run(args: argparse.Namespace) -> None:
+    settings.redis_url = SecretStr(args.redis_url)
+    rows = [
+        (
+            "fresh",
+            *await _drive(
+                lambda n: _fresh_request(args.redis_url, n), args.requests, args.concurrency
+            ),
+        ),
+        ("pooled", *await _drive(_pooled_request, args.requests, args.concurrency)),
+    ]
+    await close_redis_connections()
+
+    print(f"{args.requests} requests, concurrency {args.concurrency}")
+    print(f"{'mode':<8} {'connects':>9} {'conn/request':>13} {'ms/request':>11}")
+    for mode, connects, elapsed in rows:
+        print(
+            f"{mode:<8} {connects:>9} {connects / args.requests:>13.2f} "
+            f"{elapsed * 1000 / args.requests:>11.3f}"
+        )
+
+
+def main() -> None:
+    asyncio.run(_run(_parse_args()))
+
+
+if __name__ == "__main__":
+    main()
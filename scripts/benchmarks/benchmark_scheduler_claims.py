@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Measure how the scheduler finds and reschedules due schedules.
+
+Seeds ``--schedules`` enabled schedules whose ``next_run_at`` is spread over
+the last ``--spread-seconds`` and compares one scheduler pass of:
+
+- legacy: the former ``find_schedules_needing_runs`` FT query (default paging)
+  followed by the per-schedule HSET/HSET, HSET/HSET/HGET updates
+- claim: ``claim_due_schedules`` against the due sorted set
+
+Round trips are counted by instrumenting ``send_packed_command`` on the
+redis-py asyncio connection. Docket submission is not included; both modes
+hand the same runs to it.
+
+Usage:
+    python scripts/benchmarks/benchmark_scheduler_claims.py --redis-url redis://localhost:6379/0
+    python scripts/benchmarks/benchmark_scheduler_claims.py --schedules 10000 --batch-size 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Iterator
+
+from pydantic import SecretStr
+from redis.asyncio import Redis
+from redis.asyncio.connection import AbstractConnection
+from redisvl.query import FilterQuery
+
+from redis_sre_agent.core import redis as core_redis
+from redis_sre_agent.core import schedules as core_schedules
+from redis_sre_agent.core.config import settings
+from redis_sre_agent.core.keys import RedisKeys
+from redis_sre_agent.core.redis import get_schedules_index
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--redis-url",
+        default=settings.redis_url.get_secret_value(),
+        help="Redis URL to benchmark against (defaults to REDIS_URL).",
+    )
+    parser.add_argument("--schedules", type=int, default=10_000, help="Schedules to seed.")
+    parser.add_argument(
+        "--spread-seconds",
+        type=int,
+        default=30,
+        help="Seeded next_run_at values are spread over this many past seconds.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=settings.scheduler_claim_batch_size,
+        help="Schedules claimed per script call.",
+    )
+    return parser.parse_args()
+
+
+class _RoundTripCounter:
+    def __init__(self) -> None:
+        self.count = 0
+
+
+@contextmanager
+def _count_round_trips() -> Iterator[_RoundTripCounter]:
+    counter = _RoundTripCounter()
+    original = AbstractConnection.send_packed_command
+
+    async def _counting_send(self, command, check_health=True):
+        counter.count += 1
+        return await original(self, command, check_health)
+
+    AbstractConnection.send_packed_command = _counting_send
+    try:
+        yield counter
+    finally:
+        AbstractConnection.send_packed_command = original
+
+
+def _schedule_ids(count: int) -> list[str]:
+    return [f"bench-schedule-{i}" for i in range(count)]
+
+
+async def _seed(client: Redis, count: int, spread_seconds: int, now: datetime) -> None:
+    """Write schedule hashes and due-set entries the way store_schedule does."""
+    ids = _schedule_ids(count)
+    for start in range(0, count, 1000):
+        pipe = client.pipeline(transaction=False)
+        due = {}
+        for i, schedule_id in enumerate(ids[start : start + 1000], start=start):
+            next_run = now.timestamp() - (i % max(spread_seconds, 1))
+            pipe.hset(
+                RedisKeys.schedule_key(schedule_id),
+                mapping={
+                    "id": schedule_id,
+                    "name": f"Bench schedule {i}",
+                    "description": "",
+                    "interval_type": "hours",
+                    "interval_value": 1,
+                    "redis_instance_id": "",
+                    "instructions": "Check memory usage",
+                    "enabled": "true",
+                    "created_at": now.timestamp(),
+                    "updated_at": now.timestamp(),
+                    "last_run_at": 0,
+                    "next_run_at": next_run,
+                },
+            )
+            due[schedule_id] = next_run
+        pipe.zadd(RedisKeys.schedules_due(), due)
+        await pipe.execute()
+
+
+async def _run_legacy(client: Redis, now: datetime) -> tuple[int, int, float]:
+    index = await get_schedules_index()
+    query = FilterQuery(
+        return_fields=["id", "interval_type", "interval_value", "next_run_at"],
+        filter_expression=f"@enabled:{{true}} @next_run_at:[0 {now.timestamp()}]",
+    )
+    with _count_round_trips() as counter:
+        started = time.perf_counter()
+        results = await index.query(query)
+        for result in results:
+            key = result["id"]
+            next_run = now + timedelta(hours=1)
+            await client.hset(key, "last_run_at", now.timestamp())
+            await client.hset(key, "updated_at", now.timestamp())
+            await client.hset(key, "next_run_at", next_run.timestamp())
+            await client.hset(key, "updated_at", now.timestamp())
+            await client.hget(key, "next_run_at")
+        elapsed = time.perf_counter() - started
+    return len(results), counter.count, elapsed
+
+
+async def _run_claim(now: datetime, batch_size: int) -> tuple[int, int, float]:
+    with _count_round_trips() as counter:
+        started = time.perf_counter()
+        runs = await core_schedules.claim_due_schedules(
+            now, current_time=now, batch_size=batch_size
+        )
+        elapsed = time.perf_counter() - started
+    return len(runs), counter.count, elapsed
+
+
+async def _cleanup(client: Redis, count: int) -> None:
+    ids = _schedule_ids(count)
+    for start in range(0, count, 1000):
+        chunk = ids[start : start + 1000]
+        pipe = client.pipeline(transaction=False)
+        pipe.delete(*(RedisKeys.schedule_key(schedule_id) for schedule_id in chunk))
+        pipe.zrem(RedisKeys.schedules_due(), *chunk)
+        await pipe.execute()
+
+
+async def _run(args: argparse.Namespace) -> None:
+    settings.redis_url = SecretStr(args.redis_url)
+    client = core_redis.get_redis_client()
+    rows = []
+    try:
+        for mode in ("legacy", "claim"):
+            now = datetime.now(timezone.utc)
+            await _cleanup(client, args.schedules)
+            await _seed(client, args.schedules, args.spread_seconds, now)
+            if mode == "legacy":
+                rows.append((mode, *await _run_legacy(client, now)))
+            else:
+                rows.append((mode, *await _run_claim(now, args.batch_size)))
+    finally:
+        await _cleanup(client, args.schedules)
+
+    print(f"{args.schedules} due schedules, one scheduler pass")
+    print(f"{'mode':<8} {'handled':>8} {'missed':>8} {'round trips':>12} {'ms':>10}")
+    for mode, handled, trips, elapsed in rows:
+        print(
+            f"{mode:<8} {handled:>8} {args.schedules - handled:>8} {trips:>12} "
+            f"{elapsed * 1000:>10.1f}"
+        )
+
+
+def main() -> None:
+    asyncio.run(_run(_parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Measure target resolution against the in-process ``TargetIndex``.
+
+Generates a synthetic catalog of ``--targets`` instance and cluster docs and
+``--queries`` natural-language queries (exact names, hostnames, aliases,
+environment/usage phrases, kind/type hints and misses), then reports:
+
+- full index build time and incremental update time for 1% changed docs
+- per-query latency of ``TargetIndex.search``
+- per-query latency of the previous approach, scoring every doc with
+  ``_score_target_doc`` (on ``--legacy-queries`` queries, since it is slow)
+
+Results of both approaches are compared for every legacy query.
+
+Usage:
+    python scripts/benchmarks/benchmark_target_resolution.py
+    python scripts/benchmarks/benchmark_target_resolution.py --targets 50000 --queries 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+from typing import List, Optional, Sequence, Tuple
+
+from redis_sre_agent.core.targets import (
+    TargetCatalogDoc,
+    TargetIndex,
+    _parse_query_hints,
+    _score_target_doc,
+)
+
+_WORDS = (
+    "checkout cart payments ledger session login inventory search catalog orders "
+    "billing fraud ranking feed profile auth geo pricing shipping returns reviews "
+    "chat notify metrics events audit rates tokens quotas media thumbnails"
+).split()
+_ENVIRONMENTS = ("production", "staging", "development", "test")
+_USAGES = ("cache", "queue", "session", "analytics", "custom")
+_TYPES = ("oss_single", "oss_cluster", "redis_enterprise", "redis_cloud")
+_CAPABILITIES = ("redis", "diagnostics", "metrics", "logs", "admin", "cloud")
+_QUERY_FILLERS = ("check", "why is", "latency on", "memory of", "show me", "")
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--targets", type=int, default=10_000, help="Catalog size.")
+    parser.add_argument("--queries", type=int, default=1_000, help="Queries to resolve.")
+    parser.add_argument(
+        "--legacy-queries", type=int, default=50, help="Queries scored the per-doc way."
+    )
+    parser.add_argument("--seed", type=int, default=7, help="Random seed.")
+    return parser.parse_args()
+
+
+def _synthetic_catalog(count: int, rng: random.Random) -> List[TargetCatalogDoc]:
+    docs: List[TargetCatalogDoc] = []
+    for i in range(count):
+        kind = "cluster" if i % 10 == 0 else "instance"
+        words = rng.sample(_WORDS, 2)
+        environment = rng.choice(_ENVIRONMENTS)
+        usage = rng.choice(_USAGES)
+        name = f"{'-'.join(words)}-{environment[:4]}-{i}"
+        host = f"{words[0]}-{i}.{environment[:4]}.example.com"
+        docs.append(
+            TargetCatalogDoc(
+                target_id=f"{kind}:{name}",
+                target_kind=kind,
+                resource_id=name,
+                display_name=" ".join(words) + f" {i}",
+                name=name,
+                environment=environment,
+                status=rng.choice(("healthy", "unknown")),
+                target_type=rng.choice(_TYPES),
+                usage=usage if kind == "instance" else None,
+                monitoring_identifier=host,
+                search_text=" ".join([*words, environment, usage, *rng.sample(_WORDS, 3)]),
+                search_aliases=[f"{words[0]} {words[1]} {i}", f"{words[1]}{i}"],
+                capabilities=rng.sample(_CAPABILITIES, 3),
+                user_id=None if i % 4 else f"user-{i % 7}",
+            )
+        )
+    return docs
+
+
+def _synthetic_queries(
+    docs: Sequence[TargetCatalogDoc], count: int, rng: random.Random
+) -> List[Tuple[str, Optional[List[str]]]]:
+    queries: List[Tuple[str, Optional[List[str]]]] = []
+    for i in range(count):
+        doc = rng.choice(docs)
+        filler = rng.choice(_QUERY_FILLERS)
+        shape = i % 6
+        if shape == 0:
+            query = f"{filler} {doc.name}"
+        elif shape == 1:
+            query = f"{filler} {doc.monitoring_identifier}"
+        elif shape == 2:
+            query = f"{filler} {doc.search_aliases[0]}"
+        elif shape == 3:
+            query = f"{rng.choice(_WORDS)} {rng.choice(_USAGES)} in {rng.choice(_ENVIRONMENTS)}"
+        elif shape == 4:
+            query = f"{rng.choice(('enterprise', 'cloud', 'oss'))} cluster"
+        else:
+            query = f"{filler} unknown-target-{i}.internal.example.net"
+        capabilities = [rng.choice(_CAPABILITIES)] if i % 3 == 0 else None
+        queries.append((query.strip(), capabilities))
+    return queries
+
+
+def _legacy_search(docs, query, capabilities):
+    hints = _parse_query_hints(query)
+    results = []
+    for doc in docs:
+        score, reasons = _score_target_doc(
+            query, doc, preferred_capabilities=capabilities, hints=hints
+        )
+        if score >= 2.5:
+            results.append((doc.target_id, score, reasons))
+    return results
+
+
+def _percentile(samples: Sequence[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main() -> None:
+    args = _parse_args()
+    rng = random.Random(args.seed)
+    docs = _synthetic_catalog(args.targets, rng)
+    queries = _synthetic_queries(docs, args.queries, rng)
+
+    started = time.perf_counter()
+    index = TargetIndex(docs, generation=1)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    changed = list(docs)
+    for position in rng.sample(range(len(changed)), max(1, len(changed) // 100)):
+        changed[position] = changed[position].model_copy(
+            update={"search_text": f"{changed[position].search_text} rotated"}
+        )
+    started = time.perf_counter()
+    index.update(changed, generation=2)
+    update_ms = (time.perf_counter() - started) * 1000
+
+    index_ms: List[float] = []
+    matches = 0
+    for query, capabilities in queries:
+        started = time.perf_counter()
+        results = index.search(_parse_query_hints(query), preferred_capabilities=capabilities)
+        index_ms.append((time.perf_counter() - started) * 1000)
+        matches += len(results)
+
+    legacy_ms: List[float] = []
+    mismatches = 0
+    for query, capabilities in queries[: args.legacy_queries]:
+        started = time.perf_counter()
+        expected = _legacy_search(changed, query, capabilities)
+        legacy_ms.append((time.perf_counter() - started) * 1000)
+        actual = index.search(_parse_query_hints(query), preferred_capabilities=capabilities)
+        if [(f.doc.target_id, score, reasons) for f, score, reasons in actual] != expected:
+            mismatches += 1
+
+    print(f"{args.targets} targets, {args.queries} queries ({matches} matches)")
+    print(f"{'index build ms':<26} {build_ms:>12,.1f}")
+    print(f"{'1% incremental update ms':<26} {update_ms:>12,.1f}")
+    print(f"{'index p50 ms/query':<26} {statistics.median(index_ms):>12,.3f}")
+    print(f"{'index p95 ms/query':<26} {_percentile(index_ms, 0.95):>12,.3f}")
+    print(f"{'index total s':<26} {sum(index_ms) / 1000:>12,.2f}")
+    if legacy_ms:
+        legacy_mean = statistics.mean(legacy_ms)
+        index_mean = statistics.mean(index_ms)
+        print(f"{'per-doc mean ms/query':<26} {legacy_mean:>12,.3f}")
+        print(f"{'speedup':<26} {legacy_mean / index_mean:>11,.0f}x")
+        print(f"{'result mismatches':<26} {mismatches:>12}")
+
+
+if __name__ == "__main__":
+    main()
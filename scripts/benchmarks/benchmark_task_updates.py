@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Measure Redis round trips and latency per task progress update.
+
+Compares the pre-pipelining command sequence of ``TaskManager.add_task_update``
+(RPUSH, HSET, index check, GET+HGETALL+HSET+EXPIRE search doc upsert, HGET
+thread id, XADD+EXPIRE) with the current coalesced, pipelined writer.
+
+Round trips are counted by instrumenting ``send_packed_command`` on the
+redis-py asyncio connection, so one pipeline flush counts as one trip.
+
+Usage:
+    python scripts/benchmarks/benchmark_task_updates.py --redis-url redis://localhost:6379/0
+    python scripts/benchmarks/benchmark_task_updates.py --updates 500 --concurrency 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Iterator
+
+from pydantic import SecretStr
+from redis.asyncio import Redis
+from redis.asyncio.connection import AbstractConnection
+
+from redis_sre_agent.api.websockets import encode_task_stream_event
+from redis_sre_agent.core.config import settings
+from redis_sre_agent.core.keys import RedisKeys
+from redis_sre_agent.core.redis import SRE_TASKS_INDEX, get_tasks_index
+from redis_sre_agent.core.tasks import TaskManager, TaskUpdate
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--redis-url",
+        default=settings.redis_url.get_secret_value(),
+        help="Redis URL to benchmark against (defaults to REDIS_URL).",
+    )
+    parser.add_argument("--updates", type=int, default=200, help="Updates per task.")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Number of tasks emitting updates at the same time.",
+    )
+    parser.add_argument(
+        "--flush-interval-ms",
+        type=float,
+        default=settings.task_update_flush_interval_ms,
+        help="Coalescing window for the pipelined writer.",
+    )
+    return parser.parse_args()
+
+
+class _RoundTripCounter:
+    def __init__(self) -> None:
+        self.count = 0
+
+
+@contextmanager
+def _count_round_trips() -> Iterator[_RoundTripCounter]:
+    counter = _RoundTripCounter()
+    original = AbstractConnection.send_packed_command
+
+    async def _counting_send(self, command, check_health=True):
+        counter.count += 1
+        return await original(self, command, check_health)
+
+    AbstractConnection.send_packed_command = _counting_send
+    try:
+        yield counter
+    finally:
+        AbstractConnection.send_packed_command = original
+
+
+async def _legacy_add_task_update(client: Redis, task_id: str, message: str) -> None:
+    """Replay the command sequence add_task_update issued before pipelining."""
+    update = TaskUpdate(message=message)
+    await client.rpush(RedisKeys.task_updates(task_id), json.dumps(update.model_dump()))
+    await client.hset(
+        RedisKeys.task_metadata(task_id), "updated_at", datetime.now(timezone.utc).isoformat()
+    )
+    index = await get_tasks_index()
+    await index.exists()
+    await client.get(RedisKeys.task_status(task_id))
+    md = await client.hgetall(RedisKeys.task_metadata(task_id))
+    key = f"{SRE_TASKS_INDEX}:{task_id}"
+    await client.hset(key, mapping={"status": "in_progress", "updated_at": time.time()})
+    await client.expire(key, 86400)
+    thread_id = md.get(b"thread_id", b"").decode()
+    stream_key = RedisKeys.task_stream(thread_id)
+    await client.xadd(
+        stream_key,
+        encode_task_stream_event(thread_id, "progress", {"message": message, "task_id": task_id}),
+    )
+    await client.expire(stream_key, 86400)
+
+
+async def _seed_tasks(manager: TaskManager, count: int) -> list[str]:
+    task_ids = []
+    for i in range(count):
+        task_id = await manager.create_task(thread_id=f"bench-thread-{i}", subject="bench")
+        task_ids.append(task_id)
+    return task_ids
+
+
+async def _run_legacy(client: Redis, task_ids: list[str], updates: int) -> tuple[int, float]:
+    async def _emit(task_id: str) -> None:
+        for n in range(updates):
+            await _legacy_add_task_update(client, task_id, f"step {n}")
+
+    with _count_round_trips() as counter:
+        started = time.perf_counter()
+        await asyncio.gather(*(_emit(task_id) for task_id in task_ids))
+        elapsed = time.perf_counter() - started
+    return counter.count, elapsed
+
+
+async def _run_pipelined(
+    client: Redis, task_ids: list[str], updates: int, flush_interval: float
+) -> tuple[int, float]:
+    manager = TaskManager(redis_client=client, update_flush_interval=flush_interval)
+    for task_id in task_ids:
+        # Seed the search doc and thread cache the way a worker does on start
+        await manager._upsert_task_search_doc(task_id)
+
+    async def _emit(task_id: str) -> None:
+        for n in range(updates):
+            await manager.add_task_update(task_id, f"step {n}")
+
+    with _count_round_trips() as counter:
+        started = time.perf_counter()
+        await asyncio.gather(*(_emit(task_id) for task_id in task_ids))
+        elapsed = time.perf_counter() - started
+    return counter.count, elapsed
+
+
+async def _cleanup(client: Redis, task_ids: list[str]) -> None:
+    from redis_sre_agent.core.tasks import delete_task
+
+    for task_id in task_ids:
+        await delete_task(task_id=task_id, redis_client=client)
+
+
+async def _run(args: argparse.Namespace) -> None:
+    settings.redis_url = SecretStr(args.redis_url)
+    client = Redis.from_url(args.redis_url)
+    manager = TaskManager(redis_client=client)
+    task_ids = await _seed_tasks(manager, args.concurrency)
+    total = args.updates * len(task_ids)
+    try:
+        rows = [
+            ("legacy", *await _run_legacy(client, task_ids, args.updates)),
+            (
+                "pipelined",
+                *await _run_pipelined(
+                    client, task_ids, args.updates, args.flush_interval_ms / 1000.0
+                ),
+            ),
+        ]
+    finally:
+        await _cleanup(client, task_ids)
+        await client.aclose()
+
+    print(f"{total} updates across {len(task_ids)} concurrent tasks")
+    print(f"{'mode':<10} {'round trips':>12} {'trips/update':>13} {'ms/update':>10}")
+    for mode, trips, elapsed in rows:
+        print(f"{mode:<10} {trips:>12} {trips / total:>13.2f} {elapsed * 1000 / total:>10.3f}")
+
+
+def main() -> None:
+    asyncio.run(_run(_parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""Compare ANN vector index latency and recall@k against a flat (exact) index.
+
+Copies up to ``--docs`` knowledge chunks (title + vector) into two scratch
+indices: a FLAT/float32 baseline and a candidate built with ``--algorithm``,
+the HNSW parameters and ``--datatype`` (defaulting to the VECTOR_* settings).
+Queries are the retrieval evaluation test cases from
+``redis_sre_agent.evaluation.retrieval_eval``, embedded with the configured
+vectorizer, plus ``--sampled`` stored chunk vectors reused as queries.
+
+For each index it reports KNN latency percentiles, recall@k of the candidate
+against the flat results (ANN recall), and recall@k against the evaluation
+cases' relevant titles (retrieval quality). Scratch indices and their keys are
+dropped afterwards.
+
+Usage:
+    python scripts/benchmarks/benchmark_vector_index.py --redis-url redis://localhost:6379/0
+    python scripts/benchmarks/benchmark_vector_index.py --algorithm hnsw --ef-runtime 50 --k 10
+    python scripts/benchmarks/benchmark_vector_index.py --datatype float16 --docs 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import re
+import statistics
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from pydantic import SecretStr
+from redisvl.index import AsyncSearchIndex
+from redisvl.query import VectorQuery
+from redisvl.schema import IndexSchema
+
+from redis_sre_agent.core.config import settings
+from redis_sre_agent.core.redis import (
+    SRE_KNOWLEDGE_SCHEMA,
+    close_redis_connections,
+    get_redis_client,
+    get_vectorizer,
+)
+from redis_sre_agent.evaluation.retrieval_eval import (
+    RetrievalEvaluator,
+    get_admin_api_retrieval_test_cases,
+    get_redis_retrieval_test_cases,
+    get_rladmin_retrieval_test_cases,
+)
+
+_BASELINE_INDEX = "bench_vector_flat"
+_CANDIDATE_INDEX = "bench_vector_ann"
+_PART_SUFFIX = re.compile(r"\s*\(part \d+\)\s*$", re.IGNORECASE)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--redis-url",
+        default=settings.redis_url.get_secret_value(),
+        help="Redis URL to benchmark against (defaults to REDIS_URL).",
+    )
+    parser.add_argument("--docs", type=int, default=100_000, help="Chunks to copy.")
+    parser.add_argument("--k", type=int, default=10, help="Results per KNN query.")
+    parser.add_argument("--sampled", type=int, default=200, help="Stored vectors as queries.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per query.")
+    parser.add_argument(
+        "--algorithm",
+        choices=["flat", "hnsw", "svs-vamana"],
+        default=settings.vector_index_algorithm
+        if settings.vector_index_algorithm != "flat"
+        else "hnsw",
+    )
+    parser.add_argument("--m", type=int, default=settings.vector_hnsw_m)
+    parser.add_argument("--ef-construction", type=int, default=settings.vector_hnsw_ef_construction)
+    parser.add_argument("--ef-runtime", type=int, default=settings.vector_hnsw_ef_runtime)
+    parser.add_argument(
+        "--datatype", choices=["float32", "float16"], default=settings.vector_datatype
+    )
+    return parser.parse_args()
+
+
+def _schema(name: str, dim: int, attrs: Dict[str, Any]) -> IndexSchema:
+    return IndexSchema.from_dict(
+        {
+            "index": {"name": name, "prefix": f"{name}:", "storage_type": "hash"},
+            "fields": [
+                {"name": "title", "type": "tag"},
+                {
+                    "name": "vector",
+                    "type": "vector",
+                    "attrs": {"dims": dim, "distance_metric": "cosine", **attrs},
+                },
+            ],
+        }
+    )
+
+
+async def _load_chunks(limit: int) -> List[tuple[str, np.ndarray]]:
+    """Read (title, float32 vector) pairs from the knowledge index."""
+    client = get_redis_client()
+    prefix = SRE_KNOWLEDGE_SCHEMA["index"]["prefix"]
+    source_dtype = np.dtype(settings.vector_datatype)
+    chunks: List[tuple[str, np.ndarray]] = []
+    batch: List[bytes] = []
+
+    async def _flush() -> None:
+        async with client.pipeline(transaction=False) as pipe:
+            for key in batch:
+                pipe.hmget(key, "title", "vector")
+            rows = await pipe.execute(raise_on_error=False)
+        for row in rows:
+            if not isinstance(row, list) or not row[1]:
+                continue
+            title = row[0].decode() if row[0] else ""
+            vector = np.frombuffer(row[1], dtype=source_dtype)
+            if vector.size == settings.vector_dim:
+                chunks.append((title, vector.astype(np.float32)))
+
+    async for key in client.scan_iter(match=f"{prefix}*", count=1000):
+        batch.append(key)
+        if len(batch) >= 1000:
+            await _flush()
+            batch = []
+            if len(chunks) >= limit:
+                break
+    if batch:
+        await _flush()
+    return chunks[:limit]
+
+
+async def _build_index(
+    schema: IndexSchema, chunks: List[tuple[str, np.ndarray]], dtype: str
+) -> tuple[AsyncSearchIndex, float]:
+    index = AsyncSearchIndex(schema=schema, redis_client=get_redis_client())
+    await index.create(overwrite=True, drop=True)
+    started = time.perf_counter()
+    await index.load(
+        [
+            {"id": str(i), "title": title, "vector": vector.astype(dtype).tobytes()}
+            for i, (title, vector) in enumerate(chunks)
+        ],
+        id_field="id",
+        batch_size=1000,
+    )
+    # Wait for background indexing to finish so build time is comparable
+    while True:
+        info = await index.info()
+        if float(info.get("percent_indexed", 1)) >= 1 and int(info.get("indexing", 0)) == 0:
+            break
+        await asyncio.sleep(0.1)
+    return index, time.perf_counter() - started
+
+
+async def _knn(
+    index: AsyncSearchIndex,
+    vector: np.ndarray,
+    k: int,
+    dtype: str,
+    ef_runtime: Optional[int] = None,
+) -> tuple[List[Dict[str, Any]], float]:
+    query = VectorQuery(
+        vector=vector.tolist(),
+        vector_field_name="vector",
+        return_fields=["title"],
+        num_results=k,
+        dtype=dtype,
+        ef_runtime=ef_runtime,
+    )
+    started = time.perf_counter()
+    results = await index.query(query)
+    return results, time.perf_counter() - started
+
+
+def _ids(results: List[Dict[str, Any]]) -> List[str]:
+    return [str(result["id"]).rsplit(":", 1)[-1] for result in results]
+
+
+def _titles(results: List[Dict[str, Any]]) -> List[str]:
+    titles: List[str] = []
+    for result in results:
+        title = _PART_SUFFIX.sub("", str(result.get("title", "")))
+        if title and title not in titles:
+            titles.append(title)
+    return titles
+
+
+def _pct(values: List[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000
+
+
+async def _run(args: argparse.Namespace) -> None:
+    settings.redis_url = SecretStr(args.redis_url)
+    chunks = await _load_chunks(args.docs)
+    if not chunks:
+        print("No knowledge chunks with vectors found; ingest documents first.")
+        return
+    dim = int(chunks[0][1].size)
+
+    candidate_attrs: Dict[str, Any] = {"algorithm": args.algorithm, "datatype": args.datatype}
+    ef_runtime = None
+    if args.algorithm == "hnsw":
+        candidate_attrs.update(
+            {"m": args.m, "ef_construction": args.ef_construction, "ef_runtime": args.ef_runtime}
+        )
+        ef_runtime = args.ef_runtime
+
+    baseline, baseline_build = await _build_index(
+        _schema(_BASELINE_INDEX, dim, {"algorithm": "flat", "datatype": "float32"}),
+        chunks,
+        "float32",
+    )
+    candidate, candidate_build = await _build_index(
+        _schema(_CANDIDATE_INDEX, dim, candidate_attrs), chunks, args.datatype
+    )
+
+    test_cases = [
+        *get_redis_retrieval_test_cases(),
+        *get_rladmin_retrieval_test_cases(),
+        *get_admin_api_retrieval_test_cases(),
+    ]
+    embeddings = await get_vectorizer().aembed_many([case.query for case in test_cases])
+    queries = [
+        (np.asarray(vector, dtype=np.float32), case) for vector, case in zip(embeddings, test_cases)
+    ]
+    rng = random.Random(0)
+    for _, vector in rng.sample(chunks, min(args.sampled, len(chunks))):
+        queries.append((vector, None))
+
+    evaluator = RetrievalEvaluator(k_values=[args.k])
+    latencies: Dict[str, List[float]] = {"flat": [], args.algorithm: []}
+    ann_recall: List[float] = []
+    relevance: Dict[str, List[float]] = {"flat": [], args.algorithm: []}
+
+    try:
+        for vector, case in queries:
+            for _ in range(args.repeat):
+                exact, exact_elapsed = await _knn(baseline, vector, args.k, "float32")
+                approx, approx_elapsed = await _knn(
+                    candidate, vector, args.k, args.datatype, ef_runtime
+                )
+                latencies["flat"].append(exact_elapsed)
+                latencies[args.algorithm].append(approx_elapsed)
+            exact_ids = _ids(exact)
+            ann_recall.append(evaluator.calculate_recall_at_k(_ids(approx), exact_ids, args.k))
+            if case is not None:
+                for name, results in (("flat", exact), (args.algorithm, approx)):
+                    relevance[name].append(
+                        evaluator.calculate_recall_at_k(
+                            _titles(results), case.relevant_docs, args.k
+                        )
+                    )
+    finally:
+        await baseline.delete(drop=True)
+        await candidate.delete(drop=True)
+        await close_redis_connections()
+
+    print(
+        f"{len(chunks)} chunks, dim {dim}, {len(queries)} queries "
+        f"({len(test_cases)} eval cases), k={args.k}"
+    )
+    print(f"candidate: {candidate_attrs}")
+    print(
+        f"{'index':<12} {'build s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+        f"{'eval recall@k':>14}"
+    )
+    for name, build in (("flat", baseline_build), (args.algorithm, candidate_build)):
+        print(
+            f"{name:<12} {build:>8.1f} {statistics.median(latencies[name]) * 1000:>8.2f} "
+            f"{_pct(latencies[name], 0.95):>8.2f} {_pct(latencies[name], 0.99):>8.2f} "
+            f"{statistics.mean(relevance[name]) if relevance[name] else 0.0:>14.3f}"
+        )
+    print(f"ANN recall@{args.k} vs flat: {statistics.mean(ann_recall):.4f}")
+
+
+def main() -> None:
+    asyncio.run(_run(_parse_args()))
+
+
+if __name__ == "__main__":
+    main()
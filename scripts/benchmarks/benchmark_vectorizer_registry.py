@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Measure first-query and steady-state embedding latency with and without reuse.
+
+``uncached`` builds a fresh vectorizer via ``create_vectorizer`` for every
+query (the previous ``get_vectorizer`` behaviour: new model load for
+``EMBEDDING_PROVIDER=local`` and a new embeddings-cache client each time).
+``registry`` goes through ``get_cached_vectorizer``, which builds once per
+event loop and configuration. Each query text is unique per run so embeddings
+come from the model rather than the Redis embeddings cache.
+
+Needs Redis for the embeddings cache and either an OpenAI key or the local
+sentence-transformers model configured in the environment.
+
+Usage:
+    python scripts/benchmarks/benchmark_vectorizer_registry.py
+    EMBEDDING_PROVIDER=local python scripts/benchmarks/benchmark_vectorizer_registry.py --queries 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from typing import Callable, List
+
+from pydantic import SecretStr
+
+from redis_sre_agent.core.config import settings
+from redis_sre_agent.core.redis import close_redis_connections
+from redis_sre_agent.core.vectorizer_helpers import (
+    Vectorizer,
+    clear_vectorizer_cache,
+    create_vectorizer,
+    get_cached_vectorizer,
+)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--redis-url",
+        default=settings.redis_url.get_secret_value(),
+        help="Redis URL for the embeddings cache (defaults to REDIS_URL).",
+    )
+    parser.add_argument("--queries", type=int, default=20, help="Embeddings per mode.")
+    return parser.parse_args()
+
+
+async def _measure(get: Callable[[], Vectorizer], queries: int) -> List[float]:
+    """Return per-query latency, including vectorizer lookup/construction."""
+    run_id = uuid.uuid4().hex[:8]
+    latencies: List[float] = []
+    for i in range(queries):
+        started = time.perf_counter()
+        vectorizer = await asyncio.to_thread(get)
+        await vectorizer.aembed(f"redis memory fragmentation after failover {run_id} {i}")
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+async def _run(args: argparse.Namespace) -> None:
+    settings.redis_url = SecretStr(args.redis_url)
+    clear_vectorizer_cache()
+    results = {}
+    try:
+        results["uncached"] = await _measure(create_vectorizer, args.queries)
+        results["registry"] = await _measure(get_cached_vectorizer, args.queries)
+    finally:
+        clear_vectorizer_cache()
+        await close_redis_connections()
+
+    print(
+        f"provider={settings.embedding_provider} model={settings.embedding_model} "
+        f"queries={args.queries}"
+    )
+    print(f"{'mode':<10} {'first ms':>10} {'steady p50 ms':>14} {'steady mean ms':>15}")
+    for mode, latencies in results.items():
+        steady = latencies[1:] or latencies
+        print(
+            f"{mode:<10} {latencies[0] * 1000:>10.1f} "
+            f"{statistics.median(steady) * 1000:>14.1f} {statistics.mean(steady) * 1000:>15.1f}"
+        )
+
+
+def main() -> None:
+    asyncio.run(_run(_parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Load test the multiplexed task stream fan-out with simulated WebSockets.
+
+Opens ``--sockets`` simulated WebSocket clients spread across ``--threads``
+task threads, subscribes them through ``TaskStreamManager``, publishes
+``--updates`` progress events per thread and a final ``turn_complete``, then
+reports XREAD calls, delivery latency percentiles and dropped updates.
+
+A fraction of sockets (``--slow-fraction``) sleeps ``--slow-ms`` per send to
+show that slow clients only grow their own bounded queue.
+
+Usage:
+    python scripts/benchmarks/benchmark_websocket_fanout.py --redis-url redis://localhost:6379/0
+    python scripts/benchmarks/benchmark_websocket_fanout.py --sockets 1000 --threads 50 --updates 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import List
+
+from pydantic import SecretStr
+
+from redis_sre_agent.api.websockets import TaskStreamManager
+from redis_sre_agent.core.config import settings
+from redis_sre_agent.core.keys import RedisKeys
+from redis_sre_agent.core.redis import close_redis_connections, get_redis_client
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--redis-url",
+        default=settings.redis_url.get_secret_value(),
+        help="Redis URL to benchmark against (defaults to REDIS_URL).",
+    )
+    parser.add_argument("--sockets", type=int, default=1000, help="Simulated WebSockets.")
+    parser.add_argument("--threads", type=int, default=50, help="Watched task threads.")
+    parser.add_argument("--updates", type=int, default=100, help="Progress updates per thread.")
+    parser.add_argument("--slow-fraction", type=float, default=0.02)
+    parser.add_argument("--slow-ms", type=float, default=50.0)
+    parser.add_argument("--queue-size", type=int, default=100)
+    return parser.parse_args()
+
+
+class _SimulatedWebSocket:
+    def __init__(self, send_delay: float = 0.0) -> None:
+        self.send_delay = send_delay
+        self.latencies: List[float] = []
+        self.completed = asyncio.Event()
+        self.closed = False
+
+    async def send_text(self, message: str) -> None:
+        if self.send_delay:
+            await asyncio.sleep(self.send_delay)
+        event = json.loads(message)
+        sent_at = event.get("sent_at")
+        if sent_at is not None:
+            self.latencies.append(time.perf_counter() - float(sent_at))
+        if event.get("update_type") == "turn_complete":
+            self.completed.set()
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed = True
+        self.completed.set()
+
+
+async def _run(args: argparse.Namespace) -> None:
+    settings.redis_url = SecretStr(args.redis_url)
+    manager = TaskStreamManager(max_client_queue_size=args.queue_size)
+    client = await manager._get_client()
+
+    xread_calls = 0
+    original_xread = client.xread
+
+    async def _counting_xread(*a, **kw):
+        nonlocal xread_calls
+        xread_calls += 1
+        return await original_xread(*a, **kw)
+
+    client.xread = _counting_xread
+
+    thread_ids = [f"bench-ws-{i}" for i in range(args.threads)]
+    slow_every = int(1 / args.slow_fraction) if args.slow_fraction > 0 else 0
+    sockets = []
+    subscribers = []
+    for n in range(args.sockets):
+        delay = args.slow_ms / 1000 if slow_every and n % slow_every == 0 else 0.0
+        websocket = _SimulatedWebSocket(send_delay=delay)
+        thread_id = thread_ids[n % len(thread_ids)]
+        subscriber = await manager.subscribe(thread_id, websocket)
+        subscriber.start()
+        sockets.append((thread_id, websocket))
+        subscribers.append(subscriber)
+
+    # Let the reader pick up every stream key before publishing
+    await asyncio.sleep(manager.read_block_ms / 1000 + 0.1)
+
+    started = time.perf_counter()
+    for n in range(args.updates):
+        await asyncio.gather(
+            *(
+                manager.publish_task_update(
+                    thread_id, "progress", {"message": f"step {n}", "sent_at": time.perf_counter()}
+                )
+                for thread_id in thread_ids
+            )
+        )
+    await asyncio.gather(*(manager.publish_task_update(t, "turn_complete", {}) for t in thread_ids))
+    await asyncio.wait_for(asyncio.gather(*(ws.completed.wait() for _, ws in sockets)), timeout=120)
+    elapsed = time.perf_counter() - started
+
+    for thread_id, websocket in sockets:
+        await manager.unsubscribe(thread_id, websocket)
+    redis = get_redis_client()
+    await redis.delete(*(RedisKeys.task_stream(t) for t in thread_ids))
+    await close_redis_connections()
+
+    latencies = sorted(lat for _, ws in sockets for lat in ws.latencies)
+    delivered = len(latencies)
+    dropped = sum(s.dropped for s in subscribers)
+    closed = sum(1 for _, ws in sockets if ws.closed)
+
+    def _pct(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+    print(
+        f"{args.sockets} sockets, {args.threads} threads, "
+        f"{args.updates * args.threads} progress events published in {elapsed:.2f}s"
+    )
+    print(f"XREAD calls:          {xread_calls}")
+    print(f"progress delivered:   {delivered}")
+    print(f"progress dropped:     {dropped}")
+    print(f"slow clients closed:  {closed}")
+    if latencies:
+        print(
+            f"latency ms p50/p95/p99/max: {statistics.median(latencies) * 1000:.1f} / "
+            f"{_pct(0.95):.1f} / {_pct(0.99):.1f} / {latencies[-1] * 1000:.1f}"
+        )
+
+
+def main() -> None:
+    asyncio.run(_run(_parse_args()))
+
+
+if __name__ == "__main__":
+    main()
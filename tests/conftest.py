@@ -63,6 +63,36 @@ def mock_redis_infrastructure():
         yield
 
 
+@pytest.fixture(autouse=True)
+def reset_vectorizer_cache():
+    """Keep process-wide vectorizer instances (often mocks) from leaking between tests."""
+    from redis_sre_agent.core.vectorizer_helpers import clear_vectorizer_cache
+
+    clear_vectorizer_cache()
+    yield
+    clear_vectorizer_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_instance_registry():
+    """Keep the process-local instance registry from leaking between tests."""
+    from redis_sre_agent.core.instances import clear_instance_registry
+
+    clear_instance_registry()
+    yield
+    clear_instance_registry()
+
+
+@pytest.fixture(autouse=True)
+def reset_cluster_snapshots():
+    """Keep memoized Redis Enterprise admin API responses from leaking between tests."""
+    from redis_sre_agent.tools.admin.redis_enterprise.snapshot import clear_cluster_snapshots
+
+    clear_cluster_snapshots()
+    yield
+    clear_cluster_snapshots()
+
+
 # Load environment variables from .env file
 try:
     from dotenv import load_dotenv
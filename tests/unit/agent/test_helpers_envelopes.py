@@ -33,6 +33,20 @@ def test_build_result_envelope_parses_json_content():
     assert env["data"] == {"alpha": 1}
 
 
+def test_build_result_envelope_merges_envelope_only_artifact():
+    tool_name = "prometheus_query_range"
+    msg = ToolMessage(
+        content='{"status": "success", "series": []}',
+        tool_call_id="abc",
+        artifact={"data": [{"metric": {}, "values": [[1, "2"]]}]},
+    )
+
+    env = build_result_envelope(tool_name, {}, msg, {})
+
+    assert env["data"]["series"] == []
+    assert env["data"]["data"] == [{"metric": {}, "values": [[1, "2"]]}]
+
+
 def test_build_result_envelope_fallbacks_to_raw():
     tool_name = "knowledge.kb.search"
     tool_args = {"q": "redis cluster"}
@@ -158,3 +158,27 @@ async def test_execute_tool_calls_with_gate_preserves_order_with_local_and_manag
             }
         ]
     )
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_calls_with_gate_keeps_envelope_only_off_message_content():
+    tool_manager = SimpleNamespace(
+        execute_tool_calls=AsyncMock(
+            return_value=[
+                {
+                    "status": "success",
+                    "series": [{"metric": {}, "mean": 1.0}],
+                    "envelope_only": {"data": [{"metric": {}, "values": [[1, "1"]]}]},
+                }
+            ]
+        ),
+    )
+
+    tool_messages = await execute_tool_calls_with_gate(
+        tool_manager=tool_manager,
+        tool_calls=[{"id": "tool-call-1", "name": "prometheus_query_range", "args": {}}],
+    )
+
+    assert "envelope_only" not in tool_messages[0].content
+    assert '"series"' in tool_messages[0].content
+    assert tool_messages[0].artifact == {"data": [{"metric": {}, "values": [[1, "1"]]}]}
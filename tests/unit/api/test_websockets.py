@@ -1,6 +1,8 @@
 """Tests for WebSocket task status functionality."""
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -97,28 +99,88 @@ class TestTaskStreamManager:
     async def test_start_stop_consumer(self, stream_manager):
         """Test starting and stopping stream consumers."""
         thread_id = "test_thread"
+        mock_redis = AsyncMock(spec=Redis)
+        mock_redis.xrevrange = AsyncMock(return_value=[(b"5-0", {})])
 
-        # Mock the consume method to avoid actual Redis operations
-        with patch.object(stream_manager, "_consume_stream", new_callable=AsyncMock):
-            # Start consumer
+        # Mock the read loop to avoid actual Redis operations
+        with (
+            patch.object(
+                stream_manager, "_get_client", new_callable=AsyncMock, return_value=mock_redis
+            ),
+            patch.object(stream_manager, "_consume_streams", new_callable=AsyncMock),
+        ):
+            # Start consumer from the current end of the stream
             await stream_manager.start_consumer(thread_id)
-            assert thread_id in stream_manager._consumer_tasks
+            assert stream_manager.is_consuming(thread_id)
+            assert stream_manager._last_ids[thread_id] == "5-0"
+            reader = stream_manager._reader_task
 
-            # Starting again should not create duplicate
-            await stream_manager.start_consumer(thread_id)
-            assert (
-                len([t for t in stream_manager._consumer_tasks.values() if not t.cancelled()]) == 1
-            )
+            # A second thread shares the same reader task
+            await stream_manager.start_consumer("other_thread")
+            assert stream_manager._reader_task is reader
+            mock_redis.xrevrange.assert_awaited()
 
-            # Stop consumer
+            # Stop consumers; the reader stops with the last one
             await stream_manager.stop_consumer(thread_id)
-            assert thread_id not in stream_manager._consumer_tasks
+            assert not stream_manager.is_consuming(thread_id)
+            assert stream_manager._reader_task is reader
+            await stream_manager.stop_consumer("other_thread")
+            assert stream_manager._reader_task is None
+
+    @pytest.mark.asyncio
+    async def test_consume_streams_uses_one_xread_for_all_threads(self, stream_manager):
+        """One XREAD covers every watched stream and updates are routed per thread."""
+        from redis_sre_agent.core.keys import RedisKeys
+
+        calls = []
+
+        async def xread(streams, count, block):
+            calls.append(dict(streams))
+            if len(calls) == 1:
+                return [
+                    (
+                        RedisKeys.task_stream("t1").encode(),
+                        [(b"2-0", {b"thread_id": b"t1", b"update_type": b"progress"})],
+                    ),
+                    (
+                        RedisKeys.task_stream("t2").encode(),
+                        [(b"3-0", {b"thread_id": b"t2", b"update_type": b"turn_complete"})],
+                    ),
+                ]
+            await asyncio.sleep(3600)
+
+        mock_redis = AsyncMock(spec=Redis)
+        mock_redis.xrevrange = AsyncMock(return_value=[])
+        mock_redis.xread = AsyncMock(side_effect=xread)
+        ws1, ws2 = AsyncMock(), AsyncMock()
+
+        with patch.object(
+            stream_manager, "_get_client", new_callable=AsyncMock, return_value=mock_redis
+        ):
+            sub1 = await stream_manager.subscribe("t1", ws1)
+            sub2 = await stream_manager.subscribe("t2", ws2)
+            for _ in range(20):
+                if len(calls) >= 2:
+                    break
+                await asyncio.sleep(0)
+
+            assert calls[0] == {
+                RedisKeys.task_stream("t1"): "0-0",
+                RedisKeys.task_stream("t2"): "0-0",
+            }
+            assert calls[1] == {
+                RedisKeys.task_stream("t1"): "2-0",
+                RedisKeys.task_stream("t2"): "3-0",
+            }
+            assert sub1.pending == 1 and sub2.pending == 1
+
+            await stream_manager.unsubscribe("t1", ws1)
+            await stream_manager.unsubscribe("t2", ws2)
+            assert stream_manager._reader_task is None
 
     @pytest.mark.asyncio
     async def test_broadcast_update(self, stream_manager):
         """Test broadcasting updates to WebSocket clients."""
-        from redis_sre_agent.api.websockets import _active_connections
-
         thread_id = "test_thread"
 
         # Mock WebSocket connections
@@ -127,7 +189,13 @@ class TestTaskStreamManager:
         mock_ws_failed = AsyncMock()
         mock_ws_failed.send_text.side_effect = Exception("Connection failed")
 
-        _active_connections[thread_id] = {mock_ws1, mock_ws2, mock_ws_failed}
+        with patch.object(stream_manager, "start_consumer", new_callable=AsyncMock):
+            subscribers = [
+                await stream_manager.subscribe(thread_id, ws)
+                for ws in (mock_ws1, mock_ws2, mock_ws_failed)
+            ]
+        for subscriber in subscribers:
+            subscriber.start()
 
         # Test broadcast
         fields = {
@@ -136,18 +204,83 @@ class TestTaskStreamManager:
             b"message": b"Task started",
         }
 
-        await stream_manager._broadcast_update(thread_id, fields)
+        stream_manager._broadcast_update(thread_id, fields)
+        for _ in range(5):
+            await asyncio.sleep(0)
 
         # Verify successful connections received the message
         mock_ws1.send_text.assert_called_once()
         mock_ws2.send_text.assert_called_once()
+        assert json.loads(mock_ws1.send_text.call_args.args[0])["status"] == "running"
 
         # Verify failed connection was removed
-        assert mock_ws_failed not in _active_connections[thread_id]
-        assert len(_active_connections[thread_id]) == 2
+        assert stream_manager.connection_count(thread_id) == 2
 
         # Clean up
-        del _active_connections[thread_id]
+        with patch.object(stream_manager, "stop_consumer", new_callable=AsyncMock):
+            for ws in (mock_ws1, mock_ws2, mock_ws_failed):
+                await stream_manager.unsubscribe(thread_id, ws)
+        assert stream_manager.connection_count(thread_id) == 0
+
+    @pytest.mark.asyncio
+    async def test_fan_out_to_many_sockets_with_slow_clients(self, stream_manager):
+        """1,000 sockets on one thread; slow sockets do not delay fast ones."""
+        stream_manager.max_client_queue_size = 5
+        release_slow = asyncio.Event()
+
+        async def slow_send(message):
+            await release_slow.wait()
+
+        fast = [AsyncMock() for _ in range(990)]
+        slow = [AsyncMock() for _ in range(10)]
+        for ws in slow:
+            ws.send_text.side_effect = slow_send
+
+        with patch.object(stream_manager, "start_consumer", new_callable=AsyncMock):
+            subscribers = [await stream_manager.subscribe("t1", ws) for ws in fast + slow]
+        for subscriber in subscribers:
+            subscriber.start()
+
+        for n in range(20):
+            stream_manager._broadcast_update(
+                "t1", {b"update_type": b"progress", b"message": f"step {n}".encode()}
+            )
+            await asyncio.sleep(0)
+        stream_manager._broadcast_update("t1", {b"update_type": b"turn_complete"})
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert all(ws.send_text.await_count == 21 for ws in fast)
+        slow_subscribers = subscribers[-10:]
+        # Old progress updates were dropped, but the terminal event is still queued
+        assert all(s.pending <= 5 and s.dropped > 0 for s in slow_subscribers)
+        assert all('"turn_complete"' in s._messages[-1][1] for s in slow_subscribers)
+
+        release_slow.set()
+        with patch.object(stream_manager, "stop_consumer", new_callable=AsyncMock):
+            for ws in fast + slow:
+                await stream_manager.unsubscribe("t1", ws)
+
+    @pytest.mark.asyncio
+    async def test_subscriber_closes_when_nothing_can_be_dropped(self):
+        """A client whose queue is full of state changes is asked to reconnect."""
+        from redis_sre_agent.api.websockets import TaskStreamSubscriber
+
+        websocket = AsyncMock()
+        closed = []
+        subscriber = TaskStreamSubscriber(websocket, 2, on_closed=closed.append)
+
+        assert subscriber.put("turn_complete", "a")
+        assert subscriber.put("awaiting_approval", "b")
+        assert not subscriber.put("turn_complete", "c")
+
+        subscriber.start()
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        websocket.close.assert_awaited_once_with(code=1013)
+        websocket.send_text.assert_not_awaited()
+        assert closed == [subscriber]
 
 
 class TestWebSocketEndpoint:
@@ -180,11 +313,6 @@ class TestWebSocketEndpoint:
     @pytest.mark.asyncio
     async def test_websocket_connection_success(self, test_client):
         """Test successful WebSocket connection."""
-        # Clear global state
-        from redis_sre_agent.api.websockets import _active_connections
-
-        _active_connections.clear()
-
         thread_id = "test_thread"
 
         # Mock thread state
@@ -206,8 +334,9 @@ class TestWebSocketEndpoint:
             mock_manager_class.return_value = mock_manager
             mock_manager.get_thread.return_value = mock_thread_state
 
-            mock_stream_manager.start_consumer = AsyncMock()
-            mock_stream_manager.stop_consumer = AsyncMock()
+            mock_subscriber = MagicMock()
+            mock_stream_manager.subscribe = AsyncMock(return_value=mock_subscriber)
+            mock_stream_manager.unsubscribe = AsyncMock()
 
             with test_client.websocket_connect(f"/api/v1/ws/tasks/{thread_id}") as websocket:
                 # Should receive initial state
@@ -218,8 +347,10 @@ class TestWebSocketEndpoint:
                 # With no task, updates should be empty
                 assert data["updates"] == []
 
-                # Verify stream consumer was started
-                mock_stream_manager.start_consumer.assert_called_once_with(thread_id)
+                # Verify the client subscribed and delivery started after initial state
+                mock_stream_manager.subscribe.assert_awaited_once()
+                assert mock_stream_manager.subscribe.await_args.args[0] == thread_id
+                mock_subscriber.start.assert_called_once()
 
                 # Test ping/pong
                 websocket.send_json({"type": "ping"})
@@ -304,3 +304,27 @@ class TestIndexSyncSchemasCLI:
 
         output_data = json.loads(result.output)
         assert output_data["indices"]["skills"]["action"] == "recreated"
+
+
+class TestIndexBackfillChunkRegistryCLI:
+    """Test index backfill-chunk-registry CLI command."""
+
+    def test_backfill_chunk_registry_reports_counts(self, cli_runner):
+        from redis_sre_agent.core.migrations.chunk_registry import ChunkRegistryBackfillSummary
+
+        summary = ChunkRegistryBackfillSummary(
+            indices={"sre_knowledge": {"documents": 2, "chunks": 5}},
+            skipped_ready=["sre_skills"],
+        )
+
+        with patch(
+            "redis_sre_agent.core.migrations.chunk_registry.run_chunk_registry_backfill",
+            new_callable=AsyncMock,
+            return_value=summary,
+        ) as mock_backfill:
+            result = cli_runner.invoke(index, ["backfill-chunk-registry", "--force"])
+
+        assert result.exit_code == 0
+        mock_backfill.assert_awaited_once_with(force=True, source="cli")
+        assert "sre_knowledge: 5 chunks across 2 documents" in result.output
+        assert "sre_skills: already backfilled" in result.output
@@ -74,6 +74,7 @@ class TestWorkerStartCommand:
         mock_settings = MagicMock()
         mock_settings.redis_url.get_secret_value.return_value = "redis://localhost:6379"
         mock_settings.task_timeout = 30
+        mock_settings.embedding_prewarm = False
 
         caplog.set_level("ERROR", logger="redis_sre_agent.cli.worker")
 
@@ -82,6 +83,10 @@ class TestWorkerStartCommand:
             patch("redis_sre_agent.cli.worker.setup_tracing"),
             patch("prometheus_client.start_http_server"),
             patch("redis_sre_agent.core.redis.create_indices", AsyncMock(return_value=True)),
+            patch(
+                "redis_sre_agent.core.migrations.chunk_registry.run_chunk_registry_backfill",
+                AsyncMock(return_value=MagicMock()),
+            ),
             patch(
                 "redis_sre_agent.knowledge_pack.loader.auto_load_configured_knowledge_pack",
                 AsyncMock(side_effect=RuntimeError("pack boom")),
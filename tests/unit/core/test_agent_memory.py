@@ -1,5 +1,6 @@
 """Unit tests for Redis Agent Memory Server integration helpers."""
 
+import asyncio
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -8,6 +9,7 @@ import pytest
 from redis_sre_agent.core.agent_memory import (
     AgentMemoryService,
     TurnMemoryContext,
+    clear_asset_search_cache,
     prepare_agent_turn_memory,
 )
 from redis_sre_agent.core.turn_scope import TurnScope
@@ -40,6 +42,17 @@ def memory_settings(monkeypatch):
         "redis_sre_agent.core.agent_memory.settings.agent_memory_recent_message_limit",
         8,
     )
+    monkeypatch.setattr(
+        "redis_sre_agent.core.agent_memory.settings.agent_memory_turn_deadline_seconds",
+        5.0,
+    )
+    monkeypatch.setattr(
+        "redis_sre_agent.core.agent_memory.settings.agent_memory_asset_search_cache_ttl_seconds",
+        60.0,
+    )
+    clear_asset_search_cache()
+    yield
+    clear_asset_search_cache()
 
 
 class TestPrepareTurnContext:
@@ -181,6 +194,85 @@ class TestPrepareTurnContext:
         assert mock_client.get_or_create_working_memory.await_count == 1
         assert mock_client.search_long_term_memory.await_count == 1
 
+    @pytest.mark.asyncio
+    async def test_slow_retrieval_degrades_to_partial_context(self, memory_settings, monkeypatch):
+        monkeypatch.setattr(
+            "redis_sre_agent.core.agent_memory.settings.agent_memory_turn_deadline_seconds",
+            0.05,
+        )
+
+        async def _search(**kwargs):
+            if kwargs.get("entities") is not None:
+                await asyncio.sleep(10)
+            return SimpleNamespace(memories=[SimpleNamespace(text="User prefers tables")])
+
+        mock_client = AsyncMock()
+        mock_client.get_or_create_working_memory = AsyncMock(
+            return_value=(False, SimpleNamespace(context=None))
+        )
+        mock_client.search_long_term_memory = AsyncMock(side_effect=_search)
+        mock_client.__aenter__.return_value = mock_client
+        mock_client.__aexit__.return_value = None
+        mock_emitter = AsyncMock()
+
+        with patch("redis_sre_agent.core.agent_memory.MemoryAPIClient", return_value=mock_client):
+            result = await AgentMemoryService().prepare_turn_context(
+                query="Why is latency high?",
+                session_id="session-1",
+                user_id="user-1",
+                instance_id="instance-1",
+                emitter=SimpleNamespace(emit=mock_emitter),
+            )
+
+        assert result.status == "partial"
+        assert result.long_term_count == 1
+        assert "User prefers tables" in (result.system_prompt or "")
+        assert result.asset_working_memory is not None
+        metadata = mock_emitter.await_args.args[2]
+        assert metadata["status"] == "partial"
+        assert metadata["timed_out"] == ["asset_long_term"]
+        assert set(metadata["timings_ms"]) == {
+            "user_working_memory",
+            "user_long_term",
+            "asset_working_memory",
+            "asset_long_term",
+            "total",
+        }
+
+    @pytest.mark.asyncio
+    async def test_asset_long_term_results_are_cached_per_asset_and_query(self, memory_settings):
+        mock_client = AsyncMock()
+        mock_client.get_or_create_working_memory = AsyncMock(
+            return_value=(False, SimpleNamespace(context=None))
+        )
+        mock_client.search_long_term_memory = AsyncMock(
+            return_value=SimpleNamespace(
+                memories=[SimpleNamespace(text="Instance hit OOM last week")]
+            )
+        )
+        mock_client.__aenter__.return_value = mock_client
+        mock_client.__aexit__.return_value = None
+        mock_emitter = AsyncMock()
+
+        async def _turn(query: str, instance_id: str = "instance-1") -> TurnMemoryContext:
+            return await AgentMemoryService().prepare_turn_context(
+                query=query,
+                session_id="session-1",
+                user_id=None,
+                instance_id=instance_id,
+                emitter=SimpleNamespace(emit=mock_emitter),
+            )
+
+        with patch("redis_sre_agent.core.agent_memory.MemoryAPIClient", return_value=mock_client):
+            first = await _turn("Scheduled health check at 2025-11-24T10:00:00Z")
+            second = await _turn("Scheduled health check at 2025-11-24T10:05:00Z")
+            await _turn("Scheduled health check", instance_id="instance-2")
+
+        assert "Instance hit OOM last week" in (first.system_prompt or "")
+        assert second.system_prompt == first.system_prompt
+        assert mock_client.search_long_term_memory.await_count == 2
+        assert mock_emitter.await_args_list[1].args[2]["asset_long_term_cached"] is True
+
 
 class TestPersistTurn:
     @pytest.mark.asyncio
@@ -0,0 +1,92 @@
+"""Unit tests for the per-document chunk registry backfill migration."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from redis_sre_agent.core.migrations.chunk_registry import (
+    MIGRATION_LOCK_KEY,
+    run_chunk_registry_backfill,
+)
+
+
+def _deduplicator(prefix: str, *, ready: bool, counts=None, error=None) -> Mock:
+    deduplicator = Mock(key_prefix=prefix)
+    deduplicator.is_chunk_registry_ready = AsyncMock(return_value=ready)
+    deduplicator.backfill_chunk_registry = AsyncMock(return_value=counts, side_effect=error)
+    return deduplicator
+
+
+@pytest.mark.asyncio
+async def test_backfill_skips_ready_indices_and_records_errors():
+    mock_client = AsyncMock()
+    mock_client.set = AsyncMock(return_value=True)
+    mock_client.eval = AsyncMock(return_value=1)
+    deduplicators = [
+        _deduplicator("sre_knowledge", ready=False, counts={"documents": 2, "chunks": 5}),
+        _deduplicator("sre_skills", ready=True),
+        _deduplicator("sre_support_tickets", ready=False, error=RuntimeError("boom")),
+    ]
+
+    with (
+        patch(
+            "redis_sre_agent.core.migrations.chunk_registry.get_redis_client",
+            return_value=mock_client,
+        ),
+        patch(
+            "redis_sre_agent.core.migrations.chunk_registry._build_deduplicators",
+            AsyncMock(return_value=deduplicators),
+        ),
+    ):
+        summary = await run_chunk_registry_backfill(source="test", batch_size=50)
+
+    assert summary.indices == {"sre_knowledge": {"documents": 2, "chunks": 5}}
+    assert summary.skipped_ready == ["sre_skills"]
+    assert summary.errors == ["sre_support_tickets: boom"]
+    deduplicators[0].backfill_chunk_registry.assert_awaited_once_with(batch_size=50)
+    deduplicators[1].backfill_chunk_registry.assert_not_awaited()
+    assert mock_client.set.await_args.args[0] == MIGRATION_LOCK_KEY
+    mock_client.eval.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_backfill_force_rebuilds_ready_indices():
+    mock_client = AsyncMock()
+    mock_client.set = AsyncMock(return_value=True)
+    deduplicator = _deduplicator("sre_knowledge", ready=True, counts={"documents": 1, "chunks": 1})
+
+    with (
+        patch(
+            "redis_sre_agent.core.migrations.chunk_registry.get_redis_client",
+            return_value=mock_client,
+        ),
+        patch(
+            "redis_sre_agent.core.migrations.chunk_registry._build_deduplicators",
+            AsyncMock(return_value=[deduplicator]),
+        ),
+    ):
+        summary = await run_chunk_registry_backfill(force=True)
+
+    assert summary.indices == {"sre_knowledge": {"documents": 1, "chunks": 1}}
+    deduplicator.is_chunk_registry_ready.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_backfill_skips_when_lock_is_held():
+    mock_client = AsyncMock()
+    mock_client.set = AsyncMock(return_value=None)
+    build = AsyncMock()
+
+    with (
+        patch(
+            "redis_sre_agent.core.migrations.chunk_registry.get_redis_client",
+            return_value=mock_client,
+        ),
+        patch("redis_sre_agent.core.migrations.chunk_registry._build_deduplicators", build),
+    ):
+        summary = await run_chunk_registry_backfill()
+
+    assert summary.skipped_due_lock is True
+    assert summary.finished_at
+    build.assert_not_awaited()
+    mock_client.eval.assert_not_awaited()
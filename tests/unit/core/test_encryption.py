@@ -5,8 +5,11 @@ import os
 from unittest.mock import patch
 
 import pytest
+from pydantic import SecretStr
 
+from redis_sre_agent.core import encryption
 from redis_sre_agent.core.encryption import (
+    EncryptedSecretStr,
     EncryptionError,
     decrypt_secret,
     encrypt_secret,
@@ -189,3 +192,40 @@ class TestEncryption:
             assert isinstance(envelope[field], str)
             # Should be valid base64
             base64.b64decode(envelope[field])
+
+
+class TestEncryptedSecretStr:
+    """Test lazily decrypted secrets."""
+
+    def test_decrypts_once_on_first_use(self, master_key):
+        """Construction, repr and truthiness do not decrypt; the plaintext is cached."""
+        stored = encrypt_secret("s3cret")
+        secret = EncryptedSecretStr(stored)
+
+        with patch.object(encryption, "decrypt_secret", wraps=encryption.decrypt_secret) as decrypt:
+            assert bool(secret)
+            assert str(secret) == "**********"
+            assert not secret.is_decrypted
+            assert decrypt.call_count == 0
+
+            assert secret.get_secret_value() == "s3cret"
+            assert secret.get_secret_value() == "s3cret"
+            assert decrypt.call_count == 1
+
+        assert secret.is_decrypted
+        assert secret.stored_value == stored
+
+    def test_plaintext_stored_value_passes_through(self):
+        """Legacy plaintext values are returned unchanged."""
+        assert EncryptedSecretStr("redis://localhost:6379").get_secret_value() == (
+            "redis://localhost:6379"
+        )
+        assert not EncryptedSecretStr("")
+
+    def test_equals_secret_str_with_same_value(self, master_key):
+        """Equality compares plaintext values against any SecretStr."""
+        secret = EncryptedSecretStr(encrypt_secret("value"))
+
+        assert secret == SecretStr("value")
+        assert secret != SecretStr("other")
+        assert hash(secret) == hash("value")
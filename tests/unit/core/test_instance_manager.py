@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from pydantic import SecretStr
 
+from redis_sre_agent.core.encryption import EncryptedSecretStr
 from redis_sre_agent.core.instances import (
     InstanceQueryResult,
     RedisInstance,
@@ -485,6 +486,126 @@ class TestGetInstances:
             assert instances == []
 
 
+class TestInstanceRegistry:
+    """Test the generation-versioned process-local instance registry."""
+
+    @staticmethod
+    def _patches(mock_index, mock_redis):
+        return (
+            patch(
+                "redis_sre_agent.core.instances.get_instances_index",
+                new_callable=AsyncMock,
+                return_value=mock_index,
+            ),
+            patch(
+                "redis_sre_agent.core.instances._ensure_instances_index_exists",
+                new_callable=AsyncMock,
+            ),
+            patch("redis_sre_agent.core.instances.get_redis_client", return_value=mock_redis),
+        )
+
+    @staticmethod
+    def _mock_index():
+        inst_data = {
+            "id": "redis-1",
+            "name": "Test",
+            "connection_url": "redis://localhost:6379",
+            "admin_url": "https://cluster:9443",
+            "admin_username": "admin",
+            "admin_password": "pw",
+            "environment": "dev",
+            "usage": "cache",
+            "description": "Test",
+            "instance_type": "redis_enterprise",
+        }
+        mock_index = AsyncMock()
+        mock_index.exists = AsyncMock(return_value=True)
+        mock_index.query = AsyncMock(return_value=[{"data": json.dumps(inst_data)}])
+        return mock_index
+
+    @pytest.mark.asyncio
+    async def test_serves_registry_until_generation_changes(self):
+        """Repeated reads reuse the registry; a new generation reloads it."""
+        mock_index = self._mock_index()
+        mock_redis = AsyncMock()
+        mock_redis.get = AsyncMock(return_value=b"1")
+
+        p1, p2, p3 = self._patches(mock_index, mock_redis)
+        with p1, p2, p3:
+            first = await get_instances()
+            assert await get_instance_map() == {"redis-1": first[0]}
+            assert (await get_instance_by_id("redis-1")) is first[0]
+            # One load is a count query plus a fetch.
+            assert mock_index.query.await_count == 2
+            mock_redis.hget.assert_not_called()
+
+            mock_redis.get = AsyncMock(return_value=b"2")
+            reloaded = await get_instances()
+            assert mock_index.query.await_count == 4
+            assert reloaded[0] is not first[0]
+
+    @pytest.mark.asyncio
+    async def test_unreadable_generation_always_reloads(self):
+        """Without a readable generation the registry is never trusted."""
+        mock_index = self._mock_index()
+        mock_redis = AsyncMock()
+        mock_redis.get = AsyncMock(side_effect=Exception("Redis down"))
+
+        p1, p2, p3 = self._patches(mock_index, mock_redis)
+        with p1, p2, p3:
+            await get_instances()
+            await get_instances()
+            assert mock_index.query.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_loaded_secrets_are_decrypted_lazily(self):
+        """Loading instances does not decrypt secrets until they are used."""
+        mock_index = self._mock_index()
+        mock_redis = AsyncMock()
+        mock_redis.get = AsyncMock(return_value=None)
+
+        p1, p2, p3 = self._patches(mock_index, mock_redis)
+        with p1, p2, p3:
+            [instance] = await get_instances()
+
+        assert isinstance(instance.connection_url, EncryptedSecretStr)
+        assert isinstance(instance.admin_password, EncryptedSecretStr)
+        assert not instance.connection_url.is_decrypted
+        assert not instance.admin_password.is_decrypted
+        assert instance.connection_url.get_secret_value() == "redis://localhost:6379"
+        assert not instance.admin_password.is_decrypted
+
+    @pytest.mark.asyncio
+    async def test_upsert_keeps_stored_secret_envelope(self):
+        """Re-saving a loaded instance writes the stored secret without re-encrypting."""
+        instance = RedisInstance(
+            id="redis-1",
+            name="Test",
+            connection_url=EncryptedSecretStr("ENVELOPE"),
+            environment="dev",
+            usage="cache",
+            description="Test",
+            instance_type=RedisInstanceType.oss_single,
+        )
+        mock_redis = AsyncMock()
+
+        with (
+            patch("redis_sre_agent.core.instances.get_redis_client", return_value=mock_redis),
+            patch(
+                "redis_sre_agent.core.instances._ensure_instances_index_exists",
+                new_callable=AsyncMock,
+            ),
+            patch("redis_sre_agent.core.instances.is_encrypted", return_value=True),
+            patch("redis_sre_agent.core.instances.encrypt_secret") as encrypt,
+        ):
+            assert await _upsert_instance_index_doc(instance) is True
+
+        encrypt.assert_not_called()
+        mapping = mock_redis.hset.await_args.kwargs["mapping"]
+        assert json.loads(mapping["data"])["connection_url"] == "ENVELOPE"
+        assert not instance.connection_url.is_decrypted
+
+
 class TestQueryInstances:
     """Test query_instances function."""
 
@@ -687,6 +808,7 @@ class TestDeleteInstanceIndexDoc:
         with patch("redis_sre_agent.core.instances.get_redis_client", return_value=mock_redis):
             await delete_instance_index_doc("redis-1")
             mock_redis.delete.assert_called_once()
+            mock_redis.incr.assert_any_await("sre:instances:generation")
 
     @pytest.mark.asyncio
     async def test_delete_failure_silent(self):
@@ -1031,6 +1153,7 @@ class TestSaveInstances:
         ):
             result = await save_instances(instances)
             assert result is True
+            mock_redis.incr.assert_any_await("sre:instances:generation")
 
     @pytest.mark.asyncio
     async def test_save_instances_error(self):
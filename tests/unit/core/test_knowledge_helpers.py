@@ -1,5 +1,6 @@
 """Tests for knowledge helper functions."""
 
+import asyncio
 import hashlib
 import inspect
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -1371,6 +1372,80 @@ class TestSearchKnowledgeBaseHelper:
         assert result["results_count"] == 0
         assert mock_index.query.call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_search_knowledge_base_runs_prequeries_and_embedding_concurrently(self):
+        """Exact, phrase and embed+vector stages overlap and report their timings."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def _slow(result):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return result
+
+        async def _query(_query):
+            return await _slow([])
+
+        async def _embed(_texts):
+            return await _slow([[0.1, 0.2]])
+
+        mock_index = AsyncMock()
+        mock_index.query = AsyncMock(side_effect=_query)
+        mock_vectorizer = MagicMock()
+        mock_vectorizer.aembed_many = AsyncMock(side_effect=_embed)
+
+        with (
+            patch(
+                "redis_sre_agent.core.knowledge_helpers.get_knowledge_index",
+                new_callable=AsyncMock,
+                return_value=mock_index,
+            ),
+            patch(
+                "redis_sre_agent.core.knowledge_helpers.get_vectorizer",
+                return_value=mock_vectorizer,
+            ),
+            patch("redis_sre_agent.core.knowledge_helpers.HybridQuery"),
+        ):
+            result = await search_knowledge_base_helper(query="ret-4421", limit=5)
+
+        # The phrase query and the embedding start alongside the first exact query
+        assert max_in_flight >= 3
+        assert set(result["timings_ms"]) == {"exact", "phrase", "embed", "index", "total"}
+        assert result["timings_ms"]["total"] < (
+            result["timings_ms"]["exact"]
+            + result["timings_ms"]["phrase"]
+            + result["timings_ms"]["embed"]
+            + result["timings_ms"]["index"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_search_knowledge_base_semantic_only_timings(self):
+        """Natural-language queries skip the prequeries and only time embed/index."""
+        mock_index = AsyncMock()
+        mock_index.query = AsyncMock(return_value=[])
+        mock_vectorizer = MagicMock()
+        mock_vectorizer.aembed_many = AsyncMock(return_value=[[0.1, 0.2, 0.3]])
+
+        with (
+            patch(
+                "redis_sre_agent.core.knowledge_helpers.get_knowledge_index",
+                new_callable=AsyncMock,
+                return_value=mock_index,
+            ),
+            patch(
+                "redis_sre_agent.core.knowledge_helpers.get_vectorizer",
+                return_value=mock_vectorizer,
+            ),
+        ):
+            result = await search_knowledge_base_helper(
+                query="why is redis memory growing", limit=5
+            )
+
+        assert set(result["timings_ms"]) == {"embed", "index", "total"}
+
 
 class TestSearchKnowledgeBaseVersionHelpers:
     """Test helper functions used by search_knowledge_base_helper."""
@@ -1396,14 +1471,43 @@ class TestSearchKnowledgeBaseVersionHelpers:
         assert [doc["id"] for doc in deduped] == ["a", "b"]
 
 
+class _RecordingPipeline:
+    """Transaction pipeline stand-in that records queued chunk writes."""
+
+    def __init__(self):
+        self.hsets = []
+        self.sadds = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def hset(self, key, mapping):
+        self.hsets.append((key, mapping))
+
+    def sadd(self, key, *members):
+        self.sadds.append((key, members))
+
+    async def execute(self):
+        return []
+
+
+def _index_with_pipeline():
+    pipe = _RecordingPipeline()
+    index = MagicMock()
+    index.client.pipeline = MagicMock(return_value=pipe)
+    return index, pipe
+
+
 class TestIngestSreDocumentHelper:
     """Test ingest_sre_document_helper function."""
 
     @pytest.mark.asyncio
     async def test_ingest_document_success(self):
         """Test successful document ingestion."""
-        mock_index = AsyncMock()
-        mock_index.load = AsyncMock()
+        mock_index, pipe = _index_with_pipeline()
 
         mock_vectorizer = MagicMock()
         mock_vectorizer.aembed = AsyncMock(return_value=b"vector_bytes")
@@ -1441,22 +1545,74 @@ class TestIngestSreDocumentHelper:
         assert result["document_id"] == expected_key
         assert result["document_hash"] == expected_document_hash
         assert result["chunk_count"] == 1
-        mock_index.load.assert_called_once()
-        call_args = mock_index.load.call_args
-        doc_data = call_args.kwargs.get("data") or call_args[1].get("data")
-        keys = call_args.kwargs.get("keys") or call_args[1].get("keys")
+        keys = [key for key, _ in pipe.hsets]
+        doc_data = [mapping for _, mapping in pipe.hsets]
         assert keys == [expected_key]
+        assert pipe.sadds == [(f"sre_knowledge_chunks:{expected_document_hash}", (expected_key,))]
         assert doc_data[0]["id"] == expected_key
         assert doc_data[0]["document_hash"] == expected_document_hash
         assert doc_data[0]["content_hash"] == expected_content_hash
         assert doc_data[0]["chunk_index"] == 0
         assert doc_data[0]["version"] == "latest"
 
+    @pytest.mark.asyncio
+    async def test_ingested_chunk_is_deletable_after_registry_backfill(self):
+        """Ingested chunks are registered, so delete works once empty sets are trusted."""
+        from redis_sre_agent.pipelines.ingestion.deduplication import DocumentDeduplicator
+
+        store: dict = {}
+
+        async def _sadd(key, *members):
+            store.setdefault(key, set()).update(members)
+            return len(members)
+
+        async def _delete(*keys):
+            return sum(store.pop(key, None) is not None for key in keys)
+
+        client = MagicMock()
+        client.sadd = AsyncMock(side_effect=_sadd)
+        client.smembers = AsyncMock(side_effect=lambda key: set(store.get(key, set())))
+        client.exists = AsyncMock(side_effect=lambda key: int(key in store))
+        client.delete = AsyncMock(side_effect=_delete)
+        pipe = _RecordingPipeline()
+        client.pipeline = MagicMock(return_value=pipe)
+        mock_index = MagicMock(client=client)
+        mock_vectorizer = MagicMock()
+        mock_vectorizer.aembed = AsyncMock(return_value=b"vector_bytes")
+
+        deduplicator = DocumentDeduplicator(mock_index, key_prefix="sre_knowledge")
+        store[deduplicator.chunk_registry_ready_key] = "2026-01-01T00:00:00+00:00"
+        with (
+            patch(
+                "redis_sre_agent.core.knowledge_helpers.get_knowledge_index",
+                new_callable=AsyncMock,
+                return_value=mock_index,
+            ),
+            patch(
+                "redis_sre_agent.core.knowledge_helpers.get_vectorizer",
+                return_value=mock_vectorizer,
+            ),
+        ):
+            result = await ingest_sre_document_helper(
+                title="Test Document", content="This is test content", source="test"
+            )
+
+        for key, mapping in pipe.hsets:
+            store[key] = mapping
+        for key, members in pipe.sadds:
+            await _sadd(key, *members)
+
+        assert await deduplicator.find_existing_chunks(result["document_hash"]) == [
+            result["document_id"]
+        ]
+        assert await deduplicator.delete_existing_chunks(result["document_hash"]) == 1
+        assert result["document_id"] not in store
+        assert deduplicator.generate_chunk_registry_key(result["document_hash"]) not in store
+
     @pytest.mark.asyncio
     async def test_ingest_document_with_product_labels(self):
         """Test document ingestion with product labels."""
-        mock_index = AsyncMock()
-        mock_index.load = AsyncMock()
+        mock_index, pipe = _index_with_pipeline()
 
         mock_vectorizer = MagicMock()
         mock_vectorizer.aembed = AsyncMock(return_value=b"vector_bytes")
@@ -1484,8 +1640,7 @@ class TestIngestSreDocumentHelper:
         assert result["status"] == "ingested"
         assert result["doc_type"] == "skill"
         # Verify the document was loaded with product labels
-        call_args = mock_index.load.call_args
-        doc_data = call_args.kwargs.get("data") or call_args[1].get("data")
+        doc_data = [mapping for _, mapping in pipe.hsets]
         assert doc_data[0]["product_labels"] == "redis-cloud,enterprise"
         assert doc_data[0]["doc_type"] == "skill"
         assert doc_data[0]["pinned"] == "false"
@@ -1495,8 +1650,7 @@ class TestIngestSreDocumentHelper:
 
     @pytest.mark.asyncio
     async def test_ingest_document_allows_empty_content_with_pipeline_chunk_key(self):
-        mock_index = AsyncMock()
-        mock_index.load = AsyncMock()
+        mock_index, pipe = _index_with_pipeline()
 
         mock_vectorizer = MagicMock()
         mock_vectorizer.aembed = AsyncMock(return_value=b"empty-vector")
@@ -1528,15 +1682,14 @@ class TestIngestSreDocumentHelper:
         assert result["document_id"] == expected_key
         assert result["chunk_count"] == 1
         mock_vectorizer.aembed.assert_awaited_once_with("", as_buffer=True)
-        doc_data = mock_index.load.call_args.kwargs["data"]
+        doc_data = [mapping for _, mapping in pipe.hsets]
         assert doc_data[0]["id"] == expected_key
         assert doc_data[0]["content_hash"] == hashlib.sha256(b"").hexdigest()
         assert doc_data[0]["content"] == ""
 
     @pytest.mark.asyncio
     async def test_ingest_document_stores_long_markdown_as_single_chunk(self):
-        mock_index = AsyncMock()
-        mock_index.load = AsyncMock()
+        mock_index, pipe = _index_with_pipeline()
 
         mock_vectorizer = MagicMock()
         mock_vectorizer.aembed = AsyncMock(return_value=b"long-vector")
@@ -1565,7 +1718,7 @@ class TestIngestSreDocumentHelper:
 
         assert result["chunk_count"] == 1
         assert result["document_id"].endswith(":chunk:0")
-        doc_data = mock_index.load.call_args.kwargs["data"]
+        doc_data = [mapping for _, mapping in pipe.hsets]
         assert doc_data[0]["content"] == content
         assert doc_data[0]["chunk_index"] == 0
         assert doc_data[0]["title"] == "Long Markdown Runbook"
@@ -1573,8 +1726,7 @@ class TestIngestSreDocumentHelper:
     @pytest.mark.asyncio
     async def test_ingest_support_ticket_defaults_pinned_false(self):
         """Support tickets should store pinned=false to support tag filters."""
-        mock_index = AsyncMock()
-        mock_index.load = AsyncMock()
+        mock_index, pipe = _index_with_pipeline()
 
         mock_vectorizer = MagicMock()
         mock_vectorizer.aembed = AsyncMock(return_value=b"vector_bytes")
@@ -1601,8 +1753,7 @@ class TestIngestSreDocumentHelper:
 
         assert result["status"] == "ingested"
         assert result["doc_type"] == "support_ticket"
-        call_args = mock_index.load.call_args
-        doc_data = call_args.kwargs.get("data") or call_args[1].get("data")
+        doc_data = [mapping for _, mapping in pipe.hsets]
         assert doc_data[0]["pinned"] == "false"
         assert doc_data[0]["id"].startswith("sre_support_tickets:")
         assert doc_data[0]["id"].endswith(":chunk:0")
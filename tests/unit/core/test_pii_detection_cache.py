@@ -0,0 +1,101 @@
+"""Tests for the content-hash PII detection cache."""
+
+import base64
+import json
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from redis_sre_agent.core.encryption import decrypt_secret
+from redis_sre_agent.core.pii_detection_cache import (
+    PIIDetectionCache,
+    detector_fingerprint,
+    text_digest,
+)
+
+SPANS = [("private_email", 6, 23, 0.98, "PRIVATE_EMAIL")]
+
+
+def _cache(**kwargs):
+    options = {"fingerprint": "fp", "max_entries": 2, "ttl_seconds": 60}
+    options.update(kwargs)
+    return PIIDetectionCache(**options)
+
+
+def _mock_redis():
+    store = {}
+    client = MagicMock()
+    client.mget = AsyncMock(side_effect=lambda keys: [store.get(key) for key in keys])
+
+    pipe = MagicMock()
+    pipe.set = MagicMock(side_effect=lambda key, value, ex=None: store.__setitem__(key, value))
+    pipe.execute = AsyncMock(return_value=[])
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    client.pipeline = MagicMock(return_value=pipe)
+    client.store = store
+    return client
+
+
+def test_detector_fingerprint_depends_on_model_categories_and_options():
+    base = detector_fingerprint("openai/privacy-filter", ["secret", "private_email"], 2000)
+
+    assert base == detector_fingerprint("openai/privacy-filter", ["private_email", "secret"], 2000)
+    assert base != detector_fingerprint("other/model", ["private_email", "secret"], 2000)
+    assert base != detector_fingerprint("openai/privacy-filter", ["secret"], 2000)
+    assert base != detector_fingerprint("openai/privacy-filter", ["private_email", "secret"], 500)
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used():
+    cache = _cache()
+    await cache.set_many({"a": SPANS, "b": []})
+    await cache.get_many(["a"])
+    await cache.set_many({"c": []})
+
+    assert await cache.get_many(["a", "b", "c"]) == {"a": SPANS, "c": []}
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_expires_entries_after_ttl():
+    cache = _cache()
+    with patch("redis_sre_agent.core.pii_detection_cache.time.monotonic", return_value=100.0):
+        await cache.set_many({"a": SPANS})
+    with patch("redis_sre_agent.core.pii_detection_cache.time.monotonic", return_value=161.0):
+        assert await cache.get_many(["a"]) == {}
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_redis_backed_cache_encrypts_entries(monkeypatch):
+    monkeypatch.setenv("REDIS_SRE_MASTER_KEY", base64.b64encode(os.urandom(32)).decode())
+    redis = _mock_redis()
+    digest = text_digest("Email alice@example.com")
+
+    with patch("redis_sre_agent.core.redis.get_redis_client", return_value=redis):
+        await _cache(redis_enabled=True).set_many({digest: SPANS})
+        ((key, value),) = redis.store.items()
+        assert key == f"sre:pii_detection:fp:{digest}"
+        assert "private_email" not in value
+        assert json.loads(decrypt_secret(value)) == [list(SPANS[0])]
+
+        # A fresh process-local cache is filled from Redis
+        other = _cache(redis_enabled=True)
+        assert await other.get_many([digest]) == {digest: SPANS}
+        assert len(other) == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_backing_is_disabled_without_master_key(monkeypatch):
+    monkeypatch.delenv("REDIS_SRE_MASTER_KEY", raising=False)
+    redis = _mock_redis()
+    cache = _cache(redis_enabled=True)
+
+    with patch("redis_sre_agent.core.redis.get_redis_client", return_value=redis):
+        await cache.set_many({"a": SPANS})
+
+    assert cache.redis_enabled is False
+    assert redis.store == {}
+    assert await cache.get_many(["a"]) == {"a": SPANS}
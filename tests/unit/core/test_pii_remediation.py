@@ -24,6 +24,15 @@ from redis_sre_agent.core.pii_remediation import (
 )
 
 
+def _per_text_pipeline(classify):
+    """Adapt a per-text fake classifier to the batched pipeline call shape."""
+
+    def pipeline(texts, batch_size=None):
+        return [classify(text) for text in texts]
+
+    return pipeline
+
+
 class TestPIIRemediatorLoading:
     def teardown_method(self):
         reset_pii_remediator_factory()
@@ -100,18 +109,23 @@ async def test_default_privacy_filter_empty_settings_categories_disable_detectio
         SimpleNamespace(
             pii_remediation_model="openai/privacy-filter",
             pii_remediation_categories=[],
+            pii_remediation_batch_size=16,
+            pii_remediation_max_sequence_chars=2000,
+            pii_remediation_cache_enabled=False,
         ),
     ):
         remediator = DefaultPrivacyFilterPIIRemediator()
 
-    remediator._pipeline = lambda text: [
-        {
-            "entity_group": "PRIVATE_EMAIL",
-            "start": 6,
-            "end": 23,
-            "score": 0.98,
-        }
-    ]
+    remediator._pipeline = _per_text_pipeline(
+        lambda text: [
+            {
+                "entity_group": "PRIVATE_EMAIL",
+                "start": 6,
+                "end": 23,
+                "score": 0.98,
+            }
+        ]
+    )
     request = PIIRemediationRequest(
         mode=PIIRemediationMode.REDACT,
         request_kind="test",
@@ -139,20 +153,22 @@ async def test_default_privacy_filter_redacts_with_stable_placeholders():
         model_name="openai/privacy-filter",
         categories=["private_email"],
     )
-    remediator._pipeline = lambda text: [
-        {
-            "entity_group": "PRIVATE_EMAIL",
-            "start": 6,
-            "end": 23,
-            "score": 0.98,
-        },
-        {
-            "entity_group": "PRIVATE_EMAIL",
-            "start": 34,
-            "end": 51,
-            "score": 0.97,
-        },
-    ]
+    remediator._pipeline = _per_text_pipeline(
+        lambda text: [
+            {
+                "entity_group": "PRIVATE_EMAIL",
+                "start": 6,
+                "end": 23,
+                "score": 0.98,
+            },
+            {
+                "entity_group": "PRIVATE_EMAIL",
+                "start": 34,
+                "end": 51,
+                "score": 0.97,
+            },
+        ]
+    )
     request = PIIRemediationRequest(
         mode=PIIRemediationMode.REDACT,
         request_kind="test",
@@ -180,14 +196,16 @@ async def test_default_privacy_filter_blocks_when_mode_is_block():
         model_name="openai/privacy-filter",
         categories=["secret"],
     )
-    remediator._pipeline = lambda text: [
-        {
-            "entity_group": "SECRET",
-            "start": 4,
-            "end": 14,
-            "score": 0.91,
-        }
-    ]
+    remediator._pipeline = _per_text_pipeline(
+        lambda text: [
+            {
+                "entity_group": "SECRET",
+                "start": 4,
+                "end": 14,
+                "score": 0.91,
+            }
+        ]
+    )
     request = PIIRemediationRequest(
         mode=PIIRemediationMode.BLOCK,
         request_kind="test",
@@ -207,20 +225,22 @@ async def test_default_privacy_filter_prefers_longer_same_start_overlaps():
         model_name="openai/privacy-filter",
         categories=["private_email", "private_name"],
     )
-    remediator._pipeline = lambda text: [
-        {
-            "entity_group": "PRIVATE_NAME",
-            "start": 6,
-            "end": 11,
-            "score": 0.90,
-        },
-        {
-            "entity_group": "PRIVATE_EMAIL",
-            "start": 6,
-            "end": 23,
-            "score": 0.99,
-        },
-    ]
+    remediator._pipeline = _per_text_pipeline(
+        lambda text: [
+            {
+                "entity_group": "PRIVATE_NAME",
+                "start": 6,
+                "end": 11,
+                "score": 0.90,
+            },
+            {
+                "entity_group": "PRIVATE_EMAIL",
+                "start": 6,
+                "end": 23,
+                "score": 0.99,
+            },
+        ]
+    )
     request = PIIRemediationRequest(
         mode=PIIRemediationMode.REDACT,
         request_kind="test",
@@ -278,7 +298,7 @@ async def test_default_privacy_filter_serializes_shared_pipeline_access():
             with counter_lock:
                 active -= 1
 
-    remediator._pipeline = fake_classifier
+    remediator._pipeline = _per_text_pipeline(fake_classifier)
 
     request_one = PIIRemediationRequest(
         mode=PIIRemediationMode.DETECT,
@@ -301,6 +321,120 @@ async def test_default_privacy_filter_serializes_shared_pipeline_access():
     assert max_active == 1
 
 
+@pytest.mark.asyncio
+async def test_default_privacy_filter_batches_blocks_per_request():
+    remediator = DefaultPrivacyFilterPIIRemediator(
+        model_name="openai/privacy-filter",
+        categories=["private_email"],
+        batch_size=4,
+    )
+    calls = []
+
+    def fake_pipeline(texts, batch_size=None):
+        calls.append(list(texts))
+        return [
+            [{"entity_group": "PRIVATE_EMAIL", "start": 0, "end": len(text), "score": 0.9}]
+            for text in texts
+        ]
+
+    remediator._pipeline = fake_pipeline
+    blocks = [
+        PIITextBlock(block_id=f"b{i}", path="prompt", role="user", text=f"u{i}@example.com")
+        for i in range(6)
+    ] + [PIITextBlock(block_id="empty", path="prompt", role="user", text="")]
+    request = PIIRemediationRequest(
+        mode=PIIRemediationMode.DETECT,
+        request_kind="test",
+        blocks=blocks,
+        categories=["private_email"],
+    )
+
+    result = await remediator.remediate(request)
+
+    assert [len(call) for call in calls] == [4, 2]
+    assert [f.block_id for f in result.findings] == [f"b{i}" for i in range(6)]
+    assert result.findings[5].text == "u5@example.com"
+
+
+def test_default_privacy_filter_chunks_long_blocks_and_maps_offsets():
+    remediator = DefaultPrivacyFilterPIIRemediator(
+        model_name="openai/privacy-filter",
+        categories=["private_email"],
+        max_sequence_chars=100,
+    )
+    email = "alice@example.com"
+    text = ("word " * 30) + email + (" word" * 30)
+    calls = []
+
+    def fake_pipeline(texts, batch_size=None):
+        calls.extend(texts)
+        results = []
+        for chunk in texts:
+            pos = chunk.find(email)
+            results.append(
+                [{"entity_group": "PRIVATE_EMAIL", "start": pos, "end": pos + len(email)}]
+                if pos != -1
+                else []
+            )
+        return results
+
+    remediator._pipeline = fake_pipeline
+
+    spans = remediator._detect_spans(text)
+
+    assert len(calls) > 1
+    assert all(len(chunk) <= 100 for chunk in calls)
+    # Overlapping chunks may both see the email; only one span survives
+    assert len(spans) == 1
+    assert spans[0].start == text.index(email)
+    assert spans[0].text == email
+
+
+@pytest.mark.asyncio
+async def test_default_privacy_filter_reuses_cached_detections_across_requests():
+    from redis_sre_agent.observability.pii_remediation_metrics import (
+        PII_REMEDIATION_CACHE_LOOKUPS,
+    )
+
+    remediator = DefaultPrivacyFilterPIIRemediator(
+        model_name="openai/privacy-filter",
+        categories=["private_email"],
+    )
+    classified = []
+
+    def classify(text):
+        classified.append(text)
+        pos = text.find("alice@example.com")
+        return (
+            [{"entity_group": "PRIVATE_EMAIL", "start": pos, "end": pos + 17, "score": 0.9}]
+            if pos != -1
+            else []
+        )
+
+    remediator._pipeline = _per_text_pipeline(classify)
+    system = PIITextBlock(
+        block_id="sys", path="prompt", role="system", text="Email alice@example.com"
+    )
+
+    def _request(*blocks):
+        return PIIRemediationRequest(
+            mode=PIIRemediationMode.REDACT,
+            request_kind="test",
+            blocks=list(blocks),
+            categories=["private_email"],
+        )
+
+    hits_before = PII_REMEDIATION_CACHE_LOOKUPS.labels(result="hit")._value.get()
+    await remediator.remediate(_request(system))
+    turn = PIITextBlock(block_id="u1", path="messages[1]", role="user", text="no pii here")
+    result = await remediator.remediate(_request(system, turn))
+
+    assert classified == ["Email alice@example.com", "no pii here"]
+    assert result.blocks[0].text == "Email [PII:EMAIL:1]"
+    assert result.findings[0].text == "alice@example.com"
+    assert PII_REMEDIATION_CACHE_LOOKUPS.labels(result="hit")._value.get() == hits_before + 1
+
+
 def test_reset_pii_remediator_factory_shuts_down_cached_instance():
     remediator = MagicMock()
     set_pii_remediator_factory(lambda: remediator)
@@ -3,6 +3,7 @@
 Tests written first, then implementation follows.
 """
 
+import array
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -679,8 +680,8 @@ class TestEmbedQARecordTask:
         mock_vectorizer = MagicMock()
         mock_vectorizer.aembed = AsyncMock(
             side_effect=[
-                b"\x00" * 16,  # question vector
-                b"\x01" * 16,  # answer vector
+                [0.0, 0.0, 0.0, 0.0],  # question vector
+                [1.0, 1.0, 1.0, 1.0],  # answer vector
             ]
         )
 
@@ -705,6 +706,10 @@ class TestEmbedQARecordTask:
         mock_qa_manager.get_qa.assert_called_once_with("qa-123")
         mock_qa_manager.update_vectors.assert_called_once()
         assert mock_vectorizer.aembed.call_count == 2
+        # Q&A vectors are always stored as float32 buffers
+        vectors = mock_qa_manager.update_vectors.call_args.kwargs
+        assert vectors["question_vector"] == array.array("f", [0.0] * 4).tobytes()
+        assert vectors["answer_vector"] == array.array("f", [1.0] * 4).tobytes()
 
     @pytest.mark.asyncio
     async def test_embed_qa_record_not_found(self):
@@ -4,14 +4,17 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from redis_sre_agent.core.config import Settings
 from redis_sre_agent.core.redis import (
     SRE_KNOWLEDGE_SCHEMA,
     SRE_SKILLS_SCHEMA,
     SRE_SUPPORT_TICKETS_SCHEMA,
+    close_redis_connections,
     create_indices,
     get_index_schema_status,
     get_knowledge_index,
     get_redis_client,
+    get_tasks_index,
     get_vectorizer,
     initialize_redis,
     sync_index_schemas,
@@ -63,61 +66,120 @@ class TestRedisInfrastructure:
             assert ordered_field_names.index("pinned") < ordered_field_names.index("chunk_index")
 
     @patch("redis_sre_agent.core.redis.Redis")
-    def test_get_redis_client(self, mock_redis):
-        """Test Redis client creation (no caching - creates fresh each time)."""
+    def test_get_redis_client_without_running_loop(self, mock_redis):
+        """Outside an event loop a standalone client is created per call."""
         mock_client = Mock()
         mock_redis.from_url.return_value = mock_client
 
-        # First call creates client
         client1 = get_redis_client()
         assert client1 == mock_client
         mock_redis.from_url.assert_called_once()
 
-        # Second call creates NEW client (no caching to avoid event loop issues)
         client2 = get_redis_client()
         assert client2 == mock_client
-        # from_url should be called TWICE (no caching)
         assert mock_redis.from_url.call_count == 2
 
-    @patch("redis_sre_agent.core.redis.create_vectorizer")
-    def test_get_vectorizer(self, mock_create_vectorizer):
-        """Test vectorizer creation delegates to the helper on each call."""
+    @pytest.mark.asyncio
+    async def test_get_redis_client_shares_pool_within_loop(self):
+        """Clients on the same loop and URL share one connection pool."""
+        client1 = get_redis_client(url="redis://localhost:6379/0")
+        client2 = get_redis_client(url="redis://localhost:6379/0")
+        other = get_redis_client(url="redis://localhost:6379/1")
+
+        assert client1 is not client2
+        assert client1.connection_pool is client2.connection_pool
+        assert other.connection_pool is not client1.connection_pool
+
+        # Closing a client must not tear down the shared pool
+        await client1.aclose()
+        assert get_redis_client(url="redis://localhost:6379/0").connection_pool is (
+            client2.connection_pool
+        )
+        await close_redis_connections()
+
+    def test_get_redis_client_uses_separate_pools_per_loop(self):
+        """Each event loop gets its own pool."""
+        import asyncio
+
+        async def _pool():
+            return get_redis_client(url="redis://localhost:6379/0").connection_pool
+
+        assert asyncio.run(_pool()) is not asyncio.run(_pool())
+
+    @pytest.mark.asyncio
+    async def test_close_redis_connections_resets_registry(self):
+        """Shutdown disconnects pools and drops cached indices for the loop."""
+        client = get_redis_client(url="redis://localhost:6379/0")
+        index = await get_tasks_index()
+        pool = client.connection_pool
+
+        with patch.object(pool, "disconnect", new_callable=AsyncMock) as mock_disconnect:
+            await close_redis_connections()
+
+        mock_disconnect.assert_awaited_once()
+        assert get_redis_client(url="redis://localhost:6379/0").connection_pool is not pool
+        assert await get_tasks_index() is not index
+        await close_redis_connections()
+
+    @patch("redis_sre_agent.core.vectorizer_helpers.create_vectorizer")
+    @pytest.mark.asyncio
+    async def test_get_vectorizer(self, mock_create_vectorizer):
+        """Test vectorizer creation is cached across calls on one event loop."""
         mock_vectorizer_instance = Mock()
         mock_create_vectorizer.return_value = mock_vectorizer_instance
 
         vectorizer1 = get_vectorizer()
         assert vectorizer1 == mock_vectorizer_instance
-        mock_create_vectorizer.assert_called_once_with(config=None)
+        mock_create_vectorizer.assert_called_once_with(config=None, model=None, cache=None)
 
         vectorizer2 = get_vectorizer()
-        assert vectorizer2 == mock_vectorizer_instance
-        assert mock_create_vectorizer.call_count == 2
+        assert vectorizer2 is vectorizer1
+        assert mock_create_vectorizer.call_count == 1
 
-    @patch("redis_sre_agent.core.redis.create_vectorizer")
+    @patch("redis_sre_agent.core.vectorizer_helpers.create_vectorizer")
     def test_get_vectorizer_passes_explicit_config(self, mock_create_vectorizer):
         """Test get_vectorizer forwards explicit config for dependency injection."""
         mock_vectorizer_instance = Mock()
         mock_create_vectorizer.return_value = mock_vectorizer_instance
-        config = Mock()
+        config = Settings(openai_api_key="explicit-key")
 
         result = get_vectorizer(config=config)
 
         assert result is mock_vectorizer_instance
-        mock_create_vectorizer.assert_called_once_with(config=config)
+        mock_create_vectorizer.assert_called_once_with(config=config, model=None)
 
     @pytest.mark.asyncio
     async def test_get_knowledge_index(self):
-        """Test knowledge index creation (no caching - creates fresh each time)."""
-        # Just test that it returns an AsyncSearchIndex instance
-        # Don't test implementation details
+        """Test knowledge index is cached per event loop."""
         index1 = await get_knowledge_index()
         assert index1 is not None
 
-        # Second call creates NEW instance (no caching to avoid event loop issues)
+        # Second call on the same loop reuses the cached index and pool
         index2 = await get_knowledge_index()
-        assert index2 is not None
-        # Should be different instances (no caching)
-        assert index1 is not index2
+        assert index1 is index2
+
+        tasks_index = await get_tasks_index()
+        assert tasks_index is not index1
+        assert tasks_index._redis_client.connection_pool is index1._redis_client.connection_pool
+
+    @pytest.mark.asyncio
+    async def test_search_index_cache_is_keyed_by_schema_contents(self):
+        """Test a changed schema with the same index name gets a new index."""
+        import copy
+
+        from redis_sre_agent.core.redis import _get_search_index
+
+        url = "redis://localhost:6379/0"
+        changed = copy.deepcopy(SRE_KNOWLEDGE_SCHEMA)
+        changed["fields"].append({"name": "extra_tag", "type": "tag"})
+
+        index = _get_search_index(SRE_KNOWLEDGE_SCHEMA, url)
+
+        assert _get_search_index(copy.deepcopy(SRE_KNOWLEDGE_SCHEMA), url) is index
+        changed_index = _get_search_index(changed, url)
+        assert changed_index is not index
+        assert "extra_tag" in changed_index.schema.field_names
+        await close_redis_connections()
 
     @pytest.mark.asyncio
     async def test_redis_connection_success(self, mock_redis_client):
@@ -412,3 +474,206 @@ class TestRedisInfrastructure:
 
         assert result["redis_connection"] == "available"
         assert result["vectorizer"] == "unavailable"
+
+
+def _vector_info_attribute(algorithm: str, data_type: str, dim: int, **extra) -> list:
+    attribute = [
+        b"attribute",
+        b"vector",
+        b"type",
+        b"VECTOR",
+        b"algorithm",
+        algorithm.encode(),
+        b"data_type",
+        data_type.encode(),
+        b"dim",
+        str(dim).encode(),
+        b"distance_metric",
+        b"COSINE",
+    ]
+    for key, value in extra.items():
+        attribute.extend([key.encode(), str(value).encode()])
+    return attribute
+
+
+class TestVectorIndexSettings:
+    """Vector algorithm/datatype settings for the document indices."""
+
+    def test_document_vector_attrs_default_to_flat_float32(self):
+        from redis_sre_agent.core.redis import _document_vector_attrs
+
+        with patch("redis_sre_agent.core.redis.settings") as mock_settings:
+            mock_settings.vector_dim = 384
+            mock_settings.vector_index_algorithm = "flat"
+            mock_settings.vector_datatype = "float32"
+            attrs = _document_vector_attrs()
+
+        assert attrs == {
+            "dims": 384,
+            "distance_metric": "cosine",
+            "algorithm": "flat",
+            "datatype": "float32",
+        }
+
+    def test_document_vector_attrs_include_hnsw_parameters(self):
+        from redisvl.schema import IndexSchema
+
+        from redis_sre_agent.core.redis import _build_document_schema
+
+        with patch("redis_sre_agent.core.redis.settings") as mock_settings:
+            mock_settings.vector_dim = 384
+            mock_settings.vector_index_algorithm = "hnsw"
+            mock_settings.vector_hnsw_m = 32
+            mock_settings.vector_hnsw_ef_construction = 400
+            mock_settings.vector_hnsw_ef_runtime = 50
+            mock_settings.vector_datatype = "float16"
+            schema = _build_document_schema("sre_knowledge", include_pinned=True)
+
+        vector = IndexSchema.from_dict(schema).fields["vector"]
+        assert vector.attrs.algorithm.value == "HNSW"
+        assert vector.attrs.datatype.value == "FLOAT16"
+        assert (vector.attrs.m, vector.attrs.ef_construction, vector.attrs.ef_runtime) == (
+            32,
+            400,
+            50,
+        )
+
+    def test_hnsw_build_parameters_drift_only_when_reported(self):
+        from redis_sre_agent.core.redis import (
+            _actual_field_definitions,
+            _compare_index_schema,
+            _expected_field_definitions,
+        )
+
+        schema = {
+            "fields": [
+                {
+                    "name": "vector",
+                    "type": "vector",
+                    "attrs": {
+                        "dims": 4,
+                        "distance_metric": "cosine",
+                        "algorithm": "hnsw",
+                        "datatype": "float32",
+                        "m": 16,
+                        "ef_construction": 200,
+                        "ef_runtime": 10,
+                    },
+                }
+            ]
+        }
+        expected = _expected_field_definitions(schema)
+
+        unreported = _actual_field_definitions(
+            [b"attributes", [_vector_info_attribute("HNSW", "FLOAT32", 4)]]
+        )
+        assert _compare_index_schema(expected, unreported)["in_sync"] is True
+
+        matching = _actual_field_definitions(
+            [
+                b"attributes",
+                [_vector_info_attribute("HNSW", "FLOAT32", 4, M=16, ef_construction=200)],
+            ]
+        )
+        assert _compare_index_schema(expected, matching)["in_sync"] is True
+
+        changed = _actual_field_definitions(
+            [
+                b"attributes",
+                [_vector_info_attribute("HNSW", "FLOAT32", 4, M=8, ef_construction=200)],
+            ]
+        )
+        assert _compare_index_schema(expected, changed)["mismatched_fields"]["vector"]
+
+        flat = _actual_field_definitions(
+            [b"attributes", [_vector_info_attribute("FLAT", "FLOAT32", 4)]]
+        )
+        assert _compare_index_schema(expected, flat)["mismatched_fields"]["vector"]
+
+    @pytest.mark.asyncio
+    async def test_sync_index_schemas_reencodes_vectors_on_datatype_change(self):
+        """Changing VECTOR_DATATYPE rewrites stored blobs before recreating the index."""
+        import numpy as np
+
+        schema = {
+            "index": {"name": "sre_knowledge", "prefix": "sre_knowledge:"},
+            "fields": [
+                {
+                    "name": "vector",
+                    "type": "vector",
+                    "attrs": {
+                        "dims": 4,
+                        "distance_metric": "cosine",
+                        "algorithm": "flat",
+                        "datatype": "float16",
+                    },
+                }
+            ],
+        }
+        stored = np.array([0.5, -1.0, 0.25, 2.0], dtype=np.float32).tobytes()
+        hash_data = {
+            b"sre_knowledge:a": {"vector": stored},
+            b"sre_knowledge:b": {"vector": stored},
+            # Already converted by an earlier interrupted run
+            b"sre_knowledge:c": {"vector": np.zeros(4, dtype=np.float16).tobytes()},
+        }
+
+        class _Pipeline:
+            def __init__(self):
+                self.ops = []
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def hget(self, key, field):
+                self.ops.append(("hget", key, field))
+
+            def hset(self, key, field, value):
+                self.ops.append(("hset", key, field, value))
+
+            async def execute(self, raise_on_error=True):
+                results = []
+                for op in self.ops:
+                    if op[0] == "hget":
+                        results.append(hash_data[op[1]].get(op[2]))
+                    else:
+                        hash_data[op[1]][op[2]] = op[3]
+                        results.append(0)
+                return results
+
+        async def _scan_iter(match=None, count=None):
+            for key in list(hash_data):
+                yield key
+
+        client = Mock()
+        client.pipeline = Mock(side_effect=lambda transaction=False: _Pipeline())
+        client.scan_iter = _scan_iter
+        client.execute_command = AsyncMock(
+            side_effect=[
+                [b"attributes", [_vector_info_attribute("FLAT", "FLOAT32", 4)]],
+                b"OK",
+            ]
+        )
+        mock_index = AsyncMock()
+        mock_index.exists.return_value = True
+        mock_index._redis_client = client
+
+        async def _get_index(config=None):
+            return mock_index
+
+        with patch(
+            "redis_sre_agent.core.redis._iter_index_configs",
+            return_value=[("knowledge", "sre_knowledge", _get_index, schema)],
+        ):
+            result = await sync_index_schemas(index_name="knowledge")
+
+        entry = result["indices"]["knowledge"]
+        assert entry["action"] == "recreated"
+        assert entry["reencoded_vectors"] == 2
+        converted = np.frombuffer(hash_data[b"sre_knowledge:a"]["vector"], dtype=np.float16)
+        assert converted.tolist() == [0.5, -1.0, 0.25, 2.0]
+        assert hash_data[b"sre_knowledge:c"]["vector"] == np.zeros(4, dtype=np.float16).tobytes()
+        mock_index.create.assert_awaited_once()
@@ -5,16 +5,29 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from redis_sre_agent.core import schedules as schedules_module
 from redis_sre_agent.core.schedules import (
+    claim_due_schedules,
     delete_schedule,
+    ensure_schedule_due_index,
     find_schedules_needing_runs,
     get_schedule,
+    release_schedule_claims,
     store_schedule,
     update_schedule_last_run,
     update_schedule_next_run,
 )
 
 
+def _mock_client_with_pipeline(results=None):
+    """Build a Redis client mock whose pipeline() records queued commands."""
+    mock_client = AsyncMock()
+    mock_pipe = MagicMock()
+    mock_pipe.execute = AsyncMock(return_value=results or [])
+    mock_client.pipeline = MagicMock(return_value=mock_pipe)
+    return mock_client, mock_pipe
+
+
 @pytest.fixture
 def sample_schedule():
     """Sample schedule data for testing."""
@@ -40,22 +53,40 @@ class TestScheduleStorage:
     async def test_store_schedule_success(self, sample_schedule):
         """Test successful schedule storage."""
         with patch("redis_sre_agent.core.schedules.get_redis_client") as mock_get_client:
-            mock_client = AsyncMock()
+            mock_client, mock_pipe = _mock_client_with_pipeline([1, 1])
             mock_get_client.return_value = mock_client
-            mock_client.hset.return_value = 1
 
             result = await store_schedule(sample_schedule)
 
             assert result is True
-            mock_client.hset.assert_called()
+            mock_pipe.hset.assert_called_once()
+            mock_pipe.zadd.assert_called_once_with(
+                "sre:schedules:due",
+                {"test-schedule-123": sample_schedule["next_run_at"]},
+            )
+            mock_pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_store_disabled_schedule_removes_it_from_due_set(self, sample_schedule):
+        """Disabled schedules are not kept in the due set."""
+        sample_schedule["enabled"] = False
+        with patch("redis_sre_agent.core.schedules.get_redis_client") as mock_get_client:
+            mock_client, mock_pipe = _mock_client_with_pipeline([1, 1])
+            mock_get_client.return_value = mock_client
+
+            result = await store_schedule(sample_schedule)
+
+            assert result is True
+            mock_pipe.zadd.assert_not_called()
+            mock_pipe.zrem.assert_called_once_with("sre:schedules:due", "test-schedule-123")
 
     @pytest.mark.asyncio
     async def test_store_schedule_failure(self, sample_schedule):
         """Test schedule storage failure."""
         with patch("redis_sre_agent.core.schedules.get_redis_client") as mock_get_client:
-            mock_client = AsyncMock()
+            mock_client, mock_pipe = _mock_client_with_pipeline()
             mock_get_client.return_value = mock_client
-            mock_client.hset.side_effect = Exception("Redis error")
+            mock_pipe.execute.side_effect = Exception("Redis error")
 
             result = await store_schedule(sample_schedule)
 
@@ -102,14 +133,14 @@ class TestScheduleStorage:
     async def test_delete_schedule_success(self):
         """Test successful schedule deletion."""
         with patch("redis_sre_agent.core.schedules.get_redis_client") as mock_get_client:
-            mock_client = AsyncMock()
+            mock_client, mock_pipe = _mock_client_with_pipeline([1, 1])
             mock_get_client.return_value = mock_client
-            mock_client.delete.return_value = 1
 
             result = await delete_schedule("test-schedule-123")
 
             assert result is True
-            mock_client.delete.assert_called_with("sre_schedules:test-schedule-123")
+            mock_pipe.delete.assert_called_with("sre_schedules:test-schedule-123")
+            mock_pipe.zrem.assert_called_with("sre:schedules:due", "test-schedule-123")
 
     @pytest.mark.asyncio
     async def test_update_schedule_next_run_success(self):
@@ -117,16 +148,24 @@ class TestScheduleStorage:
         next_run_time = datetime.now(timezone.utc) + timedelta(hours=2)
 
         with patch("redis_sre_agent.core.schedules.get_redis_client") as mock_get_client:
-            mock_client = AsyncMock()
+            mock_client, mock_pipe = _mock_client_with_pipeline([2, 0])
             mock_get_client.return_value = mock_client
-            mock_client.hset.return_value = 1
-            mock_client.hget.return_value = str(next_run_time.timestamp()).encode()
 
             result = await update_schedule_next_run("test-schedule-123", next_run_time)
 
             assert result is True
-            # Should call hset twice (next_run_at and updated_at)
-            assert mock_client.hset.call_count == 2
+            # One HSET for next_run_at/updated_at, no verify read
+            mock_pipe.hset.assert_called_once()
+            assert set(mock_pipe.hset.call_args.kwargs["mapping"]) == {
+                "next_run_at",
+                "updated_at",
+            }
+            mock_pipe.zadd.assert_called_once_with(
+                "sre:schedules:due",
+                {"test-schedule-123": next_run_time.timestamp()},
+                xx=True,
+            )
+            mock_client.hget.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_update_schedule_last_run_success(self):
@@ -141,8 +180,8 @@ class TestScheduleStorage:
             result = await update_schedule_last_run("test-schedule-123", last_run_time)
 
             assert result is True
-            # Should call hset twice (last_run_at and updated_at)
-            assert mock_client.hset.call_count == 2
+            # last_run_at and updated_at are written in one HSET
+            mock_client.hset.assert_awaited_once()
 
 
 class TestScheduleQueries:
@@ -152,93 +191,192 @@ class TestScheduleQueries:
     async def test_find_schedules_needing_runs_with_due_schedules(self):
         """Test finding schedules that need to run."""
         current_time = datetime.now(timezone.utc)
-
-        # Mock schedule that needs to run (next_run_at is in the past)
-        due_schedule = {
-            "id": "due-schedule",
-            "name": "Due Schedule",
-            "enabled": "true",  # RedisVL stores as string
-            "next_run_at": str(
-                (current_time - timedelta(minutes=30)).timestamp()
-            ),  # RedisVL stores as timestamp string
+        due_hash = {
+            b"id": b"due-schedule",
+            b"name": b"Due Schedule",
+            b"enabled": b"true",
+            b"interval_type": b"hours",
+            b"interval_value": b"1",
+            b"next_run_at": str((current_time - timedelta(minutes=30)).timestamp()).encode(),
         }
 
-        # Mock the RedisVL index and query
-        mock_index = AsyncMock()
-        mock_query_result = [due_schedule]
-        mock_index.query.return_value = mock_query_result
-        mock_index.__aenter__.return_value = mock_index
-        mock_index.__aexit__.return_value = None
-
-        with patch("redis_sre_agent.core.schedules.get_schedules_index") as mock_get_index:
-            mock_get_index.return_value = mock_index
+        with patch("redis_sre_agent.core.schedules.get_redis_client") as mock_get_client:
+            mock_client, mock_pipe = _mock_client_with_pipeline([due_hash])
+            mock_client.zrangebyscore.return_value = [b"due-schedule"]
+            mock_get_client.return_value = mock_client
 
             result = await find_schedules_needing_runs(current_time)
 
             assert len(result) == 1
             assert result[0]["id"] == "due-schedule"
+            mock_client.zrangebyscore.assert_awaited_once_with(
+                "sre:schedules:due", "-inf", current_time.timestamp()
+            )
+            mock_pipe.hgetall.assert_called_once_with("sre_schedules:due-schedule")
 
     @pytest.mark.asyncio
     async def test_find_schedules_needing_runs_no_due_schedules(self):
         """Test finding schedules when none are due."""
-        current_time = datetime.now(timezone.utc)
+        with patch("redis_sre_agent.core.schedules.get_redis_client") as mock_get_client:
+            mock_client, mock_pipe = _mock_client_with_pipeline()
+            mock_client.zrangebyscore.return_value = []
+            mock_get_client.return_value = mock_client
 
-        # Mock schedule that doesn't need to run (next_run_at is in the future)
-        future_schedule = {
-            "id": "future-schedule",
-            "name": "Future Schedule",
-            "enabled": True,
-            "next_run_at": (current_time + timedelta(hours=1)).isoformat(),
-        }
+            result = await find_schedules_needing_runs(datetime.now(timezone.utc))
+
+            assert result == []
+            mock_client.pipeline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_find_schedules_needing_runs_skips_disabled_and_deleted(self):
+        """Stale due-set entries for disabled or deleted schedules are ignored."""
+        disabled_hash = {b"id": b"disabled", b"enabled": b"false", b"interval_value": b"1"}
 
-        with (
-            patch("redis_sre_agent.core.schedules.list_schedules") as mock_list,
-            patch("redis_sre_agent.core.schedules.get_schedules_index") as mock_get_index,
-        ):
-            mock_list.return_value = [future_schedule]
-            mock_index = MagicMock()
-            mock_index.__aenter__.return_value = mock_index
-            mock_index.__aexit__.return_value = None
+        with patch("redis_sre_agent.core.schedules.get_redis_client") as mock_get_client:
+            mock_client, _ = _mock_client_with_pipeline([disabled_hash, {}])
+            mock_client.zrangebyscore.return_value = [b"disabled", b"deleted"]
+            mock_get_client.return_value = mock_client
 
-            # Ensure index path returns no results for isolation
-            async def _q(_):
-                return []
+            result = await find_schedules_needing_runs(datetime.now(timezone.utc))
 
-            mock_index.query = _q
-            mock_get_index.return_value = mock_index
+            assert result == []
 
-            result = await find_schedules_needing_runs(current_time)
 
-            assert len(result) == 0
+class TestScheduleClaims:
+    """Test due-set claiming and backfill."""
 
     @pytest.mark.asyncio
-    async def test_find_schedules_needing_runs_disabled_schedules(self):
-        """Test that disabled schedules are not returned."""
-        current_time = datetime.now(timezone.utc)
+    async def test_claim_due_schedules_parses_claimed_rows(self):
+        """Claimed rows come back as run dicts with a datetime scheduled_at."""
+        now = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+        due_at = now - timedelta(seconds=3)
+        horizon = now + timedelta(seconds=30)
 
-        # Mock disabled schedule that would otherwise be due
-        disabled_schedule = {
-            "id": "disabled-schedule",
-            "name": "Disabled Schedule",
-            "enabled": False,
-            "next_run_at": (current_time - timedelta(minutes=30)).isoformat(),
-        }
+        with patch("redis_sre_agent.core.schedules.get_redis_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.zrangebyscore.return_value = [b"sched-1", b"sched-2"]
+            mock_client.eval.return_value = [
+                [b"sched-1", f"{due_at.timestamp():.6f}".encode(), b"Nightly", b"Check", b""]
+            ]
+            mock_get_client.return_value = mock_client
+
+            runs = await claim_due_schedules(horizon, current_time=now, batch_size=10)
 
-        with (
-            patch("redis_sre_agent.core.schedules.list_schedules") as mock_list,
-            patch("redis_sre_agent.core.schedules.get_schedules_index") as mock_get_index,
-        ):
-            mock_list.return_value = [disabled_schedule]
-            mock_index = MagicMock()
-            mock_index.__aenter__.return_value = mock_index
-            mock_index.__aexit__.return_value = None
+        assert runs == [
+            {
+                "id": "sched-1",
+                "name": "Nightly",
+                "instructions": "Check",
+                "redis_instance_id": None,
+                "scheduled_at": due_at,
+            }
+        ]
+        mock_client.zrangebyscore.assert_awaited_once_with(
+            "sre:schedules:due", "-inf", horizon.timestamp(), start=0, num=10
+        )
+        # Every key the script touches is declared in KEYS
+        assert mock_client.eval.await_args.args[1:] == (
+            3,
+            "sre:schedules:due",
+            "sre_schedules:sched-1",
+            "sre_schedules:sched-2",
+            repr(horizon.timestamp()),
+            repr(now.timestamp()),
+            "sched-1",
+            "sched-2",
+        )
+
+    @pytest.mark.asyncio
+    async def test_claim_due_schedules_drains_full_batches(self):
+        """A full batch triggers another claim call until a short batch is seen."""
+        now = datetime.now(timezone.utc)
+        row = [b"sched", f"{now.timestamp():.6f}".encode(), b"n", b"i", b"inst-1"]
+
+        with patch("redis_sre_agent.core.schedules.get_redis_client") as mock_get_client:
+            mock_client = AsyncMock()
+            # First batch is full (2 candidates, one dropped as disabled)
+            mock_client.zrangebyscore.side_effect = [[b"a", b"b"], [b"c"]]
+            mock_client.eval.side_effect = [[row], [row]]
+            mock_get_client.return_value = mock_client
 
-            async def _q(_):
-                return []
+            runs = await claim_due_schedules(now, current_time=now, batch_size=2)
 
-            mock_index.query = _q
-            mock_get_index.return_value = mock_index
+        assert mock_client.eval.await_count == 2
+        assert len(runs) == 2
+        assert runs[0]["redis_instance_id"] == "inst-1"
 
-            result = await find_schedules_needing_runs(current_time)
+    @pytest.mark.asyncio
+    async def test_claim_due_schedules_skips_script_when_nothing_is_due(self):
+        with patch("redis_sre_agent.core.schedules.get_redis_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.zrangebyscore.return_value = []
+            mock_get_client.return_value = mock_client
+
+            now = datetime.now(timezone.utc)
+            assert await claim_due_schedules(now, current_time=now) == []
+
+        mock_client.eval.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_release_schedule_claims_moves_runs_back(self):
+        """Unsubmitted runs go back to their earliest slot if still tracked."""
+        early = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+        runs = [
+            {"id": "a", "scheduled_at": early + timedelta(minutes=1)},
+            {"id": "a", "scheduled_at": early},
+            {"id": "b", "scheduled_at": early},
+        ]
+
+        with patch("redis_sre_agent.core.schedules.get_redis_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_get_client.return_value = mock_client
+
+            await release_schedule_claims(runs)
+
+        mock_client.zadd.assert_awaited_once_with(
+            "sre:schedules:due",
+            {"a": early.timestamp(), "b": early.timestamp()},
+            xx=True,
+            lt=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_ensure_schedule_due_index_backfills_once(self, monkeypatch):
+        """Existing enabled schedules are added to the due set and a marker is set."""
+        monkeypatch.setattr(schedules_module, "_due_index_ready", False)
+
+        async def _scan_iter(match=None, count=None):
+            for key in [b"sre_schedules:a", b"sre_schedules:b"]:
+                yield key
+
+        with patch("redis_sre_agent.core.schedules.get_redis_client") as mock_get_client:
+            mock_client, mock_pipe = _mock_client_with_pipeline(
+                [[b"true", b"1700000000.0"], [b"false", b"0"]]
+            )
+            mock_client.exists.return_value = 0
+            mock_client.scan_iter = _scan_iter
+            mock_get_client.return_value = mock_client
+
+            added = await ensure_schedule_due_index()
+            again = await ensure_schedule_due_index()
+
+        assert added == 1
+        assert again == 0
+        mock_client.zadd.assert_awaited_once_with("sre:schedules:due", {"a": 1700000000.0})
+        mock_client.set.assert_awaited_once()
+        assert mock_client.set.await_args.args[0] == "sre:schedules:due:ready"
+        mock_client.exists.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_ensure_schedule_due_index_skips_when_marker_present(self, monkeypatch):
+        monkeypatch.setattr(schedules_module, "_due_index_ready", False)
+
+        with patch("redis_sre_agent.core.schedules.get_redis_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.exists.return_value = 1
+            mock_get_client.return_value = mock_client
+
+            added = await ensure_schedule_due_index()
 
-            assert len(result) == 0
+        assert added == 0
+        mock_client.zadd.assert_not_called()
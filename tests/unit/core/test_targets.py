@@ -42,6 +42,11 @@ def reset_authoritative_target_catalog_snapshot_cache():
     target_module._authoritative_target_catalog_snapshot_cache_expires_at = 0.0
 
 
+@pytest.fixture(autouse=True)
+def reset_target_index(monkeypatch):
+    monkeypatch.setattr(target_module, "_target_index", target_module.TargetIndex())
+
+
 def test_build_target_doc_from_instance_excludes_secrets_and_includes_aliases():
     instance = RedisInstance(
         id="redis-prod-checkout-cache",
@@ -1654,3 +1659,242 @@ async def test_get_target_catalog_reuses_cached_authoritative_snapshot():
         docs = await get_target_catalog()
 
     assert [doc.resource_id for doc in docs] == ["redis-development-demo2"]
+
+
+def _index_test_docs() -> list[TargetCatalogDoc]:
+    return [
+        TargetCatalogDoc(
+            target_id="instance:checkout-cache-prod",
+            target_kind="instance",
+            resource_id="checkout-cache-prod",
+            display_name="checkout-cache-prod",
+            name="checkout-cache-prod",
+            environment="production",
+            status="healthy",
+            target_type="oss_single",
+            usage="cache",
+            monitoring_identifier="cache-01.prod.example.com",
+            search_text="checkout cache production",
+            search_aliases=["checkout cache", "cart"],
+            capabilities=["redis", "metrics"],
+        ),
+        TargetCatalogDoc(
+            target_id="instance:session-store-staging",
+            target_kind="instance",
+            resource_id="session-store-staging",
+            display_name="session store",
+            name="session-store-staging",
+            environment="staging",
+            target_type="redis_enterprise",
+            usage="session",
+            search_text="login sessions staging",
+            capabilities=["redis", "logs"],
+            user_id="user-a",
+        ),
+        TargetCatalogDoc(
+            target_id="cluster:payments-enterprise",
+            target_kind="cluster",
+            resource_id="payments-enterprise",
+            display_name="payments enterprise cluster",
+            name="payments-enterprise",
+            environment="production",
+            status="active",
+            target_type="redis_enterprise",
+            search_text="payments ledger cluster",
+            capabilities=["admin", "diagnostics"],
+            user_id="user-b",
+        ),
+        TargetCatalogDoc(
+            target_id="instance:analytics-dev",
+            target_kind="instance",
+            resource_id="analytics-dev",
+            display_name="analytics dev",
+            name="analytics-dev",
+            environment="development",
+            target_type="redis_cloud",
+            usage="analytics",
+            search_text="event analytics",
+            capabilities=["redis", "admin"],
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    "query, capabilities",
+    [
+        ("checkout cache", None),
+        ("checkout-cache-prod", None),
+        ("cache-01.prod.example.com", None),
+        ("is cache-01.prod.example.com healthy", None),
+        ("prod", None),
+        ("staging session", ["logs"]),
+        ("enterprise cluster", ["admin"]),
+        ("enterprise", ["admin"]),
+        ("database", ["redis", "admin"]),
+        ("compare checkout-cache-prod with payments-enterprise", None),
+        ("cart", None),
+        ("nothing matches this", None),
+    ],
+)
+def test_target_index_search_matches_per_doc_scoring(query, capabilities):
+    docs = _index_test_docs()
+    hints = target_module._parse_query_hints(query)
+    expected = []
+    for doc in docs:
+        score, reasons = target_module._score_target_doc(
+            query, doc, preferred_capabilities=capabilities, hints=hints
+        )
+        if score >= 2.5:
+            expected.append((doc.target_id, score, reasons))
+
+    results = target_module.TargetIndex(docs).search(hints, preferred_capabilities=capabilities)
+
+    assert [
+        (features.doc.target_id, score, reasons) for features, score, reasons in results
+    ] == expected
+
+
+def test_target_index_update_reindexes_only_changed_docs():
+    docs = _index_test_docs()
+    index = target_module.TargetIndex(docs, generation=1)
+    unchanged = index.features("instance:checkout-cache-prod")
+
+    renamed = docs[1].model_copy(update={"search_text": "login tokens staging"})
+    added = docs[0].model_copy(
+        update={
+            "target_id": "instance:inventory",
+            "resource_id": "inventory",
+            "display_name": "inventory",
+            "name": "inventory",
+            "monitoring_identifier": None,
+            "search_aliases": [],
+            "search_text": "warehouse stock",
+        }
+    )
+    index.update([docs[0], renamed, added, docs[3]], generation=2)
+
+    assert index.generation == 2
+    assert len(index) == 4
+    assert index.features("instance:checkout-cache-prod") is unchanged
+    assert index.features("cluster:payments-enterprise") is None
+
+    def _search(query):
+        return [
+            features.doc.target_id
+            for features, _, _ in index.search(target_module._parse_query_hints(query))
+        ]
+
+    assert _search("payments ledger cluster") == []
+    assert _search("staging login tokens") == ["instance:session-store-staging"]
+    assert _search("inventory") == ["instance:inventory"]
+    assert _search("prod") == ["instance:checkout-cache-prod", "instance:inventory"]
+
+
+def test_target_index_docs_are_scoped_per_user():
+    index = target_module.TargetIndex(_index_test_docs())
+
+    visible = index.docs(user_id="user-a")
+    reused_index, within = target_module._target_index_for_docs(visible)
+    results = reused_index.search(target_module._parse_query_hints("prod"), within=within)
+
+    assert [doc.resource_id for doc in visible] == [
+        "checkout-cache-prod",
+        "session-store-staging",
+        "analytics-dev",
+    ]
+    assert reused_index is index
+    assert [features.doc.resource_id for features, _, _ in results] == ["checkout-cache-prod"]
+    assert target_module._target_index_for_docs(list(visible))[0] is not index
+
+
+@pytest.mark.asyncio
+async def test_get_target_catalog_serves_index_until_generation_changes():
+    instance = RedisInstance(
+        id="redis-development-demo2",
+        name="demo2",
+        connection_url="redis://redis-demo:6379/0",
+        environment="development",
+        usage="cache",
+        description="Demo Redis instance",
+        instance_type="oss_single",
+    )
+    doc = target_module.build_target_doc_from_instance(instance)
+    target_module._cache_authoritative_target_catalog_snapshot(
+        target_module.AuthoritativeTargetCatalogSnapshot(
+            instances=[instance], clusters=[], docs=[doc]
+        )
+    )
+    mock_index = AsyncMock()
+    mock_index.query = AsyncMock(
+        side_effect=[1, [{"data": doc.model_dump_json()}], 1, [{"data": doc.model_dump_json()}]]
+    )
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(side_effect=[b"3", b"3", b"4"])
+
+    with (
+        patch(
+            "redis_sre_agent.core.targets._ensure_targets_index_exists",
+            new=AsyncMock(return_value=None),
+        ),
+        patch(
+            "redis_sre_agent.core.targets.get_targets_index", new=AsyncMock(return_value=mock_index)
+        ),
+        patch("redis_sre_agent.core.targets.get_redis_client", return_value=mock_client),
+        patch(
+            "redis_sre_agent.core.targets.get_instances_strict",
+            new=AsyncMock(return_value=[instance]),
+        ) as mock_get_instances,
+        patch(
+            "redis_sre_agent.core.targets.get_clusters_strict",
+            new=AsyncMock(return_value=[]),
+        ),
+    ):
+        first = await get_target_catalog()
+        cached = await get_target_catalog()
+        assert mock_index.query.await_count == 2
+        mock_get_instances.assert_not_awaited()
+
+        refreshed = await get_target_catalog()
+
+    assert [d.resource_id for d in first] == ["redis-development-demo2"]
+    assert cached == first
+    assert refreshed == first
+    assert mock_index.query.await_count == 4
+    # Another process bumped the generation, so the drift check rereads authoritative records.
+    mock_get_instances.assert_awaited_once()
+    assert target_module._target_index.generation == 4
+
+
+@pytest.mark.asyncio
+async def test_sync_target_catalog_bumps_generation_and_updates_index():
+    instance = RedisInstance(
+        id="redis-prod-checkout-cache",
+        name="checkout-cache-prod",
+        connection_url="redis://cache.internal:6379/0",
+        environment="production",
+        usage="cache",
+        description="Primary checkout cache",
+        instance_type="oss_single",
+    )
+    mock_client = AsyncMock()
+    mock_client.incr = AsyncMock(return_value=7)
+
+    with (
+        patch("redis_sre_agent.core.targets.get_redis_client", return_value=mock_client),
+        patch(
+            "redis_sre_agent.core.targets._ensure_targets_index_exists",
+            new=AsyncMock(return_value=None),
+        ),
+        patch(
+            "redis_sre_agent.core.targets.get_targets_index",
+            new=AsyncMock(side_effect=RuntimeError("index unavailable")),
+        ),
+    ):
+        mock_client.scan = AsyncMock(return_value=(0, []))
+        assert await sync_target_catalog(instances=[instance], clusters=[]) is True
+
+    mock_client.incr.assert_awaited_once_with("sre:targets:generation")
+    assert target_module._target_index.generation == 7
+    assert [doc.resource_id for doc in target_module._target_index.docs()] == [
+        "redis-prod-checkout-cache"
+    ]
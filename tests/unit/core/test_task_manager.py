@@ -151,39 +151,41 @@ class TestTaskManagerUpdateStatus:
             assert result is True
 
 
+def _make_pipeline(execute_result=None):
+    """Build a pipeline mock that records queued commands."""
+    pipe = MagicMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=None)
+    pipe.execute = AsyncMock(return_value=execute_result or [1, True, True, True, b"1-0", True])
+    return pipe
+
+
 class TestTaskManagerAddUpdate:
     """Test TaskManager.add_task_update method."""
 
     @pytest.fixture
     def task_manager(self):
         mock_redis = AsyncMock()
-        mock_redis.rpush = AsyncMock(return_value=1)
-        mock_redis.hset = AsyncMock(return_value=True)
         mock_redis.hget = AsyncMock(return_value=b"thread-123")
-        return TaskManager(redis_client=mock_redis)
+        mock_redis.pipeline = MagicMock(return_value=_make_pipeline())
+        return TaskManager(redis_client=mock_redis, update_flush_interval=0)
 
     @pytest.mark.asyncio
     async def test_add_task_update_success(self, task_manager):
         """Test adding a task update."""
-        with (
-            patch.object(task_manager, "_upsert_task_search_doc", new_callable=AsyncMock),
-            patch.object(
-                task_manager, "_publish_stream_update", new_callable=AsyncMock
-            ) as mock_pub,
-        ):
-            mock_pub.return_value = True
+        with patch.object(task_manager, "_upsert_task_search_doc", new_callable=AsyncMock):
             result = await task_manager.add_task_update("task-123", "Progress update")
 
             assert result is True
-            task_manager._redis.rpush.assert_called_once()
+            pipe = task_manager._redis.pipeline.return_value
+            pipe.rpush.assert_called_once()
+            pipe.execute.assert_awaited_once()
+            task_manager._redis.rpush.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_add_task_update_with_metadata(self, task_manager):
         """Test adding task update with metadata."""
-        with (
-            patch.object(task_manager, "_upsert_task_search_doc", new_callable=AsyncMock),
-            patch.object(task_manager, "_publish_stream_update", new_callable=AsyncMock),
-        ):
+        with patch.object(task_manager, "_upsert_task_search_doc", new_callable=AsyncMock):
             result = await task_manager.add_task_update(
                 "task-123",
                 "Processing step",
@@ -191,22 +193,156 @@ class TestTaskManagerAddUpdate:
                 metadata={"step": 1, "total": 5},
             )
             assert result is True
+            pipe = task_manager._redis.pipeline.return_value
+            payload = json.loads(pipe.rpush.call_args.args[1])
+            assert payload["update_type"] == "step"
+            assert payload["metadata"] == {"step": 1, "total": 5}
 
     @pytest.mark.asyncio
     async def test_add_task_update_no_thread_id(self, task_manager):
         """Test adding update when thread_id is not found."""
         task_manager._redis.hget = AsyncMock(return_value=None)
 
-        with (
-            patch.object(task_manager, "_upsert_task_search_doc", new_callable=AsyncMock),
-            patch.object(
-                task_manager, "_publish_stream_update", new_callable=AsyncMock
-            ) as mock_pub,
-        ):
+        with patch.object(task_manager, "_upsert_task_search_doc", new_callable=AsyncMock):
             result = await task_manager.add_task_update("task-123", "Update")
             assert result is True
             # Should not publish if no thread_id
-            mock_pub.assert_not_called()
+            task_manager._redis.pipeline.return_value.xadd.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_add_task_update_publishes_stream_in_pipeline(self, task_manager):
+        """The WebSocket stream entry is written in the same pipeline."""
+        from redis_sre_agent.core.keys import RedisKeys
+
+        with patch.object(task_manager, "_upsert_task_search_doc", new_callable=AsyncMock):
+            await task_manager.add_task_update("task-123", "Update", "progress")
+
+        pipe = task_manager._redis.pipeline.return_value
+        task_manager._redis.pipeline.assert_called_once_with(transaction=True)
+        stream_key, fields = pipe.xadd.call_args.args
+        assert stream_key == RedisKeys.task_stream("thread-123")
+        assert fields["task_id"] == "task-123"
+        assert fields["message"] == "Update"
+        pipe.expire.assert_any_call(stream_key, 86400)
+
+    @pytest.mark.asyncio
+    async def test_add_task_update_caches_thread_id(self, task_manager):
+        """The task's thread is looked up once per manager."""
+        with patch.object(task_manager, "_upsert_task_search_doc", new_callable=AsyncMock):
+            await task_manager.add_task_update("task-123", "one")
+            await task_manager.add_task_update("task-123", "two")
+
+        task_manager._redis.hget.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_add_task_update_skips_full_upsert_once_seeded(self, task_manager):
+        """After a full search doc write, updates only refresh updated_at in the pipeline."""
+        task_manager._search_doc_fields["task-123"] = ("in_progress", "", "", "thread-123", "0")
+        pipe = _make_pipeline([1, True, True, True, True, b"1-0", True])
+        task_manager._redis.pipeline = MagicMock(return_value=pipe)
+
+        with patch.object(
+            task_manager, "_upsert_task_search_doc", new_callable=AsyncMock
+        ) as mock_upsert:
+            result = await task_manager.add_task_update("task-123", "Update")
+
+        assert result is True
+        mock_upsert.assert_not_awaited()
+        search_hsets = [c for c in pipe.hset.call_args_list if c.args[0] == "sre_tasks:task-123"]
+        assert len(search_hsets) == 1
+        assert search_hsets[0].args[1] == "updated_at"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_updates_share_one_pipeline(self):
+        """Updates submitted within the flush interval are written together."""
+        import asyncio
+
+        pipe = _make_pipeline([3, True, 2, True, b"1-0", b"1-1", b"2-0", True, True])
+        mock_redis = AsyncMock()
+        mock_redis.pipeline = MagicMock(return_value=pipe)
+        manager = TaskManager(redis_client=mock_redis, update_flush_interval=0.01)
+        manager._task_thread_ids.update({"task-a": "thread-a", "task-b": "thread-b"})
+
+        with patch.object(manager, "_upsert_task_search_doc", new_callable=AsyncMock):
+            results = await asyncio.gather(
+                manager.add_task_update("task-a", "a1"),
+                manager.add_task_update("task-a", "a2"),
+                manager.add_task_update("task-b", "b1"),
+            )
+
+        assert results == [True, True, True]
+        mock_redis.pipeline.assert_called_once()
+        pipe.execute.assert_awaited_once()
+        assert pipe.rpush.call_count == 2
+        assert len(pipe.rpush.call_args_list[0].args) == 3
+        assert pipe.xadd.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_add_task_update_propagates_pipeline_error(self, task_manager):
+        """A failed flush surfaces to the caller awaiting the update."""
+        task_manager._redis.pipeline.return_value.execute = AsyncMock(
+            side_effect=RuntimeError("connection lost")
+        )
+
+        with pytest.raises(RuntimeError, match="connection lost"):
+            await task_manager.add_task_update("task-123", "Update")
+
+    @pytest.mark.asyncio
+    async def test_batched_updates_get_their_own_outcome(self):
+        """A failed command or bad payload only fails the updates it belongs to."""
+        import asyncio
+
+        from redis.exceptions import ResponseError
+
+        wrongtype = ResponseError("WRONGTYPE Operation against a key")
+        # task-a RPUSH fails, task-b succeeds, the stream XADD for task-b fails
+        pipe = _make_pipeline([wrongtype, True, 4, True, ResponseError("stream"), True])
+        mock_redis = AsyncMock()
+        mock_redis.pipeline = MagicMock(return_value=pipe)
+        manager = TaskManager(redis_client=mock_redis, update_flush_interval=0.01)
+        manager._task_thread_ids.update({"task-a": "", "task-b": "thread-b"})
+
+        with patch.object(manager, "_upsert_task_search_doc", new_callable=AsyncMock):
+            results = await asyncio.gather(
+                manager.add_task_update("task-a", "a1"),
+                manager.add_task_update("task-b", "b1"),
+                manager.add_task_update("task-b", "b2", metadata={"bad": object()}),
+                return_exceptions=True,
+            )
+
+        assert results[0] is wrongtype
+        assert results[1] is True
+        assert isinstance(results[2], TypeError)
+        pipe.execute.assert_awaited_once_with(raise_on_error=False)
+        assert pipe.xadd.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_aborted_transaction_is_retried_per_task(self):
+        """An aborted MULTI applies nothing, so each task is written on its own."""
+        import asyncio
+
+        from redis.exceptions import ExecAbortError
+
+        batch_pipe = _make_pipeline()
+        batch_pipe.execute = AsyncMock(side_effect=ExecAbortError("EXECABORT"))
+        bad_pipe = _make_pipeline()
+        bad_pipe.execute = AsyncMock(side_effect=ExecAbortError("EXECABORT"))
+        good_pipe = _make_pipeline([2, True])
+        mock_redis = AsyncMock()
+        mock_redis.pipeline = MagicMock(side_effect=[batch_pipe, bad_pipe, good_pipe])
+        manager = TaskManager(redis_client=mock_redis, update_flush_interval=0.01)
+        manager._task_thread_ids.update({"task-a": "", "task-b": ""})
+
+        with patch.object(manager, "_upsert_task_search_doc", new_callable=AsyncMock):
+            results = await asyncio.gather(
+                manager.add_task_update("task-a", "a1"),
+                manager.add_task_update("task-b", "b1"),
+                return_exceptions=True,
+            )
+
+        assert isinstance(results[0], ExecAbortError)
+        assert results[1] is True
+        assert mock_redis.pipeline.call_count == 3
 
 
 class TestTaskManagerGetThreadId:
@@ -461,6 +597,18 @@ class TestTaskManagerUpsertSearchDoc:
             # Index creation is best-effort, may or may not be called
             # The important thing is it doesn't fail
 
+    @pytest.mark.asyncio
+    async def test_upsert_search_doc_only_touches_updated_at_when_unchanged(self, task_manager):
+        """A repeat upsert with identical indexed fields writes just the timestamp."""
+        with patch("redis_sre_agent.core.tasks._tasks_index_ready", True):
+            await task_manager._upsert_task_search_doc("task-123")
+            await task_manager._upsert_task_search_doc("task-123")
+
+        first, second = task_manager._redis.hset.call_args_list
+        assert "mapping" in first.kwargs
+        assert second.args[:2] == ("sre_tasks:task-123", "updated_at")
+        assert task_manager._task_thread_ids["task-123"] == "thread-123"
+
     @pytest.mark.asyncio
     async def test_upsert_search_doc_failure(self, task_manager):
         """Test search doc upsert failure."""
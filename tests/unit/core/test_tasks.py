@@ -1,7 +1,7 @@
 """Unit tests for Docket task system and SRE tasks."""
 
 import asyncio
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
@@ -1157,33 +1157,76 @@ class TestSchedulerTask:
         """Test scheduler task when no schedules need runs."""
         with (
             patch(
-                "redis_sre_agent.core.schedules.find_schedules_needing_runs",
+                "redis_sre_agent.core.schedules.ensure_schedule_due_index",
+                new_callable=AsyncMock,
+                return_value=0,
+            ),
+            patch(
+                "redis_sre_agent.core.schedules.claim_due_schedules",
                 new_callable=AsyncMock,
                 return_value=[],
             ),
+            patch(
+                "redis_sre_agent.core.docket_tasks.get_redis_url",
+                new_callable=AsyncMock,
+                return_value="redis://localhost:6379",
+            ),
+            patch(
+                "redis_sre_agent.core.docket_tasks.Docket",
+            ) as mock_docket_class,
         ):
+            mock_docket_class.return_value.__aenter__ = AsyncMock(return_value=AsyncMock())
+            mock_docket_class.return_value.__aexit__ = AsyncMock(return_value=None)
+
             result = await scheduler_task()
 
         assert result["submitted_tasks"] == 0
         assert result["status"] == "completed"
         assert "task_id" in result
 
+    @pytest.mark.asyncio
+    async def test_scheduler_task_does_not_claim_when_docket_is_unreachable(self):
+        """Runs are only claimed once the Docket connection is up."""
+        with (
+            patch(
+                "redis_sre_agent.core.schedules.ensure_schedule_due_index",
+                new_callable=AsyncMock,
+                return_value=0,
+            ),
+            patch(
+                "redis_sre_agent.core.schedules.claim_due_schedules",
+                new_callable=AsyncMock,
+            ) as mock_claim,
+            patch(
+                "redis_sre_agent.core.docket_tasks.get_redis_url",
+                new_callable=AsyncMock,
+                return_value="redis://localhost:6379",
+            ),
+            patch(
+                "redis_sre_agent.core.docket_tasks.Docket",
+            ) as mock_docket_class,
+        ):
+            mock_docket_class.return_value.__aenter__ = AsyncMock(
+                side_effect=ConnectionError("down")
+            )
+
+            with pytest.raises(ConnectionError):
+                await scheduler_task()
+
+        mock_claim.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_scheduler_task_with_schedules(self):
-        """Test scheduler task with schedules needing runs."""
-        mock_schedule = {
+        """Claimed runs are submitted to Docket for their exact due time."""
+        scheduled_at = datetime.now(timezone.utc) + timedelta(seconds=12, milliseconds=250)
+        claimed_run = {
             "id": "sched-1",
             "name": "Test Schedule",
             "instructions": "Check Redis health",
-            "next_run_at": datetime.now(timezone.utc).isoformat(),
             "redis_instance_id": "inst-1",
-            "cron_expression": "*/5 * * * *",
+            "scheduled_at": scheduled_at,
         }
 
-        # Mock Redis client - needs to be returned from async get_redis_client
-        mock_redis = AsyncMock()
-        mock_redis.set = AsyncMock(return_value=True)  # Dedup key set succeeds
-
         mock_docket = AsyncMock()
         mock_docket.add = MagicMock()
         mock_task_func = AsyncMock(return_value="task-123")
@@ -1193,26 +1236,17 @@ class TestSchedulerTask:
         mock_thread_manager.create_thread = AsyncMock(return_value="thread-123")
         mock_thread_manager.set_thread_subject = AsyncMock()
 
-        # get_redis_client is called both sync and async in the function
-        # Line 380: redis_client = get_redis_client() - sync
-        # Line 412: redis_client = await get_redis_client() - async
-        async def mock_get_redis_client():
-            return mock_redis
-
         with (
             patch(
-                "redis_sre_agent.core.schedules.find_schedules_needing_runs",
+                "redis_sre_agent.core.schedules.ensure_schedule_due_index",
                 new_callable=AsyncMock,
-                return_value=[mock_schedule],
+                return_value=0,
             ),
             patch(
-                "redis_sre_agent.core.schedules.update_schedule_last_run",
+                "redis_sre_agent.core.schedules.claim_due_schedules",
                 new_callable=AsyncMock,
-            ),
-            patch(
-                "redis_sre_agent.core.schedules.update_schedule_next_run",
-                new_callable=AsyncMock,
-            ),
+                return_value=[claimed_run],
+            ) as mock_claim,
             patch(
                 "redis_sre_agent.core.docket_tasks.get_redis_url",
                 new_callable=AsyncMock,
@@ -1223,65 +1257,74 @@ class TestSchedulerTask:
             ) as mock_docket_class,
             patch(
                 "redis_sre_agent.core.docket_tasks.get_redis_client",
-                side_effect=lambda: mock_redis,
+                return_value=AsyncMock(),
             ),
             patch(
                 "redis_sre_agent.core.docket_tasks.ThreadManager",
                 return_value=mock_thread_manager,
             ),
-            patch(
-                "redis_sre_agent.core.schedules.Schedule",
-            ) as mock_schedule_class,
         ):
-            # Setup async context manager for Docket
             mock_docket_class.return_value.__aenter__ = AsyncMock(return_value=mock_docket)
             mock_docket_class.return_value.__aexit__ = AsyncMock(return_value=None)
 
-            # Setup Schedule mock
-            mock_schedule_obj = MagicMock()
-            mock_schedule_obj.calculate_next_run.return_value = datetime.now(timezone.utc)
-            mock_schedule_class.return_value = mock_schedule_obj
-
             result = await scheduler_task()
 
         assert result["status"] == "completed"
         assert result["processed_schedules"] == 1
-        # Note: submitted_tasks may be 0 if the async get_redis_client call fails
-        # The important thing is the function completes without error
+        assert result["submitted_tasks"] == 1
+
+        # Claims reach past the next scheduler run
+        horizon = mock_claim.await_args.args[0]
+        assert horizon - mock_claim.await_args.kwargs["current_time"] > timedelta(seconds=30)
+
+        add_kwargs = mock_docket.add.call_args.kwargs
+        assert add_kwargs["when"] == scheduled_at
+        assert add_kwargs["key"] == f"schedule_sched-1_{scheduled_at.strftime('%Y%m%d_%H%M%S')}"
+        context = mock_task_func.await_args.kwargs["context"]
+        assert context["instance_id"] == "inst-1"
+        assert context["scheduled_at"] == scheduled_at.isoformat()
+        mock_thread_manager.set_thread_subject.assert_awaited_once_with(
+            "thread-123", "Test Schedule"
+        )
 
     @pytest.mark.asyncio
-    async def test_scheduler_task_dedup_prevents_duplicate(self):
-        """Test scheduler task deduplication prevents duplicate submissions."""
-        mock_schedule = {
-            "id": "sched-1",
-            "name": "Test Schedule",
-            "instructions": "Check Redis health",
-            "next_run_at": datetime.now(timezone.utc).isoformat(),
-            "cron_expression": "*/5 * * * *",
-        }
-
-        mock_redis = AsyncMock()
-        mock_redis.set = AsyncMock(return_value=False)  # Dedup key already exists
+    async def test_scheduler_task_counts_failed_submissions(self):
+        """A failed submission does not stop the others and is released for retry."""
+        now = datetime.now(timezone.utc)
+        claimed_runs = [
+            {
+                "id": f"sched-{i}",
+                "name": f"Schedule {i}",
+                "instructions": "Check",
+                "redis_instance_id": None,
+                "scheduled_at": now,
+            }
+            for i in range(3)
+        ]
 
         mock_docket = AsyncMock()
+        mock_docket.add = MagicMock(return_value=AsyncMock(return_value="task"))
+
         mock_thread_manager = AsyncMock()
-        mock_thread_manager.create_thread = AsyncMock(return_value="thread-123")
-        mock_thread_manager.set_thread_subject = AsyncMock()
+        mock_thread_manager.create_thread = AsyncMock(
+            side_effect=["thread-0", RuntimeError("boom"), "thread-2"]
+        )
 
         with (
             patch(
-                "redis_sre_agent.core.schedules.find_schedules_needing_runs",
+                "redis_sre_agent.core.schedules.ensure_schedule_due_index",
                 new_callable=AsyncMock,
-                return_value=[mock_schedule],
+                return_value=0,
             ),
             patch(
-                "redis_sre_agent.core.schedules.update_schedule_last_run",
+                "redis_sre_agent.core.schedules.claim_due_schedules",
                 new_callable=AsyncMock,
+                return_value=claimed_runs,
             ),
             patch(
-                "redis_sre_agent.core.schedules.update_schedule_next_run",
+                "redis_sre_agent.core.schedules.release_schedule_claims",
                 new_callable=AsyncMock,
-            ),
+            ) as mock_release,
             patch(
                 "redis_sre_agent.core.docket_tasks.get_redis_url",
                 new_callable=AsyncMock,
@@ -1292,28 +1335,21 @@ class TestSchedulerTask:
             ) as mock_docket_class,
             patch(
                 "redis_sre_agent.core.docket_tasks.get_redis_client",
-                return_value=mock_redis,
+                return_value=AsyncMock(),
             ),
             patch(
                 "redis_sre_agent.core.docket_tasks.ThreadManager",
                 return_value=mock_thread_manager,
             ),
-            patch(
-                "redis_sre_agent.core.schedules.Schedule",
-            ) as mock_schedule_class,
         ):
             mock_docket_class.return_value.__aenter__ = AsyncMock(return_value=mock_docket)
             mock_docket_class.return_value.__aexit__ = AsyncMock(return_value=None)
 
-            mock_schedule_obj = MagicMock()
-            mock_schedule_obj.calculate_next_run.return_value = datetime.now(timezone.utc)
-            mock_schedule_class.return_value = mock_schedule_obj
-
             result = await scheduler_task()
 
-        # Task was not submitted due to deduplication
-        assert result["submitted_tasks"] == 0
-        assert result["processed_schedules"] == 1
+        assert result["processed_schedules"] == 3
+        assert result["submitted_tasks"] == 2
+        mock_release.assert_awaited_once_with([claimed_runs[1]])
 
 
 class TestProcessAgentTurn:
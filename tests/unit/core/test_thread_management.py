@@ -24,6 +24,17 @@ from redis_sre_agent.core.threads import (
 from redis_sre_agent.core.turn_scope import TurnScope
 
 
+def _mock_redis_client() -> AsyncMock:
+    """AsyncMock Redis client whose pipeline() behaves like redis.asyncio's."""
+    mock_redis = AsyncMock()
+    pipe = MagicMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=None)
+    pipe.execute = AsyncMock(return_value=[1])
+    mock_redis.pipeline = MagicMock(return_value=pipe)
+    return mock_redis
+
+
 class TestThreadManager:
     """Test thread management functionality."""
 
@@ -149,7 +160,7 @@ class TestProcessAgentTurn:
             patch("redis_sre_agent.core.docket_tasks.route_to_appropriate_agent") as mock_route,
         ):
             # Mock Redis client
-            mock_redis = AsyncMock()
+            mock_redis = _mock_redis_client()
             mock_get_redis.return_value = mock_redis
 
             # Mock thread manager
@@ -475,7 +486,7 @@ class TestProcessAgentTurn:
             patch("redis_sre_agent.core.docket_tasks.get_redis_client") as mock_get_redis,
             patch("redis_sre_agent.core.docket_tasks.ThreadManager") as mock_manager_class,
         ):
-            mock_redis = AsyncMock()
+            mock_redis = _mock_redis_client()
             mock_get_redis.return_value = mock_redis
 
             mock_manager = AsyncMock()
@@ -678,7 +689,7 @@ class TestProcessAgentTurn:
             patch("redis_sre_agent.core.docket_tasks.route_to_appropriate_agent") as mock_route,
         ):
             # Mock Redis client
-            mock_redis = AsyncMock()
+            mock_redis = _mock_redis_client()
             mock_get_redis.return_value = mock_redis
 
             # Mock thread manager
@@ -1,11 +1,19 @@
 """Unit tests for vectorizer helper functions."""
 
-from unittest.mock import MagicMock, Mock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+from pydantic import SecretStr
 
 import redis_sre_agent.core.vectorizer_helpers as vectorizer_helpers
+from redis_sre_agent.core.config import Settings
 from redis_sre_agent.core.vectorizer_helpers import (
+    clear_vectorizer_cache,
     create_vectorizer,
+    get_cached_vectorizer,
     get_vectorizer_factory,
+    prewarm_vectorizer,
     set_vectorizer_factory,
 )
 
@@ -18,6 +26,7 @@ class TestVectorizerHelpers:
         vectorizer_helpers._vectorizer_factory = None
         vectorizer_helpers._settings_vectorizer_factory = None
         vectorizer_helpers._factory_initialized = False
+        clear_vectorizer_cache()
 
     def test_get_vectorizer_factory_returns_none_by_default(self):
         """Factory getter should return None when nothing is registered."""
@@ -70,7 +79,8 @@ class TestVectorizerHelpers:
         with (
             patch("redis_sre_agent.core.vectorizer_helpers.settings") as mock_settings,
             patch(
-                "redis_sre_agent.core.vectorizer_helpers.EmbeddingsCache", return_value=mock_cache
+                "redis_sre_agent.core.vectorizer_helpers.EmbeddingsCache",
+                return_value=mock_cache,
             ),
             patch(
                 "redis_sre_agent.core.redis.OpenAITextVectorizer",
@@ -83,6 +93,7 @@ class TestVectorizerHelpers:
             mock_settings.embedding_model = "text-embedding-3-small"
             mock_settings.openai_api_key = "test-key"
             mock_settings.openai_base_url = "https://proxy.example.com/v1"
+            mock_settings.vector_datatype = "float32"
             mock_settings.vectorizer_factory = None
 
             result = create_vectorizer()
@@ -95,6 +106,7 @@ class TestVectorizerHelpers:
                 "api_key": "test-key",
                 "base_url": "https://proxy.example.com/v1",
             },
+            dtype="float32",
         )
 
     def test_create_vectorizer_local_defaults(self):
@@ -105,7 +117,8 @@ class TestVectorizerHelpers:
         with (
             patch("redis_sre_agent.core.vectorizer_helpers.settings") as mock_settings,
             patch(
-                "redis_sre_agent.core.vectorizer_helpers.EmbeddingsCache", return_value=mock_cache
+                "redis_sre_agent.core.vectorizer_helpers.EmbeddingsCache",
+                return_value=mock_cache,
             ),
             patch(
                 "redis_sre_agent.core.redis.HFTextVectorizer",
@@ -116,6 +129,7 @@ class TestVectorizerHelpers:
             mock_settings.embeddings_cache_ttl = 120
             mock_settings.embedding_provider = "local"
             mock_settings.embedding_model = "sentence-transformers/all-MiniLM-L6-v2"
+            mock_settings.vector_datatype = "float16"
             mock_settings.vectorizer_factory = None
 
             result = create_vectorizer()
@@ -124,6 +138,7 @@ class TestVectorizerHelpers:
         mock_hf_vectorizer.assert_called_once_with(
             model="sentence-transformers/all-MiniLM-L6-v2",
             cache=mock_cache,
+            dtype="float16",
         )
 
     def test_custom_factory_receives_provider_model_config_and_cache(self):
@@ -136,7 +151,8 @@ class TestVectorizerHelpers:
         with (
             patch("redis_sre_agent.core.vectorizer_helpers.settings") as mock_settings,
             patch(
-                "redis_sre_agent.core.vectorizer_helpers.EmbeddingsCache", return_value=mock_cache
+                "redis_sre_agent.core.vectorizer_helpers.EmbeddingsCache",
+                return_value=mock_cache,
             ),
         ):
             mock_settings.redis_url.get_secret_value.return_value = "redis://localhost:6379/0"
@@ -169,7 +185,8 @@ class TestVectorizerHelpers:
                 return_value=module,
             ),
             patch(
-                "redis_sre_agent.core.vectorizer_helpers.EmbeddingsCache", return_value=mock_cache
+                "redis_sre_agent.core.vectorizer_helpers.EmbeddingsCache",
+                return_value=mock_cache,
             ),
         ):
             mock_settings.redis_url.get_secret_value.return_value = "redis://localhost:6379/0"
@@ -206,7 +223,8 @@ class TestVectorizerHelpers:
                 return_value=module,
             ),
             patch(
-                "redis_sre_agent.core.vectorizer_helpers.EmbeddingsCache", return_value=mock_cache
+                "redis_sre_agent.core.vectorizer_helpers.EmbeddingsCache",
+                return_value=mock_cache,
             ),
         ):
             result = create_vectorizer(config=config)
@@ -226,7 +244,8 @@ class TestVectorizerHelpers:
         with (
             patch("redis_sre_agent.core.vectorizer_helpers.settings") as mock_settings,
             patch(
-                "redis_sre_agent.core.vectorizer_helpers.EmbeddingsCache", return_value=mock_cache
+                "redis_sre_agent.core.vectorizer_helpers.EmbeddingsCache",
+                return_value=mock_cache,
             ),
             patch(
                 "redis_sre_agent.core.redis.OpenAITextVectorizer",
@@ -274,7 +293,8 @@ class TestVectorizerHelpers:
                 side_effect=resolve_factory_side_effect,
             ),
             patch(
-                "redis_sre_agent.core.vectorizer_helpers.EmbeddingsCache", return_value=mock_cache
+                "redis_sre_agent.core.vectorizer_helpers.EmbeddingsCache",
+                return_value=mock_cache,
             ),
         ):
             mock_settings.redis_url.get_secret_value.return_value = "redis://localhost:6379/0"
@@ -343,3 +363,126 @@ class TestVectorizerHelpers:
                 assert "aembed_many" in str(exc)
             else:
                 raise AssertionError("Expected TypeError for invalid vectorizer interface")
+
+
+class TestVectorizerRegistry:
+    """Test the per-loop vectorizer registry."""
+
+    def teardown_method(self):
+        vectorizer_helpers._vectorizer_factory = None
+        vectorizer_helpers._settings_vectorizer_factory = None
+        vectorizer_helpers._factory_initialized = False
+        clear_vectorizer_cache()
+
+    @pytest.mark.asyncio
+    async def test_same_configuration_reuses_instance(self):
+        config = Settings(openai_api_key="key-a")
+        with patch(
+            "redis_sre_agent.core.vectorizer_helpers.create_vectorizer",
+            side_effect=lambda **_: Mock(),
+        ) as mock_create:
+            first = get_cached_vectorizer(config)
+            second = get_cached_vectorizer(config)
+
+        assert first is second
+        mock_create.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_different_configuration_builds_new_instance(self):
+        with patch(
+            "redis_sre_agent.core.vectorizer_helpers.create_vectorizer",
+            side_effect=lambda **_: Mock(),
+        ) as mock_create:
+            first = get_cached_vectorizer(Settings(openai_api_key="key-a"))
+            second = get_cached_vectorizer(Settings(openai_api_key="key-b"))
+            third = get_cached_vectorizer(
+                Settings(openai_api_key="key-a", embedding_model="text-embedding-3-large")
+            )
+
+        assert len({id(first), id(second), id(third)}) == 3
+        assert mock_create.call_count == 3
+
+    def test_secret_api_keys_are_fingerprinted_by_value(self):
+        base = Settings()
+        first = base.model_copy(update={"openai_api_key": SecretStr("key-a")})
+        second = base.model_copy(update={"openai_api_key": SecretStr("key-b")})
+
+        fingerprint = vectorizer_helpers._config_fingerprint
+        assert fingerprint(first, None, {}) != fingerprint(second, None, {})
+
+    @pytest.mark.asyncio
+    async def test_set_vectorizer_factory_clears_registry(self):
+        config = Settings(openai_api_key="key-a")
+        with patch(
+            "redis_sre_agent.core.vectorizer_helpers.create_vectorizer",
+            side_effect=lambda **_: Mock(),
+        ):
+            first = get_cached_vectorizer(config)
+            set_vectorizer_factory(None)
+            second = get_cached_vectorizer(config)
+
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_prewarm_builds_and_embeds_once(self):
+        vectorizer = Mock(aembed=AsyncMock(return_value=[0.0]))
+        with patch(
+            "redis_sre_agent.core.vectorizer_helpers.create_vectorizer",
+            return_value=vectorizer,
+        ):
+            result = await prewarm_vectorizer(Settings(openai_api_key="key-a"))
+            again = get_cached_vectorizer(Settings(openai_api_key="key-a"))
+
+        assert result is vectorizer
+        assert again is vectorizer
+        vectorizer.aembed.assert_awaited_once_with("warmup")
+
+    def test_outside_a_loop_builds_a_new_instance(self):
+        config = Settings(openai_api_key="key-a")
+        with patch(
+            "redis_sre_agent.core.vectorizer_helpers.create_vectorizer",
+            side_effect=lambda **_: Mock(),
+        ) as mock_create:
+            first = get_cached_vectorizer(config)
+            second = get_cached_vectorizer(config)
+
+        assert first is not second
+        assert mock_create.call_count == 2
+
+    def test_each_event_loop_gets_its_own_instance(self):
+        config = Settings(openai_api_key="key-a")
+
+        async def lookup():
+            return get_cached_vectorizer(config), get_cached_vectorizer(config)
+
+        with patch(
+            "redis_sre_agent.core.vectorizer_helpers.create_vectorizer",
+            side_effect=lambda **_: Mock(),
+        ):
+            first, first_again = asyncio.run(lookup())
+            second, _ = asyncio.run(lookup())
+
+        assert first is first_again
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_embeddings_cache_is_given_the_pooled_redis_client(self):
+        shared = Mock()
+        with (
+            patch(
+                "redis_sre_agent.core.redis.get_redis_client", return_value=shared
+            ) as mock_get_client,
+            patch("redis_sre_agent.core.vectorizer_helpers.EmbeddingsCache") as mock_cache,
+        ):
+            cache = vectorizer_helpers._build_embeddings_cache(
+                Settings(redis_url="redis://localhost:6379/0")
+            )
+
+        assert cache is mock_cache.return_value
+        mock_get_client.assert_called_once_with(url="redis://localhost:6379/0")
+        mock_cache.assert_called_once_with(
+            name="sre_embeddings_cache",
+            redis_url="redis://localhost:6379/0",
+            async_redis_client=shared,
+            ttl=Settings().embeddings_cache_ttl,
+        )
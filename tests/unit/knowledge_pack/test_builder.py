@@ -1,18 +1,28 @@
 import json
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock
+from zipfile import ZIP_STORED, ZipFile
 
+import pytest
+
+from redis_sre_agent.core.config import Settings
+from redis_sre_agent.knowledge_pack import builder
 from redis_sre_agent.knowledge_pack.builder import (
     _copy_batch_artifacts,
+    build_knowledge_pack,
     compute_embedding_fingerprint,
     compute_schema_hash,
     resolve_pack_embedding_profile,
 )
+from redis_sre_agent.knowledge_pack.checksums import verify_zip_checksums
 from redis_sre_agent.knowledge_pack.models import (
     AIRGAP_EMBEDDING_MODEL,
     AIRGAP_EMBEDDING_PROVIDER,
     AIRGAP_PACK_PROFILE,
     AIRGAP_VECTOR_DIM,
+    KNOWLEDGE_PACK_CHUNK_RECORDS_FILE,
+    KNOWLEDGE_PACK_CHUNK_VECTORS_FILE,
     STANDARD_PACK_PROFILE,
 )
 
@@ -26,6 +36,18 @@ def test_compute_schema_hash_changes_with_vector_dim():
     assert small != large
 
 
+def test_compute_schema_hash_ignores_vector_index_tuning(monkeypatch):
+    baseline = compute_schema_hash(1536)
+    schema = json.loads(json.dumps(builder.SRE_KNOWLEDGE_SCHEMA))
+    for field in schema["fields"]:
+        if field["name"] == "vector":
+            field["attrs"].update(algorithm="hnsw", m=32, ef_construction=400, ef_runtime=20)
+    monkeypatch.setattr(builder, "SRE_KNOWLEDGE_SCHEMA", schema)
+
+    assert compute_schema_hash(1536) == baseline
+    assert compute_schema_hash(1536, "float16") != baseline
+
+
 def test_compute_embedding_fingerprint_changes_with_embedding_settings():
     schema_hash = compute_schema_hash(1536)
     baseline = compute_embedding_fingerprint(
@@ -101,3 +123,103 @@ def test_copy_batch_artifacts_excludes_batch_manifest_from_fallback_count(tmp_pa
     copied_count = _copy_batch_artifacts(source_batch_path, tmp_path / "pack-root")
 
     assert copied_count == 2
+
+
+class _FakePipeline:
+    def __init__(self, hashes):
+        self._hashes = hashes
+        self._keys = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def hgetall(self, key):
+        self._keys.append(key)
+
+    async def execute(self):
+        return [dict(self._hashes.get(key, {})) for key in self._keys]
+
+
+class _FakeRedis:
+    def __init__(self, hashes):
+        self.hashes = hashes
+        self.pipelines = 0
+
+    async def scan_iter(self, match, count=None):
+        prefix = match.split("*", 1)[0]
+        for key in self.hashes:
+            if key.startswith(prefix) and (":chunk:" in key) == (":chunk:" in match):
+                yield key.encode("utf-8")
+
+    def pipeline(self, transaction=True):
+        self.pipelines += 1
+        return _FakePipeline(self.hashes)
+
+
+@pytest.mark.asyncio
+async def test_build_knowledge_pack_streams_vectors_into_stored_sidecar(
+    tmp_path: Path, monkeypatch
+):
+    batch_path = tmp_path / "artifacts" / "2026-05-12"
+    batch_path.mkdir(parents=True)
+    (batch_path / "batch_manifest.json").write_text(
+        json.dumps({"batch_date": "2026-05-12", "total_documents": 1}), encoding="utf-8"
+    )
+    hashes = {
+        "sre_knowledge:doc-b:chunk:0": {b"id": b"b0", b"content": b"B", b"vector": b"\x02" * 8},
+        "sre_knowledge:doc-a:chunk:1": {b"id": b"a1", b"content": b"A1", b"vector": b"\x01" * 8},
+        "sre_knowledge:doc-a:chunk:0": {b"id": b"a0", b"content": b"A0", b"vector": b"\x00" * 8},
+        "sre_knowledge_meta:doc-a": {b"title": b"Doc A"},
+    }
+    redis_client = _FakeRedis(hashes)
+
+    async def fake_get_knowledge_index(**kwargs):
+        return SimpleNamespace(client=redis_client)
+
+    monkeypatch.setattr(
+        "redis_sre_agent.knowledge_pack.builder.get_knowledge_index", fake_get_knowledge_index
+    )
+    monkeypatch.setattr("redis_sre_agent.knowledge_pack.builder._HGETALL_BATCH_SIZE", 2)
+    output_path = tmp_path / "out" / "pack.zip"
+
+    result = await build_knowledge_pack(
+        batch_date="2026-05-12",
+        output_path=output_path,
+        artifacts_path=tmp_path / "artifacts",
+        repo_sha="abc123",
+        config=Settings(redis_url="redis://localhost:6379/0"),
+    )
+
+    assert result["record_counts"]["chunk_records"] == 3
+    assert result["record_counts"]["document_meta_records"] == 1
+    with ZipFile(output_path) as archive:
+        records = [
+            json.loads(line)
+            for line in archive.read(KNOWLEDGE_PACK_CHUNK_RECORDS_FILE).decode().splitlines()
+        ]
+        vectors_info = archive.getinfo(KNOWLEDGE_PACK_CHUNK_VECTORS_FILE)
+        vectors = archive.read(KNOWLEDGE_PACK_CHUNK_VECTORS_FILE)
+        manifest = json.loads(archive.read("manifest.json"))
+        registry = json.loads(archive.read("restore/active_pack_registry.json"))
+
+    assert [record["key"] for record in records] == [
+        "sre_knowledge:doc-a:chunk:0",
+        "sre_knowledge:doc-a:chunk:1",
+        "sre_knowledge:doc-b:chunk:0",
+    ]
+    assert [(record["vector_offset"], record["vector_length"]) for record in records] == [
+        (0, 8),
+        (8, 8),
+        (16, 8),
+    ]
+    assert "vector" not in records[0]["payload"]
+    assert vectors == b"\x00" * 8 + b"\x01" * 8 + b"\x02" * 8
+    assert vectors_info.compress_type == ZIP_STORED
+    assert manifest["pack_format_version"] == 2
+    assert registry["chunk_keys"] == [record["key"] for record in records]
+    # Two pipelined chunk batches plus one for the meta hashes
+    assert redis_client.pipelines == 3
+    verify_zip_checksums(output_path)
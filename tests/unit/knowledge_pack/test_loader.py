@@ -3,7 +3,7 @@ import hashlib
 import json
 from pathlib import Path
 from types import SimpleNamespace
-from zipfile import ZIP_DEFLATED, ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 import pytest
 
@@ -17,6 +17,7 @@ from redis_sre_agent.knowledge_pack.checksums import (
     write_checksums_file,
 )
 from redis_sre_agent.knowledge_pack.loader import (
+    _delete_registry_keys,
     _extract_artifacts_from_pack,
     _knowledge_index_stats,
     _materialize_registry_from_runtime_batch,
@@ -129,6 +130,28 @@ def test_get_restore_compatibility_matches_current_runtime():
     assert "match the pack fingerprint" in reason
 
 
+def test_get_restore_compatibility_names_differing_field():
+    config = Settings(
+        redis_url="redis://localhost:6379/0",
+        embedding_provider="openai",
+        embedding_model="text-embedding-3-small",
+        vector_dim=1536,
+        vector_datatype="float16",
+        vector_index_algorithm="hnsw",
+    )
+    manifest = _make_manifest(
+        provider="openai",
+        model="text-embedding-3-small",
+        vector_dim=1536,
+    )
+
+    compatible, reason = get_restore_compatibility(manifest, config=config)
+
+    assert compatible is False
+    assert "vector_datatype (runtime=float16, pack=float32)" in reason
+    assert "embedding_model" not in reason
+
+
 def test_inspect_knowledge_pack_reports_incompatible_runtime(tmp_path: Path):
     config = Settings(
         redis_url="redis://localhost:6379/0",
@@ -150,6 +173,36 @@ def test_inspect_knowledge_pack_reports_incompatible_runtime(tmp_path: Path):
     assert "do not match the pack fingerprint" in inspection.compatibility_reason
 
 
+class _ReplayPipeline:
+    """Pipeline stand-in that replays queued commands on its fake client."""
+
+    def __init__(self, client):
+        self.client = client
+        self.queued: list[tuple] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def __await__(self):
+        yield from ()
+        return self
+
+    def __getattr__(self, name):
+        def _queue(*args, **kwargs):
+            self.queued.append((name, args, kwargs))
+            return self
+
+        return _queue
+
+    async def execute(self):
+        return [
+            await getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.queued
+        ]
+
+
 @pytest.mark.asyncio
 async def test_knowledge_index_stats_uses_public_index_client(monkeypatch):
     class FakeClient:
@@ -448,6 +501,12 @@ async def test_restore_keeps_active_pack_keys_when_load_fails(tmp_path: Path, mo
     stored_registries: list[str] = []
 
     class FakeRedis:
+        def pipeline(self, transaction=True):
+            return _ReplayPipeline(self)
+
+        async def hset(self, key, mapping):
+            raise RuntimeError("restore failed")
+
         async def delete(self, *keys):
             deleted_keys.extend(keys)
             return len(keys)
@@ -458,9 +517,6 @@ async def test_restore_keeps_active_pack_keys_when_load_fails(tmp_path: Path, mo
     class FakeIndex:
         client = FakeRedis()
 
-        async def load(self, **kwargs):
-            raise RuntimeError("restore failed")
-
     async def noop_create_indices(**kwargs):
         return None
 
@@ -494,6 +550,117 @@ async def test_restore_keeps_active_pack_keys_when_load_fails(tmp_path: Path, mo
     assert stored_registries == []
 
 
+@pytest.mark.asyncio
+async def test_restore_streams_v2_records_with_sidecar_vectors(tmp_path: Path, monkeypatch):
+    manifest = _make_manifest(
+        provider="openai",
+        model="text-embedding-3-small",
+        vector_dim=1536,
+    )
+    chunk_keys = [f"sre_knowledge:doc-{i}:chunk:0" for i in range(5)]
+    registry = ActiveKnowledgePackRegistry(
+        pack_id=manifest.pack_id,
+        loaded_at="2026-05-13T00:00:00+00:00",
+        batch_date=manifest.batch_date,
+        schema_hash=manifest.schema_hash,
+        embedding_fingerprint=manifest.embedding_fingerprint,
+        chunk_keys=chunk_keys,
+        document_meta_keys=["sre_knowledge_meta:doc-0"],
+    )
+    records = [
+        {"key": key, "payload": {"id": key}, "vector_offset": i * 4, "vector_length": 4}
+        for i, key in enumerate(chunk_keys)
+    ]
+    pack_path = tmp_path / "pack.zip"
+    with ZipFile(pack_path, "w", compression=ZIP_DEFLATED) as archive:
+        archive.writestr(
+            "restore/knowledge_chunks.ndjson",
+            "".join(json.dumps(record) + "\n" for record in records),
+        )
+        archive.writestr(
+            "restore/knowledge_chunk_vectors.bin",
+            b"".join(bytes([i]) * 4 for i in range(5)),
+            compress_type=ZIP_STORED,
+        )
+        archive.writestr(
+            "restore/knowledge_document_meta.ndjson",
+            json.dumps({"key": "sre_knowledge_meta:doc-0", "mapping": {"title": "Doc"}}) + "\n",
+        )
+        archive.writestr("restore/knowledge_source_meta.ndjson", "")
+        archive.writestr("restore/active_pack_registry.json", registry.model_dump_json())
+
+    commands: list[tuple] = []
+    stored_registries: list[str] = []
+
+    class FakePipeline:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            return False
+
+        def sadd(self, key, *members):
+            commands.append(("sadd", key, *members))
+
+        async def hset(self, key, mapping):
+            commands.append(("hset", key, mapping))
+
+        async def execute(self):
+            return []
+
+    class FakeRedis:
+        def pipeline(self, transaction=True):
+            return FakePipeline()
+
+        async def set(self, key, value):
+            stored_registries.append(key)
+
+    class FakeIndex:
+        client = FakeRedis()
+
+    async def noop_create_indices(**kwargs):
+        return None
+
+    async def fake_get_index(**kwargs):
+        return FakeIndex()
+
+    async def fake_index_stats(config):
+        return {"exists": True, "num_docs": 0}
+
+    async def fake_load_registry(redis_client):
+        return None
+
+    monkeypatch.setattr("redis_sre_agent.knowledge_pack.loader.create_indices", noop_create_indices)
+    monkeypatch.setattr("redis_sre_agent.knowledge_pack.loader.get_knowledge_index", fake_get_index)
+    monkeypatch.setattr(
+        "redis_sre_agent.knowledge_pack.loader._knowledge_index_stats", fake_index_stats
+    )
+    monkeypatch.setattr("redis_sre_agent.knowledge_pack.loader._load_registry", fake_load_registry)
+    monkeypatch.setattr("redis_sre_agent.knowledge_pack.loader._RESTORE_BATCH_SIZE", 2)
+
+    result = await _restore_from_pack(
+        pack_path=pack_path,
+        manifest=manifest,
+        replace_existing=False,
+        config=Settings(redis_url="redis://localhost:6379/0"),
+    )
+
+    assert result["chunk_records_loaded"] == 5
+    assert result["document_meta_records_loaded"] == 1
+    assert result["source_meta_records_loaded"] == 0
+    loaded = {
+        command[1]: command[2]["vector"]
+        for command in commands
+        if command[0] == "hset" and command[1] in chunk_keys
+    }
+    assert loaded == {key: bytes([i]) * 4 for i, key in enumerate(chunk_keys)}
+    assert sorted(command[1] for command in commands if command[0] == "sadd") == [
+        f"sre_knowledge_chunks:doc-{i}" for i in range(5)
+    ]
+    assert ("hset", "sre_knowledge_meta:doc-0", {"title": "Doc"}) in commands
+    assert stored_registries == ["sre:knowledge_pack:active"]
+
+
 @pytest.mark.asyncio
 async def test_reingest_keeps_active_pack_keys_when_ingestion_fails(tmp_path: Path, monkeypatch):
     manifest = _make_manifest(
@@ -530,6 +697,9 @@ async def test_reingest_keeps_active_pack_keys_when_ingestion_fails(tmp_path: Pa
     }
 
     class FakeRedis:
+        def pipeline(self, transaction=True):
+            return _ReplayPipeline(self)
+
         async def hgetall(self, key):
             return dict(hashes.get(key, {}))
 
@@ -612,3 +782,43 @@ async def test_reingest_keeps_active_pack_keys_when_ingestion_fails(tmp_path: Pa
     }
     assert stored_registries == []
     assert orchestrator_scrapers == [[]]
+
+
+@pytest.mark.asyncio
+async def test_deleting_registry_keys_drops_chunks_from_chunk_registry():
+    registry = ActiveKnowledgePackRegistry(
+        pack_id="old-pack",
+        loaded_at="2026-05-12T00:00:00+00:00",
+        batch_date="2026-05-12",
+        schema_hash="schema",
+        embedding_fingerprint="fingerprint",
+        chunk_keys=["sre_knowledge:doc-1:chunk:0", "sre_knowledge:doc-1:chunk:1"],
+        document_meta_keys=["sre_knowledge_meta:doc-1"],
+        source_meta_keys=[],
+    )
+    pipelines: list[_ReplayPipeline] = []
+    registry_sets = {
+        "sre_knowledge_chunks:doc-1": {
+            "sre_knowledge:doc-1:chunk:0",
+            "sre_knowledge:doc-1:chunk:1",
+        }
+    }
+
+    class FakeRedis:
+        def pipeline(self, transaction=True):
+            pipelines.append(_ReplayPipeline(self))
+            return pipelines[-1]
+
+        async def delete(self, *keys):
+            return len(keys)
+
+        async def srem(self, key, *members):
+            registry_sets[key].difference_update(members)
+            return len(members)
+
+    deleted = await _delete_registry_keys(FakeRedis(), registry)
+
+    assert deleted["chunk_keys"] == 2
+    assert registry_sets == {"sre_knowledge_chunks:doc-1": set()}
+    # The chunk delete and the registry update share one transaction
+    assert [name for name, _, _ in pipelines[0].queued] == ["delete", "srem"]
@@ -9,6 +9,7 @@ import pytest
 from redis_sre_agent.mcp_server.server import (
     mcp,
     redis_sre_audit_cli_mcp_parity,
+    redis_sre_backfill_chunk_registry,
     redis_sre_backfill_empty_thread_subjects,
     redis_sre_backfill_instance_links,
     redis_sre_backfill_scheduled_thread_subjects,
@@ -156,6 +157,7 @@ class TestMCPServerSetup:
         assert "redis_sre_get_index_schema_status" in tool_names
         assert "redis_sre_recreate_indices" in tool_names
         assert "redis_sre_sync_index_schemas" in tool_names
+        assert "redis_sre_backfill_chunk_registry" in tool_names
         assert "redis_sre_list_schedules" in tool_names
         assert "redis_sre_get_schedule" in tool_names
         assert "redis_sre_create_schedule" in tool_names
@@ -2046,6 +2048,20 @@ class TestIndexTools:
         assert result == mock_result
         mock_helper.assert_awaited_once_with(index_name="knowledge", confirm=True)
 
+    @pytest.mark.asyncio
+    async def test_backfill_chunk_registry_delegates_to_helper(self):
+        mock_result = {"success": True, "indices": {"sre_knowledge": {"chunks": 3}}}
+
+        with patch(
+            "redis_sre_agent.core.index_helpers.backfill_chunk_registry_helper",
+            new_callable=AsyncMock,
+            return_value=mock_result,
+        ) as mock_helper:
+            result = await redis_sre_backfill_chunk_registry(force=True)
+
+        assert result == mock_result
+        mock_helper.assert_awaited_once_with(force=True)
+
     @pytest.mark.asyncio
     async def test_sync_index_schemas_error_payload(self):
         with patch(
@@ -3366,3 +3382,27 @@ class TestPurgeTasksTool:
             result = await redis_sre_purge_tasks(confirm=True, purge_all=True)
 
         assert result == {"error": "boom", "status": "failed"}
+
+
+@pytest.mark.asyncio
+async def test_serve_closes_redis_and_http_clients_on_exit():
+    from redis_sre_agent.mcp_server.server import _serve_and_close_redis
+
+    async def serve():
+        raise RuntimeError("transport closed")
+
+    with (
+        patch(
+            "redis_sre_agent.core.redis.close_redis_connections",
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("redis down"),
+        ) as close_redis,
+        patch(
+            "redis_sre_agent.tools.http.close_http_clients", new_callable=AsyncMock
+        ) as close_http,
+    ):
+        with pytest.raises(RuntimeError):
+            await _serve_and_close_redis(serve())
+
+    close_redis.assert_awaited_once()
+    close_http.assert_awaited_once()
@@ -17,13 +17,42 @@ def _async_iter(items):
     return generator()
 
 
+class _FakePipeline:
+    def __init__(self, results=None):
+        self.calls = []
+        self.mappings = {}
+        self.results = results
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def _queue(*args, **kwargs):
+            self.calls.append((name, args))
+            if "mapping" in kwargs:
+                self.mappings[args[0]] = kwargs["mapping"]
+            return self
+
+        return _queue
+
+    async def execute(self):
+        return self.results if self.results is not None else [1] * len(self.calls)
+
+
 @pytest.fixture
 def redis_client():
     client = AsyncMock()
-    client.scan_iter = lambda match=None: _async_iter([])
+    client.scan_iter = lambda match=None, count=None: _async_iter([])
     client.hgetall = AsyncMock(return_value={})
     client.delete = AsyncMock(return_value=0)
     client.hset = AsyncMock(return_value=1)
+    client.smembers = AsyncMock(return_value=set())
+    client.exists = AsyncMock(return_value=0)
+    client.sadd = AsyncMock(return_value=1)
+    client.pipeline = lambda transaction=True: _FakePipeline()
     return client
 
 
@@ -43,6 +72,7 @@ async def test_key_generation_and_decode_mapping(deduplicator):
         == f"sre_knowledge_meta:source:{expected_hash}"
     )
     assert DocumentDeduplicator._decode_mapping({b"a": b"1", "b": 2}) == {"a": "1", "b": 2}
+    assert deduplicator.generate_chunk_registry_key("abc") == "sre_knowledge_chunks:abc"
 
 
 @pytest.mark.asyncio
@@ -66,6 +96,70 @@ async def test_find_existing_chunks_success_and_scan_errors(redis_client, dedupl
     assert await broken_deduplicator.find_existing_chunks("hash") == []
 
 
+@pytest.mark.asyncio
+async def test_find_existing_chunks_registers_scanned_keys(redis_client, deduplicator):
+    redis_client.scan_iter = lambda match=None: _async_iter([b"sre_knowledge:hash:chunk:0"])
+
+    assert await deduplicator.find_existing_chunks("hash") == ["sre_knowledge:hash:chunk:0"]
+    redis_client.sadd.assert_awaited_once_with(
+        "sre_knowledge_chunks:hash", "sre_knowledge:hash:chunk:0"
+    )
+
+
+@pytest.mark.asyncio
+async def test_find_existing_chunks_uses_registry_without_scanning(redis_client, deduplicator):
+    def unexpected_scan(match=None):
+        raise AssertionError("registry lookups must not scan")
+
+    redis_client.scan_iter = unexpected_scan
+    redis_client.smembers.return_value = {
+        b"sre_knowledge:hash:chunk:1",
+        b"sre_knowledge:hash:chunk:0",
+    }
+    assert await deduplicator.find_existing_chunks("hash") == [
+        "sre_knowledge:hash:chunk:0",
+        "sre_knowledge:hash:chunk:1",
+    ]
+    redis_client.smembers.assert_awaited_with("sre_knowledge_chunks:hash")
+
+    # Once the index is backfilled an empty set means the document has no chunks
+    redis_client.smembers.return_value = set()
+    redis_client.exists.return_value = 1
+    assert await deduplicator.find_existing_chunks("other") == []
+    assert await deduplicator.find_existing_chunks("other") == []
+    redis_client.exists.assert_awaited_once_with("sre_knowledge_chunks:backfilled")
+
+
+@pytest.mark.asyncio
+async def test_backfill_chunk_registry_groups_keys_by_document(redis_client, deduplicator):
+    pipelines = []
+
+    def pipeline(transaction=True):
+        pipelines.append(_FakePipeline())
+        return pipelines[-1]
+
+    redis_client.pipeline = pipeline
+    redis_client.scan_iter = lambda match=None, count=None: _async_iter(
+        [
+            b"sre_knowledge:aaa:chunk:0",
+            "sre_knowledge:aaa:chunk:1",
+            "sre_knowledge:bbb:chunk:0",
+        ]
+    )
+
+    assert await deduplicator.backfill_chunk_registry(batch_size=2) == {
+        "documents": 2,
+        "chunks": 3,
+    }
+    assert [call for pipe in pipelines for call in pipe.calls] == [
+        ("sadd", ("sre_knowledge_chunks:aaa", "sre_knowledge:aaa:chunk:0")),
+        ("sadd", ("sre_knowledge_chunks:aaa", "sre_knowledge:aaa:chunk:1")),
+        ("sadd", ("sre_knowledge_chunks:bbb", "sre_knowledge:bbb:chunk:0")),
+    ]
+    assert redis_client.set.await_args.args[0] == "sre_knowledge_chunks:backfilled"
+    assert await deduplicator.is_chunk_registry_ready() is True
+
+
 @pytest.mark.asyncio
 async def test_delete_existing_chunks_variants(redis_client, deduplicator):
     deduplicator.find_existing_chunks = AsyncMock(return_value=[])
@@ -74,6 +168,8 @@ async def test_delete_existing_chunks_variants(redis_client, deduplicator):
     deduplicator.find_existing_chunks = AsyncMock(return_value=["a", "b"])
     redis_client.delete.return_value = 2
     assert await deduplicator.delete_existing_chunks("hash") == 2
+    redis_client.delete.assert_any_await("a", "b")
+    redis_client.delete.assert_awaited_with("sre_knowledge_chunks:hash")
 
     redis_client.delete.side_effect = RuntimeError("boom")
     assert await deduplicator.delete_existing_chunks("hash") == 0
@@ -210,15 +306,13 @@ async def test_delete_tracked_source_document(redis_client, deduplicator):
 @pytest.mark.asyncio
 async def test_get_existing_chunks_with_hashes_and_should_replace(redis_client, deduplicator):
     redis_client.scan_iter = lambda match=None: _async_iter([b"chunk:0", "chunk:1", "chunk:2"])
-    redis_client.hgetall.side_effect = [
-        {b"content_hash": b"same", b"vector": b"vec"},
-        {"content_hash": "other"},
-        {},
-    ]
+    pipe = _FakePipeline(results=[[b"same", b"vec"], ["other", None], [None, None]])
+    redis_client.pipeline = lambda transaction=True: pipe
 
     assert await deduplicator.get_existing_chunks_with_hashes("hash") == {
         "chunk:0": {"content_hash": "same", "vector": b"vec"}
     }
+    assert pipe.calls[0] == ("hmget", ("chunk:0", "content_hash", "vector"))
 
     redis_client.scan_iter = lambda match=None: (_ for _ in ()).throw(RuntimeError("boom"))
     assert await deduplicator.get_existing_chunks_with_hashes("hash") == {}
@@ -294,6 +388,8 @@ async def test_replace_document_chunks_reuses_and_embeds(redis_client, deduplica
     )
     deduplicator.delete_existing_chunks = AsyncMock(return_value=1)
     deduplicator.update_document_metadata = AsyncMock()
+    pipe = _FakePipeline()
+    redis_client.pipeline = lambda transaction=True: pipe
 
     vectorizer = AsyncMock()
     vectorizer.aembed_many = AsyncMock(return_value=[b"fresh"])
@@ -304,9 +400,22 @@ async def test_replace_document_chunks_reuses_and_embeds(redis_client, deduplica
     vectorizer.aembed_many.assert_awaited_once_with(["new body"], as_buffer=True)
     deduplicator.delete_existing_chunks.assert_awaited_once_with("hash")
     deduplicator.update_document_metadata.assert_awaited_once()
-    deduplicator.index.load.assert_awaited_once()
+    # Chunk hashes and their registry entry are written in one transaction
+    assert pipe.calls == [
+        ("hset", ("sre_knowledge:hash:chunk:0",)),
+        ("hset", ("sre_knowledge:hash:chunk:1",)),
+        (
+            "sadd",
+            (
+                "sre_knowledge_chunks:hash",
+                "sre_knowledge:hash:chunk:0",
+                "sre_knowledge:hash:chunk:1",
+            ),
+        ),
+    ]
+    redis_client.sadd.assert_not_awaited()
 
-    indexed_docs = deduplicator.index.load.await_args.kwargs["data"]
+    indexed_docs = list(pipe.mappings.values())
     assert indexed_docs[0]["vector"] == b"reused"
     assert indexed_docs[0]["product_labels"] == "redis,sre"
     assert indexed_docs[0]["product_label_tags"] == "ops"
@@ -353,7 +462,9 @@ async def test_replace_document_chunks_all_reused_and_error_paths(deduplicator):
     await deduplicator.replace_document_chunks(chunks, vectorizer)
     vectorizer.aembed_many.assert_not_called()
 
-    deduplicator.index.load.side_effect = RuntimeError("boom")
+    failing = _FakePipeline()
+    failing.execute = AsyncMock(side_effect=RuntimeError("boom"))
+    deduplicator.index.client.pipeline = lambda transaction=True: failing
     with pytest.raises(RuntimeError, match="boom"):
         await deduplicator.replace_document_chunks(chunks, AsyncMock())
 
@@ -0,0 +1,130 @@
+"""Tests for cross-document embedding batching."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from redis_sre_agent.pipelines.ingestion.embedding_batcher import EmbeddingBatcher
+
+
+def _vectorizer(fail_on=None):
+    calls = []
+
+    async def aembed_many(texts, as_buffer=False):
+        calls.append(list(texts))
+        if fail_on is not None and fail_on in texts:
+            raise RuntimeError(f"cannot embed {fail_on}")
+        return [f"vec:{text}".encode() if as_buffer else [len(text)] for text in texts]
+
+    return AsyncMock(aembed_many=AsyncMock(side_effect=aembed_many)), calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_batch():
+    vectorizer, calls = _vectorizer()
+    batcher = EmbeddingBatcher(vectorizer, linger_seconds=0.01)
+
+    first, second = await asyncio.gather(
+        batcher.aembed_many(["a", "b"], as_buffer=True),
+        batcher.aembed_many(["c"], as_buffer=True),
+    )
+
+    assert first == [b"vec:a", b"vec:b"]
+    assert second == [b"vec:c"]
+    assert calls == [["a", "b", "c"]]
+    assert batcher.stats == {"requests": 2, "texts": 3, "batches": 1}
+
+
+@pytest.mark.asyncio
+async def test_batches_respect_size_and_token_limits():
+    vectorizer, calls = _vectorizer()
+    batcher = EmbeddingBatcher(vectorizer, max_batch_size=3, max_batch_tokens=5)
+
+    results = await asyncio.gather(
+        batcher.aembed_many(["a", "b"], as_buffer=True),
+        batcher.aembed_many(["c", "d"], as_buffer=True),
+        batcher.aembed_many(["x" * 16], as_buffer=True),
+    )
+
+    assert results == [[b"vec:a", b"vec:b"], [b"vec:c", b"vec:d"], [b"vec:" + b"x" * 16]]
+    assert all(len(call) <= 3 for call in calls)
+    assert ["x" * 16] in calls
+    assert sorted(text for call in calls for text in call) == ["a", "b", "c", "d", "x" * 16]
+
+
+@pytest.mark.asyncio
+async def test_buffer_and_list_requests_are_batched_separately():
+    vectorizer, calls = _vectorizer()
+    batcher = EmbeddingBatcher(vectorizer, linger_seconds=0)
+
+    buffers, lists = await asyncio.gather(
+        batcher.aembed_many(["a"], as_buffer=True),
+        batcher.aembed_many(["bb"]),
+    )
+
+    assert buffers == [b"vec:a"]
+    assert lists == [[2]]
+    assert calls == [["a"], ["bb"]]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_only_fails_the_offending_document():
+    vectorizer, calls = _vectorizer(fail_on="bad")
+    batcher = EmbeddingBatcher(vectorizer, linger_seconds=0.01)
+
+    good, bad = await asyncio.gather(
+        batcher.aembed_many(["ok"], as_buffer=True),
+        batcher.aembed_many(["bad"], as_buffer=True),
+        return_exceptions=True,
+    )
+
+    assert good == [b"vec:ok"]
+    assert isinstance(bad, RuntimeError)
+    assert calls == [["ok", "bad"], ["ok"], ["bad"]]
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    in_flight = 0
+    peak = 0
+
+    async def aembed_many(texts, as_buffer=False):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [b"v"] * len(texts)
+
+    batcher = EmbeddingBatcher(
+        AsyncMock(aembed_many=AsyncMock(side_effect=aembed_many)),
+        max_batch_size=1,
+        max_concurrency=2,
+    )
+
+    await asyncio.gather(*(batcher.aembed_many([str(i)], as_buffer=True) for i in range(6)))
+
+    assert peak == 2
+    assert batcher.stats["batches"] == 6
+
+
+@pytest.mark.asyncio
+async def test_cancelled_batch_cancels_waiting_callers():
+    started = asyncio.Event()
+
+    async def aembed_many(texts, as_buffer=False):
+        started.set()
+        await asyncio.sleep(10)
+
+    batcher = EmbeddingBatcher(
+        AsyncMock(aembed_many=AsyncMock(side_effect=aembed_many)), linger_seconds=0
+    )
+    callers = [asyncio.ensure_future(batcher.aembed_many([text], as_buffer=True)) for text in "ab"]
+    await started.wait()
+
+    for task in list(batcher._tasks):
+        task.cancel()
+    results = await asyncio.wait_for(asyncio.gather(*callers, return_exceptions=True), 1)
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
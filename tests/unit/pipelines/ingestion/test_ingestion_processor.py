@@ -254,6 +254,13 @@ class TestIngestionPipeline:
         mock_redis_client.delete = mock_delete
         mock_redis_client.hset = mock_hset
 
+        # Chunks and their registry entries are written in one transaction pipeline
+        mock_pipe = MagicMock()
+        mock_pipe.__aenter__ = AsyncMock(return_value=mock_pipe)
+        mock_pipe.__aexit__ = AsyncMock(return_value=False)
+        mock_pipe.execute = AsyncMock(return_value=[])
+        mock_redis_client.pipeline = MagicMock(return_value=mock_pipe)
+
         # Set the client attribute on the mock index
         mock_index.client = mock_redis_client
 
@@ -575,7 +582,8 @@ class TestIngestionPipeline:
         assert len(result["categories_processed"]) == 3
 
         # Verify Redis components were called
-        mock_index.load.assert_called()
+        mock_index.client.pipeline.return_value.hset.assert_called()
+        mock_index.client.pipeline.return_value.sadd.assert_called()
         mock_save_manifest.assert_called_once()
 
     @pytest.mark.asyncio
@@ -1,6 +1,8 @@
 """Additional focused tests for ingestion processor helpers."""
 
+import asyncio
 import json
+import os
 import runpy
 import sys
 from pathlib import Path
@@ -520,6 +522,173 @@ async def test_process_category_ignores_empty_scope_for_non_source_docs(pipeline
     assert result["source_document_scopes"] == []
 
 
+@pytest.mark.asyncio
+async def test_process_category_streams_documents_through_bounded_workers(storage, tmp_path):
+    category_path = tmp_path / "shared"
+    category_path.mkdir()
+    for i in range(7):
+        (category_path / f"doc-{i}.json").write_text(
+            json.dumps(
+                {
+                    "title": f"Doc {i}",
+                    "content": "body",
+                    "source_url": f"https://redis.io/docs/doc-{i}",
+                    "category": "shared",
+                    "doc_type": "knowledge",
+                    "severity": "medium",
+                    "metadata": {},
+                }
+            ),
+            encoding="utf-8",
+        )
+
+    in_flight = 0
+    peak = 0
+
+    async def fake_index(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"chunks_created": 1, "chunks_indexed": 1, "source_document_change": None}
+
+    pipeline = IngestionPipeline(storage, config={"ingestion_concurrency": 3})
+    with (
+        patch.object(pipeline.processor, "chunk_document", return_value=[{"id": "chunk-1"}]),
+        patch(
+            "redis_sre_agent.pipelines.ingestion._processor_impl.index_processed_document",
+            new=AsyncMock(side_effect=fake_index),
+        ),
+    ):
+        result = await pipeline._process_category(
+            category_path, "shared", MagicMock(), {"knowledge": AsyncMock()}
+        )
+
+    assert result["documents_processed"] == 7
+    assert result["chunks_indexed"] == 7
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_process_category_reads_batch_documents_file_and_reports_unreadable_files(
+    storage, tmp_path
+):
+    batch_path = tmp_path / "2026-05-12"
+    category_path = batch_path / "shared"
+    category_path.mkdir(parents=True)
+    records = {
+        "shared/indexed.json": {
+            "title": "Indexed",
+            "content": "body",
+            "source_url": "https://redis.io/docs/indexed",
+            "category": "shared",
+            "doc_type": "knowledge",
+            "severity": "medium",
+            "metadata": {},
+        },
+        "shared/versioned.json": {
+            "title": "Versioned",
+            "content": "body",
+            "source_url": "https://redis.io/docs/7.8/versioned",
+            "category": "shared",
+            "doc_type": "knowledge",
+            "severity": "medium",
+            "metadata": {},
+        },
+    }
+    for relative_path in records:
+        # Content on disk differs from the batch documents record, which must win
+        (batch_path / relative_path).write_text("{}", encoding="utf-8")
+    (category_path / "broken.json").write_text("{not json", encoding="utf-8")
+    (batch_path / "batch_documents.ndjson").write_text(
+        "".join(json.dumps({"path": p, "document": d}) + "\n" for p, d in records.items()),
+        encoding="utf-8",
+    )
+
+    index = AsyncMock(
+        return_value={"chunks_created": 1, "chunks_indexed": 1, "source_document_change": None}
+    )
+    pipeline = IngestionPipeline(storage, config={"latest_only": True})
+    batch_index = pipeline._index_batch_documents("2026-05-12", batch_path)
+    with (
+        patch.object(pipeline.processor, "chunk_document", return_value=[{"id": "chunk-1"}]),
+        patch(
+            "redis_sre_agent.pipelines.ingestion._processor_impl.index_processed_document", index
+        ),
+    ):
+        result = await pipeline._process_category(
+            category_path,
+            "shared",
+            MagicMock(),
+            {"knowledge": AsyncMock()},
+            batch_index=batch_index,
+        )
+
+    assert len(batch_index) == 2
+    assert result["documents_processed"] == 1
+    assert index.await_args.kwargs["document"].title == "Indexed"
+    assert len(result["errors"]) == 1
+    assert result["errors"][0].startswith("Failed to process broken.json:")
+
+
+@pytest.mark.asyncio
+async def test_process_category_rewrites_stale_batch_documents_file_and_parses_once(
+    storage, tmp_path
+):
+    batch_path = tmp_path / "2026-05-12"
+    category_path = batch_path / "shared"
+    category_path.mkdir(parents=True)
+    documents_path = batch_path / "batch_documents.ndjson"
+    documents_path.write_text(
+        json.dumps({"path": "shared/doc.json", "document": {"title": "Stale"}}) + "\n",
+        encoding="utf-8",
+    )
+    artifact = category_path / "doc.json"
+    artifact.write_text(
+        json.dumps(
+            {
+                "title": "Fresh",
+                "content": "body",
+                "source_url": "https://redis.io/docs/doc",
+                "category": "shared",
+                "doc_type": "knowledge",
+                "severity": "medium",
+                "metadata": {},
+            }
+        ),
+        encoding="utf-8",
+    )
+    os.utime(documents_path, (1_000, 1_000))
+
+    index = AsyncMock(
+        return_value={"chunks_created": 1, "chunks_indexed": 1, "source_document_change": None}
+    )
+    pipeline = IngestionPipeline(storage, config={"latest_only": True})
+    batch_index = pipeline._index_batch_documents("2026-05-12", batch_path)
+    with (
+        # Summaries and documents both come from the rewritten file
+        patch("json.load", side_effect=AssertionError("artifact parsed again")),
+        patch.object(pipeline.processor, "chunk_document", return_value=[{"id": "chunk-1"}]),
+        patch(
+            "redis_sre_agent.pipelines.ingestion._processor_impl.index_processed_document", index
+        ),
+    ):
+        result = await pipeline._process_category(
+            category_path,
+            "shared",
+            MagicMock(),
+            {"knowledge": AsyncMock()},
+            batch_index=batch_index,
+        )
+
+    assert artifact in batch_index
+    assert result["documents_processed"] == 1
+    assert result["errors"] == []
+    assert index.await_args.kwargs["document"].title == "Fresh"
+    assert storage.batch_documents_current("2026-05-12") is True
+
+
 @pytest.mark.asyncio
 async def test_process_category_keeps_failed_source_documents_in_scope(pipeline, tmp_path):
     category_path = tmp_path / "shared"
@@ -1114,6 +1283,39 @@ async def test_ingest_batch_error_path(pipeline, tmp_path):
             await pipeline.ingest_batch(batch_date)
 
 
+@pytest.mark.asyncio
+async def test_ingest_batch_drains_embedding_batcher_when_category_fails(pipeline, tmp_path):
+    batch_date = "2025-01-20"
+    batch_path = tmp_path / batch_date
+    (batch_path / "shared").mkdir(parents=True)
+    manifest = {"batch_date": batch_date, "documents": [{"category": "shared"}]}
+    vectorizer = MagicMock()
+    vectorizer.aembed_many = AsyncMock(return_value=[[0.1]])
+    queued = []
+
+    async def queue_then_fail(category_path, category, batcher, *args, **kwargs):
+        # Leave a request queued behind the linger timer, then fail the batch
+        queued.append(asyncio.ensure_future(batcher.aembed_many(["text"])))
+        await asyncio.sleep(0)
+        raise RuntimeError("process boom")
+
+    with (
+        patch.object(pipeline.storage, "get_batch_manifest", return_value=manifest),
+        patch.object(pipeline, "_build_deduplicators", return_value={"knowledge": AsyncMock()}),
+        patch(
+            "redis_sre_agent.pipelines.ingestion._processor_impl.get_vectorizer",
+            return_value=vectorizer,
+        ),
+        patch.object(pipeline, "_list_tracked_source_documents", return_value={}),
+        patch.object(pipeline, "_process_category", side_effect=queue_then_fail),
+    ):
+        with pytest.raises(RuntimeError, match="process boom"):
+            await pipeline.ingest_batch(batch_date)
+
+    vectorizer.aembed_many.assert_awaited_once_with(["text"], as_buffer=False)
+    assert await queued[0] == [[0.1]]
+
+
 def test_pipeline_module_main_executes_help():
     original_argv = sys.argv[:]
     sys.argv = ["redis_sre_agent.cli.pipeline", "--help"]
@@ -1,4 +1,5 @@
 import json
+import os
 
 from redis_sre_agent.pipelines.scraper.base import (
     ArtifactStorage,
@@ -88,3 +89,109 @@ def test_save_batch_manifest_creates_batch_directory_when_empty(tmp_path):
     assert manifest["categories"] == {}
     assert manifest["document_types"] == {}
     assert manifest["sources"] == []
+
+
+def test_save_batch_manifest_writes_streamable_documents_file(tmp_path):
+    storage = ArtifactStorage(tmp_path)
+    storage.set_batch_date("2026-05-12")
+
+    document = ScrapedDocument(
+        title="KB Doc",
+        content="from scraper",
+        source_url="https://redis.io/kb/example",
+        category=DocumentCategory.OSS,
+        doc_type=DocumentType.DOCUMENTATION,
+    )
+    document_path = storage.save_document(document)
+    manifest_path = storage.save_batch_manifest()
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+
+    assert manifest["documents_file"] == "batch_documents.ndjson"
+    records = list(storage.iter_batch_documents("2026-05-12"))
+    assert records == [
+        (
+            document_path.relative_to(tmp_path / "2026-05-12").as_posix(),
+            json.loads(document_path.read_text(encoding="utf-8")),
+        )
+    ]
+
+
+def test_iter_batch_documents_skips_invalid_lines_and_missing_files(tmp_path):
+    storage = ArtifactStorage(tmp_path)
+    assert list(storage.iter_batch_documents("2026-05-12")) == []
+
+    batch_path = tmp_path / "2026-05-12"
+    batch_path.mkdir()
+    (batch_path / "batch_documents.ndjson").write_text(
+        '{"path": "oss/a.json", "document": {"title": "A"}}\nnot json\n\n{"document": {}}\n',
+        encoding="utf-8",
+    )
+
+    assert list(storage.iter_batch_documents("2026-05-12")) == [("oss/a.json", {"title": "A"})]
+
+
+def test_read_batch_document_by_record_offset(tmp_path):
+    storage = ArtifactStorage(tmp_path)
+    batch_path = tmp_path / "2026-05-12"
+    batch_path.mkdir()
+    (batch_path / "batch_documents.ndjson").write_text(
+        '{"path": "oss/a.json", "document": {"title": "A"}}\n'
+        "\n"
+        '{"path": "oss/b.json", "document": {"title": "B é"}}\n',
+        encoding="utf-8",
+    )
+
+    records = list(storage.iter_batch_records("2026-05-12"))
+
+    assert [(path, doc) for _, path, doc in records] == [
+        ("oss/a.json", {"title": "A"}),
+        ("oss/b.json", {"title": "B é"}),
+    ]
+    assert [storage.read_batch_document("2026-05-12", offset) for offset, _, _ in records] == [
+        {"title": "A"},
+        {"title": "B é"},
+    ]
+
+
+def test_batch_documents_current_tracks_artifact_mtimes(tmp_path):
+    storage = ArtifactStorage(tmp_path)
+    batch_path = tmp_path / "2026-05-12"
+    (batch_path / "oss").mkdir(parents=True)
+    artifact = batch_path / "oss" / "a.json"
+    artifact.write_text('{"title": "A"}', encoding="utf-8")
+    assert storage.batch_documents_current("2026-05-12") is False
+
+    documents_path = batch_path / "batch_documents.ndjson"
+    documents_path.write_text('{"path": "oss/a.json", "document": {"title": "A"}}\n')
+    os.utime(artifact, (1_000, 1_000))
+    os.utime(documents_path, (2_000, 2_000))
+    assert storage.batch_documents_current("2026-05-12") is True
+
+    os.utime(artifact, (3_000, 3_000))
+    assert storage.batch_documents_current("2026-05-12") is False
+
+
+def test_rewrite_batch_documents_yields_readable_offsets(tmp_path):
+    storage = ArtifactStorage(tmp_path)
+    batch_path = tmp_path / "2026-05-12"
+    (batch_path / "oss").mkdir(parents=True)
+    (batch_path / "oss" / "a.json").write_text('{"title": "A"}', encoding="utf-8")
+    (batch_path / "oss" / "b.json").write_text('{"title": "B é"}', encoding="utf-8")
+    (batch_path / "oss" / "broken.json").write_text("{not json", encoding="utf-8")
+    (batch_path / "batch_manifest.json").write_text("{}", encoding="utf-8")
+    (batch_path / "batch_documents.ndjson").write_text(
+        '{"path": "oss/a.json", "document": {"title": "stale"}}\n', encoding="utf-8"
+    )
+
+    records = list(storage.rewrite_batch_documents("2026-05-12"))
+
+    assert [(path, doc) for _, path, doc in records] == [
+        ("oss/a.json", {"title": "A"}),
+        ("oss/b.json", {"title": "B é"}),
+    ]
+    assert [storage.read_batch_document("2026-05-12", offset) for offset, _, _ in records] == [
+        {"title": "A"},
+        {"title": "B é"},
+    ]
+    assert list(storage.iter_batch_records("2026-05-12")) == records
+    assert storage.batch_documents_current("2026-05-12") is True
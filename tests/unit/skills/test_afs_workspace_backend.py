@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
@@ -609,3 +610,167 @@ def test_parse_event_stream_payload_extracts_jsonrpc_object() -> None:
     )
 
     assert payload["result"]["ok"] is True
+
+
+_CATALOG_SKILLS = [
+    {
+        "skillSlug": "redis-maintenance-triage",
+        "displayName": "Redis Maintenance Triage",
+        "description": "Check maintenance mode first.",
+        "version": "v1",
+        "resources": [],
+    },
+    {
+        "skillSlug": "example-incident-brief",
+        "displayName": "Example Incident Brief",
+        "description": "Produce an example incident brief.",
+        "version": "v1",
+        "resources": [],
+    },
+]
+
+
+def _pooled_client(handler) -> httpx.AsyncClient:  # type: ignore[no-untyped-def]
+    return httpx.AsyncClient(
+        base_url="https://skills.internal", transport=httpx.MockTransport(handler)
+    )
+
+
+@pytest.mark.asyncio
+async def test_afs_workspace_skill_backend_semantic_ranking_reuses_skill_embeddings() -> None:
+    backend = AFSWorkspaceSkillBackend(
+        base_url="https://skills.internal",
+        tenant_id="tenant_a",
+        project_id="proj_1",
+        agent_id="agent_1",
+    )
+    catalog = [dict(skill) for skill in _CATALOG_SKILLS]
+    vectorizer = AsyncMock()
+    vectorizer.aembed_many = AsyncMock(
+        side_effect=[
+            [[1.0, 0.0], [0.1, 0.9], [0.9, 0.1]],
+            [[0.0, 1.0]],
+            [[1.0, 0.0], [1.0, 0.0]],
+        ]
+    )
+
+    with patch("redis_sre_agent.core.redis.get_vectorizer", return_value=vectorizer):
+        first = await backend._semantic_rank_skills(catalog, query="incident brief")
+        second = await backend._semantic_rank_skills(catalog, query="maintenance")
+        catalog[0] = dict(catalog[0], description="Now covers failover too.")
+        third = await backend._semantic_rank_skills(catalog, query="failover")
+
+    assert [s["skillSlug"] for s in first] == ["example-incident-brief", "redis-maintenance-triage"]
+    assert [s["skillSlug"] for s in second] == [
+        "redis-maintenance-triage",
+        "example-incident-brief",
+    ]
+    assert [s["skillSlug"] for s in third] == ["redis-maintenance-triage", "example-incident-brief"]
+    calls = [call.args[0] for call in vectorizer.aembed_many.await_args_list]
+    assert calls[1] == ["maintenance"]
+    # Only the edited skill is re-embedded
+    assert len(calls[2]) == 2 and "failover" in calls[2][1]
+
+
+@pytest.mark.asyncio
+async def test_afs_workspace_skill_backend_semantic_ranking_falls_back_to_keywords() -> None:
+    backend = AFSWorkspaceSkillBackend(
+        base_url="https://skills.internal",
+        tenant_id="tenant_a",
+        project_id="proj_1",
+        agent_id="agent_1",
+    )
+    vectorizer = AsyncMock()
+    vectorizer.aembed_many = AsyncMock(return_value=[[1.0, 0.0], [1.0]])
+
+    with patch("redis_sre_agent.core.redis.get_vectorizer", return_value=vectorizer):
+        ranked = await backend._semantic_rank_skills(list(_CATALOG_SKILLS), query="incident")
+
+    assert [s["skillSlug"] for s in ranked] == ["example-incident-brief"]
+
+
+@pytest.mark.asyncio
+async def test_afs_workspace_skill_backend_revalidates_catalog_with_etag() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("if-none-match") == '"cat-1"':
+            return httpx.Response(304, headers={"ETag": '"cat-1"'})
+        return httpx.Response(
+            200,
+            json={"data": {"skills": _CATALOG_SKILLS, "total": 2}},
+            headers={"ETag": '"cat-1"'},
+        )
+
+    client = _pooled_client(handler)
+    backend = AFSWorkspaceSkillBackend(
+        base_url="https://skills.internal",
+        tenant_id="tenant_a",
+        project_id="proj_1",
+        agent_id="agent_1",
+        bearer_token="token",
+    )
+    with patch(
+        "redis_sre_agent.skills.afs_workspace_backend.get_http_client", return_value=client
+    ) as get_client:
+        first = await backend.list_skills(
+            query="incident", search_type="keyword", limit=10, offset=0, version="v1"
+        )
+        second = await backend.list_skills(
+            query="incident", search_type="keyword", limit=10, offset=0, version="v1"
+        )
+    await client.aclose()
+
+    assert get_client.call_args.args == ("https://skills.internal",)
+    assert get_client.call_args.kwargs["headers"]["Authorization"] == "Bearer token"
+    assert len(requests) == 2
+    assert "if-none-match" not in requests[0].headers
+    assert requests[1].headers["if-none-match"] == '"cat-1"'
+    assert dict(requests[1].url.params) == {"limit": "100", "offset": "0", "version": "v1"}
+    assert first["skills"] == second["skills"]
+    assert second["skills"][0]["name"] == "example-incident-brief"
+
+
+@pytest.mark.asyncio
+async def test_afs_workspace_skill_backend_gateway_uses_pooled_client() -> None:
+    catalog = json.dumps({"skills": _CATALOG_SKILLS})
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if body["method"] == "initialize":
+            payload = {"jsonrpc": "2.0", "id": body["id"], "result": {"protocolVersion": "v9"}}
+            return httpx.Response(
+                200,
+                text=f"event: message\ndata: {json.dumps(payload)}\n\n",
+                headers={"content-type": "text/event-stream", "mcp-session-id": "sess-1"},
+            )
+        assert request.headers["mcp-session-id"] == "sess-1"
+        assert request.headers["mcp-protocol-version"] == "v9"
+        return httpx.Response(
+            200,
+            json={
+                "jsonrpc": "2.0",
+                "id": body["id"],
+                "result": {"structuredContent": {"content": catalog}},
+            },
+        )
+
+    client = _pooled_client(handler)
+    backend = AFSWorkspaceSkillBackend(
+        base_url="https://skills.internal",
+        tenant_id="tenant_a",
+        project_id="proj_1",
+        agent_id="agent_1",
+        gateway_url="https://gateway.internal",
+        gateway_token="secret",
+        workspace_id="skills-proj-1-agent-1",
+    )
+    with patch("redis_sre_agent.skills.afs_workspace_backend.get_http_client", return_value=client):
+        result = await backend.list_skills(query=None, limit=10, offset=0, version="latest")
+    await client.aclose()
+
+    assert [skill["name"] for skill in result["skills"]] == [
+        "redis-maintenance-triage",
+        "example-incident-brief",
+    ]
@@ -4,6 +4,7 @@ These tests use mocked responses and a local mock admin API. No real Redis Enter
 cluster is required.
 """
 
+import asyncio
 import inspect
 from unittest.mock import AsyncMock, MagicMock, call, patch
 
@@ -18,6 +19,7 @@ from redis_sre_agent.tools.admin.redis_enterprise.provider import (
     RedisEnterpriseAdminConfig,
     RedisEnterpriseAdminToolProvider,
 )
+from redis_sre_agent.tools.admin.redis_enterprise.snapshot import project
 
 
 @pytest.fixture
@@ -230,6 +232,7 @@ async def test_create_tool_schemas(provider):
     assert any("get_crdb_health_report" in name for name in tool_names)
     assert any("get_crdt_syncer_state" in name for name in tool_names)
     assert any("get_sync_source_stats" in name for name in tool_names)
+    assert any("get_cluster_snapshot" in name for name in tool_names)
 
 
 @pytest.mark.asyncio
@@ -1441,3 +1444,189 @@ class TestRedisEnterpriseAdminSSLError:
 
             assert result["status"] == "error"
             assert "SSL" in result["error"] or "certificate" in result["error"].lower()
+
+
+def _json_client(payloads):
+    """Mock upstream client returning ``payloads[path]`` and recording GET paths."""
+    paths = []
+
+    async def get(path, params=None):
+        paths.append((path, dict(params or {})))
+        response = MagicMock()
+        response.json.return_value = payloads[path]
+        response.raise_for_status = MagicMock()
+        return response
+
+    client = AsyncMock()
+    client.get = AsyncMock(side_effect=get)
+    return client, paths
+
+
+TOPOLOGY = {
+    "/v1/cluster": {"name": "lab", "alert_settings": {"node_memory": {"enabled": True}}},
+    "/v1/bdbs": [
+        {"uid": 1, "name": "db1", "status": "active", "memory_size": 1024},
+        {"uid": 2, "name": "db2", "status": "active", "memory_size": 2048},
+    ],
+    "/v1/nodes": [{"uid": 1, "addr": "10.0.0.1", "status": "active"}],
+    "/v1/shards": [{"uid": "1", "bdb_uid": 1, "node_uid": "1", "role": "master"}],
+}
+
+
+class TestClusterSnapshot:
+    """Topology reads are memoized per cluster and fetched concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_listings_are_shared_across_providers_for_a_cluster(self, redis_instance, config):
+        client, paths = _json_client(TOPOLOGY)
+        first = RedisEnterpriseAdminToolProvider(redis_instance=redis_instance, config=config)
+        second = RedisEnterpriseAdminToolProvider(redis_instance=redis_instance, config=config)
+
+        with (
+            patch.object(first, "get_client", return_value=client),
+            patch.object(second, "get_client", return_value=client),
+        ):
+            await first.list_databases()
+            projected = await second.list_databases(fields="uid, name")
+            database = await second.get_database(uid=2, fields="name")
+            alerts = await first.get_cluster_alerts()
+            await second.get_cluster_info()
+
+        assert projected["databases"] == [{"uid": 1, "name": "db1"}, {"uid": 2, "name": "db2"}]
+        assert database["database"] == {"name": "db2"}
+        assert alerts["alert_settings"] == {"node_memory": {"enabled": True}}
+        assert paths == [("/v1/bdbs", {}), ("/v1/cluster", {})]
+
+    @pytest.mark.asyncio
+    async def test_listings_are_not_shared_across_passwords(self, redis_instance, config):
+        client, paths = _json_client(TOPOLOGY)
+        other_instance = redis_instance.model_copy(update={"admin_password": "wrong-password"})
+        first = RedisEnterpriseAdminToolProvider(redis_instance=redis_instance, config=config)
+        second = RedisEnterpriseAdminToolProvider(redis_instance=other_instance, config=config)
+
+        with (
+            patch.object(first, "get_client", return_value=client),
+            patch.object(second, "get_client", return_value=client),
+        ):
+            await first.list_databases()
+            await second.list_databases()
+
+        assert paths == [("/v1/bdbs", {}), ("/v1/bdbs", {})]
+        assert "wrong-password" not in repr(second._cluster_key)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_request(self, provider):
+        client, paths = _json_client(TOPOLOGY)
+
+        with patch.object(provider, "get_client", return_value=client):
+            results = await asyncio.gather(*(provider.list_nodes() for _ in range(5)))
+
+        assert all(result["count"] == 1 for result in results)
+        assert paths == [("/v1/nodes", {})]
+
+    @pytest.mark.asyncio
+    async def test_projection_without_full_listing_fetches_only_requested_fields(self, provider):
+        client, paths = _json_client(TOPOLOGY)
+
+        with patch.object(provider, "get_client", return_value=client):
+            await provider.list_shards(fields="uid,role")
+            await provider.list_shards(fields="uid,role")
+
+        assert paths == [("/v1/shards", {"fields": "uid,role"})]
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_memoization(self, redis_instance):
+        provider = RedisEnterpriseAdminToolProvider(
+            redis_instance=redis_instance,
+            config=RedisEnterpriseAdminConfig(snapshot_ttl_seconds=0),
+        )
+        client, paths = _json_client(TOPOLOGY)
+
+        with patch.object(provider, "get_client", return_value=client):
+            await provider.list_databases()
+            await provider.list_databases()
+
+        assert len(paths) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_cluster_snapshot(self, provider):
+        client, paths = _json_client(TOPOLOGY)
+
+        with patch.object(provider, "get_client", return_value=client):
+            snapshot = await provider.get_cluster_snapshot(database_fields="uid,status")
+            # The memoized shard listing serves a later single-shard lookup.
+            shard = await provider.get_shard(uid=1)
+
+        assert snapshot["status"] == "success"
+        assert snapshot["cluster"]["name"] == "lab"
+        assert snapshot["databases"] == [
+            {"uid": 1, "status": "active"},
+            {"uid": 2, "status": "active"},
+        ]
+        assert snapshot["counts"] == {"databases": 2, "nodes": 1, "shards": 1}
+        assert shard["shard"]["role"] == "master"
+        assert sorted(paths) == [
+            ("/v1/bdbs", {"fields": "uid,status"}),
+            ("/v1/cluster", {}),
+            ("/v1/nodes", {}),
+            ("/v1/shards", {}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_cluster_snapshot_reports_failed_sections(self, provider):
+        request = httpx.Request("GET", "https://test.example.com/v1/shards")
+        response = httpx.Response(403, request=request, text="forbidden")
+
+        async def get_json(path, params=None):
+            if path == "/v1/shards":
+                raise httpx.HTTPStatusError("forbidden", request=request, response=response)
+            return TOPOLOGY[path]
+
+        with patch.object(provider, "_get_json", side_effect=get_json):
+            snapshot = await provider.get_cluster_snapshot(include_cluster=False)
+
+        assert snapshot["status"] == "success"
+        assert "cluster" not in snapshot
+        assert snapshot["errors"] == {"shards": "HTTP 403: forbidden"}
+        assert snapshot["counts"] == {"databases": 2, "nodes": 1}
+
+
+@pytest.mark.asyncio
+async def test_rebalance_status_fetches_action_details_concurrently(provider):
+    """Ambiguous SMUpdateBDB actions are inspected in parallel, in list order."""
+    actions = [
+        {"action_uid": f"a{i}", "name": "SMUpdateBDB", "status": "running"} for i in range(4)
+    ]
+    in_flight = 0
+    peak = 0
+
+    async def get_json(path, params=None):
+        nonlocal in_flight, peak
+        if path == "/v2/actions":
+            return actions
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        uid = path.rsplit("/", 1)[-1]
+        return {
+            "action_uid": uid,
+            "name": "SMUpdateBDB",
+            "object_name": f"bdb:{uid[1:]}",
+            "pending_ops": {"shard:1": {"op_name": "migrate_shard"}},
+        }
+
+    with patch.object(provider, "_get_json", side_effect=get_json):
+        result = await provider.rebalance_status()
+
+    assert [row["action_uid"] for row in result["active"]] == ["a0", "a1", "a2", "a3"]
+    assert [row["db_uid"] for row in result["active"]] == [0, 1, 2, 3]
+    assert 1 < peak <= provider.config.max_concurrency
+
+
+def test_project_keeps_requested_fields():
+    rows = [{"uid": 1, "name": "a", "status": "active"}, {"uid": 2}]
+
+    assert project(rows, " uid, name ,uid,missing") == [{"uid": 1, "name": "a"}, {"uid": 2}]
+    assert project(rows, "") is rows
+    assert project("scalar", "uid") == "scalar"
@@ -1,17 +1,21 @@
-from unittest.mock import AsyncMock, patch
+import asyncio
+import re
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from pydantic import SecretStr
 
 from redis_sre_agent.core.instances import RedisInstance, RedisInstanceType
+from redis_sre_agent.tools.host_telemetry.merging import host_label, merge_host_matchers
 from redis_sre_agent.tools.host_telemetry.provider import (
     HostTelemetryConfig,
     HostTelemetryLokiConfig,
     HostTelemetryPromConfig,
     HostTelemetryToolProvider,
 )
+from redis_sre_agent.tools.logs.loki.provider import reduce_streams_response
 from redis_sre_agent.tools.manager import ToolManager
-from redis_sre_agent.tools.models import ToolDefinition
+from redis_sre_agent.tools.models import ENVELOPE_ONLY_KEY, ToolCapability, ToolDefinition
 
 
 class TestHostTelemetryPromConfig:
@@ -221,3 +225,194 @@ async def test_host_telemetry_minimal_metrics_and_logs():
             )
             assert lres["status"] == "success"
             assert lres["results"] and lres["results"][0]["provider"] in {"loki"}
+
+
+# --------------------------- Merged per-host queries ---------------------------
+
+
+class _FakeMetrics:
+    """Metrics provider answering ``{instance=~"a|b"}`` with one series per host."""
+
+    provider_name = "prometheus"
+
+    def __init__(self, aggregate: bool = False, delay: float = 0.0):
+        self.queries = []
+        self.aggregate = aggregate
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+
+    async def query_range(self, query, start_time, end_time, step):
+        self.queries.append(query)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        match = re.search(r'instance=~?"([^"]*)"', query)
+        hosts = [h.replace("\\\\", "") for h in match.group(1).split("|")]
+        labels = [{}] if self.aggregate else [{"instance": h} for h in hosts]
+        raw = [{"metric": m, "values": [[1, "1"]]} for m in labels]
+        return {
+            "status": "success",
+            "query": query,
+            "series": [{"metric": m, "samples": 1} for m in labels],
+            "series_count": len(labels),
+            ENVELOPE_ONLY_KEY: {"data": raw},
+        }
+
+
+class _FakeLogs:
+    """Loki-like provider with ``entries[host]`` log lines per host."""
+
+    provider_name = "loki"
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.calls = []
+
+    async def query_range(self, query, start, end, direction, limit):
+        self.calls.append((query, limit))
+        hosts = re.search(r'host=~?"([^"]*)"', query).group(1).split("|")
+        streams = [
+            {
+                "stream": {"job": "syslog", "host": h},
+                "values": [[str(10**18 + i), f"{h} line {i}"] for i in range(self.entries[h])],
+            }
+            for h in hosts
+            if self.entries.get(h)
+        ]
+        rows = sorted(
+            ((v, s["stream"]) for s in streams for v in s["values"]),
+            key=lambda r: int(r[0][0]),
+            reverse=True,
+        )[:limit]
+        result = {}
+        for value, labels in rows:
+            result.setdefault(labels["host"], {"stream": labels, "values": []})["values"].append(
+                value
+            )
+        payload = {
+            "status": "success",
+            "data": {"resultType": "streams", "result": list(result.values())},
+        }
+        return reduce_streams_response({"status": "success", "code": 200, "data": payload})
+
+
+def _telemetry(fake_metrics=None, fake_logs=None, **config):
+    provider = HostTelemetryToolProvider()
+    provider.instance_config = HostTelemetryConfig(**config)
+    manager = MagicMock()
+    manager.get_providers_for_capability.side_effect = lambda cap: {
+        ToolCapability.METRICS: [fake_metrics] if fake_metrics else [],
+        ToolCapability.LOGS: [fake_logs] if fake_logs else [],
+    }.get(cap, [])
+    provider._manager = manager
+    return provider
+
+
+_ALIASES = {
+    "cpu": 'rate(node_cpu_seconds_total{instance="{host}"}[5m])',
+    "mem": 'node_memory_MemAvailable_bytes{instance="{host}"}',
+}
+
+
+class TestHostMatcherMerging:
+    def test_host_label_requires_one_matcher_label(self):
+        assert host_label('up{instance="{host}"}') == "instance"
+        assert host_label("up{instance='{host}'} / on() up{instance='{host}'}") == "instance"
+        assert host_label('up{instance="{host}", node="{host}"}') is None
+        assert host_label('up{instance=~"{host}:.*"}') is None
+        assert host_label('topk(3, up{instance="{host}"})') is None
+
+    def test_merge_escapes_regex_and_string_characters(self):
+        merged = merge_host_matchers('up{instance="{host}"}', ["a.example:9100", 'b"q'])
+        assert merged == 'up{instance=~"a\\\\.example:9100|b\\"q"}'
+
+
+@pytest.mark.asyncio
+async def test_host_metrics_merges_hosts_into_one_query_per_alias():
+    metrics = _FakeMetrics()
+    provider = _telemetry(metrics, metrics={"metric_aliases": _ALIASES})
+    hosts = ["n1.example:9100", "n2.example:9100", "n3.example:9100"]
+
+    res = await provider.get_host_metrics(hosts, ["cpu", "mem"], start_time="1h")
+
+    assert len(metrics.queries) == 2
+    assert [(r["host"], r["key"]) for r in res["results"]] == [
+        (h, k) for h in hosts for k in ("cpu", "mem")
+    ]
+    for entry in res["results"]:
+        assert entry["result"]["series"] == [{"metric": {"instance": entry["host"]}, "samples": 1}]
+        assert entry["result"]["series_count"] == 1
+    raw = res[ENVELOPE_ONLY_KEY]["raw_results"]
+    assert [r["data"][0]["metric"]["instance"] for r in raw] == [h for h in hosts for _ in "ab"]
+
+
+@pytest.mark.asyncio
+async def test_host_metrics_falls_back_per_host_when_series_lose_host_label():
+    metrics = _FakeMetrics(aggregate=True)
+    provider = _telemetry(metrics, metrics={"metric_aliases": {"cpu": _ALIASES["cpu"]}})
+
+    res = await provider.get_host_metrics(["n1", "n2"], ["cpu"], start_time="1h")
+
+    assert metrics.queries[0] == 'rate(node_cpu_seconds_total{instance=~"n1|n2"}[5m])'
+    assert sorted(metrics.queries[1:]) == [
+        'rate(node_cpu_seconds_total{instance="n1"}[5m])',
+        'rate(node_cpu_seconds_total{instance="n2"}[5m])',
+    ]
+    assert sorted(r["query"] for r in res["results"]) == sorted(metrics.queries[1:])
+
+
+@pytest.mark.asyncio
+async def test_host_metrics_chunks_hosts_and_bounds_concurrency():
+    metrics = _FakeMetrics(delay=0.01)
+    provider = _telemetry(
+        metrics,
+        max_concurrency=2,
+        metrics={"metric_aliases": _ALIASES, "max_hosts_per_query": 10},
+    )
+    hosts = [f"n{i}" for i in range(35)]
+
+    res = await provider.get_host_metrics(hosts, ["cpu", "mem"], start_time="1h")
+
+    assert len(metrics.queries) == 8
+    assert metrics.peak == 2
+    assert all("result" in r for r in res["results"])
+    assert len(res["results"]) == 70
+
+
+@pytest.mark.asyncio
+async def test_host_logs_split_per_host_and_requery_crowded_out_hosts():
+    logs = _FakeLogs({"a": 30, "b": 2, "c": 0})
+    provider = _telemetry(fake_logs=logs, logs={"limit": 10, "max_entries_per_query": 30})
+
+    res = await provider.get_host_logs(["a", "b", "c"], start="1h", end="now")
+
+    merged_query, merged_limit = logs.calls[0]
+    assert merged_query == '{job="syslog", host=~"a|b|c"}'
+    assert merged_limit == 30
+    # "a" filled the merged limit, so "b" and "c" are asked on their own
+    assert sorted(logs.calls[1:]) == [
+        ('{job="syslog", host="b"}', 10),
+        ('{job="syslog", host="c"}', 10),
+    ]
+    by_host = {r["host"]: r for r in res["results"]}
+    assert [s["lines"] for s in by_host["a"]["result"]["data"]["streams"]] == [10]
+    assert by_host["a"]["query"] == merged_query
+    assert [s["lines"] for s in by_host["b"]["result"]["data"]["streams"]] == [2]
+    assert by_host["c"]["result"]["data"]["streams"] == []
+    assert [r["host"] for r in res[ENVELOPE_ONLY_KEY]["raw_results"]] == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_host_logs_keep_newest_entries_per_host():
+    logs = _FakeLogs({"a": 4, "b": 4})
+    provider = _telemetry(fake_logs=logs, logs={"limit": 3, "max_entries_per_query": 10})
+
+    res = await provider.get_host_logs(["a", "b"], start="1h", end="now", keywords=["err"])
+
+    assert logs.calls == [('{job="syslog", host=~"a|b"} |~ "(err)"', 6)]
+    raw = res[ENVELOPE_ONLY_KEY]["raw_results"]
+    for entry in raw:
+        (stream,) = entry["data"]["data"]["result"]
+        assert [v[0] for v in stream["values"]] == [str(10**18 + i) for i in (3, 2, 1)]
@@ -2,12 +2,13 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from redis_sre_agent.tools.logs.loki import provider as provider_module
 from redis_sre_agent.tools.logs.loki.provider import (
     LokiConfig,
     LokiInstanceConfig,
     LokiToolProvider,
 )
-from redis_sre_agent.tools.models import ToolCapability
+from redis_sre_agent.tools.models import ENVELOPE_ONLY_KEY, ToolCapability
 
 
 class TestLokiConfig:
@@ -481,17 +482,20 @@ class TestLokiToolProviderRequest:
         mock_response.headers = {"content-type": "application/json"}
         mock_response.json.return_value = {"data": {"result": []}}
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.request = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
+        mock_client = MagicMock()
+        mock_client.request = AsyncMock(return_value=mock_response)
+        with patch.object(provider_module, "get_http_client", return_value=mock_client):
             result = await provider._request("GET", "/loki/api/v1/query", params={"query": "{}"})
 
             assert result["status"] == "success"
             assert result["code"] == 200
+            mock_client.request.assert_awaited_once_with(
+                "GET",
+                "/loki/api/v1/query",
+                params={"query": "{}"},
+                data=None,
+                timeout=provider.config.timeout,
+            )
 
     @pytest.mark.asyncio
     async def test_request_non_json_response(self):
@@ -503,13 +507,9 @@ class TestLokiToolProviderRequest:
         mock_response.headers = {"content-type": "text/plain"}
         mock_response.text = "OK"
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.request = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
+        mock_client = MagicMock()
+        mock_client.request = AsyncMock(return_value=mock_response)
+        with patch.object(provider_module, "get_http_client", return_value=mock_client):
             result = await provider._request("GET", "/loki/api/v1/labels")
 
             assert result["status"] == "success"
@@ -525,13 +525,9 @@ class TestLokiToolProviderRequest:
         mock_response.headers = {"content-type": "application/json"}
         mock_response.json.return_value = {"message": "Bad Request"}
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.request = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
+        mock_client = MagicMock()
+        mock_client.request = AsyncMock(return_value=mock_response)
+        with patch.object(provider_module, "get_http_client", return_value=mock_client):
             result = await provider._request("GET", "/loki/api/v1/query")
 
             assert result["status"] == "error"
@@ -542,19 +538,94 @@ class TestLokiToolProviderRequest:
         """Test _request handles exceptions."""
         provider = LokiToolProvider()
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.request = AsyncMock(side_effect=Exception("Connection failed"))
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
+        mock_client = MagicMock()
+        mock_client.request = AsyncMock(side_effect=Exception("Connection failed"))
+        with patch.object(provider_module, "get_http_client", return_value=mock_client):
             result = await provider._request("GET", "/loki/api/v1/query")
 
             assert result["status"] == "error"
             assert "Connection failed" in result["error"]
 
 
+class TestLokiToolProviderReduction:
+    """Test template reduction of log query results."""
+
+    @staticmethod
+    def _streams_response():
+        base = 1_700_000_000_000_000_000
+        values = [
+            [str(base + i * 1_000_000_000), f"Accepted connection from 10.0.0.{i % 9}:6379"]
+            for i in range(20)
+        ]
+        values.append([str(base + 30_000_000_000), "Background saving started by pid 4242"])
+        return {
+            "status": "success",
+            "code": 200,
+            "data": {
+                "status": "success",
+                "data": {
+                    "resultType": "streams",
+                    "result": [{"stream": {"job": "redis"}, "values": values}],
+                },
+            },
+        }
+
+    @pytest.mark.asyncio
+    async def test_query_range_reduces_streams(self, monkeypatch):
+        provider = LokiToolProvider()
+        raw = self._streams_response()
+
+        async def fake_request(method, path, params=None, data=None):
+            return raw
+
+        monkeypatch.setattr(provider, "_request", fake_request)
+
+        res = await provider.query_range(query='{job="redis"}', start="1h", end="now")
+
+        summary = res["data"]["log_templates"]
+        assert summary["total_lines"] == 21
+        assert summary["template_count"] == 2
+        top = summary["templates"][0]
+        assert top["template"] == "Accepted connection from <*>"
+        assert top["count"] == 20
+        assert top["first_seen"] < top["last_seen"]
+        assert res["data"]["streams"] == [{"stream": {"job": "redis"}, "lines": 21}]
+        assert res[ENVELOPE_ONLY_KEY] == {"data": raw["data"]}
+
+    @pytest.mark.asyncio
+    async def test_query_range_reduce_false_returns_raw(self, monkeypatch):
+        provider = LokiToolProvider()
+        raw = self._streams_response()
+
+        async def fake_request(method, path, params=None, data=None):
+            return raw
+
+        monkeypatch.setattr(provider, "_request", fake_request)
+
+        res = await provider.query_range(query='{job="redis"}', start="1h", end="now", reduce=False)
+
+        assert res is raw
+
+    @pytest.mark.asyncio
+    async def test_metric_results_are_not_reduced(self, monkeypatch):
+        provider = LokiToolProvider()
+        raw = {
+            "status": "success",
+            "code": 200,
+            "data": {"data": {"resultType": "vector", "result": []}},
+        }
+
+        async def fake_request(method, path, params=None, data=None):
+            return raw
+
+        monkeypatch.setattr(provider, "_request", fake_request)
+
+        res = await provider.query(query='sum(rate({job="redis"}[5m]))')
+
+        assert res == raw
+        assert ENVELOPE_ONLY_KEY not in res
+
+
 class TestLokiToolProviderSelectorFromLabels:
     """Test _selector_from_labels helper."""
 
@@ -0,0 +1,94 @@
+"""Tests for streaming log template mining."""
+
+from redis_sre_agent.tools.logs.reduction import (
+    WILDCARD,
+    LogTemplateMiner,
+    extract_timestamp,
+    reduce_log_lines,
+)
+
+
+def test_variable_tokens_are_masked():
+    miner = LogTemplateMiner()
+    miner.add("Accepted connection from 10.0.0.1:6379 id=17")
+    miner.add("Accepted connection from 192.168.1.20:6380 id=942")
+
+    [template] = miner.templates()
+    assert template.template == f"Accepted connection from {WILDCARD} {WILDCARD}"
+    assert template.count == 2
+
+
+def test_similar_lines_merge_and_differing_tokens_become_wildcards():
+    miner = LogTemplateMiner()
+    miner.add("Client closed connection reason timeout")
+    miner.add("Client closed connection reason eof")
+
+    [template] = miner.templates()
+    assert template.template == f"Client closed connection reason {WILDCARD}"
+
+
+def test_dissimilar_lines_form_separate_templates():
+    miner = LogTemplateMiner()
+    miner.add("Background saving started")
+    miner.add("Background saving terminated with success")
+    miner.add("Background saving started")
+
+    ranked = miner.templates()
+    assert [t.template for t in ranked] == [
+        "Background saving started",
+        "Background saving terminated with success",
+    ]
+    assert ranked[0].count == 2
+
+
+def test_exact_line_cache_is_bounded():
+    miner = LogTemplateMiner(max_exact_lines=2)
+    for word in ("alpha", "beta", "gamma", "alpha"):
+        miner.add(f"Module loaded name {word}")
+
+    [template] = miner.templates()
+    assert template.count == 4
+    assert len(miner._exact) == 2
+
+
+def test_timestamps_track_window_regardless_of_order():
+    miner = LogTemplateMiner(max_samples=2)
+    for ts in ("2025-01-01T00:00:05", "2025-01-01T00:00:01", "2025-01-01T00:00:03"):
+        miner.add("Replica is online", ts)
+
+    [template] = miner.templates()
+    assert template.first_seen == "2025-01-01T00:00:01"
+    assert template.last_seen == "2025-01-01T00:00:05"
+    assert len(template.samples) == 2
+
+
+def test_reduce_log_lines_summary_truncates_templates():
+    lines = [(None, f"event type{i % 5} happened") for i in range(50)]
+    lines += [(None, "rare event")]
+
+    summary = reduce_log_lines(lines, max_templates=1)
+
+    assert summary["total_lines"] == 51
+    assert summary["template_count"] == 2
+    assert summary["templates"][0]["count"] == 50
+    assert summary["omitted_template_lines"] == 1
+    assert summary["compression_ratio"] == 25.5
+
+
+def test_extract_timestamp():
+    assert extract_timestamp("2025-11-24 10:53:15,123 INFO started") == (
+        "2025-11-24 10:53:15,123",
+        "INFO started",
+    )
+    assert extract_timestamp("[2025-11-24T10:53:15Z] ok") == ("2025-11-24T10:53:15Z", "ok")
+    assert extract_timestamp("no timestamp here") == (None, "no timestamp here")
+
+
+def test_sample_overrides_stored_line():
+    miner = LogTemplateMiner()
+    miner.add("user 1 logged in", sample="[node 1] user 1 logged in")
+    miner.add("user 2 logged in", sample="[node 2] user 2 logged in")
+
+    [template] = miner.templates()
+    assert template.template == "user <*> logged in"
+    assert template.samples == ["[node 1] user 1 logged in", "[node 2] user 2 logged in"]
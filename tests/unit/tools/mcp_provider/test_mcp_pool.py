@@ -1,13 +1,37 @@
 """Unit tests for MCP connection pool."""
 
+import asyncio
 from contextlib import asynccontextmanager
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from redis_sre_agent.core.config import MCPServerConfig
 from redis_sre_agent.evaluation.injection import eval_injection_scope
-from redis_sre_agent.tools.mcp.pool import MCPConnectionPool, PooledConnection
+from redis_sre_agent.tools.mcp import pool as pool_module
+from redis_sre_agent.tools.mcp.pool import (
+    MCPConnectionPool,
+    MCPPoolUnavailableError,
+    PooledConnection,
+    list_tools_cached,
+)
+
+
+def _configure_pool_settings(mock_settings, servers):
+    mock_settings.mcp_servers = servers
+    mock_settings.mcp_pool_sessions_per_server = 2
+    mock_settings.mcp_pool_max_in_flight_per_session = 2
+    mock_settings.mcp_pool_health_check_interval = 0
+
+
+def _pooled(server_name="test-server", tools=None, session=None):
+    return PooledConnection(
+        server_name=server_name,
+        session=session or MagicMock(),
+        tools=tools if tools is not None else [],
+        exit_stack=AsyncMock(),
+    )
 
 
 class TestMCPConnectionPool:
@@ -53,7 +77,7 @@ class TestMCPConnectionPool:
         pool = MCPConnectionPool.get_instance()
 
         with patch("redis_sre_agent.core.config.settings") as mock_settings:
-            mock_settings.mcp_servers = {}
+            _configure_pool_settings(mock_settings, {})
             status = await pool.start()
 
         assert status == {}
@@ -70,7 +94,7 @@ class TestMCPConnectionPool:
 
         # Mock the settings to return one server
         with patch("redis_sre_agent.core.config.settings") as mock_settings:
-            mock_settings.mcp_servers = {"test-server": mock_config}
+            _configure_pool_settings(mock_settings, {"test-server": mock_config})
 
             # Mock the connection method
             with patch.object(pool, "_connect_server") as mock_connect:
@@ -87,9 +111,10 @@ class TestMCPConnectionPool:
         eval_config = MCPServerConfig(url="https://eval.example/mcp")
 
         with patch("redis_sre_agent.core.config.settings") as mock_settings:
-            mock_settings.mcp_servers = {
-                "global-server": MCPServerConfig(url="https://global.example/mcp")
-            }
+            _configure_pool_settings(
+                mock_settings,
+                {"global-server": MCPServerConfig(url="https://global.example/mcp")},
+            )
 
             with patch.object(
                 pool, "_connect_server", new=AsyncMock(return_value=True)
@@ -148,9 +173,11 @@ class TestMCPConnectionPool:
                 side_effect=lambda read_stream, write_stream: _FakeSession(),
             ),
         ):
-            connection = await pool._connect_server("afs_gateway", config)
+            connection = await pool._open_session("afs_gateway", config)
+            await pool._close_connection(connection)
 
         assert connection.server_name == "afs_gateway"
+        assert connection.healthy is False
         assert seen == {
             "url": "http://afs-gateway.example/mcp",
             "headers": {"Authorization": "Bearer secret-token"},
@@ -164,13 +191,9 @@ class TestMCPConnectionPool:
         # Manually add a connection
         mock_session = MagicMock()
         mock_tools = [MagicMock()]
-        mock_exit_stack = MagicMock()
-        pool._connections["test-server"] = PooledConnection(
-            server_name="test-server",
-            session=mock_session,
-            tools=mock_tools,
-            exit_stack=mock_exit_stack,
-        )
+        pool._connections["test-server"] = [
+            _pooled(session=mock_session, tools=mock_tools),
+        ]
         pool._started = True
 
         conn = pool.get_connection("test-server")
@@ -193,17 +216,13 @@ class TestMCPConnectionPool:
         pool._started = True
 
         # Add a mock connection
-        mock_exit_stack = AsyncMock()
-        pool._connections["test-server"] = PooledConnection(
-            server_name="test-server",
-            session=MagicMock(),
-            tools=[],
-            exit_stack=mock_exit_stack,
-        )
+        conn = _pooled()
+        pool._connections["test-server"] = [conn]
 
         await pool.shutdown()
 
         assert len(pool._connections) == 0
+        conn.exit_stack.aclose.assert_awaited_once()
         assert pool._started is False
 
     def test_stats_after_connections(self):
@@ -212,18 +231,11 @@ class TestMCPConnectionPool:
         pool._started = True
 
         # Add mock connections
-        pool._connections["server1"] = PooledConnection(
-            server_name="server1",
-            session=MagicMock(),
-            tools=[MagicMock(), MagicMock()],
-            exit_stack=MagicMock(),
-        )
-        pool._connections["server2"] = PooledConnection(
-            server_name="server2",
-            session=MagicMock(),
-            tools=[MagicMock()],
-            exit_stack=MagicMock(),
-        )
+        pool._connections["server1"] = [
+            _pooled("server1", tools=[MagicMock(), MagicMock()]),
+            _pooled("server1", tools=[MagicMock(), MagicMock()]),
+        ]
+        pool._connections["server2"] = [_pooled("server2", tools=[MagicMock()])]
 
         stats = pool.stats()
         assert stats["started"] is True
@@ -231,3 +243,169 @@ class TestMCPConnectionPool:
         assert "server1" in stats["connections"]
         assert stats["connections"]["server1"]["tools"] == 2
         assert stats["connections"]["server2"]["tools"] == 1
+        assert stats["connections"]["server1"]["sessions"] == 2
+
+    @pytest.mark.asyncio
+    async def test_start_connects_servers_concurrently(self):
+        """Slow servers connect in parallel rather than one after another."""
+        pool = MCPConnectionPool.get_instance()
+        running = 0
+        peak = 0
+
+        async def _slow_connect(name, config):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if name == "broken":
+                raise RuntimeError("boom")
+            return []
+
+        with patch("redis_sre_agent.core.config.settings") as mock_settings:
+            _configure_pool_settings(
+                mock_settings,
+                {name: MCPServerConfig(command="x") for name in ("a", "b", "broken")},
+            )
+            with patch.object(pool, "_connect_server", side_effect=_slow_connect):
+                status = await pool.start()
+
+        assert status == {"a": True, "b": True, "broken": False}
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_connect_server_opens_configured_session_count(self):
+        """Each server gets N sessions; partial failures keep the rest."""
+        pool = MCPConnectionPool.get_instance()
+        pool._sessions_per_server = 3
+        opened = iter([_pooled(), RuntimeError("flaky"), _pooled()])
+
+        async def _open(name, config):
+            outcome = next(opened)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        with patch.object(pool, "_open_session", side_effect=_open):
+            conns = await pool._connect_server("test-server", MCPServerConfig(command="x"))
+
+        assert len(conns) == 2
+        assert pool.stats()["connections"]["test-server"]["sessions"] == 2
+
+    @pytest.mark.asyncio
+    async def test_call_tool_dispatches_to_least_busy_session(self):
+        """Concurrent calls spread across sessions and respect the in-flight limit."""
+        pool = MCPConnectionPool.get_instance()
+        pool._max_in_flight = 1
+        release = asyncio.Event()
+        peak_in_flight = 0
+
+        def _session():
+            session = MagicMock()
+
+            async def _call_tool(name, arguments):
+                nonlocal peak_in_flight
+                peak_in_flight = max(
+                    peak_in_flight, max(c.in_flight for c in pool._connections["test-server"])
+                )
+                await release.wait()
+                return "ok"
+
+            session.call_tool = AsyncMock(side_effect=_call_tool)
+            return session
+
+        first, second = _pooled(session=_session()), _pooled(session=_session())
+        pool._connections["test-server"] = [first, second]
+
+        calls = [asyncio.create_task(pool.call_tool("test-server", "tool", {})) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        assert first.in_flight == 1 and second.in_flight == 1
+
+        release.set()
+        assert await asyncio.gather(*calls) == ["ok", "ok", "ok"]
+        assert peak_in_flight == 1
+        assert first.call_count + second.call_count == 3
+        assert first.in_flight == 0 and second.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_call_tool_retires_session_on_transport_error(self):
+        """A broken transport removes the session from dispatch."""
+        pool = MCPConnectionPool.get_instance()
+        broken = _pooled()
+        broken.session.call_tool = AsyncMock(side_effect=ConnectionError("gone"))
+        pool._connections["test-server"] = [broken]
+
+        with pytest.raises(ConnectionError):
+            await pool.call_tool("test-server", "tool", {})
+
+        assert broken.healthy is False
+        assert not pool.is_connected("test-server")
+        with pytest.raises(MCPPoolUnavailableError):
+            await pool.call_tool("test-server", "tool", {})
+
+    @pytest.mark.asyncio
+    async def test_check_health_reconnects_failed_sessions(self):
+        """Sessions that fail a ping are replaced up to the configured count."""
+        pool = MCPConnectionPool.get_instance()
+        pool._sessions_per_server = 2
+        pool._configs["test-server"] = MCPServerConfig(command="x")
+        alive, dead = _pooled(), _pooled()
+        alive.session.send_ping = AsyncMock()
+        dead.session.send_ping = AsyncMock(side_effect=ConnectionError("gone"))
+        pool._connections["test-server"] = [alive, dead]
+        replacement = _pooled()
+
+        with patch.object(pool, "_open_session", AsyncMock(return_value=replacement)) as mock_open:
+            healthy = await pool.check_health()
+
+        assert healthy == {"test-server": 2}
+        mock_open.assert_awaited_once()
+        assert pool._connections["test-server"] == [alive, replacement]
+        dead.exit_stack.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refills_do_not_exceed_session_count(self):
+        """A reconnect racing a health check never opens more than N sessions."""
+        pool = MCPConnectionPool.get_instance()
+        pool._sessions_per_server = 2
+        pool._configs["test-server"] = MCPServerConfig(command="x")
+
+        async def _open(name, config):
+            await asyncio.sleep(0.01)
+            return _pooled()
+
+        with patch.object(pool, "_open_session", side_effect=_open):
+            await asyncio.gather(pool.check_health(), pool.reconnect("test-server"))
+
+        assert len(pool._connections["test-server"]) == 2
+
+
+class TestListToolsCache:
+    """list_tools results are reused per server version."""
+
+    def teardown_method(self):
+        pool_module.clear_tools_cache()
+
+    @pytest.mark.asyncio
+    async def test_reuses_tools_for_same_server_version(self):
+        session = MagicMock()
+        session.list_tools = AsyncMock(return_value=SimpleNamespace(tools=["t1"]))
+        v1 = SimpleNamespace(serverInfo=SimpleNamespace(name="srv", version="1.0"))
+        v2 = SimpleNamespace(serverInfo=SimpleNamespace(name="srv", version="2.0"))
+
+        assert await list_tools_cached("github", session, v1) == ["t1"]
+        assert await list_tools_cached("github", session, v1) == ["t1"]
+        assert session.list_tools.await_count == 1
+
+        await list_tools_cached("github", session, v2)
+        assert session.list_tools.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unversioned_servers_are_not_cached(self):
+        session = MagicMock()
+        session.list_tools = AsyncMock(return_value=SimpleNamespace(tools=[]))
+
+        await list_tools_cached("github", session, None)
+        await list_tools_cached("github", session, None)
+
+        assert session.list_tools.await_count == 2
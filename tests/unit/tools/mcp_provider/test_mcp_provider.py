@@ -352,12 +352,14 @@ class TestMCPToolProviderAsync:
         # Create a mock pooled connection
         mock_session = MagicMock()
         mock_tools = [MagicMock(name="tool1")]
-        pool._connections["test-server"] = PooledConnection(
-            server_name="test-server",
-            session=mock_session,
-            tools=mock_tools,
-            exit_stack=MagicMock(),
-        )
+        pool._connections["test-server"] = [
+            PooledConnection(
+                server_name="test-server",
+                session=mock_session,
+                tools=mock_tools,
+                exit_stack=MagicMock(),
+            )
+        ]
         pool._started = True
 
         config = MCPServerConfig(command="test")
@@ -1,10 +1,11 @@
 """Unit tests for PrometheusToolProvider."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from redis_sre_agent.core.instances import RedisInstance
+from redis_sre_agent.tools.metrics.prometheus import provider as provider_module
 from redis_sre_agent.tools.metrics.prometheus.provider import (
     PrometheusConfig,
     PrometheusToolProvider,
@@ -274,17 +275,28 @@ class TestPrometheusToolProviderHttpGetJson:
 
         mock_resp = MagicMock()
         mock_resp.json.return_value = {"status": "success", "data": {"result": []}}
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(return_value=mock_resp)
 
-        with patch("asyncio.to_thread", return_value=mock_resp):
+        with patch.object(
+            provider_module, "get_http_client", return_value=mock_client
+        ) as mock_get_client:
             result = await provider._http_get_json("/api/v1/query", params={"query": "up"})
-            assert result["status"] == "success"
+
+        assert result["status"] == "success"
+        mock_get_client.assert_called_once_with("http://localhost:9090", verify=True)
+        mock_client.get.assert_awaited_once_with(
+            "/api/v1/query", params={"query": "up"}, timeout=5.0
+        )
 
     @pytest.mark.asyncio
     async def test_http_get_json_network_error(self):
         """Test _http_get_json with network error."""
         provider = PrometheusToolProvider()
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(side_effect=Exception("Connection refused"))
 
-        with patch("asyncio.to_thread", side_effect=Exception("Connection refused")):
+        with patch.object(provider_module, "get_http_client", return_value=mock_client):
             result = await provider._http_get_json("/api/v1/query")
             assert result["status"] == "error"
             assert "Connection refused" in result["error"]
@@ -293,31 +305,128 @@ class TestPrometheusToolProviderHttpGetJson:
 class TestPrometheusToolProviderWaitForTargets:
     """Test _wait_for_targets helper."""
 
+    @pytest.fixture(autouse=True)
+    def _reset_ready_urls(self, monkeypatch):
+        monkeypatch.setattr(provider_module, "_READY_PROMETHEUS_URLS", {})
+
     @pytest.mark.asyncio
     async def test_wait_for_targets_success(self):
         """Test _wait_for_targets success."""
         provider = PrometheusToolProvider()
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {
+        payload = {
             "status": "success",
             "data": {"activeTargets": [{"labels": {"job": "redis"}}]},
         }
 
-        with patch("requests.get", return_value=mock_resp):
+        with patch.object(
+            provider, "_http_get_json", new_callable=AsyncMock, return_value=payload
+        ) as mock_get:
             # Should return quickly when targets are active
-            await provider._wait_for_targets(timeout_seconds=1.0)
+            assert await provider._wait_for_targets(timeout_seconds=1.0) is True
+            # Readiness is remembered per URL
+            assert await provider._wait_for_targets(timeout_seconds=1.0) is True
+
+        mock_get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_readiness_expires_and_clears_on_connection_error(self, monkeypatch):
+        provider = PrometheusToolProvider()
+        base = provider.config.url.rstrip("/")
+        payload = {
+            "status": "success",
+            "data": {"activeTargets": [{"labels": {"job": "redis"}}]},
+        }
+
+        with patch.object(
+            provider, "_http_get_json", new_callable=AsyncMock, return_value=payload
+        ) as mock_get:
+            assert await provider._wait_for_targets(timeout_seconds=1.0) is True
+            provider_module._READY_PROMETHEUS_URLS[base] -= (
+                provider_module.READY_PROMETHEUS_TTL_SECONDS + 1
+            )
+            assert await provider._wait_for_targets(timeout_seconds=1.0) is True
+
+        assert mock_get.await_count == 2
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(side_effect=Exception("Connection refused"))
+        with patch.object(provider_module, "get_http_client", return_value=mock_client):
+            await provider._http_get_json("/api/v1/query")
+        assert base not in provider_module._READY_PROMETHEUS_URLS
 
     @pytest.mark.asyncio
     async def test_wait_for_targets_timeout(self):
         """Test _wait_for_targets timeout (no error raised)."""
         provider = PrometheusToolProvider()
+        payload = {"status": "success", "data": {"activeTargets": []}}
 
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {"status": "success", "data": {"activeTargets": []}}
-
-        with patch("requests.get", return_value=mock_resp):
+        with patch.object(provider, "_http_get_json", new_callable=AsyncMock, return_value=payload):
             # Should not raise even if no targets
-            await provider._wait_for_targets(timeout_seconds=0.1)
+            assert await provider._wait_for_targets(timeout_seconds=0.1) is False
+
+
+class TestPrometheusToolProviderQueryRange:
+    """Test query_range reduction."""
+
+    @staticmethod
+    def _matrix():
+        return [
+            {
+                "metric": {"__name__": "redis_connected_clients", "instance": "r1"},
+                "values": [[1700000000 + 15 * i, str(10 if i < 40 else 50)] for i in range(80)],
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_query_range_reduces_series_and_keeps_raw_envelope_only(self):
+        provider = PrometheusToolProvider()
+        payload = {"status": "success", "data": {"resultType": "matrix", "result": self._matrix()}}
+
+        with (
+            patch.object(provider, "_wait_for_targets", new_callable=AsyncMock, return_value=True),
+            patch.object(provider, "_http_get_json", new_callable=AsyncMock, return_value=payload),
+        ):
+            result = await provider.query_range("redis_connected_clients", "1h")
+
+        assert result["status"] == "success"
+        assert "data" not in result
+        assert result["series_count"] == 1
+        series = result["series"][0]
+        assert series["samples"] == 80
+        assert series["min"] == 10
+        assert series["max"] == 50
+        assert series["last"] == 50
+        assert series["change_points"][0]["timestamp"] == 1700000000 + 15 * 40
+        assert result["envelope_only"]["data"] == self._matrix()
+
+    @pytest.mark.asyncio
+    async def test_query_range_raw_mode_returns_matrix(self):
+        provider = PrometheusToolProvider()
+        payload = {"status": "success", "data": {"resultType": "matrix", "result": self._matrix()}}
+
+        with (
+            patch.object(provider, "_wait_for_targets", new_callable=AsyncMock, return_value=True),
+            patch.object(provider, "_http_get_json", new_callable=AsyncMock, return_value=payload),
+        ):
+            result = await provider.query_range("redis_connected_clients", "1h", reduce=False)
+
+        assert result["data"] == self._matrix()
+        assert "series" not in result
+        assert "envelope_only" not in result
+
+    @pytest.mark.asyncio
+    async def test_query_range_skips_empty_retries_once_targets_ready(self):
+        provider = PrometheusToolProvider()
+        payload = {"status": "success", "data": {"resultType": "matrix", "result": []}}
+
+        with (
+            patch.object(provider, "_wait_for_targets", new_callable=AsyncMock, return_value=True),
+            patch.object(
+                provider, "_http_get_json", new_callable=AsyncMock, return_value=payload
+            ) as mock_get,
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            result = await provider.query_range("absent_metric", "1h")
+
+        assert result["series"] == []
+        mock_get.assert_awaited_once()
+        mock_sleep.assert_not_awaited()
@@ -0,0 +1,62 @@
+"""Unit tests for Prometheus range result reduction."""
+
+import random
+
+from redis_sre_agent.tools.metrics.prometheus.reduction import (
+    summarize_matrix,
+    summarize_series,
+)
+
+
+def _series(values, start=1700000000, step=15):
+    return {
+        "metric": {"__name__": "m", "instance": "r1"},
+        "values": [[start + step * i, str(v)] for i, v in enumerate(values)],
+    }
+
+
+def test_summarize_series_basic_statistics():
+    summary = summarize_series(_series([1, 2, 3, 4, 5]))
+
+    assert summary["metric"] == {"__name__": "m", "instance": "r1"}
+    assert summary["samples"] == 5
+    assert summary["start"] == 1700000000
+    assert summary["end"] == 1700000060
+    assert summary["min"] == 1
+    assert summary["max"] == 5
+    assert summary["mean"] == 3
+    assert summary["last"] == 5
+    assert summary["slope_per_second"] == float(f"{1 / 15:.6g}")
+    assert "change_points" not in summary
+
+
+def test_summarize_series_reports_level_shifts():
+    rng = random.Random(7)
+    values = [100 + rng.gauss(0, 1) + (20 if i >= 500 else 0) for i in range(1000)]
+
+    summary = summarize_series(_series(values, start=0, step=1))
+
+    assert len(summary["change_points"]) == 1
+    point = summary["change_points"][0]
+    assert abs(point["timestamp"] - 500) <= 2
+    assert point["before_mean"] < point["after_mean"]
+
+
+def test_summarize_series_ignores_noise():
+    rng = random.Random(3)
+    summary = summarize_series(_series([50 + rng.gauss(0, 2) for _ in range(500)]))
+
+    assert "change_points" not in summary
+
+
+def test_summarize_series_handles_non_finite_and_empty():
+    summary = summarize_series(_series(["NaN", "+Inf", 4]))
+    assert summary["non_finite_samples"] == 2
+    assert summary["min"] == summary["max"] == 4
+
+    assert summarize_series({"metric": {}, "values": []}) == {"metric": {}, "samples": 0}
+
+
+def test_summarize_matrix_keeps_series_order():
+    result = summarize_matrix([_series([1, 1]), _series([2, 2])])
+    assert [s["mean"] for s in result] == [1, 2]
@@ -0,0 +1,220 @@
+"""Tests for indexed support package log access."""
+
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from redis_sre_agent.tools.support_package import log_index
+from redis_sre_agent.tools.support_package.log_index import (
+    SupportPackageLogIndex,
+    evict_log_indexes,
+    lease_log_file_index,
+    normalize_level,
+    parse_line_timestamp,
+)
+
+LEVEL_CYCLE = ("INFO", "WARNING", "ERROR", "CRITICAL")
+
+
+def _epoch(text: str) -> float:
+    return datetime.fromisoformat(text).replace(tzinfo=timezone.utc).timestamp()
+
+
+@pytest.fixture
+def event_log(tmp_path: Path) -> Path:
+    """2000 timestamped lines, one per second, plus untimestamped continuations."""
+    lines = []
+    for i in range(2000):
+        ts = datetime.fromtimestamp(_epoch("2025-11-24T10:00:00") + i, tz=timezone.utc)
+        lines.append(f"{ts:%Y-%m-%d %H:%M:%S} {LEVEL_CYCLE[i % 4]} EventLog: seq={i}")
+        if i % 500 == 0:
+            lines.append("    traceback continuation")
+    path = tmp_path / "event_log.log"
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+@pytest.fixture(autouse=True)
+def _small_strides(monkeypatch):
+    monkeypatch.setattr(log_index, "TIMESTAMP_INDEX_STRIDE", 64)
+    monkeypatch.setattr(log_index, "REGEX_TAIL_BLOCK_LINES", 100)
+
+
+class TestLogFileIndex:
+    def test_line_offsets(self, event_log: Path):
+        index = log_index.LogFileIndex(event_log)
+
+        assert index.line_count == 2004
+        assert index.line(0).endswith("seq=0")
+        assert index.line(1) == "    traceback continuation"
+        assert index.line(index.line_count - 1).endswith("seq=1999")
+
+    def test_head_and_tail(self, event_log: Path):
+        index = log_index.LogFileIndex(event_log)
+
+        head = index.select(limit=2)
+        tail = index.select(limit=2, tail=True)
+
+        assert [index.line(int(i)) for i in head][0].endswith("seq=0")
+        assert [index.line(int(i)) for i in tail][-1].endswith("seq=1999")
+
+    def test_time_range_uses_sparse_index(self, event_log: Path):
+        index = log_index.LogFileIndex(event_log)
+
+        ids = index.select(start=_epoch("2025-11-24T10:08:20"), end=_epoch("2025-11-24T10:08:29"))
+        lines = [index.line(int(i)) for i in ids]
+
+        # seq 500..509 plus the continuation line after seq=500
+        assert len(lines) == 11
+        assert lines[0].endswith("seq=500")
+        assert lines[-1].endswith("seq=509")
+
+    def test_level_bitmap(self, event_log: Path):
+        index = log_index.LogFileIndex(event_log)
+
+        ids = index.select(levels=["critical"])
+
+        assert len(ids) == 500
+        assert all(" CRITICAL " in index.line(int(i)) for i in ids)
+        assert len(index.select(levels=["WARN", "ERROR"])) == 1000
+
+    def test_regex_head_and_tail(self, event_log: Path):
+        index = log_index.LogFileIndex(event_log)
+        pattern = re.compile(rb"seq=1\d\d$", re.MULTILINE)
+
+        head = [index.line(int(i)) for i in index.select(pattern=pattern, limit=2)]
+        tail = [index.line(int(i)) for i in index.select(pattern=pattern, limit=2, tail=True)]
+        errors = index.select(pattern=pattern, levels=["ERROR"])
+
+        assert head[0].endswith("seq=100") and head[1].endswith("seq=101")
+        assert tail[0].endswith("seq=198") and tail[1].endswith("seq=199")
+        assert len(errors) == 25
+
+    def test_level_words_match_any_case(self, tmp_path: Path):
+        path = tmp_path / "mixed.log"
+        path.write_text("error: disk full\nError something\nERROR boom\ninfo: fine\n")
+        index = log_index.LogFileIndex(path)
+
+        ids = index.select(levels=["ERROR"])
+
+        assert [index.line(int(i)) for i in ids] == [
+            "error: disk full",
+            "Error something",
+            "ERROR boom",
+        ]
+
+    def test_regex_does_not_match_across_lines(self, tmp_path: Path):
+        path = tmp_path / "split.log"
+        path.write_text("foo\nbar\nfoo  bar\n")
+        index = log_index.LogFileIndex(path)
+
+        ids = index.select(pattern=re.compile(rb"foo\s+bar", re.MULTILINE))
+
+        assert ids.tolist() == [2]
+
+    def test_empty_file(self, tmp_path: Path):
+        path = tmp_path / "empty.log"
+        path.write_text("")
+
+        index = log_index.LogFileIndex(path)
+
+        assert index.line_count == 0
+        assert index.select(limit=10).size == 0
+
+    def test_redis_server_log_levels(self, tmp_path: Path):
+        path = tmp_path / "redis.log"
+        path.write_text(
+            "123:M 24 Nov 2025 10:53:15.123 * Ready to accept connections tcp\n"
+            "123:M 24 Nov 2025 10:53:16.000 # Connection with replica lost.\n"
+        )
+        index = log_index.LogFileIndex(path)
+
+        [warning] = index.select(levels=["WARNING"])
+
+        assert index.line(int(warning)).endswith("replica lost.")
+        assert index.timestamp(0) == pytest.approx(_epoch("2025-11-24T10:53:15.123"))
+
+
+class TestLogIndexCache:
+    def test_index_is_cached_until_file_changes(self, event_log: Path):
+        with lease_log_file_index(event_log) as first:
+            with lease_log_file_index(event_log) as again:
+                assert again is first
+
+        with event_log.open("a") as handle:
+            handle.write("2025-11-24 11:00:00 ERROR appended\n")
+
+        with lease_log_file_index(event_log) as rebuilt:
+            assert rebuilt is not first
+            assert rebuilt.line(rebuilt.line_count - 1).endswith("appended")
+
+    def test_evict_log_indexes(self, event_log: Path):
+        with lease_log_file_index(event_log):
+            pass
+
+        evict_log_indexes(event_log.parent)
+
+        assert event_log.resolve() not in log_index._file_indexes
+
+    def test_evicted_index_stays_open_while_leased(self, event_log: Path):
+        with lease_log_file_index(event_log) as index:
+            evict_log_indexes(event_log.parent)
+
+            assert event_log.resolve() not in log_index._file_indexes
+            assert index.line(0).endswith("seq=0")
+
+        assert index._mmap is None
+
+    def test_query_over_more_files_than_cache_holds(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(log_index, "MAX_CACHED_LOG_INDEXES", 2)
+        node_logs = {}
+        for n in range(5):
+            path = tmp_path / f"node_{n}.log"
+            path.write_text(f"2025-11-24 10:00:0{n} ERROR node {n}\n")
+            node_logs[str(n)] = {"event_log.log": path}
+
+        lines = SupportPackageLogIndex(node_logs).query("event_log.log", levels=["error"])
+
+        assert [line.text for line in lines] == [
+            f"2025-11-24 10:00:0{n} ERROR node {n}" for n in range(5)
+        ]
+        assert len(log_index._file_indexes) == 2
+
+
+class TestSupportPackageLogIndex:
+    def test_query_merges_nodes_by_timestamp(self, tmp_path: Path):
+        node_logs = {}
+        for node_id, seconds in (("1", (0, 2, 4)), ("2", (1, 3, 5))):
+            path = tmp_path / f"node_{node_id}.log"
+            path.write_text(
+                "".join(f"2025-11-24 10:00:0{s} ERROR node {node_id} tick\n" for s in seconds)
+            )
+            node_logs[node_id] = {"event_log.log": path}
+        index = SupportPackageLogIndex(node_logs)
+
+        lines = index.query("event_log.log", limit=4, tail=True)
+
+        assert [(line.node_id, line.line_number) for line in lines] == [
+            ("1", 2),
+            ("2", 2),
+            ("1", 3),
+            ("2", 3),
+        ]
+        assert lines[-1].to_dict()["timestamp"] == "2025-11-24T10:00:05+00:00"
+        assert index.query("event_log.log", node_ids=["2"], limit=1)[0].node_id == "2"
+        assert index.files("missing.log") == []
+
+
+def test_normalize_level():
+    assert normalize_level("warn") == "WARNING"
+    assert normalize_level("Fatal") == "CRITICAL"
+    with pytest.raises(ValueError):
+        normalize_level("LOUD")
+
+
+def test_parse_line_timestamp():
+    assert parse_line_timestamp(b"2025-11-24T10:00:00Z x") == _epoch("2025-11-24T10:00:00")
+    assert parse_line_timestamp(b"[2025-11-24 10:00:00,500] x") == _epoch("2025-11-24T10:00:00.5")
+    assert parse_line_timestamp(b"no timestamp") is None
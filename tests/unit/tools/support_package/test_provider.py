@@ -199,6 +199,112 @@ class TestSupportPackageToolProvider:
         assert result["status"] == "error"
         assert "not found" in result["error"].lower()
 
+    @pytest.mark.asyncio
+    async def test_large_log_is_reduced_to_templates(self, sample_package_dir: Path):
+        """Test that logs above the threshold are summarized as templates."""
+        from redis_sre_agent.tools.support_package.provider import (
+            LOG_REDUCE_MIN_LINES,
+            SupportPackageToolProvider,
+        )
+
+        lines = [
+            f"2025-11-24 10:{i // 60:02d}:{i % 60:02d} INFO shard:{i % 4} "
+            f"replication offset {i * 512} acknowledged"
+            for i in range(LOG_REDUCE_MIN_LINES + 50)
+        ]
+        lines.append("2025-11-24 11:00:00 ERROR Failed to connect to master")
+        log_path = sample_package_dir / "node_1" / "logs" / "redis_1.log"
+        log_path.write_text("\n".join(lines) + "\n")
+
+        provider = SupportPackageToolProvider(package_path=sample_package_dir)
+        result = await provider.logs(node_id="1", log_name="redis_1.log")
+
+        assert result["status"] == "success"
+        assert "data" not in result
+        assert result["line_count"] == LOG_REDUCE_MIN_LINES + 51
+        summary = result["log_templates"]
+        assert summary["template_count"] == 2
+        top = summary["templates"][0]
+        assert top["template"] == "INFO <*> replication offset <*> acknowledged"
+        assert top["first_seen"] == "2025-11-24T10:00:00+00:00"
+        assert top["last_seen"] == "2025-11-24T10:04:09+00:00"
+        assert top["samples"][0] == f"[node 1] {lines[0]}"
+
+    @pytest.mark.asyncio
+    async def test_reduced_redis_server_log_keeps_timestamps_and_nodes(
+        self, sample_package_dir: Path
+    ):
+        """Test that Redis server log timestamps and sample nodes survive reduction."""
+        from redis_sre_agent.tools.support_package.provider import SupportPackageToolProvider
+
+        log_path = sample_package_dir / "node_1" / "logs" / "redis_1.log"
+        log_path.write_text(
+            "123:M 24 Nov 2025 10:53:15.123 # Connection with replica 10.0.0.2:6379 lost.\n"
+            "123:M 24 Nov 2025 10:55:00.000 # Connection with replica 10.0.0.3:6379 lost.\n"
+        )
+
+        provider = SupportPackageToolProvider(package_path=sample_package_dir)
+        result = await provider.logs(node_id="1", log_name="redis_1.log", reduce=True)
+
+        [template] = result["log_templates"]["templates"]
+        assert template["first_seen"] == "2025-11-24T10:53:15.123000+00:00"
+        assert template["last_seen"] == "2025-11-24T10:55:00+00:00"
+        assert template["samples"][0].startswith("[node 1] 123:M 24 Nov 2025")
+
+    @pytest.mark.asyncio
+    async def test_logs_reduce_flag_overrides_threshold(self, sample_package_dir: Path):
+        """Test that reduce=True/False force templates or raw lines."""
+        from redis_sre_agent.tools.support_package.provider import SupportPackageToolProvider
+
+        provider = SupportPackageToolProvider(package_path=sample_package_dir)
+
+        reduced = await provider.logs(node_id="1", log_name="event_log.log", reduce=True)
+        assert reduced["log_templates"]["total_lines"] == 2
+
+        raw = await provider.logs(node_id="1", log_name="event_log.log", reduce=False, limit=1)
+        assert raw["line_count"] == 1
+        assert "node_joined" in raw["data"]
+
+    @pytest.mark.asyncio
+    async def test_logs_tail_time_range_and_pattern(self, sample_package_dir: Path):
+        """Test tail, time range and regex queries against the log index."""
+        from redis_sre_agent.tools.support_package.provider import SupportPackageToolProvider
+
+        provider = SupportPackageToolProvider(package_path=sample_package_dir)
+
+        tail = await provider.logs(node_id="1", log_name="event_log.log", limit=1, tail=True)
+        assert tail["data"].endswith('{"type":"failed"}')
+
+        ranged = await provider.logs(
+            node_id="1",
+            log_name="event_log.log",
+            start="2025-11-24T10:53:16",
+            end="2025-11-24T10:54:00",
+        )
+        assert ranged["line_count"] == 1
+        assert "failed" in ranged["data"]
+
+        matched = await provider.logs(log_name="event_log.log", pattern=r"node_\w+")
+        assert matched["nodes"] == ["1"]
+        assert "node_joined" in matched["data"]
+        assert "failed" not in matched["data"]
+
+    @pytest.mark.asyncio
+    async def test_logs_invalid_filters_return_error(self, sample_package_dir: Path):
+        """Test that unknown levels, bad timestamps and bad regexes are reported."""
+        from redis_sre_agent.tools.support_package.provider import SupportPackageToolProvider
+
+        provider = SupportPackageToolProvider(package_path=sample_package_dir)
+
+        for kwargs in ({"level": "LOUD"}, {"start": "yesterday"}, {"pattern": "("}):
+            result = await provider.logs(node_id="1", log_name="event_log.log", **kwargs)
+            assert result["status"] == "error"
+            assert "Invalid log query" in result["error"]
+
+        missing = await provider.logs(log_name="missing.log")
+        assert missing["status"] == "error"
+        assert "not found" in missing["error"]
+
 
 class TestToolManagerIntegration:
     """Tests for ToolManager integration with support packages."""
@@ -1,5 +1,6 @@
 """Tests for ToolManager."""
 
+import asyncio
 from contextlib import AsyncExitStack
 from unittest.mock import AsyncMock, patch
 
@@ -14,6 +15,8 @@ from redis_sre_agent.core.approvals import (
     ApprovalRequiredError,
     ApprovalStatus,
     GraphResumeState,
+    ToolExecutionDecision,
+    ToolExecutionMode,
     build_action_hash,
 )
 from redis_sre_agent.core.clusters import RedisCluster, RedisClusterType
@@ -515,6 +518,292 @@ async def test_execute_tool_calls_propagates_approval_required(monkeypatch):
     approval_manager.create_approval.assert_awaited_once()
 
 
+def _tracking_invoke(tracker: dict, result: dict, delay: float = 0.01) -> AsyncMock:
+    """Build an invoke that records how many calls are in flight at once."""
+
+    async def _invoke(args):
+        tracker["active"] += 1
+        tracker["peak"] = max(tracker["peak"], tracker["active"])
+        tracker["order"].append(result["name"])
+        await asyncio.sleep(delay)
+        tracker["active"] -= 1
+        return result
+
+    return AsyncMock(side_effect=_invoke)
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_calls_runs_read_calls_concurrently(monkeypatch):
+    """READ calls overlap and results keep the original call order."""
+    mgr = ToolManager(thread_id="thread-1", task_id="task-1")
+    tracker = {"active": 0, "peak": 0, "order": []}
+    for name, provider in (("info", "redis"), ("slowlog", "redis"), ("prom", "prometheus")):
+        _register_tool(
+            mgr,
+            name=name,
+            action_kind=ToolActionKind.READ,
+            invoke=_tracking_invoke(tracker, {"name": name}, delay=0.05 if name == "info" else 0),
+            description=name,
+            provider_name=provider,
+        )
+    monkeypatch.setattr(manager_settings, "tool_call_concurrency", 8)
+    monkeypatch.setattr(manager_settings, "tool_call_provider_concurrency", 4)
+
+    results = await mgr.execute_tool_calls(
+        [
+            {"name": "info", "args": {}},
+            {"name": "slowlog", "args": {}},
+            {"name": "prom", "args": {}},
+        ]
+    )
+
+    assert [r["name"] for r in results] == ["info", "slowlog", "prom"]
+    assert tracker["peak"] == 3
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_calls_respects_concurrency_limits(monkeypatch):
+    """Per-provider and global limits cap in-flight READ calls."""
+    mgr = ToolManager(thread_id="thread-1", task_id="task-1")
+    redis_tracker = {"active": 0, "peak": 0, "order": []}
+    all_tracker = {"active": 0, "peak": 0, "order": []}
+
+    def _invoke(name: str) -> AsyncMock:
+        async def _call(args):
+            for tracker in (redis_tracker, all_tracker) if name.startswith("r") else (all_tracker,):
+                tracker["active"] += 1
+                tracker["peak"] = max(tracker["peak"], tracker["active"])
+            await asyncio.sleep(0.01)
+            for tracker in (redis_tracker, all_tracker) if name.startswith("r") else (all_tracker,):
+                tracker["active"] -= 1
+            return {"name": name}
+
+        return AsyncMock(side_effect=_call)
+
+    names = ["r1", "r2", "r3", "p1", "p2", "p3"]
+    for name in names:
+        _register_tool(
+            mgr,
+            name=name,
+            action_kind=ToolActionKind.READ,
+            invoke=_invoke(name),
+            description=name,
+            provider_name="redis" if name.startswith("r") else "prometheus",
+        )
+    monkeypatch.setattr(manager_settings, "tool_call_concurrency", 3)
+    monkeypatch.setattr(manager_settings, "tool_call_provider_concurrency", 1)
+
+    results = await mgr.execute_tool_calls([{"name": name, "args": {}} for name in names])
+
+    assert [r["name"] for r in results] == names
+    assert redis_tracker["peak"] == 1
+    assert all_tracker["peak"] == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_calls_orders_write_after_preceding_reads(monkeypatch):
+    """A WRITE call waits for earlier READs and an approval pause skips later calls."""
+    mgr = ToolManager(thread_id="thread-1", task_id="task-1")
+    tracker = {"active": 0, "peak": 0, "order": []}
+    _register_tool(
+        mgr,
+        name="info",
+        action_kind=ToolActionKind.READ,
+        invoke=_tracking_invoke(tracker, {"name": "info"}),
+        description="info",
+    )
+    later_read = AsyncMock(return_value={"name": "slowlog"})
+    _register_tool(
+        mgr,
+        name="slowlog",
+        action_kind=ToolActionKind.READ,
+        invoke=later_read,
+        description="slowlog",
+    )
+    write_invoke = AsyncMock(return_value={"status": "should_not_run"})
+    _register_tool(
+        mgr,
+        name="stub_default_delete_user",
+        action_kind=ToolActionKind.WRITE,
+        invoke=write_invoke,
+        description="Delete user",
+    )
+    monkeypatch.setattr(manager_settings, "agent_permission_mode", "read_write")
+
+    approval_manager = AsyncMock()
+    approval_manager.get_resume_state.return_value = None
+    approval_manager.create_approval.side_effect = lambda record: record
+
+    with (
+        patch("redis_sre_agent.tools.manager.ApprovalManager", return_value=approval_manager),
+        patch(
+            "redis_sre_agent.tools.manager.interrupt",
+            return_value={"status": "approval_required"},
+        ),
+    ):
+        results = await mgr.execute_tool_calls(
+            [
+                {"name": "info", "args": {}},
+                {"name": "stub_default_delete_user", "args": {"username": "demo"}},
+                {"name": "slowlog", "args": {}},
+            ]
+        )
+
+    assert results == [{"name": "info"}, {"status": "approval_required"}]
+    assert tracker["order"] == ["info"]
+    write_invoke.assert_not_awaited()
+    later_read.assert_not_awaited()
+
+
+def _approval_batch_manager() -> tuple[ToolManager, AsyncMock, AsyncMock]:
+    """Manager with READ tools info/ask_operator/slowlog and a WRITE after them."""
+    mgr = ToolManager(thread_id="thread-1", task_id="task-1")
+    _register_tool(
+        mgr,
+        name="info",
+        action_kind=ToolActionKind.READ,
+        invoke=AsyncMock(return_value={"name": "info"}),
+        description="info",
+    )
+    _register_tool(
+        mgr,
+        name="ask_operator",
+        action_kind=ToolActionKind.READ,
+        invoke=AsyncMock(return_value={"status": "approval_required"}),
+        description="ask_operator",
+    )
+    later_read = AsyncMock(return_value={"name": "slowlog"})
+    _register_tool(
+        mgr,
+        name="slowlog",
+        action_kind=ToolActionKind.READ,
+        invoke=later_read,
+        description="slowlog",
+    )
+    write_invoke = AsyncMock(return_value={"status": "written"})
+    _register_tool(
+        mgr,
+        name="stub_default_delete_user",
+        action_kind=ToolActionKind.WRITE,
+        invoke=write_invoke,
+        description="Delete user",
+    )
+    return mgr, later_read, write_invoke
+
+
+_APPROVAL_BATCH = [
+    {"name": "info", "args": {}},
+    {"name": "ask_operator", "args": {}},
+    {"name": "slowlog", "args": {}},
+    {"name": "stub_default_delete_user", "args": {"username": "demo"}},
+]
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_calls_read_approval_pause_stops_batch(monkeypatch):
+    """A READ call that pauses for approval stops later READ and WRITE calls."""
+    mgr, later_read, write_invoke = _approval_batch_manager()
+    evaluate = mgr.evaluate_tool_call
+
+    async def _evaluate(name, args):
+        if name == "ask_operator":
+            return ToolExecutionDecision(
+                mode=ToolExecutionMode.REQUIRE_APPROVAL, tool_name=name, tool_args=args
+            )
+        return await evaluate(name, args)
+
+    resolve = mgr.resolve_tool_call
+
+    async def _resolve(name, args, *, decision=None):
+        if decision.mode is ToolExecutionMode.REQUIRE_APPROVAL:
+            return {"status": "approval_required"}
+        return await resolve(name, args, decision=decision)
+
+    monkeypatch.setattr(mgr, "evaluate_tool_call", _evaluate)
+    monkeypatch.setattr(mgr, "resolve_tool_call", _resolve)
+    monkeypatch.setattr(manager_settings, "tool_call_concurrency", 1)
+
+    results = await mgr.execute_tool_calls(_APPROVAL_BATCH)
+
+    assert results == [{"name": "info"}, {"status": "approval_required"}]
+    later_read.assert_not_awaited()
+    write_invoke.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_calls_allowed_approval_required_result_does_not_stop(monkeypatch):
+    """An allowed call whose own result says approval_required is just a result."""
+    mgr, later_read, write_invoke = _approval_batch_manager()
+    monkeypatch.setattr(manager_settings, "agent_permission_mode", "read_only")
+
+    results = await mgr.execute_tool_calls(_APPROVAL_BATCH)
+
+    assert results[:3] == [
+        {"name": "info"},
+        {"status": "approval_required"},
+        {"name": "slowlog"},
+    ]
+    assert results[3]["status"] == "blocked"
+    later_read.assert_awaited_once()
+    write_invoke.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_read_call_limits_are_shared_across_managers(monkeypatch):
+    """Concurrent turns draw on the same global slot pool."""
+    tracker = {"active": 0, "peak": 0, "order": []}
+    managers = []
+    for turn in range(3):
+        mgr = ToolManager(thread_id=f"thread-{turn}", task_id=f"task-{turn}")
+        _register_tool(
+            mgr,
+            name="info",
+            action_kind=ToolActionKind.READ,
+            invoke=_tracking_invoke(tracker, {"name": "info"}),
+            description="info",
+            provider_name=f"redis-{turn}",
+        )
+        managers.append(mgr)
+    monkeypatch.setattr(manager_settings, "tool_call_concurrency", 2)
+
+    await asyncio.gather(
+        *(mgr.execute_tool_calls([{"name": "info", "args": {}}]) for mgr in managers)
+    )
+
+    assert tracker["peak"] == 2
+    assert len(tracker["order"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_calls_reports_failed_read_in_place(monkeypatch):
+    """A failing READ call yields a failed entry without affecting its neighbours."""
+    mgr = ToolManager(thread_id="thread-1", task_id="task-1")
+    _register_tool(
+        mgr,
+        name="info",
+        action_kind=ToolActionKind.READ,
+        invoke=AsyncMock(side_effect=RuntimeError("boom")),
+        description="info",
+    )
+    _register_tool(
+        mgr,
+        name="slowlog",
+        action_kind=ToolActionKind.READ,
+        invoke=AsyncMock(return_value={"name": "slowlog"}),
+        description="slowlog",
+    )
+
+    results = await mgr.execute_tool_calls(
+        [{"name": "info", "args": {}}, {}, {"name": "slowlog", "args": {}}]
+    )
+
+    assert results == [
+        {"status": "failed", "error": "boom"},
+        {"status": "failed", "error": "missing tool name"},
+        {"name": "slowlog"},
+    ]
+
+
 @pytest.mark.asyncio
 async def test_tool_manager_allows_approved_resume_without_creating_new_approval(monkeypatch):
     """Approved resume state should let the original write execute."""
@@ -577,6 +866,54 @@ async def test_tool_manager_allows_approved_resume_without_creating_new_approval
     approval_manager.save_execution_ledger.assert_awaited()
 
 
+@pytest.mark.asyncio
+async def test_shared_cache_call_records_execution_ledger():
+    """Approved READ calls served through the shared cache still update the ledger."""
+    mgr = ToolManager(thread_id="thread-1", task_id="task-1", graph_type="chat")
+    invoke = AsyncMock(return_value={"status": "ok"})
+    _register_tool(
+        mgr, name="info", action_kind=ToolActionKind.READ, invoke=invoke, description="info"
+    )
+
+    async def get_or_compute(name, args, compute):
+        return await compute()
+
+    mgr._shared_cache = AsyncMock()
+    mgr._shared_cache.get_or_compute = AsyncMock(side_effect=get_or_compute)
+    approval_record = ApprovalRecord(
+        approval_id="approval-1",
+        task_id="task-1",
+        thread_id="thread-1",
+        graph_thread_id="task-1",
+        interrupt_id="interrupt-1",
+        graph_type="chat",
+        graph_version="v1",
+        tool_name="info",
+        tool_args={},
+        tool_args_preview={},
+        action_kind=ToolActionKind.READ.value,
+        action_hash=build_action_hash(tool_name="info", tool_args={}, target_handles=[]),
+        target_handles=[],
+        status=ApprovalStatus.APPROVED,
+    )
+    decision = ToolExecutionDecision(
+        mode=ToolExecutionMode.ALLOW, tool_name="info", approval_record=approval_record
+    )
+    approval_manager = AsyncMock()
+    approval_manager.get_execution_ledger.return_value = None
+
+    with patch("redis_sre_agent.tools.manager.ApprovalManager", return_value=approval_manager):
+        result = await mgr.resolve_tool_call("info", {}, decision=decision)
+        # The second call is served from the per-run cache
+        await mgr.resolve_tool_call("info", {}, decision=decision)
+
+    assert result == {"status": "ok"}
+    invoke.assert_awaited_once_with({})
+    saved = approval_manager.save_execution_ledger.await_args_list[1].args[0]
+    assert saved.status is ActionExecutionStatus.EXECUTED
+    assert saved.result_summary
+
+
 @pytest.mark.asyncio
 async def test_tool_manager_blocks_rejected_resume_without_invoking(monkeypatch):
     """Rejected approvals should fail closed when the graph resumes."""
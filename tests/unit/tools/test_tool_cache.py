@@ -1,7 +1,8 @@
 """Tests for ToolManager shared Redis cache functionality."""
 
+import asyncio
 import json
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -348,6 +349,157 @@ class TestToolCache:
         assert "error" in stats
 
 
+class TestToolCacheSingleFlight:
+    """Test single-flight coalescing of cache misses."""
+
+    @pytest.fixture
+    def mock_redis(self):
+        """Mock async Redis client with an in-memory store."""
+        store = {}
+        client = AsyncMock()
+        client.get = AsyncMock(side_effect=lambda key: store.get(key))
+
+        async def _setex(key, ttl, data):
+            store[key] = data.encode()
+            return True
+
+        async def _set(key, value, nx=False, ex=None):
+            if nx and key in store:
+                return None
+            store[key] = value
+            return True
+
+        client.setex = AsyncMock(side_effect=_setex)
+        client.set = AsyncMock(side_effect=_set)
+        client.exists = AsyncMock(side_effect=lambda key: int(key in store))
+        client.eval = AsyncMock(side_effect=lambda script, n, key, token: store.pop(key, None))
+        client.store = store
+        return client
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_invoke_once(self, mock_redis):
+        """Concurrent callers share one invocation and its result."""
+        cache = ToolCache(redis_client=mock_redis, instance_id="inst-1", lock_ttl=0)
+        other = ToolCache(redis_client=mock_redis, instance_id="inst-1", lock_ttl=0)
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"used_memory": 1}
+
+        results = await asyncio.gather(
+            *(c.get_or_compute("redis_cli_info", {}, compute) for c in (cache, other, cache))
+        )
+
+        assert calls == 1
+        assert results == [{"used_memory": 1}] * 3
+        mock_redis.setex.assert_awaited_once()
+        mock_redis.set.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_different_instances_do_not_coalesce(self, mock_redis):
+        """Keys differ per instance, so each instance invokes the tool."""
+        compute = AsyncMock(return_value={"ok": True})
+
+        await asyncio.gather(
+            ToolCache(redis_client=mock_redis, instance_id="a", lock_ttl=0).get_or_compute(
+                "redis_cli_info", {}, compute
+            ),
+            ToolCache(redis_client=mock_redis, instance_id="b", lock_ttl=0).get_or_compute(
+                "redis_cli_info", {}, compute
+            ),
+        )
+
+        assert compute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates_to_waiters_and_is_not_cached(self, mock_redis):
+        """A failed invocation fails every waiter; the next call retries."""
+        cache = ToolCache(redis_client=mock_redis, instance_id="inst-1", lock_ttl=0)
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            cache.get_or_compute("redis_cli_info", {}, failing),
+            cache.get_or_compute("redis_cli_info", {}, failing),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+        compute = AsyncMock(return_value={"ok": True})
+        assert await cache.get_or_compute("redis_cli_info", {}, compute) == {"ok": True}
+        compute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_takes_and_releases_redis_lock(self, mock_redis):
+        """With a lock TTL the leader holds a lock key only while invoking."""
+        cache = ToolCache(redis_client=mock_redis, instance_id="inst-1", lock_ttl=5)
+        compute = AsyncMock(return_value={"ok": True})
+
+        await cache.get_or_compute("redis_cli_info", {}, compute)
+
+        lock_key = mock_redis.set.await_args.args[0]
+        assert lock_key.startswith("sre_cache:toollock:inst-1:redis_cli_info:")
+        assert mock_redis.set.await_args.kwargs == {"nx": True, "ex": 5}
+        assert lock_key not in mock_redis.store
+        mock_redis.eval.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_waits_for_other_process_lock_holder(self, mock_redis):
+        """When another process holds the lock, use the result it caches."""
+        cache = ToolCache(redis_client=mock_redis, instance_id="inst-1", lock_ttl=5)
+        key = cache.build_key("redis_cli_info", {})
+        lock_key = key.replace("sre_cache:tool:", "sre_cache:toollock:", 1)
+        mock_redis.store[lock_key] = "other-process"
+        compute = AsyncMock(return_value={"ok": "mine"})
+
+        async def other_process_finishes():
+            await asyncio.sleep(0.06)
+            mock_redis.store[key] = json.dumps({"ok": "theirs"}).encode()
+
+        result, _ = await asyncio.gather(
+            cache.get_or_compute("redis_cli_info", {}, compute),
+            other_process_finishes(),
+        )
+
+        assert result == {"ok": "theirs"}
+        compute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_invokes_when_lock_released_without_result(self, mock_redis):
+        """If the holder releases without caching, the waiter invokes itself."""
+        cache = ToolCache(redis_client=mock_redis, instance_id="inst-1", lock_ttl=5)
+        key = cache.build_key("redis_cli_info", {})
+        lock_key = key.replace("sre_cache:tool:", "sre_cache:toollock:", 1)
+        mock_redis.store[lock_key] = "other-process"
+        compute = AsyncMock(return_value={"ok": "mine"})
+
+        async def other_process_fails():
+            await asyncio.sleep(0.06)
+            del mock_redis.store[lock_key]
+
+        result, _ = await asyncio.gather(
+            cache.get_or_compute("redis_cli_info", {}, compute),
+            other_process_fails(),
+        )
+
+        assert result == {"ok": "mine"}
+        compute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_invokes_directly(self, mock_redis):
+        """Disabled caches skip Redis entirely."""
+        cache = ToolCache(redis_client=mock_redis, instance_id="inst-1", enabled=False)
+        compute = AsyncMock(return_value={"ok": True})
+
+        assert await cache.get_or_compute("redis_cli_info", {}, compute) == {"ok": True}
+        mock_redis.get.assert_not_awaited()
+
+
 class TestToolManagerWithCache:
     """Test ToolManager integration with shared cache."""
 
@@ -427,6 +579,52 @@ class TestToolManagerWithCache:
                 # Should have tried to cache the result (or error)
                 # The implementation should call setex on success
 
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_share_one_invocation(self, mock_cache_redis, test_instance):
+        """Identical READ calls from concurrent runs invoke the tool once."""
+        from redis_sre_agent.tools.models import (
+            Tool,
+            ToolActionKind,
+            ToolCapability,
+            ToolDefinition,
+            ToolMetadata,
+        )
+
+        async def invoke(args):
+            await asyncio.sleep(0.01)
+            return {"status": "success", "info": "fresh"}
+
+        invoke_mock = AsyncMock(side_effect=invoke)
+        managers = []
+        for _ in range(3):
+            mgr = ToolManager(redis_instance=test_instance, cache_client=mock_cache_redis)
+            tool = Tool(
+                metadata=ToolMetadata(
+                    name="redis_cli_info",
+                    description="INFO",
+                    capability=ToolCapability.DIAGNOSTICS,
+                    provider_name="redis_cli",
+                    action_kind=ToolActionKind.READ,
+                ),
+                definition=ToolDefinition(
+                    name="redis_cli_info",
+                    description="INFO",
+                    capability=ToolCapability.DIAGNOSTICS,
+                    parameters={"type": "object", "properties": {}},
+                ),
+                invoke=invoke_mock,
+            )
+            mgr._tool_by_name["redis_cli_info"] = tool
+            mgr._routing_table["redis_cli_info"] = MagicMock(provider_name="redis_cli")
+            managers.append(mgr)
+
+        results = await asyncio.gather(
+            *(mgr.resolve_tool_call("redis_cli_info", {}) for mgr in managers)
+        )
+
+        invoke_mock.assert_awaited_once()
+        assert all(r == {"status": "success", "info": "fresh"} for r in results)
+
     @pytest.mark.asyncio
     async def test_tool_manager_without_cache_works(self, test_instance):
         """Test ToolManager works normally without cache client."""